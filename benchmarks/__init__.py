@@ -0,0 +1 @@
+"""Набор бенчмарков Project Creator"""
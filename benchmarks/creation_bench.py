@@ -0,0 +1,213 @@
+"""
+Бенчмарк пропускной способности создания проектов
+Прогоняет ProjectCreatorWorker синхронно на разных типах хранилищ:
+tmpfs, обычный диск и имитация сетевого хранилища (LatencyFileSystem),
+а также отдельно замеряет параллельное создание папок через имитацию
+"""
+
+import contextlib
+import io
+import itertools
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+
+from benchmarks.fake_filesystem import PROFILES, LatencyFileSystem, NetworkProfile
+from benchmarks.timing import measure
+from core.file_system import LocalFileSystem
+from core.io_policy import RetryingFileSystem
+from core.project_creator import ProjectCreatorWorker
+
+
+BENCH_TOOLS = ['ae', 'c4d', 'pr', 'houdini', 'blender']
+
+# Профиль имитации сетевого хранилища по умолчанию
+DEFAULT_FS_PROFILE = 'smb_30ms'
+
+# Количество потоков для замера параллельного создания папок
+MKDIR_WORKERS = [1, 8, 32]
+
+
+def _tmpfs_root() -> Optional[str]:
+    """Возвращает каталог на tmpfs или None, если tmpfs недоступна"""
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return None
+
+
+@contextlib.contextmanager
+def _isolated_app_data() -> Iterator[str]:
+    """
+    Подменяет домашнюю папку и папку данных приложения временной
+    
+    Воркер сохраняет снимки структуры, хеши шаблонов и индекс проектов в папке
+    данных приложения - бенчмарк не должен трогать настройки пользователя
+    """
+    home = tempfile.mkdtemp(prefix='pc_bench_home_')
+    saved = {name: os.environ.get(name) for name in ('HOME', 'USERPROFILE', 'APPDATA')}
+    os.environ.update({'HOME': home, 'USERPROFILE': home, 'APPDATA': home})
+    try:
+        yield home
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        shutil.rmtree(home, ignore_errors=True)
+
+
+def _create_projects(base_path: str, count: int, counter: Iterator[int],
+                     fs: LocalFileSystem, retries: List[int]) -> None:
+    """
+    Создает несколько проектов подряд в одном каталоге
+    
+    Args:
+        base_path: Базовый путь для проектов
+        count: Количество проектов
+        counter: Источник уникальных номеров для имен проектов
+        fs: Слой файловых операций
+        retries: Список, в который добавляется число повторов I/O каждого проекта
+    """
+    for _ in range(count):
+        project_data = {'name': f"BENCH_{next(counter):06d}", 'tools': BENCH_TOOLS}
+        worker = ProjectCreatorWorker(project_data, base_path, 'en', fs=fs)
+        worker.ui_delays = False
+        errors = []
+        worker.error_occurred.connect(errors.append)
+        # Воркер печатает лог каждого копирования - в замерах он не нужен
+        with contextlib.redirect_stdout(io.StringIO()):
+            worker.run()
+        retries.append(worker.io_metrics.retries)
+        if errors:
+            raise RuntimeError(f"Ошибка создания проекта: {errors[0]}")
+
+
+def _bench_target(name: str, root: str, projects: int, repeat: int,
+                  fs: Optional[LocalFileSystem] = None) -> Dict[str, Any]:
+    """
+    Замеряет создание проектов в заданном каталоге
+    
+    Args:
+        name: Имя цели (для отчета)
+        root: Каталог, в котором создается временная папка бенчмарка
+        projects: Количество проектов за один замер
+        repeat: Количество замеров
+        fs: Слой файловых операций (по умолчанию локальная ФС)
+        
+    Returns:
+        Статистика замера с пропускной способностью
+    """
+    base_path = tempfile.mkdtemp(prefix='pc_bench_', dir=root)
+    counter = itertools.count()
+    fs = fs or LocalFileSystem()
+    retries = []
+    
+    def reset():
+        for entry in os.listdir(base_path):
+            shutil.rmtree(os.path.join(base_path, entry), ignore_errors=True)
+    
+    try:
+        stats = measure(lambda: _create_projects(base_path, projects, counter, fs, retries),
+                        repeat=repeat, setup=reset)
+    finally:
+        shutil.rmtree(base_path, ignore_errors=True)
+    
+    stats['projects_per_run'] = projects
+    stats['io_retries'] = sum(retries)
+    stats['projects_per_s'] = projects / stats['median_s'] if stats['median_s'] else None
+    print(f"   creation[{name}]: {stats['projects_per_s']:.1f} проектов/с")
+    return stats
+
+
+def _bench_parallel_mkdir(root: str, profile: NetworkProfile, folders: int,
+                         repeat: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Замеряет параллельное создание папок через имитацию сетевого хранилища
+    
+    Args:
+        root: Каталог для временных папок
+        profile: Профиль имитации
+        folders: Количество папок за один замер
+        repeat: Количество замеров
+        
+    Returns:
+        Словарь результатов для каждого числа потоков
+    """
+    results = {}
+    base_path = tempfile.mkdtemp(prefix='pc_bench_mkdir_', dir=root)
+    fs = RetryingFileSystem(LatencyFileSystem(profile, seed=0))
+    counter = itertools.count()
+    
+    def reset():
+        for entry in os.listdir(base_path):
+            shutil.rmtree(os.path.join(base_path, entry), ignore_errors=True)
+    
+    try:
+        for workers in MKDIR_WORKERS:
+            def create_all():
+                batch = next(counter)
+                paths = [os.path.join(base_path, f"B{batch}", f"DIR_{i:04d}") for i in range(folders)]
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    list(pool.map(fs.makedirs, paths))
+            
+            stats = measure(create_all, repeat=repeat, warmup=0, setup=reset)
+            stats['folders_per_s'] = folders / stats['median_s'] if stats['median_s'] else None
+            results[f"fs.parallel_mkdir[workers={workers}]"] = stats
+            print(f"   parallel mkdir x{workers}: {stats['folders_per_s']:.1f} папок/с")
+    finally:
+        shutil.rmtree(base_path, ignore_errors=True)
+    
+    return results
+
+
+def run(projects: int, repeat: int, disk_dir: Optional[str] = None,
+        fs_profile: str = DEFAULT_FS_PROFILE, targets: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Запускает бенчмарк создания проектов на всех доступных целях
+    
+    Args:
+        projects: Количество проектов за один замер
+        repeat: Количество замеров
+        disk_dir: Каталог на диске (по умолчанию домашняя папка)
+        fs_profile: Имя профиля имитации сетевого хранилища из PROFILES
+        targets: Список целей (tmpfs, disk, latency); None - все
+        
+    Returns:
+        Словарь результатов: имя замера -> статистика
+    """
+    targets = targets or ['tmpfs', 'disk', 'latency']
+    disk_root = disk_dir or os.path.expanduser('~')
+    with _isolated_app_data():
+        return _run_targets(projects, repeat, disk_root, fs_profile, targets)
+
+
+def _run_targets(projects: int, repeat: int, disk_root: str, fs_profile: str,
+                 targets: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Выполняет замеры выбранных целей (см. run)"""
+    results = {}
+    
+    if 'tmpfs' in targets:
+        tmpfs = _tmpfs_root()
+        if tmpfs:
+            results['creation.tmpfs'] = _bench_target('tmpfs', tmpfs, projects, repeat)
+        else:
+            print("   creation[tmpfs]: tmpfs недоступна, пропускаем")
+    
+    if 'disk' in targets:
+        results['creation.disk'] = _bench_target('disk', disk_root, projects, repeat)
+    
+    if 'latency' in targets:
+        # Временные ошибки профиля обрабатываются политикой повторов воркера
+        profile = PROFILES[fs_profile]
+        latency_root = _tmpfs_root() or disk_root
+        # С задержкой замер медленный, поэтому создаем меньше проектов
+        latency_projects = max(1, projects // 5)
+        results[f"creation.latency[{fs_profile}]"] = _bench_target(
+            'latency', latency_root, latency_projects, repeat,
+            fs=LatencyFileSystem(profile, seed=0))
+        results.update(_bench_parallel_mkdir(latency_root, profile, 64, repeat))
+    
+    return results
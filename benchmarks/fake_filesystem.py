@@ -0,0 +1,267 @@
+"""
+Файловая система с имитацией сетевого хранилища
+Оборачивает LocalFileSystem и добавляет к каждой операции задержку, разброс,
+временные ошибки (EAGAIN/ESTALE) и ограничение пропускной способности.
+Позволяет воспроизводить поведение NAS/SMB на обычной Linux-машине
+"""
+
+import errno
+import os
+import random
+import shutil
+import threading
+import time
+from typing import IO, Any, Dict, List, Optional
+
+from core.file_system import LocalFileSystem
+
+
+class NetworkProfile:
+    """Параметры имитируемого сетевого хранилища"""
+    
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 error_codes: tuple = (errno.EAGAIN, errno.ESTALE),
+                 throughput: Optional[float] = None):
+        """
+        Инициализация профиля
+        
+        Args:
+            latency: Задержка одной операции в секундах
+            jitter: Максимальное случайное отклонение задержки в секундах
+            error_rate: Вероятность временной ошибки на операцию (0..1)
+            error_codes: Коды ошибок, из которых выбирается временная ошибка
+            throughput: Ограничение пропускной способности в байтах/с (None - без ограничения)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_codes = error_codes
+        self.throughput = throughput
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Возвращает параметры профиля в виде словаря"""
+        return {
+            'latency': self.latency,
+            'jitter': self.jitter,
+            'error_rate': self.error_rate,
+            'error_codes': [errno.errorcode.get(code, str(code)) for code in self.error_codes],
+            'throughput': self.throughput
+        }
+
+
+# Готовые профили типичных сетевых хранилищ
+PROFILES = {
+    'local': NetworkProfile(),
+    'nas_lan_5ms': NetworkProfile(latency=0.005, jitter=0.002, throughput=110 * 1024 * 1024),
+    'smb_30ms': NetworkProfile(latency=0.030, jitter=0.010, error_rate=0.01,
+                               throughput=40 * 1024 * 1024),
+    'vpn_80ms': NetworkProfile(latency=0.080, jitter=0.030, error_rate=0.02,
+                               throughput=5 * 1024 * 1024),
+    'flaky_smb': NetworkProfile(latency=0.030, jitter=0.020, error_rate=0.15,
+                                error_codes=(errno.EAGAIN, errno.ESTALE, errno.EBUSY),
+                                throughput=20 * 1024 * 1024),
+}
+
+
+class _ThroughputLimiter:
+    """Общий для всех потоков ограничитель пропускной способности канала"""
+    
+    def __init__(self, bytes_per_second: Optional[float]):
+        self.bytes_per_second = bytes_per_second
+        self._lock = threading.Lock()
+        self._available_at = time.monotonic()
+    
+    def consume(self, size: int) -> None:
+        """
+        Ожидает, пока канал сможет передать указанное количество байт
+        
+        Args:
+            size: Количество байт
+        """
+        if not self.bytes_per_second or size <= 0:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._available_at)
+            self._available_at = start + size / self.bytes_per_second
+            wait = self._available_at - now
+        
+        if wait > 0:
+            time.sleep(wait)
+
+
+class _ThrottledFile:
+    """Файловый объект, ограничивающий скорость чтения и записи"""
+    
+    def __init__(self, handle: IO, limiter: _ThroughputLimiter):
+        self._handle = handle
+        self._limiter = limiter
+    
+    def read(self, *args):
+        data = self._handle.read(*args)
+        self._limiter.consume(len(data))
+        return data
+    
+    def readinto(self, buffer):
+        count = self._handle.readinto(buffer)
+        self._limiter.consume(count or 0)
+        return count
+    
+    def write(self, data):
+        self._limiter.consume(len(data))
+        return self._handle.write(data)
+    
+    def __getattr__(self, name):
+        return getattr(self._handle, name)
+    
+    def __iter__(self):
+        return iter(self._handle)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._handle.close()
+
+
+class LatencyFileSystem(LocalFileSystem):
+    """Локальная файловая система с имитацией задержек и сбоев сети"""
+    
+    COPY_CHUNK_SIZE = 1024 * 1024
+    
+    def __init__(self, profile: Any = 'smb_30ms', seed: Optional[int] = None):
+        """
+        Инициализация имитатора
+        
+        Args:
+            profile: Имя профиля из PROFILES или объект NetworkProfile
+            seed: Зерно генератора случайных чисел для воспроизводимости
+        """
+        self.profile = PROFILES[profile] if isinstance(profile, str) else profile
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._limiter = _ThroughputLimiter(self.profile.throughput)
+        self.stats = {
+            'calls': {},
+            'injected_errors': 0,
+            'latency_s': 0.0,
+            'bytes': 0
+        }
+    
+    def _syscall(self, operation: str) -> None:
+        """
+        Имитирует сетевой вызов: задержка и, возможно, временная ошибка
+        
+        Args:
+            operation: Имя операции (для статистики)
+            
+        Raises:
+            OSError: Имитированная временная ошибка
+        """
+        with self._random_lock:
+            jitter = self._random.uniform(-self.profile.jitter, self.profile.jitter)
+            fail = self._random.random() < self.profile.error_rate
+            code = self._random.choice(self.profile.error_codes) if fail else None
+        
+        delay = max(0.0, self.profile.latency + jitter)
+        if delay:
+            time.sleep(delay)
+        
+        with self._stats_lock:
+            self.stats['calls'][operation] = self.stats['calls'].get(operation, 0) + 1
+            self.stats['latency_s'] += delay
+            if fail:
+                self.stats['injected_errors'] += 1
+        
+        if fail:
+            raise OSError(code, f"{os.strerror(code)} (имитация: {operation})")
+    
+    def _count_bytes(self, size: int) -> None:
+        """Учитывает переданные байты в статистике"""
+        with self._stats_lock:
+            self.stats['bytes'] += size
+    
+    def reset_stats(self) -> None:
+        """Сбрасывает накопленную статистику"""
+        with self._stats_lock:
+            self.stats = {'calls': {}, 'injected_errors': 0, 'latency_s': 0.0, 'bytes': 0}
+    
+    def makedirs(self, path: str, exist_ok: bool = True) -> None:
+        self._syscall('makedirs')
+        super().makedirs(path, exist_ok=exist_ok)
+    
+    def exists(self, path: str) -> bool:
+        self._syscall('exists')
+        return super().exists(path)
+    
+    def isdir(self, path: str) -> bool:
+        self._syscall('isdir')
+        return super().isdir(path)
+    
+    def glob(self, pattern: str) -> List[str]:
+        self._syscall('glob')
+        return super().glob(pattern)
+    
+    def listdir(self, path: str) -> List[str]:
+        self._syscall('listdir')
+        return super().listdir(path)
+    
+    def stat(self, path: str) -> os.stat_result:
+        self._syscall('stat')
+        return super().stat(path)
+    
+    def open(self, path: str, mode: str = 'r', **kwargs: Any) -> IO:
+        self._syscall('open')
+        handle = super().open(path, mode, **kwargs)
+        if 'b' in mode:
+            return _ThrottledFile(handle, self._limiter)
+        return handle
+    
+    def copy_file(self, source: str, destination: str) -> None:
+        self._syscall('copy_file')
+        size = 0
+        with open(source, 'rb') as src, open(destination, 'wb') as dst:
+            while True:
+                chunk = src.read(self.COPY_CHUNK_SIZE)
+                if not chunk:
+                    break
+                self._limiter.consume(len(chunk))
+                dst.write(chunk)
+                size += len(chunk)
+        shutil.copystat(source, destination)
+        self._count_bytes(size)
+    
+    def copy_stat(self, source: str, destination: str) -> None:
+        self._syscall('copy_stat')
+        super().copy_stat(source, destination)
+    
+    def write_text(self, path: str, content: str, encoding: str = 'utf-8') -> None:
+        data = content.encode(encoding)
+        self._syscall('write')
+        self._limiter.consume(len(data))
+        with open(path, 'wb') as f:
+            f.write(data)
+        self._count_bytes(len(data))
+    
+    def write_bytes(self, path: str, data: bytes, mtime: Optional[float] = None) -> None:
+        self._syscall('write')
+        self._limiter.consume(len(data))
+        with open(path, 'wb') as f:
+            f.write(data)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        self._count_bytes(len(data))
+    
+    def set_mtime(self, path: str, mtime: float) -> None:
+        self._syscall('set_mtime')
+        super().set_mtime(path, mtime)
+    
+    def remove(self, path: str) -> None:
+        self._syscall('remove')
+        super().remove(path)
+    
+    def rename(self, source: str, destination: str) -> None:
+        self._syscall('rename')
+        super().rename(source, destination)
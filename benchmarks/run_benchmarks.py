@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Project Creator - Запуск набора бенчмарков
+Сохраняет результаты в JSON и сравнивает их с базовым прогоном
+
+Примеры:
+    python -m benchmarks.run_benchmarks --output bench.json
+    python -m benchmarks.run_benchmarks --quick --compare bench.json --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks import creation_bench, fake_filesystem, startup_bench, structure_bench  # noqa: E402
+
+
+SUITES = ['structure', 'creation', 'startup']
+
+RESULTS_FORMAT_VERSION = 1
+
+
+def _git_revision() -> Optional[str]:
+    """Возвращает хеш текущего коммита или None вне git-репозитория"""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=PROJECT_ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _collect_metadata() -> Dict[str, Any]:
+    """Собирает сведения об окружении для сравнения результатов"""
+    return {
+        'format_version': RESULTS_FORMAT_VERSION,
+        'git_revision': _git_revision(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count()
+    }
+
+
+def run_suites(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    """
+    Запускает выбранные наборы бенчмарков
+    
+    Args:
+        args: Аргументы командной строки
+        
+    Returns:
+        Объединенный словарь результатов
+    """
+    results = {}
+    suites = args.only or SUITES
+    
+    if 'structure' in suites:
+        print("📐 Бенчмарки структуры папок...")
+        sizes = structure_bench.QUICK_SIZES if args.quick else structure_bench.DEFAULT_SIZES
+        results.update(structure_bench.run(sizes, args.repeat))
+    
+    if 'creation' in suites:
+        print("🗃️ Бенчмарки создания проектов...")
+        projects = 5 if args.quick else args.projects
+        results.update(creation_bench.run(projects, args.repeat, args.disk_dir, args.fs_profile))
+    
+    if 'startup' in suites:
+        print("🚀 Бенчмарк запуска приложения...")
+        results.update(startup_bench.run(max(1, args.repeat // 2) if args.quick else args.repeat))
+    
+    return results
+
+
+def compare_results(current: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+                    threshold: float) -> List[str]:
+    """
+    Сравнивает результаты с базовыми по медианному времени
+    
+    Args:
+        current: Текущие результаты
+        baseline: Базовые результаты
+        threshold: Допустимое относительное замедление (0.1 = 10%)
+        
+    Returns:
+        Список описаний регрессий (пустой если регрессий нет)
+    """
+    regressions = []
+    
+    for name in sorted(current):
+        if name not in baseline:
+            continue
+        base_median = baseline[name]['median_s']
+        new_median = current[name]['median_s']
+        if base_median <= 0:
+            continue
+        
+        ratio = new_median / base_median
+        marker = "❌" if ratio > 1 + threshold else "✅"
+        print(f"{marker} {name}: {base_median * 1000:.2f} мс -> {new_median * 1000:.2f} мс ({ratio:.2f}x)")
+        
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: замедление в {ratio:.2f} раза")
+    
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Разбирает аргументы командной строки"""
+    parser = argparse.ArgumentParser(description="Бенчмарки Project Creator")
+    parser.add_argument('--output', '-o', help="Файл для сохранения результатов в JSON")
+    parser.add_argument('--compare', '-c', help="JSON с базовыми результатами для сравнения")
+    parser.add_argument('--threshold', '-t', type=float, default=0.10,
+                        help="Допустимое замедление относительно базы (по умолчанию 0.10 = 10%%)")
+    parser.add_argument('--only', nargs='+', choices=SUITES, help="Запустить только указанные наборы")
+    parser.add_argument('--repeat', type=int, default=5, help="Количество замеров на случай")
+    parser.add_argument('--projects', type=int, default=20, help="Проектов за один замер создания")
+    parser.add_argument('--disk-dir', help="Каталог на диске для бенчмарка создания")
+    parser.add_argument('--fs-profile', default=creation_bench.DEFAULT_FS_PROFILE,
+                        choices=sorted(fake_filesystem.PROFILES),
+                        help="Профиль имитации сетевого хранилища")
+    parser.add_argument('--quick', action='store_true', help="Сокращенный прогон")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Главная функция запуска бенчмарков"""
+    args = parse_args(argv)
+    
+    report = {
+        'meta': _collect_metadata(),
+        'results': run_suites(args)
+    }
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"💾 Результаты сохранены: {args.output}")
+    else:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\n📊 Сравнение с {args.compare} (порог {args.threshold:.0%}):")
+        regressions = compare_results(report['results'], baseline.get('results', {}), args.threshold)
+        if regressions:
+            print("\n❌ Обнаружены регрессии производительности:")
+            for regression in regressions:
+                print(f"   {regression}")
+            return 1
+        print("\n✅ Регрессий не обнаружено")
+    
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Бенчмарк времени запуска приложения
+Запускает main.py в отдельном процессе с offscreen Qt и замеряет
+время от старта процесса до первого показа главного окна
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Dict
+
+from benchmarks.timing import summarize
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+READY_MARKER = "__STARTUP_WINDOW_SHOWN__"
+
+# Код дочернего процесса: после первого показа окна печатает маркер и завершается
+PROBE_CODE = f"""
+import sys
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+import main
+
+_original_show = main.ProjectCreatorApp.show
+
+def _show_and_report(self):
+    _original_show(self)
+    def report():
+        print({READY_MARKER!r}, flush=True)
+        QApplication.instance().quit()
+    QTimer.singleShot(0, report)
+
+main.ProjectCreatorApp.show = _show_and_report
+try:
+    main.main()
+except SystemExit:
+    pass
+"""
+
+
+def _run_once(timeout: float) -> float:
+    """
+    Запускает приложение один раз и возвращает время до показа окна
+    
+    Args:
+        timeout: Максимальное время ожидания в секундах
+        
+    Returns:
+        Время от запуска процесса до показа окна в секундах
+    """
+    env = os.environ.copy()
+    env['QT_QPA_PLATFORM'] = 'offscreen'
+    
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, '-c', PROBE_CODE],
+        cwd=PROJECT_ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True
+    )
+    
+    # Если окно так и не появится, сторожевой таймер завершит процесс
+    watchdog = threading.Timer(timeout, process.kill)
+    watchdog.start()
+    try:
+        for line in process.stdout:
+            if line.strip() == READY_MARKER:
+                elapsed = time.perf_counter() - start
+                process.wait(timeout=timeout)
+                return elapsed
+    finally:
+        watchdog.cancel()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+    
+    raise RuntimeError("Главное окно не было показано за отведенное время")
+
+
+def run(repeat: int, timeout: float = 60.0) -> Dict[str, Dict[str, Any]]:
+    """
+    Запускает бенчмарк старта приложения
+    
+    Args:
+        repeat: Количество запусков
+        timeout: Таймаут одного запуска в секундах
+        
+    Returns:
+        Словарь результатов: имя замера -> статистика
+    """
+    # Первый запуск прогревает файловый кэш и байткод
+    _run_once(timeout)
+    timings = [_run_once(timeout) for _ in range(repeat)]
+    stats = summarize(timings)
+    print(f"   startup: {stats['median_s'] * 1000:.0f} мс до показа окна")
+    return {'startup.first_window_shown': stats}
@@ -0,0 +1,84 @@
+"""
+Бенчмарки менеджера структуры папок
+Замеряет get_folder_list, _generate_tree_view и validate_structure
+на синтетических структурах разного размера
+"""
+
+from collections import deque
+from typing import Any, Dict, List
+
+from benchmarks.timing import measure
+from core.folder_structure_manager import FolderStructureManager
+
+
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+QUICK_SIZES = [10, 100, 1000]
+
+# Инструменты, папки которых добавляются в 02_PROCESS при замере get_folder_list
+BENCH_TOOLS = ['ae', 'c4d', 'pr', 'houdini', 'blender']
+
+
+def generate_structure(node_count: int, fan_out: int = 10) -> Dict[str, Any]:
+    """
+    Генерирует сбалансированную структуру папок заданного размера
+    
+    Args:
+        node_count: Общее количество папок в структуре
+        fan_out: Максимальное число подпапок у одной папки
+        
+    Returns:
+        Структура в формате FolderStructureManager
+    """
+    structure = {"02_PROCESS": {"comment": "Рабочие файлы", "children": {}}}
+    created = 1
+    queue = deque([structure["02_PROCESS"]["children"], structure])
+    
+    while created < node_count:
+        children = queue.popleft()
+        for index in range(fan_out):
+            if created >= node_count:
+                break
+            node = {"comment": f"Папка {created}", "children": {}}
+            children[f"{created:06d}_FOLDER_{index:02d}"] = node
+            queue.append(node["children"])
+            created += 1
+    
+    return structure
+
+
+def _make_manager(structure: Dict[str, Any]) -> FolderStructureManager:
+    """Создает менеджер структуры с подмененной текущей структурой"""
+    manager = FolderStructureManager()
+    manager.current_structure = structure
+    return manager
+
+
+def run(sizes: List[int], repeat: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Запускает бенчмарки структуры для всех размеров
+    
+    Args:
+        sizes: Список размеров структуры (количество узлов)
+        repeat: Количество замеров на каждый случай
+        
+    Returns:
+        Словарь результатов: имя замера -> статистика
+    """
+    results = {}
+    
+    for size in sizes:
+        structure = generate_structure(size)
+        manager = _make_manager(structure)
+        # Для больших структур сокращаем число повторов
+        runs = repeat if size <= 10000 else max(1, repeat // 2)
+        
+        results[f"structure.get_folder_list[n={size}]"] = measure(
+            lambda: manager.get_folder_list(BENCH_TOOLS), repeat=runs)
+        results[f"structure.generate_tree_view[n={size}]"] = measure(
+            lambda: manager._generate_tree_view(structure), repeat=runs)
+        results[f"structure.validate_structure[n={size}]"] = measure(
+            lambda: manager.validate_structure(structure), repeat=runs)
+        
+        print(f"   structure n={size}: готово")
+    
+    return results
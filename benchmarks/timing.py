@@ -0,0 +1,65 @@
+"""
+Вспомогательные функции для замеров времени
+Общие для всех бенчмарков: повторные прогоны и сводная статистика
+"""
+
+import gc
+import statistics
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+def measure(func: Callable[[], Any], repeat: int = 5, warmup: int = 1,
+            setup: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+    """
+    Замеряет время выполнения функции несколько раз
+    
+    Args:
+        func: Измеряемая функция без аргументов
+        repeat: Количество замеров
+        warmup: Количество прогревочных запусков (не учитываются)
+        setup: Функция подготовки, вызываемая перед каждым запуском вне замера
+        
+    Returns:
+        Словарь со статистикой: median_s, min_s, max_s, mean_s, runs
+    """
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        func()
+    
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    
+    return summarize(timings)
+
+
+def summarize(timings: list) -> Dict[str, Any]:
+    """
+    Формирует сводную статистику по списку замеров
+    
+    Args:
+        timings: Список длительностей в секундах
+        
+    Returns:
+        Словарь со статистикой замеров
+    """
+    return {
+        'median_s': statistics.median(timings),
+        'min_s': min(timings),
+        'max_s': max(timings),
+        'mean_s': statistics.fmean(timings),
+        'runs': len(timings)
+    }
@@ -24,6 +24,8 @@ class DependencyChecker:
         'psutil': '5.8.0',
         'colorama': '0.4.4',
         'packaging': '21.0',
+        'zstandard': '0.15',
+        'xxhash': '2.0',
     }
     
     def __init__(self):
@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Project Creator - Утилиты командной строки для существующих проектов
+
+Примеры:
+    python cli.py manifest /projects/Promo
+    python cli.py manifest /projects/Promo --verify --folder 04_OUT/04_MASTER
+    python cli.py sequences /projects/Promo/03_RENDER
+    python cli.py render-check /projects/Promo --range 1001-1100
+    python cli.py size /projects --depth 1 --json sizes.json
+    python cli.py archive /projects/Promo -o /archive/Promo.tar.zst
+    python cli.py restore /archive/Promo.tar.zst /projects --only 01_IN --only 02_PROCESS/AE
+    python cli.py dedup /projects --apply --hardlink
+    python cli.py index /projects
+    python cli.py search promo
+    python cli.py audit /projects --json audit.json
+    python cli.py repair audit.json --dry-run
+    python cli.py migrate /projects --apply --ops-per-second 10
+    python cli.py migrate --rollback 20240101-120000
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from core.asset_dedup import (DEDUP_FOLDERS, DEDUP_MIN_SIZE, MODE_HARDLINK, MODE_REFLINK,  # noqa: E402
+                              AssetDeduplicator)
+from core.checksum_manifest import MHL_HASH_TAGS, build_project_manifests  # noqa: E402
+from core.project_archive import (ARCHIVE_EXCLUDES, ProjectArchiver, codec_from_path,  # noqa: E402
+                                  get_default_archive_path, load_archive_index)
+from core.render_check import RenderChecker  # noqa: E402
+from core.sequence_index import SequenceIndex, collapse_frames, format_intervals  # noqa: E402
+from core.project_index import get_project_index, import_projects  # noqa: E402
+from core.project_restore import ArchiveRestorer, build_archive_index, list_archive_folders  # noqa: E402
+from core.size_scanner import SizeScanner, build_size_report, format_size  # noqa: E402
+from core.structure_audit import (AUDIT_WORKERS, StructureAuditor, load_audit_report, repair_projects,  # noqa: E402
+                                  save_audit_report)
+from core.folder_structure_manager import FolderStructureManager  # noqa: E402
+from core.structure_migration import (DEFAULT_OFF_HOURS_OPS_PER_SECOND, DEFAULT_OPS_PER_SECOND,  # noqa: E402
+                                      MIGRATION_WORKERS, ProjectMigrator, VolumeThrottle, list_migrations,
+                                      rollback_migration)
+
+
+def cmd_manifest(args: argparse.Namespace) -> int:
+    """Строит или проверяет манифесты контрольных сумм проекта"""
+    results = build_project_manifests(args.project, args.folder, full_verify=args.verify,
+                                      algorithm=args.algorithm, workers=args.workers)
+    if not results:
+        print("⚠️ Нет папок для построения манифеста")
+        return 1
+    
+    failed = False
+    for result in results:
+        counts = ', '.join(f"{status}: {count}" for status, count in sorted(result['counts'].items()))
+        print(f"📄 {result['root']}")
+        print(f"   {counts}; хешировано {result['hashed']} файлов "
+              f"({result['bytes_hashed'] / (1024 * 1024):.1f} МБ) за {result['elapsed']:.1f} с")
+        print(f"   манифест: {result['manifest']}")
+        for name in result['mismatches']:
+            print(f"   ❌ несовпадение: {name}")
+        for name in result['missing']:
+            print(f"   ❓ отсутствует: {name}")
+        for name, error in result['errors'].items():
+            print(f"   ⚠️ ошибка: {name}: {error}")
+        failed = failed or bool(result['mismatches'] or result['missing'] or result['errors'])
+    return 1 if failed else 0
+
+
+def cmd_sequences(args: argparse.Namespace) -> int:
+    """Выводит секвенции кадров папки"""
+    index = SequenceIndex(args.path)
+    directories = index.refresh(force=args.force)
+    for rel in sorted(directories):
+        entry = directories[rel]
+        if not entry.sequences and not (args.files and entry.files):
+            continue
+        print(f"📁 {rel}")
+        for sequence in entry.sequences:
+            print(f"   🎞️ {sequence.describe()} ({sequence.total_bytes / (1024 * 1024):.1f} МБ)")
+        if args.files:
+            for name, size in sorted(entry.files.items()):
+                print(f"   📄 {name} ({size} байт)")
+    print(f"Папок просканировано: {index.dirs_scanned}, из кэша: {index.dirs_reused}")
+    return 0
+
+
+def _parse_range(text: str):
+    """Разбирает диапазон кадров вида 1001-1100"""
+    first, _, last = text.partition('-')
+    return int(first), int(last or first)
+
+
+def cmd_render_check(args: argparse.Namespace) -> int:
+    """Проверяет полноту секвенций в 03_RENDER"""
+    result = RenderChecker(args.path, args.range).run(force=args.force)
+    for report in result['sequences']:
+        if report['ok'] and not args.all:
+            continue
+        status = '✅' if report['ok'] else '❌'
+        print(f"{status} {report['directory']}/{report['pattern']} "
+              f"[{report['first']}-{report['last']}] {report['frame_count']} кадров")
+        if report['missing']:
+            print(f"   пропущены: {format_intervals(report['missing'])}")
+        if report['zero_byte']:
+            print(f"   пустые: {format_intervals(report['zero_byte'])}")
+        if report['outliers']:
+            frames = collapse_frames(frame for frame, _ in report['outliers'])
+            print(f"   усеченные: {format_intervals(frames)}")
+    print(f"Секвенций: {len(result['sequences'])}, с проблемами: {result['problems']}; "
+          f"папок просканировано: {result['dirs_scanned']}, из кэша: {result['dirs_reused']}")
+    return 1 if result['problems'] else 0
+
+
+def cmd_size(args: argparse.Namespace) -> int:
+    """Считает размеры папок проекта или всей папки проектов"""
+    scanner = SizeScanner(args.path, workers=args.workers)
+    totals = scanner.scan(force=args.force)
+    report = build_size_report(scanner.root, totals, args.depth)
+    
+    if args.json:
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if args.json == '-':
+            print(output)
+        else:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                f.write(output)
+        return 0
+    
+    def show(node, indent):
+        print(f"{'  ' * indent}{format_size(node['size']):>10}  {node['files']:>8}  "
+              f"{node['latest_mtime']}  {node['name']}")
+        for child in node.get('children', []):
+            show(child, indent + 1)
+    
+    show(report, 0)
+    print(f"Папок прочитано: {scanner.dirs_scanned}, из кэша: {scanner.dirs_reused}")
+    return 0
+
+
+def cmd_archive(args: argparse.Namespace) -> int:
+    """Упаковывает проект в сжатый tar с индексом и проверкой"""
+    output = args.output or get_default_archive_path(args.project, args.codec)
+    excludes = ([] if args.no_default_excludes else list(ARCHIVE_EXCLUDES)) + (args.exclude or [])
+    
+    def report(progress):
+        percent = progress['bytes_done'] * 100 // progress['bytes_total'] if progress['bytes_total'] else 100
+        phase = 'проверка' if progress['phase'] == 'verify' else 'архивация'
+        print(f"\r   {phase}: {percent:3d}% · {format_size(int(progress['throughput']))}/с   ", end='', flush=True)
+    
+    archiver = ProjectArchiver(args.project, output, codec=args.codec or codec_from_path(output),
+                               level=args.level, excludes=excludes, workers=args.workers,
+                               progress_callback=report)
+    result = archiver.run(verify=not args.no_verify)
+    print()
+    print(f"📦 {result['archive']} ({result['codec']})")
+    print(f"   {format_size(result['bytes_in'])} → {format_size(result['compressed_size'])} "
+          f"за {result['elapsed']:.1f} с ({format_size(int(result['throughput']))}/с)")
+    for path in result['excluded']:
+        print(f"   − исключено: {path}")
+    
+    verified = result['verified']
+    if verified is None:
+        return 0
+    for name in verified['mismatches']:
+        print(f"   ❌ несовпадение: {name}")
+    for name in verified['missing']:
+        print(f"   ❓ отсутствует: {name}")
+    print(f"   проверено участников: {verified['members']}")
+    return 0 if verified['ok'] else 1
+
+
+def cmd_restore(args: argparse.Namespace) -> int:
+    """Восстанавливает проект или выбранные папки из архива"""
+    if args.list:
+        index = load_archive_index(args.archive) or build_archive_index(args.archive)
+        for folder in list_archive_folders(index, args.depth):
+            print(folder)
+        return 0
+    
+    def report(progress):
+        percent = progress['bytes_done'] * 100 // progress['bytes_total'] if progress['bytes_total'] else 0
+        print(f"\r   восстановление: {percent:3d}% · {format_size(int(progress['throughput']))}/с   ",
+              end='', flush=True)
+    
+    restorer = ArchiveRestorer(args.archive, args.destination, args.only,
+                               recreate_skeleton=not args.no_skeleton, progress_callback=report)
+    result = restorer.run()
+    print()
+    print(f"📂 {result['project_path']}")
+    print(f"   участников: {result['members']}, {format_size(result['bytes'])} за {result['elapsed']:.1f} с "
+          f"({format_size(int(result['throughput']))}/с), переходов по индексу: {result['seeks']}")
+    for name in result['mismatches']:
+        print(f"   ❌ несовпадение: {name}")
+    for name, error in result['errors'].items():
+        print(f"   ⚠️ ошибка: {name}: {error}")
+    return 1 if result['mismatches'] or result['errors'] else 0
+
+
+def cmd_dedup(args: argparse.Namespace) -> int:
+    """Ищет одинаковые ассеты в проектах и заменяет копии ссылками"""
+    folders = None if args.all_folders else (args.folder or DEDUP_FOLDERS)
+    deduplicator = AssetDeduplicator(args.base_path, folders, MODE_HARDLINK if args.hardlink else MODE_REFLINK,
+                                     min_size=args.min_size, workers=args.workers)
+    result = deduplicator.run(dry_run=not args.apply)
+    
+    for group in result['groups'][:args.top]:
+        print(f"🔁 {format_size(group['size'])} × {len(group['duplicates']) + 1}, "
+              f"освободится {format_size(group['reclaimable'])}")
+        print(f"   оригинал: {group['keeper']}")
+        for path in group['duplicates']:
+            print(f"   копия:    {path}")
+    if len(result['groups']) > args.top:
+        print(f"... и еще групп: {len(result['groups']) - args.top}")
+    
+    print(f"Файлов: {result['files']}, хешировано частично: {result['hashed_partial']}, "
+          f"полностью: {result['hashed_full']} за {result['elapsed']:.1f} с")
+    print(f"Групп дубликатов: {len(result['groups'])}, можно освободить: {format_size(result['reclaimable'])}")
+    if args.apply:
+        print(f"Заменено файлов: {result['replaced']} ({result['mode']}), "
+              f"освобождено: {format_size(result['reclaimed'])}")
+    for path, error in result['errors'].items():
+        print(f"   ⚠️ {path}: {error}")
+    if result['errors'] and not args.hardlink and args.apply:
+        print("Если файловая система не поддерживает reflink (ext4, NTFS, SMB), используйте --hardlink")
+    return 1 if result['errors'] else 0
+
+
+def cmd_index(args: argparse.Namespace) -> int:
+    """Импортирует проекты базовой папки в индекс проектов"""
+    index = get_project_index()
+    result = import_projects(index, args.base_path, with_sizes=not args.no_sizes)
+    print(f"Проектов импортировано: {result['imported']}, удалено отсутствующих: {result['removed']}")
+    print(f"Всего в индексе: {index.count()} ({index.db_path})")
+    return 0
+
+
+def cmd_search(args: argparse.Namespace) -> int:
+    """Ищет проекты в индексе"""
+    projects = get_project_index().search(' '.join(args.query), limit=args.limit)
+    for project in projects:
+        size = format_size(project['size']) if project['size'] is not None else '—'
+        print(f"{project['name']:<40} {', '.join(project['tools']):<20} {size:>10}  {project['path']}")
+    return 0 if projects else 1
+
+
+def cmd_audit(args: argparse.Namespace) -> int:
+    """Проверяет проекты базовой папки на соответствие текущей структуре"""
+    report = StructureAuditor(args.base_path, workers=args.workers).run()
+    for project in report['projects']:
+        print(f"📁 {project['name']}")
+        for path in project['missing']:
+            print(f"   ❓ нет папки: {path}")
+        for path in project['extra']:
+            print(f"   ➕ лишняя: {path}")
+        for found, expected in project['misnamed']:
+            print(f"   ✏️ {found} → {expected}")
+        if project.get('error'):
+            print(f"   ⚠️ {project['error']}")
+    print(f"Проверено проектов: {report['checked']} (из кэша: {report['reused']}) за {report['elapsed']:.1f} с, "
+          f"соответствуют: {report['compliant']}, с отклонениями: {len(report['projects'])}")
+    if args.json:
+        save_audit_report(report, args.json)
+        print(f"Отчет: {args.json}")
+    return 1 if report['projects'] else 0
+
+
+def cmd_repair(args: argparse.Namespace) -> int:
+    """Исправляет проекты по отчету проверки структуры"""
+    report = load_audit_report(args.report)
+    entries = [project for project in report['projects']
+               if not args.project or project['name'] in args.project]
+    result = repair_projects(entries, dry_run=args.dry_run)
+    if args.dry_run:
+        for action in result['actions']:
+            print(action)
+    print(f"Переименовано папок: {result['renamed']}, создано: {result['created']}")
+    for path, error in result['errors'].items():
+        print(f"   ⚠️ {path}: {error}")
+    return 1 if result['errors'] else 0
+
+
+def _load_source_structure(value: Optional[str]) -> Optional[dict]:
+    """Прежняя структура из файла JSON или сохраненного снимка по хешу"""
+    if not value:
+        return None
+    if os.path.isfile(value):
+        with open(value, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    structure = FolderStructureManager.load_snapshot(value)
+    if structure is None:
+        raise SystemExit(f"Нет файла или снимка структуры: {value}")
+    return structure
+
+
+def cmd_migrate(args: argparse.Namespace) -> int:
+    """Переводит проекты базовой папки на текущую структуру или откатывает миграцию"""
+    throttle = VolumeThrottle(args.ops_per_second, args.off_hours_ops_per_second)
+    if args.rollback:
+        if args.rollback not in list_migrations():
+            print(f"Нет журнала миграции {args.rollback}")
+            return 2
+        result = rollback_migration(args.rollback, throttle, get_project_index())
+        print(f"Откат {args.rollback}: проектов {result['projects']}, отменено действий: {result['undone']}")
+        for path, error in result['errors'].items():
+            print(f"   ⚠️ {path}: {error}")
+        return 1 if result['errors'] else 0
+    if not args.base_path:
+        print("Укажите базовую папку или --rollback. Миграции: " + (', '.join(list_migrations()) or '—'))
+        return 2
+    
+    migrator = ProjectMigrator(args.base_path, source_structure=_load_source_structure(args.source),
+                               workers=args.workers, throttle=throttle, index=get_project_index())
+    result = migrator.run(dry_run=not args.apply)
+    for plan in result['projects']:
+        if not plan['operations'] and plan['status'] != 'unknown_revision':
+            continue
+        print(f"📁 {plan['name']} [{plan['status']}]")
+        for op, source, target in plan['operations']:
+            print(f"   {op}: {source + ' → ' if source else ''}{target}")
+        for path in plan.get('conflicts', []):
+            print(f"   ⚠️ конфликт, осталось на месте: {path}")
+        if plan.get('error'):
+            print(f"   ⚠️ {plan['error']}")
+    counts = ', '.join(f"{status}: {count}" for status, count in sorted(result['counts'].items()))
+    print(f"Проектов: {len(result['projects'])} ({counts}) за {result['elapsed']:.1f} с")
+    if result['migration_id']:
+        print(f"Журнал для отката: --rollback {result['migration_id']}")
+    return 1 if result['counts'].get('error') else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Создает разбор аргументов со всеми подкомандами"""
+    parser = argparse.ArgumentParser(description="Утилиты для существующих проектов Project Creator")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    manifest = subparsers.add_parser('manifest', help="Манифесты контрольных сумм (MHL)")
+    manifest.add_argument('project', help="Путь к проекту")
+    manifest.add_argument('--folder', action='append',
+                          help="Папка проекта (можно несколько, по умолчанию 01_IN и 04_OUT/04_MASTER)")
+    manifest.add_argument('--verify', action='store_true',
+                          help="Перехешировать все файлы и сверить с предыдущим манифестом")
+    manifest.add_argument('--algorithm', choices=sorted(MHL_HASH_TAGS), help="Алгоритм хеширования")
+    manifest.add_argument('--workers', type=int, help="Количество потоков хеширования")
+    manifest.set_defaults(func=cmd_manifest)
+    
+    sequences = subparsers.add_parser('sequences', help="Секвенции кадров папки (03_RENDER, FOOTAGES)")
+    sequences.add_argument('path', help="Папка для индексации")
+    sequences.add_argument('--force', action='store_true', help="Пересканировать все папки без кэша")
+    sequences.add_argument('--files', action='store_true', help="Выводить также отдельные файлы")
+    sequences.set_defaults(func=cmd_sequences)
+    
+    render_check = subparsers.add_parser('render-check', help="Проверка полноты рендеров 03_RENDER")
+    render_check.add_argument('path', help="Папка проекта или папка рендеров")
+    render_check.add_argument('--range', type=_parse_range, help="Ожидаемый диапазон кадров, например 1001-1100")
+    render_check.add_argument('--force', action='store_true', help="Пересканировать все папки без кэша")
+    render_check.add_argument('--all', action='store_true', help="Выводить также секвенции без проблем")
+    render_check.set_defaults(func=cmd_render_check)
+    
+    size = subparsers.add_parser('size', help="Размеры папок проекта или всей папки проектов")
+    size.add_argument('path', help="Папка проекта или базовая папка проектов")
+    size.add_argument('--depth', type=int, default=2, help="Глубина отчета")
+    size.add_argument('--json', metavar='FILE', help="Сохранить отчет в JSON ('-' - вывести)")
+    size.add_argument('--force', action='store_true', help="Перечитать все папки без кэша")
+    size.add_argument('--workers', type=int, default=16, help="Количество параллельных обходчиков")
+    size.set_defaults(func=cmd_size)
+    
+    archive = subparsers.add_parser('archive', help="Архивация проекта в сжатый tar")
+    archive.add_argument('project', help="Путь к проекту")
+    archive.add_argument('-o', '--output', help="Путь к архиву (по умолчанию рядом с проектом)")
+    archive.add_argument('--codec', choices=['zstd', 'gzip', 'none'],
+                         help="Кодек сжатия, none - без сжатия (по умолчанию по расширению)")
+    archive.add_argument('--level', type=int, help="Уровень сжатия")
+    archive.add_argument('--exclude', action='append', metavar='PATTERN',
+                         help="Дополнительное правило исключения относительно корня проекта")
+    archive.add_argument('--no-default-excludes', action='store_true',
+                         help="Не применять стандартные исключения (03_RENDER, кэши)")
+    archive.add_argument('--no-verify', action='store_true', help="Не проверять архив после записи")
+    archive.add_argument('--workers', type=int, help="Количество потоков сжатия")
+    archive.set_defaults(func=cmd_archive)
+    
+    restore = subparsers.add_parser('restore', help="Восстановление проекта из архива")
+    restore.add_argument('archive', help="Путь к архиву")
+    restore.add_argument('destination', nargs='?', default='.', help="Папка, в которую восстанавливается проект")
+    restore.add_argument('--only', action='append', metavar='FOLDER',
+                         help="Папка проекта для восстановления (можно несколько, по умолчанию весь проект)")
+    restore.add_argument('--no-skeleton', action='store_true', help="Не создавать пустые папки структуры")
+    restore.add_argument('--list', action='store_true', help="Вывести папки архива и выйти")
+    restore.add_argument('--depth', type=int, default=2, help="Глубина списка папок для --list")
+    restore.set_defaults(func=cmd_restore)
+    
+    dedup = subparsers.add_parser('dedup', help="Дедупликация ассетов между проектами")
+    dedup.add_argument('base_path', help="Базовая папка проектов")
+    dedup.add_argument('--apply', action='store_true', help="Заменить дубликаты (по умолчанию только отчет)")
+    dedup.add_argument('--hardlink', action='store_true',
+                       help="Заменять жесткими ссылками вместо reflink (изменение одной копии меняет все)")
+    dedup.add_argument('--folder', action='append',
+                       help="Папка внутри проекта (можно несколько, по умолчанию 01_IN/ASSETS, FONTS, SFX)")
+    dedup.add_argument('--all-folders', action='store_true', help="Искать во всей базовой папке")
+    dedup.add_argument('--min-size', type=int, default=DEDUP_MIN_SIZE, help="Минимальный размер файла в байтах")
+    dedup.add_argument('--workers', type=int, default=8, help="Количество потоков хеширования")
+    dedup.add_argument('--top', type=int, default=20, help="Сколько групп выводить")
+    dedup.set_defaults(func=cmd_dedup)
+    
+    index = subparsers.add_parser('index', help="Импорт проектов базовой папки в индекс для поиска")
+    index.add_argument('base_path', help="Базовая папка проектов")
+    index.add_argument('--no-sizes', action='store_true', help="Не считать размеры проектов")
+    index.set_defaults(func=cmd_index)
+    
+    search = subparsers.add_parser('search', help="Поиск проектов в индексе")
+    search.add_argument('query', nargs='+', help="Слова запроса (начало слова или с опечаткой)")
+    search.add_argument('--limit', type=int, default=20, help="Максимум результатов")
+    search.set_defaults(func=cmd_search)
+    
+    audit = subparsers.add_parser('audit', help="Проверка проектов на соответствие текущей структуре папок")
+    audit.add_argument('base_path', help="Базовая папка проектов")
+    audit.add_argument('--json', help="Сохранить отчет (вход для repair)")
+    audit.add_argument('--workers', type=int, default=AUDIT_WORKERS, help="Количество потоков")
+    audit.set_defaults(func=cmd_audit)
+    
+    repair = subparsers.add_parser('repair', help="Исправление проектов по отчету audit")
+    repair.add_argument('report', help="Файл отчета audit --json")
+    repair.add_argument('--project', action='append', help="Только указанные проекты (можно несколько)")
+    repair.add_argument('--dry-run', action='store_true', help="Только показать действия")
+    repair.set_defaults(func=cmd_repair)
+    
+    migrate = subparsers.add_parser('migrate', help="Перевод проектов на текущую структуру папок")
+    migrate.add_argument('base_path', nargs='?', help="Базовая папка проектов")
+    migrate.add_argument('--from', dest='source',
+                         help="Прежняя структура (JSON или хеш снимка) для проектов без project.json")
+    migrate.add_argument('--apply', action='store_true', help="Выполнить план (по умолчанию только показать)")
+    migrate.add_argument('--workers', type=int, default=MIGRATION_WORKERS, help="Проектов одновременно")
+    migrate.add_argument('--ops-per-second', type=float, default=DEFAULT_OPS_PER_SECOND,
+                         help="Операций в секунду на том в рабочее время (0 - без ограничения)")
+    migrate.add_argument('--off-hours-ops-per-second', type=float, default=DEFAULT_OFF_HOURS_OPS_PER_SECOND,
+                         help="То же вне рабочего времени")
+    migrate.add_argument('--rollback', metavar='ID', help="Откатить миграцию по журналу")
+    migrate.set_defaults(func=cmd_migrate)
+    
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа командной строки"""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
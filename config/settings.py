@@ -8,6 +8,10 @@ import os
 from typing import Dict, Any
 
 
+# Версия приложения (записывается в метаданные создаваемых проектов)
+APP_VERSION = '0.3'
+
+
 class SettingsManager:
     """Класс для управления настройками приложения"""
     
@@ -15,7 +19,12 @@ class SettingsManager:
         'default_path': os.path.expanduser('~/Work'),  # Исправлен путь
         'language': 'ru',
         'window_geometry': None,
-        'last_project_path': None
+        'last_project_path': None,
+        'use_skeleton_archive': False,
+        'templates_source': '',
+        'verify_templates': False,
+        'watch_projects': False,
+        'watch_paths': []
     }
     
     def __init__(self, settings_file: str = "project_creator_settings.json"):
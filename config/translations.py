@@ -17,6 +17,7 @@ class Translations:
         'project_folder_placeholder': 'Выберите папку для проектов...',
         'browse': '📂 Обзор',
         'dev_tools': '🛠️ Инструменты разработки',
+        'variant_filter_placeholder': 'Фильтр вариантов шаблонов (название, клиент, тег)...',
         'project_structure': '📂 Структура проекта',
         'create_project': '🗃️ Создать проект',
         'reset': '🔄 Сбросить',
@@ -25,6 +26,9 @@ class Translations:
         'ready': 'Готов к созданию проектов',
         'ready_to_create': 'Готов к созданию проекта',
         'fill_fields': 'Заполните все поля корректно',
+        'path_checking': '⏳ Проверка папки проектов…',
+        'path_not_writable': 'Нет прав на запись в папку проектов',
+        'path_low_space': 'Готов к созданию проекта · мало места на диске: {}',
         'select_tool_warning': 'Выберите хотя бы один инструмент разработки!',
         'creating': '⏳ Создание...',
         'success': 'Успех!',
@@ -33,6 +37,8 @@ class Translations:
         'folders_created': 'Создано папок',
         'files_created': 'Создано файлов',
         'tools': 'Инструменты',
+        'io_retries': 'Повторов операций ввода-вывода',
+        'failed_files': 'Не удалось скопировать шаблоны',
         'project_ready': 'Проект готов к работе!',
         'ok': '✅ OK',
         'error': 'Ошибка',
@@ -42,6 +48,81 @@ class Translations:
         'settings_title': '⚙️ Настройки',
         'default_folder': 'Папка по умолчанию:',
         'language': 'Язык:',
+        'use_skeleton_archive': 'Быстрое создание из архива-заготовки (для сетевых дисков)',
+        'verify_templates': 'Проверять скопированные шаблоны по контрольной сумме',
+        'watch_projects': 'Следить за папкой проектов и обновлять индекс автоматически',
+        'verification_failures': 'Не прошли проверку контрольной суммы',
+        'templates_source': 'Папка шаблонов (сетевая, пусто - встроенные):',
+        'templates_source_placeholder': 'Например, \\\\server\\templates',
+        'tools_menu': '🧰 Утилиты',
+        'ingest_footage': '📥 Загрузить материал...',
+        'ingest_title': '📥 Загрузка материала в 01_IN/FOOTAGES',
+        'ingest_source': 'Источник (карта камеры, папка клиента):',
+        'ingest_project': 'Папка проекта:',
+        'ingest_backups': 'Дополнительные копии (резервные диски):',
+        'ingest_verify': 'Проверять копии по контрольной сумме',
+        'ingest_start': '▶️ Начать загрузку',
+        'ingest_progress': 'Файлов: {}/{} · {:.1f} МБ/с · осталось {}',
+        'ingest_done': 'Загрузка завершена: скопировано {}, пропущено {}, ошибок {}',
+        'ingest_failed': 'Не удалось загрузить',
+        'build_manifests': '🧾 Манифесты контрольных сумм...',
+        'manifests_progress': 'Хеширование файлов проекта: {}%',
+        'manifests_done': 'Манифесты контрольных сумм обновлены',
+        'manifests_problems': 'Обнаружены несовпадения или отсутствующие файлы',
+        'render_check': '🎞️ Проверка рендеров...',
+        'render_check_title': '🎞️ Проверка рендеров 03_RENDER',
+        'render_check_columns': ['Секвенция', 'Кадры', 'Пропущены', 'Пустые', 'Усеченные', 'Статус'],
+        'render_check_force': 'Пересканировать все папки',
+        'render_check_run': '🔍 Проверить',
+        'render_check_running': 'Проверка...',
+        'render_check_summary': 'Секвенций: {}, с проблемами: {} · папок просканировано: {}, из кэша: {}',
+        'project_sizes': '📊 Размеры проектов...',
+        'size_title': '📊 Размеры проектов',
+        'size_columns': ['Папка', 'Размер', 'Файлов', 'Изменено'],
+        'size_scan': '🔍 Подсчитать',
+        'size_export': '💾 Экспорт JSON',
+        'size_progress': 'Обработано папок: {}',
+        'size_summary': 'Всего: {} · файлов: {} · папок: {}',
+        'archive_project': '📦 Архивировать проект...',
+        'archive_filter': 'Архивы (*.tar.zst *.tar.gz *.tar)',
+        'archive_progress': 'Архивация: {}% · {}/с',
+        'archive_verify_progress': 'Проверка архива: {}% · {}/с',
+        'archive_done': 'Архив создан и проверен',
+        'archive_verify_failed': 'Архив создан, но проверка обнаружила расхождения',
+        'restore_project': '📂 Восстановить из архива...',
+        'restore_title': 'Восстановление проекта из архива',
+        'restore_archive': 'Архив:',
+        'restore_destination': 'Папка, в которую будет восстановлен проект:',
+        'restore_folders': 'Папки для восстановления (если ничего не отмечено - весь проект):',
+        'restore_no_index': 'Индекс архива не найден - он будет построен при первом восстановлении',
+        'restore_start': 'Восстановить',
+        'restore_progress': 'Восстановлено {} · {}/с',
+        'restore_done': 'Восстановлено участников: {} · {} за {:.1f} с ({}/с)',
+        'restore_problems': 'Часть файлов восстановлена с ошибками или не прошла проверку',
+        'search_placeholder': '🔍 Поиск проектов по названию, пути или инструменту...',
+        'search_no_results': 'Ничего не найдено',
+        'import_projects': '🗂️ Импортировать проекты в индекс...',
+        'import_progress': 'Импорт проектов: просканировано папок {}',
+        'import_done': 'Проектов в индексе: {} · удалено отсутствующих: {}',
+        'browse_projects': '🗂 Обзор проектов',
+        'browser_title': 'Проекты',
+        'browser_refresh': '🔄 Обновить',
+        'browser_columns': ['Проект', 'Инструменты', 'Размер', 'Изменен', 'Структура'],
+        'browser_structure': {'current': 'актуальная', 'outdated': 'отклонения', 'unknown': '—'},
+        'browser_loading': 'Загрузка проектов: {}…',
+        'browser_done': 'Проектов: {}',
+        'browser_open_selected': '📂 Открыть выбранные',
+        'open_many_confirm': 'Открыть папки выбранных проектов ({})?',
+        'open_folder_failed': 'Не удалось открыть папки:',
+        'open_folder_timeout': 'папка не ответила за {:.0f} с (сетевой диск недоступен?)',
+        'audit_structure': '🩺 Проверить структуру проектов',
+        'audit_progress': 'Проверка структуры: {} проектов…',
+        'audit_done': 'Проверено проектов: {} · соответствуют: {} · с отклонениями: {}',
+        'audit_save_report': 'Сохранить отчет',
+        'audit_report_filter': 'Отчет проверки (*.json)',
+        'add': '➕ Добавить',
+        'remove': '➖ Удалить',
+        'close': 'Закрыть',
         'save': 'Сохранить',
         'cancel': 'Отмена',
         'folder_not_exists': 'Папка не существует!',
@@ -74,6 +155,7 @@ class Translations:
         'project_folder_placeholder': 'Select projects folder...',
         'browse': '📂 Browse',
         'dev_tools': '🛠️ Development Tools',
+        'variant_filter_placeholder': 'Filter template variants (name, client, tag)...',
         'project_structure': '📦 Project Structure',
         'create_project': '🗃️ Create Project',
         'reset': '🔄 Reset',
@@ -82,6 +164,9 @@ class Translations:
         'ready': 'Ready to create projects',
         'ready_to_create': 'Ready to create project',
         'fill_fields': 'Fill all fields correctly',
+        'path_checking': '⏳ Checking projects folder…',
+        'path_not_writable': 'No write permission for the projects folder',
+        'path_low_space': 'Ready to create project · low disk space: {}',
         'select_tool_warning': 'Select at least one development tool!',
         'creating': '⏳ Creating...',
         'success': 'Success!',
@@ -90,6 +175,8 @@ class Translations:
         'folders_created': 'Folders created',
         'files_created': 'Files created',
         'tools': 'Tools',
+        'io_retries': 'I/O operations retried',
+        'failed_files': 'Failed to copy templates',
         'project_ready': 'Project is ready to work!',
         'ok': '✅ OK',
         'error': 'Error',
@@ -99,6 +186,81 @@ class Translations:
         'settings_title': '⚙️ Settings',
         'default_folder': 'Default folder:',
         'language': 'Language:',
+        'use_skeleton_archive': 'Fast creation from a skeleton archive (for network shares)',
+        'verify_templates': 'Verify copied templates by checksum',
+        'watch_projects': 'Watch the projects folder and update the index automatically',
+        'verification_failures': 'Failed checksum verification',
+        'templates_source': 'Templates folder (network share, empty - built-in):',
+        'templates_source_placeholder': 'For example, \\\\server\\templates',
+        'tools_menu': '🧰 Utilities',
+        'ingest_footage': '📥 Ingest footage...',
+        'ingest_title': '📥 Ingest footage into 01_IN/FOOTAGES',
+        'ingest_source': 'Source (camera card, client drop):',
+        'ingest_project': 'Project folder:',
+        'ingest_backups': 'Additional copies (backup drives):',
+        'ingest_verify': 'Verify copies by checksum',
+        'ingest_start': '▶️ Start ingest',
+        'ingest_progress': 'Files: {}/{} · {:.1f} MB/s · {} left',
+        'ingest_done': 'Ingest finished: {} copied, {} skipped, {} failed',
+        'ingest_failed': 'Failed to ingest',
+        'build_manifests': '🧾 Checksum manifests...',
+        'manifests_progress': 'Hashing project files: {}%',
+        'manifests_done': 'Checksum manifests updated',
+        'manifests_problems': 'Mismatched or missing files found',
+        'render_check': '🎞️ Render check...',
+        'render_check_title': '🎞️ Render check for 03_RENDER',
+        'render_check_columns': ['Sequence', 'Frames', 'Missing', 'Empty', 'Truncated', 'Status'],
+        'render_check_force': 'Rescan all folders',
+        'render_check_run': '🔍 Check',
+        'render_check_running': 'Checking...',
+        'render_check_summary': 'Sequences: {}, with problems: {} · folders scanned: {}, from cache: {}',
+        'project_sizes': '📊 Project sizes...',
+        'size_title': '📊 Project sizes',
+        'size_columns': ['Folder', 'Size', 'Files', 'Modified'],
+        'size_scan': '🔍 Scan',
+        'size_export': '💾 Export JSON',
+        'size_progress': 'Folders processed: {}',
+        'size_summary': 'Total: {} · files: {} · folders: {}',
+        'archive_project': '📦 Archive project...',
+        'archive_filter': 'Archives (*.tar.zst *.tar.gz *.tar)',
+        'archive_progress': 'Archiving: {}% · {}/s',
+        'archive_verify_progress': 'Verifying archive: {}% · {}/s',
+        'archive_done': 'Archive created and verified',
+        'archive_verify_failed': 'Archive created, but verification found mismatches',
+        'restore_project': '📂 Restore from archive...',
+        'restore_title': 'Restore project from archive',
+        'restore_archive': 'Archive:',
+        'restore_destination': 'Folder to restore the project into:',
+        'restore_folders': 'Folders to restore (nothing checked restores the whole project):',
+        'restore_no_index': 'Archive index not found - it will be built during the first restore',
+        'restore_start': 'Restore',
+        'restore_progress': 'Restored {} · {}/s',
+        'restore_done': 'Members restored: {} · {} in {:.1f} s ({}/s)',
+        'restore_problems': 'Some files failed to restore or did not pass verification',
+        'search_placeholder': '🔍 Search projects by name, path or tool...',
+        'search_no_results': 'Nothing found',
+        'import_projects': '🗂️ Import projects into index...',
+        'import_progress': 'Importing projects: {} folders scanned',
+        'import_done': 'Projects indexed: {} · missing removed: {}',
+        'browse_projects': '🗂 Browse projects',
+        'browser_title': 'Projects',
+        'browser_refresh': '🔄 Refresh',
+        'browser_columns': ['Project', 'Tools', 'Size', 'Modified', 'Structure'],
+        'browser_structure': {'current': 'current', 'outdated': 'deviates', 'unknown': '—'},
+        'browser_loading': 'Loading projects: {}…',
+        'browser_done': 'Projects: {}',
+        'browser_open_selected': '📂 Open selected',
+        'open_many_confirm': 'Open the folders of the selected projects ({})?',
+        'open_folder_failed': 'Could not open folders:',
+        'open_folder_timeout': 'folder did not respond within {:.0f} s (network drive unavailable?)',
+        'audit_structure': '🩺 Check project structure',
+        'audit_progress': 'Checking structure: {} projects…',
+        'audit_done': 'Projects checked: {} · compliant: {} · deviating: {}',
+        'audit_save_report': 'Save report',
+        'audit_report_filter': 'Audit report (*.json)',
+        'add': '➕ Add',
+        'remove': '➖ Remove',
+        'close': 'Close',
         'save': 'Save',
         'cancel': 'Cancel',
         'folder_not_exists': 'Folder does not exist!',
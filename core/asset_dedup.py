@@ -0,0 +1,414 @@
+"""
+Дедупликация ассетов между проектами
+Находит одинаковые файлы в папках ассетов всех проектов (размер, затем
+хеш начала и конца, затем полный хеш) и заменяет копии reflink-клонами
+или, по выбору пользователя, жесткими ссылками
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.file_hashing import DEFAULT_ALGORITHM, hash_bytes, hash_file
+from core.ingest import is_ignored_file
+from utils.platform_utils import clone_file
+from utils.resource_manager import get_app_data_path
+
+
+# Папки проектов, в которых ищутся дубликаты (относительно папки проекта)
+DEDUP_FOLDERS = ['01_IN/ASSETS', '01_IN/FONTS', '01_IN/SFX']
+
+# Файлы меньше этого размера не стоят замены
+DEDUP_MIN_SIZE = 64 * 1024
+
+# Размер начала и конца файла для частичного хеша
+PARTIAL_HASH_SIZE = 64 * 1024
+
+DEFAULT_HASH_WORKERS = 8
+
+MODE_REFLINK = 'reflink'
+MODE_HARDLINK = 'hardlink'
+
+# Минимальный интервал между уведомлениями о прогрессе
+PROGRESS_INTERVAL = 0.2
+
+INDEX_FORMAT_VERSION = 1
+
+
+def partial_hash(path: str, size: int, algorithm: Optional[str] = None) -> str:
+    """
+    Хеширует начало и конец файла
+    
+    Args:
+        path: Путь к файлу
+        size: Размер файла
+        algorithm: Алгоритм хеширования
+    
+    Returns:
+        Шестнадцатеричный хеш
+    """
+    with open(path, 'rb') as f:
+        data = f.read(PARTIAL_HASH_SIZE)
+        if size > 2 * PARTIAL_HASH_SIZE:
+            f.seek(size - PARTIAL_HASH_SIZE)
+            data += f.read(PARTIAL_HASH_SIZE)
+        elif size > PARTIAL_HASH_SIZE:
+            data += f.read()
+    return hash_bytes(data, algorithm)
+
+
+class DedupIndex:
+    """Постоянный индекс хешей: повторный запуск хеширует только новые и измененные файлы"""
+    
+    def __init__(self, root: str, index_path: Optional[str] = None, algorithm: str = DEFAULT_ALGORITHM):
+        """
+        Инициализация индекса
+        
+        Args:
+            root: Базовая папка проектов
+            index_path: Файл индекса (по умолчанию в папке данных приложения)
+            algorithm: Алгоритм хеширования
+        """
+        self.root = os.path.abspath(root)
+        if index_path is None:
+            key = hashlib.sha1(self.root.encode('utf-8')).hexdigest()[:16]
+            index_path = os.path.join(get_app_data_path(), 'dedup', f"{key}.json")
+        self.index_path = index_path
+        self.algorithm = algorithm
+        self._lock = threading.Lock()
+        # путь -> [размер, mtime_ns, inode, частичный хеш, полный хеш, заменен клоном]
+        self.files: Dict[str, List[Any]] = self._load()
+    
+    def _load(self) -> Dict[str, List[Any]]:
+        """Загружает индекс"""
+        try:
+            if os.path.exists(self.index_path):
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if (data.get('version') == INDEX_FORMAT_VERSION and data.get('root') == self.root
+                        and data.get('algorithm') == self.algorithm):
+                    return data['files']
+        except (json.JSONDecodeError, KeyError, TypeError, IOError) as e:
+            print(f"Ошибка загрузки индекса дубликатов: {e}")
+        return {}
+    
+    def save(self) -> None:
+        """Сохраняет индекс"""
+        try:
+            directory = os.path.dirname(self.index_path)
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix='.dedup_', dir=directory)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                with self._lock:
+                    json.dump({
+                        'version': INDEX_FORMAT_VERSION,
+                        'root': self.root,
+                        'algorithm': self.algorithm,
+                        'files': self.files
+                    }, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            print(f"Ошибка сохранения индекса дубликатов: {e}")
+    
+    def lookup(self, path: str, stat: os.stat_result) -> List[Any]:
+        """
+        Возвращает запись файла, сбрасывая хеши, если файл изменился
+        
+        Args:
+            path: Путь к файлу
+            stat: Текущий stat файла
+        
+        Returns:
+            Запись индекса
+        """
+        with self._lock:
+            entry = self.files.get(path)
+            if entry is None or entry[:3] != [stat.st_size, stat.st_mtime_ns, stat.st_ino]:
+                entry = [stat.st_size, stat.st_mtime_ns, stat.st_ino, None, None, False]
+                self.files[path] = entry
+            return entry
+    
+    def prune(self, paths: set) -> None:
+        """Удаляет записи файлов, которых больше нет"""
+        with self._lock:
+            for path in set(self.files) - paths:
+                del self.files[path]
+
+
+class AssetDeduplicator:
+    """Поиск и замена одинаковых файлов в папках ассетов проектов"""
+    
+    def __init__(self, base_path: str, folders: Optional[List[str]] = DEDUP_FOLDERS,
+                 mode: str = MODE_REFLINK, min_size: int = DEDUP_MIN_SIZE,
+                 workers: int = DEFAULT_HASH_WORKERS, index_path: Optional[str] = None,
+                 progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 cancel_event: Optional[threading.Event] = None):
+        """
+        Инициализация дедупликации
+        
+        Args:
+            base_path: Базовая папка проектов
+            folders: Папки внутри каждого проекта (None - вся базовая папка)
+            mode: MODE_REFLINK или MODE_HARDLINK
+            min_size: Минимальный размер файла
+            workers: Количество потоков хеширования
+            index_path: Файл постоянного индекса
+            progress_callback: Функция, получающая словарь прогресса
+            cancel_event: Событие отмены
+        """
+        if mode not in (MODE_REFLINK, MODE_HARDLINK):
+            raise ValueError(f"Неизвестный режим дедупликации: {mode}")
+        self.base_path = os.path.abspath(base_path)
+        self.folders = folders
+        self.mode = mode
+        self.min_size = min_size
+        self.workers = workers
+        self.index = DedupIndex(self.base_path, index_path)
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event or threading.Event()
+        self.hashed_partial = 0
+        self.hashed_full = 0
+        self.errors: Dict[str, str] = {}
+        self._last_report = 0.0
+    
+    def get_roots(self) -> List[str]:
+        """
+        Возвращает папки для поиска дубликатов
+        
+        Returns:
+            Список существующих папок ассетов всех проектов
+        """
+        if self.folders is None:
+            return [self.base_path]
+        roots = []
+        with os.scandir(self.base_path) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                for folder in self.folders:
+                    path = os.path.join(entry.path, folder)
+                    if os.path.isdir(path):
+                        roots.append(path)
+        return roots
+    
+    def scan(self) -> Dict[str, os.stat_result]:
+        """
+        Собирает файлы не меньше min_size
+        
+        Returns:
+            Словарь: абсолютный путь -> stat файла
+        """
+        files = {}
+        stack = self.get_roots()
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if is_ignored_file(entry.name):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            stat = entry.stat(follow_symlinks=False)
+                            if stat.st_size >= self.min_size:
+                                files[entry.path] = stat
+            except OSError as e:
+                self.errors[directory] = str(e)
+        return files
+    
+    def _hash_all(self, paths: List[str], stats: Dict[str, os.stat_result], full: bool) -> None:
+        """Дохеширует в пуле потоков файлы без хеша в индексе"""
+        slot = 4 if full else 3
+        todo = [path for path in paths if self.index.lookup(path, stats[path])[slot] is None]
+        phase = 'full' if full else 'partial'
+        
+        def work(path: str) -> None:
+            if self.cancel_event.is_set():
+                return
+            try:
+                if full:
+                    digest = hash_file(path, self.index.algorithm)
+                else:
+                    digest = partial_hash(path, stats[path].st_size, self.index.algorithm)
+                self.index.lookup(path, stats[path])[slot] = digest
+            except OSError as e:
+                self.errors[path] = str(e)
+        
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='Dedup') as pool:
+            for done, _ in enumerate(pool.map(work, todo), 1):
+                self._report(phase, done, len(todo))
+        if self.cancel_event.is_set():
+            raise InterruptedError("Поиск дубликатов отменен")
+        if full:
+            self.hashed_full += len(todo)
+        else:
+            self.hashed_partial += len(todo)
+    
+    @staticmethod
+    def _group(paths: List[str], key: Callable[[str], Any]) -> Dict[Any, List[str]]:
+        groups: Dict[Any, List[str]] = {}
+        for path in paths:
+            groups.setdefault(key(path), []).append(path)
+        return groups
+    
+    def find_duplicates(self, files: Dict[str, os.stat_result]) -> List[Dict[str, Any]]:
+        """
+        Находит группы одинаковых файлов
+        
+        Файлы с общим inode уже связаны жесткой ссылкой и хешируются
+        один раз; сравнение идет только в пределах одного устройства
+        
+        Args:
+            files: Результат scan()
+        
+        Returns:
+            Список групп {'size', 'hash', 'keeper', 'duplicates', 'reclaimable'}
+        """
+        # Один представитель на каждый inode
+        by_inode = self._group(list(files), lambda p: (files[p].st_dev, files[p].st_ino))
+        representatives = {paths[0]: paths for paths in by_inode.values()}
+        
+        by_size = self._group(list(representatives), lambda p: (files[p].st_dev, files[p].st_size))
+        candidates = [p for paths in by_size.values() if len(paths) > 1 for p in paths]
+        self._hash_all(candidates, files, full=False)
+        
+        by_partial = self._group(
+            [p for p in candidates if self.index.files[p][3] is not None],
+            lambda p: (files[p].st_dev, files[p].st_size, self.index.files[p][3]))
+        candidates = [p for paths in by_partial.values() if len(paths) > 1 for p in paths]
+        self._hash_all(candidates, files, full=True)
+        
+        by_full = self._group(
+            [p for p in candidates if self.index.files[p][4] is not None],
+            lambda p: (files[p].st_dev, files[p].st_size, self.index.files[p][4]))
+        
+        groups = []
+        for (_, size, digest), paths in by_full.items():
+            if len(paths) < 2:
+                continue
+            # Оригиналом остается самая старая копия
+            paths.sort(key=lambda p: (files[p].st_mtime_ns, p))
+            keeper = paths[0]
+            duplicates = [linked for path in paths[1:] for linked in representatives[path]]
+            pending = [path for path in paths[1:] if not self.index.files[path][5]]
+            groups.append({
+                'size': size,
+                'hash': digest,
+                'keeper': keeper,
+                'duplicates': sorted(duplicates),
+                'reclaimable': size * len(pending)
+            })
+        groups.sort(key=lambda group: group['reclaimable'], reverse=True)
+        return groups
+    
+    def _replace(self, keeper: str, duplicate: str) -> None:
+        """Заменяет дубликат клоном или жесткой ссылкой на оригинал"""
+        directory, name = os.path.split(duplicate)
+        temp_path = os.path.join(directory, f".{name}.dedup")
+        try:
+            if self.mode == MODE_HARDLINK:
+                os.link(keeper, temp_path)
+            else:
+                clone_file(keeper, temp_path)
+                # У клона остаются права и время дубликата
+                shutil.copystat(duplicate, temp_path)
+            os.replace(temp_path, duplicate)
+        except OSError:
+            if os.path.lexists(temp_path):
+                os.remove(temp_path)
+            raise
+    
+    def apply(self, groups: List[Dict[str, Any]], files: Dict[str, os.stat_result]) -> Tuple[int, int]:
+        """
+        Заменяет дубликаты
+        
+        Args:
+            groups: Результат find_duplicates()
+            files: Результат scan()
+        
+        Returns:
+            Кортеж (заменено файлов, освобождено байт)
+        """
+        replaced = reclaimed = 0
+        for group in groups:
+            keeper_ino = files[group['keeper']].st_ino
+            for path in group['duplicates']:
+                if self.cancel_event.is_set():
+                    raise InterruptedError("Дедупликация отменена")
+                entry = self.index.files.get(path)
+                if entry is not None and entry[5]:
+                    continue
+                try:
+                    # Файл мог измениться после хеширования
+                    stat = os.stat(path, follow_symlinks=False)
+                    if (stat.st_size, stat.st_mtime_ns) != (files[path].st_size, files[path].st_mtime_ns):
+                        self.errors[path] = "Файл изменился после хеширования"
+                        continue
+                    last_link = stat.st_nlink == 1
+                    self._replace(group['keeper'], path)
+                except OSError as e:
+                    self.errors[path] = str(e)
+                    continue
+                
+                replaced += 1
+                if last_link:
+                    reclaimed += group['size']
+                new_stat = os.stat(path, follow_symlinks=False)
+                self.index.files[path] = [new_stat.st_size, new_stat.st_mtime_ns, new_stat.st_ino,
+                                          self.index.files[group['keeper']][3],
+                                          group['hash'], self.mode == MODE_REFLINK]
+                if self.mode == MODE_HARDLINK and new_stat.st_ino != keeper_ino:
+                    self.errors[path] = "Жесткая ссылка указывает на другой inode"
+        return replaced, reclaimed
+    
+    def run(self, dry_run: bool = True) -> Dict[str, Any]:
+        """
+        Ищет дубликаты и, если это не пробный запуск, заменяет их
+        
+        Args:
+            dry_run: Только отчет без изменений на диске
+        
+        Returns:
+            Словарь с группами дубликатов и итогами
+        """
+        started = time.monotonic()
+        files = self.scan()
+        self.index.prune(set(files))
+        try:
+            groups = self.find_duplicates(files)
+            replaced = reclaimed = 0
+            if not dry_run:
+                replaced, reclaimed = self.apply(groups, files)
+        finally:
+            self.index.save()
+        
+        return {
+            'mode': self.mode,
+            'dry_run': dry_run,
+            'files': len(files),
+            'hashed_partial': self.hashed_partial,
+            'hashed_full': self.hashed_full,
+            'groups': groups,
+            'reclaimable': sum(group['reclaimable'] for group in groups),
+            'replaced': replaced,
+            'reclaimed': reclaimed,
+            'errors': self.errors,
+            'elapsed': time.monotonic() - started
+        }
+    
+    def _report(self, phase: str, done: int, total: int) -> None:
+        """Передает прогресс не чаще PROGRESS_INTERVAL"""
+        if self.progress_callback is None:
+            return
+        now = time.monotonic()
+        if now - self._last_report < PROGRESS_INTERVAL and done != total:
+            return
+        self._last_report = now
+        self.progress_callback({'phase': phase, 'done': done, 'total': total})
@@ -0,0 +1,384 @@
+"""
+Манифесты контрольных сумм (в формате MHL)
+Хеширует содержимое папок проекта в пуле потоков и повторно
+проверяет только изменившиеся с прошлого манифеста файлы
+"""
+
+import glob
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.file_hashing import hash_file, xxhash
+from core.ingest import is_ignored_file
+
+
+# Папки проекта, для которых по умолчанию строятся манифесты
+MANIFEST_FOLDERS = ['01_IN', os.path.join('04_OUT', '04_MASTER')]
+
+MANIFEST_EXTENSION = '.mhl'
+
+# Имена элементов хеша в MHL для поддерживаемых алгоритмов
+MHL_HASH_TAGS = {
+    'xxh64': 'xxhash64be',
+    'md5': 'md5',
+    'sha1': 'sha1'
+}
+
+# xxHash64 - стандарт для MHL, MD5 - запасной вариант без модуля xxhash
+DEFAULT_MANIFEST_ALGORITHM = 'xxh64' if xxhash is not None else 'md5'
+
+# Мелкие файлы (кадры секвенций) хешируются пачками, чтобы не создавать
+# задачу пула на каждый из сотен тысяч файлов
+BATCH_MAX_FILES = 64
+BATCH_MAX_BYTES = 64 * 1024 * 1024
+
+# Статусы файлов при проверке
+STATUS_NEW = 'new'
+STATUS_CHANGED = 'changed'
+STATUS_UNCHANGED = 'unchanged'
+STATUS_VERIFIED = 'verified'
+STATUS_MISMATCH = 'mismatch'
+STATUS_MISSING = 'missing'
+STATUS_ERROR = 'error'
+
+
+def scan_files(root: str) -> Dict[str, os.stat_result]:
+    """
+    Собирает файлы папки (кроме манифестов и служебных файлов) через os.scandir
+    
+    Args:
+        root: Папка для обхода
+    
+    Returns:
+        Словарь: относительный путь с разделителем '/' -> stat файла
+    """
+    files = {}
+    stack = ['']
+    while stack:
+        rel_dir = stack.pop()
+        with os.scandir(os.path.join(root, rel_dir) if rel_dir else root) as entries:
+            for entry in entries:
+                if is_ignored_file(entry.name):
+                    continue
+                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(rel_path)
+                elif entry.is_file(follow_symlinks=False) and not entry.name.endswith(MANIFEST_EXTENSION):
+                    files[rel_path] = entry.stat(follow_symlinks=False)
+    return files
+
+
+def find_latest_manifest(root: str) -> Optional[str]:
+    """
+    Ищет последний манифест в корне папки
+    
+    Args:
+        root: Папка
+    
+    Returns:
+        Путь к самому новому манифесту или None
+    """
+    manifests = glob.glob(os.path.join(glob.escape(root), '*' + MANIFEST_EXTENSION))
+    return max(manifests, key=os.path.getmtime) if manifests else None
+
+
+def _format_mtime(mtime: float) -> str:
+    return datetime.fromtimestamp(int(mtime), timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def _parse_mtime(text: str) -> int:
+    return int(datetime.strptime(text, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc).timestamp())
+
+
+def read_manifest(path: str) -> Tuple[str, Dict[str, Dict[str, Any]]]:
+    """
+    Читает манифест потоково
+    
+    Args:
+        path: Путь к файлу манифеста
+    
+    Returns:
+        Кортеж (алгоритм, словарь: путь -> {'size', 'mtime', 'digest'})
+    """
+    tags_to_algorithm = {tag: algorithm for algorithm, tag in MHL_HASH_TAGS.items()}
+    algorithm = None
+    entries = {}
+    for _, element in ET.iterparse(path):
+        if element.tag != 'hash':
+            continue
+        entry = {'size': None, 'mtime': None, 'digest': None}
+        name = None
+        for child in element:
+            if child.tag == 'file':
+                name = child.text
+            elif child.tag == 'size':
+                entry['size'] = int(child.text)
+            elif child.tag == 'lastmodificationdate':
+                entry['mtime'] = _parse_mtime(child.text)
+            elif child.tag in tags_to_algorithm:
+                algorithm = tags_to_algorithm[child.tag]
+                entry['digest'] = child.text
+        if name is not None:
+            entries[name] = entry
+        element.clear()
+    return algorithm or DEFAULT_MANIFEST_ALGORITHM, entries
+
+
+def write_manifest(path: str, root: str, algorithm: str, entries: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Записывает манифест в формате MHL 1.1
+    
+    Args:
+        path: Путь к файлу манифеста
+        root: Папка, которой соответствует манифест
+        algorithm: Алгоритм хеширования
+        entries: Словарь: путь -> {'size', 'mtime', 'digest'}
+    """
+    tag = MHL_HASH_TAGS[algorithm]
+    now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<hashlist version="1.1">\n')
+        f.write(f'  <creatorinfo>\n    <name>Motion Design Project Creator</name>\n'
+                f'    <startdate>{now}</startdate>\n    <finishdate>{now}</finishdate>\n'
+                f'    <comment>{escape(os.path.basename(os.path.normpath(root)))}</comment>\n'
+                f'  </creatorinfo>\n')
+        for name in sorted(entries):
+            entry = entries[name]
+            f.write(f'  <hash>\n    <file>{escape(name)}</file>\n    <size>{entry["size"]}</size>\n'
+                    f'    <lastmodificationdate>{_format_mtime(entry["mtime"])}</lastmodificationdate>\n'
+                    f'    <{tag}>{entry["digest"]}</{tag}>\n'
+                    f'    <hashdate>{now}</hashdate>\n  </hash>\n')
+        f.write('</hashlist>\n')
+    os.replace(temp_path, path)
+
+
+def _make_batches(names: List[str], files: Dict[str, os.stat_result]) -> List[List[str]]:
+    """Группирует файлы в пачки по количеству и суммарному размеру"""
+    batches = []
+    batch = []
+    batch_bytes = 0
+    for name in names:
+        size = files[name].st_size
+        if batch and (len(batch) >= BATCH_MAX_FILES or batch_bytes + size > BATCH_MAX_BYTES):
+            batches.append(batch)
+            batch = []
+            batch_bytes = 0
+        batch.append(name)
+        batch_bytes += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class ManifestBuilder:
+    """Построение и инкрементальная проверка манифеста папки"""
+    
+    def __init__(self, root: str, algorithm: Optional[str] = None, workers: Optional[int] = None,
+                 progress_callback: Optional[Callable[[int, int], None]] = None,
+                 cancel_event: Optional[threading.Event] = None):
+        """
+        Инициализация построителя
+        
+        Args:
+            root: Папка, для которой строится манифест
+            algorithm: Алгоритм хеширования ('xxh64', 'md5', 'sha1')
+            workers: Количество потоков хеширования
+            progress_callback: Функция (обработано байт, всего байт)
+            cancel_event: Событие отмены
+        """
+        self.root = os.path.abspath(root)
+        self.algorithm = algorithm
+        self.workers = workers or min(8, (os.cpu_count() or 2) * 2)
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event or threading.Event()
+        self._lock = threading.Lock()
+        self._bytes_done = 0
+        self._bytes_total = 0
+    
+    def run(self, full_verify: bool = False, write: bool = True) -> Dict[str, Any]:
+        """
+        Строит манифест, используя предыдущий для неизменившихся файлов
+        
+        Args:
+            full_verify: Перехешировать все файлы и сверить с предыдущим манифестом
+            write: Записать новый манифест
+        
+        Returns:
+            Словарь с итогами: пути манифестов, счетчики и списки по статусам
+        """
+        started = time.monotonic()
+        files = scan_files(self.root)
+        
+        previous_path = find_latest_manifest(self.root)
+        previous = {}
+        algorithm = self.algorithm or DEFAULT_MANIFEST_ALGORITHM
+        if previous_path is not None:
+            previous_algorithm, previous = read_manifest(previous_path)
+            # Хеши предыдущего манифеста переиспользуются только при том же алгоритме
+            if self.algorithm is None:
+                algorithm = previous_algorithm
+            if previous_algorithm != algorithm:
+                previous = {}
+        
+        statuses = {}
+        entries = {}
+        to_hash = []
+        for name, stat in files.items():
+            old = previous.get(name)
+            if old is None:
+                statuses[name] = STATUS_NEW
+                to_hash.append(name)
+            elif old['size'] != stat.st_size or old['mtime'] != int(stat.st_mtime):
+                statuses[name] = STATUS_CHANGED
+                to_hash.append(name)
+            elif full_verify:
+                to_hash.append(name)
+            else:
+                statuses[name] = STATUS_UNCHANGED
+                entries[name] = old
+        
+        # Временно недоступные файлы (например, на отключенном томе) сохраняют
+        # эталонный хеш, чтобы при появлении их можно было сверить
+        missing = sorted(set(previous) - set(files))
+        for name in missing:
+            entries[name] = previous[name]
+        errors = {}
+        
+        # Сортировка по пути сохраняет последовательное чтение кадров секвенций
+        to_hash.sort()
+        self._bytes_total = sum(files[name].st_size for name in to_hash)
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='ManifestHash') as pool:
+            for results in pool.map(lambda batch: self._hash_batch(batch, files, algorithm),
+                                    _make_batches(to_hash, files)):
+                for name, digest, error in results:
+                    if error is not None:
+                        errors[name] = error
+                        statuses[name] = STATUS_ERROR
+                        # Сбой чтения не должен стирать эталонный хеш: файл будет сверен при следующей проверке
+                        if name in previous:
+                            entries[name] = previous[name]
+                        continue
+                    stat = files[name]
+                    entries[name] = {'size': stat.st_size, 'mtime': int(stat.st_mtime), 'digest': digest}
+                    if name not in statuses:
+                        if digest == previous[name]['digest']:
+                            statuses[name] = STATUS_VERIFIED
+                        else:
+                            # Поврежденный файл сохраняет прежний хеш, чтобы не узаконить повреждение
+                            statuses[name] = STATUS_MISMATCH
+                            entries[name] = previous[name]
+        
+        if self.cancel_event.is_set():
+            raise InterruptedError("Построение манифеста отменено")
+        
+        manifest_path = None
+        if write:
+            stamp = time.strftime('%Y-%m-%d_%H%M%S')
+            folder_name = os.path.basename(self.root)
+            manifest_path = os.path.join(self.root, f"{folder_name}_{stamp}{MANIFEST_EXTENSION}")
+            write_manifest(manifest_path, self.root, algorithm, entries)
+        
+        by_status = {}
+        for name, status in statuses.items():
+            by_status.setdefault(status, []).append(name)
+        if missing:
+            by_status[STATUS_MISSING] = missing
+        
+        return {
+            'root': self.root,
+            'manifest': manifest_path,
+            'previous_manifest': previous_path,
+            'algorithm': algorithm,
+            'files': len(files),
+            'hashed': len(to_hash),
+            'bytes_hashed': self._bytes_total,
+            'counts': {status: len(names) for status, names in by_status.items()},
+            'mismatches': sorted(by_status.get(STATUS_MISMATCH, [])),
+            'missing': missing,
+            'errors': errors,
+            'elapsed': time.monotonic() - started
+        }
+    
+    def _hash_batch(self, batch: List[str], files: Dict[str, os.stat_result],
+                    algorithm: str) -> List[Tuple[str, Optional[str], Optional[str]]]:
+        """Хеширует пачку файлов в одном потоке пула"""
+        results = []
+        for name in batch:
+            if self.cancel_event.is_set():
+                break
+            try:
+                digest = hash_file(os.path.join(self.root, *name.split('/')), algorithm)
+                results.append((name, digest, None))
+            except OSError as e:
+                results.append((name, None, str(e)))
+        
+        # Прогресс сообщается один раз на пачку
+        if self.progress_callback is not None:
+            with self._lock:
+                self._bytes_done += sum(files[name].st_size for name in batch)
+                done = self._bytes_done
+            self.progress_callback(done, self._bytes_total)
+        return results
+
+
+def build_project_manifests(project_path: str, folders: Optional[List[str]] = None,
+                            full_verify: bool = False, **kwargs: Any) -> List[Dict[str, Any]]:
+    """
+    Строит манифесты для папок проекта (по умолчанию 01_IN и 04_OUT/04_MASTER)
+    
+    Args:
+        project_path: Путь к проекту
+        folders: Папки проекта относительно его корня
+        full_verify: Перехешировать все файлы
+        **kwargs: Параметры ManifestBuilder
+    
+    Returns:
+        Список итогов по каждой существующей папке
+    """
+    results = []
+    for folder in folders or MANIFEST_FOLDERS:
+        root = os.path.join(project_path, folder)
+        if os.path.isdir(root):
+            results.append(ManifestBuilder(root, **kwargs).run(full_verify=full_verify))
+    return results
+
+
+class ManifestWorker(QThread):
+    """Рабочий поток построения манифестов проекта"""
+    
+    progress_updated = pyqtSignal(int)
+    finished = pyqtSignal(list)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, project_path: str, full_verify: bool = False):
+        """
+        Инициализация рабочего потока
+        
+        Args:
+            project_path: Путь к проекту
+            full_verify: Перехешировать все файлы
+        """
+        super().__init__()
+        self.project_path = project_path
+        self.full_verify = full_verify
+    
+    def run(self) -> None:
+        """Основной метод построения манифестов"""
+        try:
+            results = build_project_manifests(
+                self.project_path, full_verify=self.full_verify,
+                progress_callback=lambda done, total: self.progress_updated.emit(
+                    int(done * 100 / total) if total else 100)
+            )
+            self.finished.emit(results)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
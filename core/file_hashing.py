@@ -0,0 +1,257 @@
+"""
+Хеширование содержимого файлов
+Быстрый хеш (xxHash, если установлен, иначе BLAKE2b) для проверки
+целостности копий и постоянное хранилище хешей исходных шаблонов
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import IO, Any, Dict, Optional
+
+from core.file_system import LocalFileSystem
+from utils.resource_manager import get_app_data_path
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Алгоритм по умолчанию: xxh3_128 заметно быстрее, BLAKE2b есть всегда
+DEFAULT_ALGORITHM = 'xxh3_128' if xxhash is not None else 'blake2b'
+
+
+def new_hasher(algorithm: Optional[str] = None) -> Any:
+    """
+    Создает объект хеширования
+    
+    Args:
+        algorithm: 'xxh3_128', 'xxh64', 'blake2b' или имя из hashlib (None - по умолчанию)
+        
+    Returns:
+        Объект с методами update() и hexdigest()
+    """
+    algorithm = algorithm or DEFAULT_ALGORITHM
+    if algorithm.startswith('xxh'):
+        if xxhash is None:
+            raise ValueError(f"Для алгоритма {algorithm} требуется модуль xxhash")
+        return getattr(xxhash, algorithm)()
+    if algorithm == 'blake2b':
+        return hashlib.blake2b(digest_size=16)
+    return hashlib.new(algorithm)
+
+
+def hash_stream(stream: IO[bytes], algorithm: Optional[str] = None) -> str:
+    """
+    Вычисляет хеш двоичного потока
+    
+    Args:
+        stream: Двоичный поток
+        algorithm: Алгоритм хеширования
+        
+    Returns:
+        Шестнадцатеричный хеш
+    """
+    hasher = new_hasher(algorithm)
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    readinto = getattr(stream, 'readinto', None)
+    
+    while True:
+        if readinto is not None:
+            count = readinto(buffer)
+            if not count:
+                break
+            hasher.update(view[:count])
+        else:
+            chunk = stream.read(HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def hash_file(path: str, algorithm: Optional[str] = None, fs: Optional[LocalFileSystem] = None) -> str:
+    """
+    Вычисляет хеш файла
+    
+    Args:
+        path: Путь к файлу
+        algorithm: Алгоритм хеширования
+        fs: Слой файловых операций
+        
+    Returns:
+        Шестнадцатеричный хеш
+    """
+    fs = fs or LocalFileSystem()
+    with fs.open(path, 'rb') as f:
+        return hash_stream(f, algorithm)
+
+
+class HashingWriter:
+    """Обертка над потоком записи, хеширующая записываемые данные на лету"""
+    
+    def __init__(self, stream: IO[bytes], algorithm: Optional[str] = None):
+        """
+        Инициализация обертки
+        
+        Args:
+            stream: Двоичный поток назначения
+            algorithm: Алгоритм хеширования
+        """
+        self._stream = stream
+        self._hasher = new_hasher(algorithm)
+        self.bytes_written = 0
+    
+    def write(self, data) -> int:
+        self._hasher.update(data)
+        self.bytes_written += len(data)
+        return self._stream.write(data)
+    
+    def flush(self) -> None:
+        self._stream.flush()
+    
+    def hexdigest(self) -> str:
+        """Возвращает хеш записанных данных"""
+        return self._hasher.hexdigest()
+
+
+def copy_file_hashed(source: str, destination: str, fs: Optional[LocalFileSystem] = None,
+                     algorithm: Optional[str] = None) -> HashingWriter:
+    """
+    Копирует файл с метаданными, вычисляя хеш за тот же проход чтения
+    
+    Args:
+        source: Исходный файл
+        destination: Файл назначения
+        fs: Слой файловых операций
+        algorithm: Алгоритм хеширования
+        
+    Returns:
+        Обертка записи с хешем и количеством записанных байт
+    """
+    fs = fs or LocalFileSystem()
+    with fs.open(source, 'rb') as src, fs.open(destination, 'wb') as dst:
+        writer = HashingWriter(dst, algorithm)
+        while True:
+            chunk = src.read(HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            writer.write(chunk)
+    fs.copy_stat(source, destination)
+    return writer
+
+
+def hash_bytes(data: bytes, algorithm: Optional[str] = None) -> str:
+    """
+    Вычисляет хеш данных в памяти
+    
+    Args:
+        data: Данные
+        algorithm: Алгоритм хеширования
+        
+    Returns:
+        Шестнадцатеричный хеш
+    """
+    hasher = new_hasher(algorithm)
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+class SourceHashStore:
+    """Постоянное хранилище хешей исходных файлов с проверкой по размеру и mtime"""
+    
+    def __init__(self, store_path: Optional[str] = None, algorithm: Optional[str] = None):
+        """
+        Инициализация хранилища
+        
+        Args:
+            store_path: Путь к JSON-файлу хранилища (по умолчанию в папке данных приложения)
+            algorithm: Алгоритм хеширования
+        """
+        self.store_path = store_path or os.path.join(get_app_data_path(), 'template_hashes.json')
+        self.algorithm = algorithm or DEFAULT_ALGORITHM
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._dirty = False
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Загружает хранилище с диска"""
+        try:
+            if os.path.exists(self.store_path):
+                with open(self.store_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Ошибка загрузки хешей шаблонов: {e}")
+        return {}
+    
+    def save(self) -> None:
+        """Сохраняет хранилище на диск, если оно изменилось"""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = dict(self._entries)
+            self._dirty = False
+        
+        try:
+            directory = os.path.dirname(self.store_path)
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix='.hashes_', dir=directory)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.store_path)
+        except OSError as e:
+            print(f"Ошибка сохранения хешей шаблонов: {e}")
+    
+    def get_hash(self, path: str, fs: Optional[LocalFileSystem] = None) -> str:
+        """
+        Возвращает хеш файла из хранилища, пересчитывая его при изменении файла
+        
+        Args:
+            path: Путь к файлу
+            fs: Слой файловых операций
+            
+        Returns:
+            Шестнадцатеричный хеш
+        """
+        fs = fs or LocalFileSystem()
+        stat = fs.stat(path)
+        key = os.path.abspath(path)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+        if (entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns
+                and entry['algorithm'] == self.algorithm):
+            return entry['digest']
+        
+        digest = hash_file(path, self.algorithm, fs)
+        with self._lock:
+            self._entries[key] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'algorithm': self.algorithm,
+                'digest': digest
+            }
+            self._dirty = True
+        return digest
+
+
+_default_store = None
+
+
+def get_source_hash_store() -> SourceHashStore:
+    """
+    Возвращает общее для приложения хранилище хешей шаблонов
+    
+    Returns:
+        Экземпляр SourceHashStore
+    """
+    global _default_store
+    if _default_store is None:
+        _default_store = SourceHashStore()
+    return _default_store
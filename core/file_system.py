@@ -0,0 +1,186 @@
+"""
+Слой файловых операций движка создания проектов
+Все обращения воркеров к файловой системе проходят через этот класс,
+что позволяет подменять его (например, имитацией сетевого хранилища)
+"""
+
+import glob
+import os
+import shutil
+from typing import IO, Any, List, Optional
+
+
+class LocalFileSystem:
+    """Файловые операции над локальной файловой системой"""
+    
+    def makedirs(self, path: str, exist_ok: bool = True) -> None:
+        """
+        Создает папку вместе с недостающими родительскими папками
+        
+        Args:
+            path: Путь к папке
+            exist_ok: Не считать ошибкой существующую папку
+        """
+        os.makedirs(path, exist_ok=exist_ok)
+    
+    def exists(self, path: str) -> bool:
+        """
+        Проверяет существование пути
+        
+        Args:
+            path: Путь для проверки
+        
+        Returns:
+            True если путь существует
+        """
+        return os.path.exists(path)
+    
+    def isdir(self, path: str) -> bool:
+        """
+        Проверяет, является ли путь папкой
+        
+        Args:
+            path: Путь для проверки
+        
+        Returns:
+            True если путь - существующая папка
+        """
+        return os.path.isdir(path)
+    
+    def glob(self, pattern: str) -> List[str]:
+        """
+        Ищет файлы по шаблону
+        
+        Args:
+            pattern: Шаблон пути (glob)
+        
+        Returns:
+            Отсортированный список найденных путей
+        """
+        return sorted(glob.glob(pattern))
+    
+    def listdir(self, path: str) -> List[str]:
+        """
+        Возвращает имена элементов папки
+        
+        Args:
+            path: Путь к папке
+        
+        Returns:
+            Список имен элементов
+        """
+        return os.listdir(path)
+    
+    def stat(self, path: str) -> os.stat_result:
+        """
+        Возвращает информацию о файле
+        
+        Args:
+            path: Путь к файлу
+        
+        Returns:
+            Результат os.stat
+        """
+        return os.stat(path)
+    
+    def open(self, path: str, mode: str = 'r', **kwargs: Any) -> IO:
+        """
+        Открывает файл
+        
+        Args:
+            path: Путь к файлу
+            mode: Режим открытия
+            **kwargs: Дополнительные аргументы для open
+        
+        Returns:
+            Файловый объект
+        """
+        return open(path, mode, **kwargs)
+    
+    def copy_file(self, source: str, destination: str) -> None:
+        """
+        Копирует файл вместе с метаданными
+        
+        Args:
+            source: Исходный файл
+            destination: Файл назначения
+        """
+        shutil.copy2(source, destination)
+    
+    def copy_stat(self, source: str, destination: str) -> None:
+        """
+        Копирует метаданные файла (права и время изменения)
+        
+        Args:
+            source: Исходный файл
+            destination: Файл назначения
+        """
+        shutil.copystat(source, destination)
+    
+    def read_bytes(self, path: str) -> bytes:
+        """
+        Читает файл целиком
+        
+        Args:
+            path: Путь к файлу
+        
+        Returns:
+            Содержимое файла
+        """
+        with self.open(path, 'rb') as f:
+            return f.read()
+    
+    def write_text(self, path: str, content: str, encoding: str = 'utf-8') -> None:
+        """
+        Записывает текст в файл
+        
+        Args:
+            path: Путь к файлу
+            content: Содержимое
+            encoding: Кодировка
+        """
+        with self.open(path, 'w', encoding=encoding) as f:
+            f.write(content)
+    
+    def write_bytes(self, path: str, data: bytes, mtime: Optional[float] = None) -> None:
+        """
+        Записывает двоичные данные в файл
+        
+        Args:
+            path: Путь к файлу
+            data: Содержимое
+            mtime: Время изменения, устанавливаемое файлу (None - текущее)
+        """
+        with self.open(path, 'wb') as f:
+            f.write(data)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+    
+    def set_mtime(self, path: str, mtime: float) -> None:
+        """
+        Устанавливает время изменения файла
+        
+        Args:
+            path: Путь к файлу
+            mtime: Время изменения
+        """
+        os.utime(path, (mtime, mtime))
+    
+    def remove(self, path: str) -> None:
+        """
+        Удаляет файл
+        
+        Args:
+            path: Путь к файлу
+        """
+        os.remove(path)
+    
+    def rename(self, source: str, destination: str) -> None:
+        """
+        Переименовывает (перемещает) файл или папку с заменой
+        
+        Args:
+            source: Исходный путь
+            destination: Новый путь
+        """
+        os.replace(source, destination)
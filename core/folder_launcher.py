@@ -0,0 +1,192 @@
+"""
+Асинхронное открытие папок в файловом менеджере
+Проверка папки и запуск xdg-open/open/explorer выполняются в фоне, поэтому
+медленный сетевой диск или долгий старт файлового менеджера не
+замораживают окно; об ошибках и зависших проверках папок сообщается сигналом
+"""
+
+import os
+import subprocess
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from utils.platform_utils import launch_file_manager
+
+
+# Сколько ждать проверки папки, прежде чем сообщить о таймауте, и завершения
+# команды открытия, прежде чем считать папку открытой
+LAUNCH_TIMEOUT = 10.0
+
+# Сколько папок открывается одновременно (остальные ждут в очереди)
+MAX_CONCURRENT_LAUNCHES = 4
+
+# Период проверки запущенных процессов
+POLL_INTERVAL_MS = 200
+
+# Коды ошибок в отчете (остальные ошибки передаются текстом)
+ERROR_TIMEOUT = 'timeout'
+ERROR_NOT_FOUND = 'not_found'
+
+
+def _start_launch(path: str) -> Optional[subprocess.Popen]:
+    """
+    Проверяет папку и запускает файловый менеджер (выполняется в фоне)
+    
+    Args:
+        path: Папка для открытия
+    
+    Returns:
+        Процесс команды открытия или None, если процесса нет (Windows)
+    
+    Raises:
+        FileNotFoundError: Папка не существует
+        OSError: Команду открытия не удалось запустить
+    """
+    if not os.path.isdir(path):
+        raise FileNotFoundError(path)
+    return launch_file_manager(path)
+
+
+class FolderLauncher(QObject):
+    """Служба открытия папок с очередью, ограничением и отчетом об ошибках"""
+    
+    # Все папки очереди обработаны: {'opened': [...], 'failed': {путь: код или текст ошибки}}
+    batch_finished = pyqtSignal(dict)
+    
+    def __init__(self, timeout: float = LAUNCH_TIMEOUT, max_concurrent: int = MAX_CONCURRENT_LAUNCHES,
+                 parent: Optional[QObject] = None):
+        """
+        Инициализация службы
+        
+        Args:
+            timeout: Время ожидания проверки папки и команды открытия в секундах
+            max_concurrent: Количество одновременно открываемых папок
+            parent: Родительский объект Qt
+        """
+        super().__init__(parent)
+        self.timeout = timeout
+        self.max_concurrent = max_concurrent
+        
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix='FolderLauncher')
+        self._queue: List[str] = []
+        # Путь -> (задача запуска, время начала)
+        self._starting: Dict[str, Tuple[Future, float]] = {}
+        # Путь -> (процесс, время начала)
+        self._running: Dict[str, Tuple[subprocess.Popen, float]] = {}
+        self._opened: List[str] = []
+        self._failed: Dict[str, str] = {}
+        
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(POLL_INTERVAL_MS)
+        self._poll_timer.timeout.connect(self._poll)
+    
+    def open(self, path: str) -> None:
+        """
+        Ставит папку в очередь на открытие
+        
+        Args:
+            path: Папка для открытия
+        """
+        self.open_many([path])
+    
+    def open_many(self, paths: Iterable[str]) -> None:
+        """
+        Ставит несколько папок в очередь; отчет приходит одним batch_finished
+        
+        Args:
+            paths: Папки для открытия
+        """
+        busy = set(self._queue) | set(self._starting) | set(self._running)
+        for path in paths:
+            path = os.path.abspath(path)
+            if path not in busy:
+                self._queue.append(path)
+                busy.add(path)
+        self._start_next()
+        if not self._poll_timer.isActive():
+            self._poll_timer.start()
+    
+    def is_busy(self) -> bool:
+        """Есть ли папки в очереди или в процессе открытия"""
+        return bool(self._queue or self._starting or self._running)
+    
+    def _start_next(self) -> None:
+        """Запускает папки из очереди в пределах ограничения"""
+        while self._queue and len(self._starting) + len(self._running) < self.max_concurrent:
+            path = self._queue.pop(0)
+            self._starting[path] = (self._executor.submit(_start_launch, path), time.monotonic())
+    
+    def _poll(self) -> None:
+        """Проверяет запуски и процессы, сообщает об ошибках и зависших проверках"""
+        now = time.monotonic()
+        
+        for path, (future, started) in list(self._starting.items()):
+            if not future.done():
+                # Проверка папки зависла (например, спящий NAS) - поток освободится сам
+                if now - started > self.timeout:
+                    del self._starting[path]
+                    self._failed[path] = ERROR_TIMEOUT
+                continue
+            del self._starting[path]
+            try:
+                process = future.result()
+            except FileNotFoundError:
+                self._failed[path] = ERROR_NOT_FOUND
+                continue
+            except OSError as e:
+                self._failed[path] = str(e)
+                continue
+            if process is None:
+                self._opened.append(path)
+            else:
+                self._running[path] = (process, started)
+        
+        for path, (process, started) in list(self._running.items()):
+            code = process.poll()
+            if code is None:
+                if now - started > self.timeout:
+                    # Команда запущена и не завершилась (некоторые файловые менеджеры
+                    # работают до закрытия окна) - папка считается открытой, процесс не трогаем
+                    del self._running[path]
+                    self._opened.append(path)
+                continue
+            del self._running[path]
+            if code == 0:
+                self._opened.append(path)
+            else:
+                self._failed[path] = f"exit code {code}"
+        
+        self._start_next()
+        if not self.is_busy():
+            self._poll_timer.stop()
+            result = {'opened': self._opened, 'failed': self._failed}
+            self._opened = []
+            self._failed = {}
+            for path, message in result['failed'].items():
+                print(f"Ошибка при открытии папки {path}: {message}")
+            self.batch_finished.emit(result)
+    
+    def shutdown(self) -> None:
+        """Останавливает службу, не дожидаясь зависших проверок"""
+        self._poll_timer.stop()
+        self._queue = []
+        self._executor.shutdown(wait=False)
+
+
+_launcher: Optional[FolderLauncher] = None
+
+
+def get_folder_launcher() -> FolderLauncher:
+    """
+    Возвращает общую для приложения службу открытия папок
+    
+    Returns:
+        Экземпляр FolderLauncher (создается в потоке интерфейса)
+    """
+    global _launcher
+    if _launcher is None:
+        _launcher = FolderLauncher()
+    return _launcher
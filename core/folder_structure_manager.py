@@ -4,14 +4,20 @@
 """
 
 import os
+import copy
 import json
-from typing import Dict, List, Any
+import hashlib
+import tempfile
+from typing import Callable, Dict, List, Any, Optional
 from utils.resource_manager import get_settings_file_path
 
 
 class FolderStructureManager:
     """Класс для управления структурой папок проекта"""
     
+    # Подписчики на изменение структуры (общие для всех экземпляров)
+    _change_listeners: List[Callable[[Dict[str, Any]], None]] = []
+    
     def __init__(self):
         """Инициализация менеджера структуры папок"""
         self.current_structure = self._load_current_structure()
@@ -85,8 +91,12 @@ class FolderStructureManager:
         Args:
             new_structure: Новая структура папок
         """
+        # Прежняя структура нужна для миграции созданных по ней проектов
+        self.save_snapshot(self._load_current_structure())
         self.current_structure = new_structure
+        self.save_snapshot()
         self._save_current_structure()
+        self._notify_structure_changed()
     
     def get_folder_list(self, selected_tools: List[str]) -> List[str]:
         """
@@ -98,8 +108,8 @@ class FolderStructureManager:
         Returns:
             Список путей папок для создания
         """
-        # Создаем копию структуры для модификации
-        structure = self.current_structure.copy()
+        # Создаем глубокую копию: папки инструментов не должны попасть в текущую структуру
+        structure = copy.deepcopy(self.current_structure)
         
         # Добавляем папки для инструментов в 02_PROCESS
         if "02_PROCESS" in structure:
@@ -155,8 +165,8 @@ class FolderStructureManager:
         if selected_tools is None:
             selected_tools = []
         
-        # Получаем структуру с инструментами
-        structure = self.current_structure.copy()
+        # Получаем структуру с инструментами (глубокая копия, текущая не меняется)
+        structure = copy.deepcopy(self.current_structure)
         
         # Добавляем папки инструментов
         if "02_PROCESS" in structure and selected_tools:
@@ -241,8 +251,122 @@ class FolderStructureManager:
     
     def reset_to_default(self) -> None:
         """Сбрасывает структуру к стандартной"""
+        self.save_snapshot(self._load_current_structure())
         self.current_structure = self._get_default_structure()
+        self.save_snapshot()
         self._save_current_structure()
+        self._notify_structure_changed()
+    
+    @classmethod
+    def add_change_listener(cls, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Подписывает обработчик на изменение структуры папок
+        
+        Args:
+            callback: Функция, получающая новую структуру
+        """
+        if callback not in cls._change_listeners:
+            cls._change_listeners.append(callback)
+    
+    @classmethod
+    def remove_change_listener(cls, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Отписывает обработчик от изменения структуры папок
+        
+        Args:
+            callback: Ранее подписанная функция
+        """
+        if callback in cls._change_listeners:
+            cls._change_listeners.remove(callback)
+    
+    def _notify_structure_changed(self) -> None:
+        """Уведомляет подписчиков об изменении структуры"""
+        for callback in list(self._change_listeners):
+            try:
+                callback(self.current_structure)
+            except Exception as e:
+                print(f"Ошибка обработчика изменения структуры: {e}")
+    
+    def get_structure_hash(self) -> str:
+        """
+        Вычисляет хеш текущей структуры папок
+        
+        Returns:
+            Шестнадцатеричный хеш структуры
+        """
+        return self.hash_structure(self.current_structure)
+    
+    @staticmethod
+    def _get_snapshots_dir() -> str:
+        """Папка снимков структур (рядом с current_structure.json)"""
+        return os.path.join(os.path.dirname(get_settings_file_path()), 'structures')
+    
+    @staticmethod
+    def hash_structure(structure: Dict[str, Any]) -> str:
+        """
+        Вычисляет хеш произвольной структуры папок
+        
+        Args:
+            structure: Структура папок
+            
+        Returns:
+            Шестнадцатеричный хеш структуры
+        """
+        payload = json.dumps(structure, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def save_snapshot(self, structure: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Сохраняет снимок структуры под ее хешем (если его еще нет)
+        
+        Args:
+            structure: Структура (по умолчанию текущая)
+            
+        Returns:
+            Хеш структуры
+        """
+        structure = self.current_structure if structure is None else structure
+        structure_hash = self.hash_structure(structure)
+        snapshot_file = os.path.join(self._get_snapshots_dir(), f"{structure_hash}.json")
+        if os.path.exists(snapshot_file):
+            return structure_hash
+        temp_path = None
+        try:
+            os.makedirs(os.path.dirname(snapshot_file), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix='.structure_', dir=os.path.dirname(snapshot_file))
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(structure, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, snapshot_file)
+        except OSError as e:
+            print(f"Ошибка сохранения снимка структуры: {e}")
+            # Недописанный временный файл не должен копиться в папке снимков
+            if temp_path is not None and os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+        return structure_hash
+    
+    @classmethod
+    def load_snapshot(cls, structure_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Загружает снимок структуры по хешу
+        
+        Args:
+            structure_hash: Хеш структуры
+            
+        Returns:
+            Структура или None, если снимка нет
+        """
+        snapshot_file = os.path.join(cls._get_snapshots_dir(), f"{structure_hash}.json")
+        try:
+            with open(snapshot_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"Ошибка загрузки снимка структуры {structure_hash}: {e}")
+            return None
     
     def get_tool_folder_mapping(self) -> Dict[str, str]:
         """
@@ -0,0 +1,473 @@
+"""
+Загрузка отснятого материала в проект
+Копирует карту камеры или папку клиента в 01_IN/FOOTAGES одним проходом
+чтения сразу в несколько мест назначения с проверкой контрольных сумм
+и возможностью продолжить прерванную загрузку
+"""
+
+import fnmatch
+import json
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.file_hashing import DEFAULT_ALGORITHM, hash_file, new_hasher
+
+
+# Папка проекта для отснятого материала
+FOOTAGE_FOLDER = os.path.join('01_IN', 'FOOTAGES')
+
+# Размер блока чтения и глубина очереди каждого писателя:
+# чтение опережает запись не более чем на INGEST_QUEUE_DEPTH блоков
+INGEST_BUFFER_SIZE = 8 * 1024 * 1024
+INGEST_QUEUE_DEPTH = 8
+
+# Журнал завершенных файлов (по строке JSON на файл) и суффикс недописанных файлов
+JOURNAL_NAME = '.ingest_journal.jsonl'
+PART_SUFFIX = '.part'
+
+# Служебные файлы ОС, которые не копируются
+IGNORED_PATTERNS = ['.DS_Store', '._*', 'Thumbs.db', 'desktop.ini', '.Spotlight-V100',
+                    '.Trashes', '.fseventsd', JOURNAL_NAME]
+
+# Минимальный интервал между уведомлениями о прогрессе
+PROGRESS_INTERVAL = 0.1
+
+
+class IngestCancelled(Exception):
+    """Загрузка отменена пользователем"""
+
+
+class IngestFile:
+    """Файл источника, подлежащий копированию"""
+    
+    __slots__ = ('rel_path', 'size', 'mtime_ns')
+    
+    def __init__(self, rel_path: str, size: int, mtime_ns: int):
+        self.rel_path = rel_path
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+
+def is_ignored_file(name: str) -> bool:
+    """Проверяет, является ли файл служебным"""
+    return any(fnmatch.fnmatch(name, pattern) for pattern in IGNORED_PATTERNS)
+
+
+def scan_source(source: str) -> List[IngestFile]:
+    """
+    Собирает список файлов источника
+    
+    Args:
+        source: Папка источника
+    
+    Returns:
+        Список файлов, отсортированный по относительному пути
+    """
+    files = []
+    stack = ['']
+    while stack:
+        rel_dir = stack.pop()
+        with os.scandir(os.path.join(source, rel_dir)) as entries:
+            for entry in entries:
+                if is_ignored_file(entry.name):
+                    continue
+                rel_path = os.path.join(rel_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(rel_path)
+                elif entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    files.append(IngestFile(rel_path, stat.st_size, stat.st_mtime_ns))
+    files.sort(key=lambda f: f.rel_path)
+    return files
+
+
+def get_footage_destination(project_path: str, source: str) -> str:
+    """
+    Возвращает папку назначения источника внутри проекта
+    
+    Args:
+        project_path: Путь к проекту
+        source: Папка источника (имя сохраняется как подпапка, например A001)
+    
+    Returns:
+        Путь вида <проект>/01_IN/FOOTAGES/<имя источника>
+    """
+    return os.path.join(project_path, FOOTAGE_FOLDER, os.path.basename(os.path.normpath(source)))
+
+
+class IngestJournal:
+    """Журнал завершенных файлов для продолжения прерванной загрузки"""
+    
+    def __init__(self, path: str):
+        """
+        Инициализация журнала
+        
+        Args:
+            path: Путь к файлу журнала
+        """
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._handle = None
+        self._load()
+    
+    def _load(self) -> None:
+        """Читает журнал, пропуская недописанную последнюю строку"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self._entries[entry['file']] = entry
+    
+    def get(self, item: IngestFile) -> Optional[Dict[str, Any]]:
+        """
+        Возвращает запись о файле, если он уже скопирован в неизменном виде
+        
+        Args:
+            item: Файл источника
+        
+        Returns:
+            Запись журнала или None
+        """
+        entry = self._entries.get(item.rel_path)
+        if entry and entry['size'] == item.size and entry['mtime_ns'] == item.mtime_ns:
+            return entry
+        return None
+    
+    def mark_done(self, item: IngestFile, digest: str, algorithm: str) -> None:
+        """
+        Записывает файл как скопированный и проверенный
+        
+        Args:
+            item: Файл источника
+            digest: Хеш содержимого
+            algorithm: Алгоритм хеширования
+        """
+        entry = {
+            'file': item.rel_path,
+            'size': item.size,
+            'mtime_ns': item.mtime_ns,
+            'algorithm': algorithm,
+            'digest': digest
+        }
+        self._entries[item.rel_path] = entry
+        if self._handle is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._handle = open(self.path, 'a', encoding='utf-8')
+        self._handle.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._handle.flush()
+    
+    def close(self) -> None:
+        """Закрывает файл журнала"""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class _DestinationWriter(threading.Thread):
+    """Поток записи в одно место назначения, получающий блоки из очереди"""
+    
+    def __init__(self, root: str, algorithm: str, verify: bool):
+        super().__init__(name=f"IngestWriter:{root}", daemon=True)
+        self.root = root
+        self.algorithm = algorithm
+        self.verify = verify
+        self.commands = queue.Queue(maxsize=INGEST_QUEUE_DEPTH)
+        self.results = queue.Queue()
+        self._handle = None
+        self._error = None
+    
+    def run(self) -> None:
+        while True:
+            command, *args = self.commands.get()
+            if command == 'stop':
+                self._discard()
+                return
+            try:
+                if command == 'open':
+                    self._open(*args)
+                elif command == 'write':
+                    if self._handle is not None:
+                        self._handle.write(args[0])
+                elif command == 'close':
+                    self.results.put(self._close(*args))
+                elif command == 'abort':
+                    self._discard()
+            except Exception as e:
+                # Ошибка запоминается до конца файла, остальные блоки пропускаются;
+                # поток продолжает работу, иначе ожидание результата не завершится
+                self._error = e
+                self._discard()
+                if command == 'close':
+                    self.results.put(self._take_error())
+    
+    def _open(self, rel_path: str) -> None:
+        self._error = None
+        path = os.path.join(self.root, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._part_path = path + PART_SUFFIX
+        self._handle = open(self._part_path, 'wb')
+    
+    def _close(self, rel_path: str, mtime_ns: int) -> Dict[str, Any]:
+        if self._handle is None:
+            return self._take_error()
+        
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        if self.verify and hasattr(os, 'posix_fadvise'):
+            # Сбрасываем страничный кэш, чтобы проверка читала данные с носителя
+            os.posix_fadvise(self._handle.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        self._handle.close()
+        self._handle = None
+        
+        path = os.path.join(self.root, rel_path)
+        os.utime(self._part_path, ns=(mtime_ns, mtime_ns))
+        os.replace(self._part_path, path)
+        
+        digest = hash_file(path, self.algorithm) if self.verify else None
+        return {'root': self.root, 'digest': digest, 'error': None}
+    
+    def _discard(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+            try:
+                os.remove(self._part_path)
+            except OSError:
+                pass
+    
+    def _take_error(self) -> Dict[str, Any]:
+        error, self._error = self._error, None
+        return {'root': self.root, 'digest': None, 'error': error}
+
+
+class IngestEngine:
+    """Конвейерное копирование источника в одно или несколько мест назначения"""
+    
+    def __init__(self, source: str, destinations: List[str], verify: bool = True,
+                 algorithm: Optional[str] = None, buffer_size: int = INGEST_BUFFER_SIZE,
+                 progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 cancel_event: Optional[threading.Event] = None):
+        """
+        Инициализация загрузки
+        
+        Args:
+            source: Папка источника
+            destinations: Папки назначения (первая - основная, в ней хранится журнал)
+            verify: Перечитывать копии и сверять хеш с хешем источника
+            algorithm: Алгоритм хеширования
+            buffer_size: Размер блока чтения
+            progress_callback: Функция, получающая словарь прогресса
+            cancel_event: Событие отмены загрузки
+        """
+        if not destinations:
+            raise ValueError("Не задано ни одного места назначения")
+        self.source = source
+        self.destinations = [os.path.abspath(d) for d in destinations]
+        self.verify = verify
+        self.algorithm = algorithm or DEFAULT_ALGORITHM
+        self.buffer_size = buffer_size
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event or threading.Event()
+        self.journal = IngestJournal(os.path.join(self.destinations[0], JOURNAL_NAME))
+        
+        self._bytes_total = 0
+        self._bytes_done = 0
+        self._files_total = 0
+        self._files_done = 0
+        self._started = 0.0
+        self._last_report = 0.0
+    
+    def run(self) -> Dict[str, Any]:
+        """
+        Выполняет загрузку
+        
+        Returns:
+            Словарь с итогами загрузки
+        
+        Raises:
+            IngestCancelled: Загрузка отменена
+        """
+        files = scan_source(self.source)
+        self._files_total = len(files)
+        self._bytes_total = sum(f.size for f in files)
+        self._started = time.monotonic()
+        
+        writers = [_DestinationWriter(root, self.algorithm, self.verify) for root in self.destinations]
+        for writer in writers:
+            writer.start()
+        
+        copied = skipped = bytes_copied = 0
+        failed = []
+        try:
+            for item in files:
+                if self._is_complete(item):
+                    skipped += 1
+                else:
+                    error = self._copy_file(item, writers)
+                    if error is None:
+                        copied += 1
+                        bytes_copied += item.size
+                    else:
+                        failed.append({'file': item.rel_path, 'error': error})
+                
+                self._files_done += 1
+                self._bytes_done += item.size
+                self._report(item.rel_path, force=True)
+        finally:
+            for writer in writers:
+                writer.commands.put(('stop',))
+            for writer in writers:
+                writer.join()
+            self.journal.close()
+        
+        return {
+            'source': self.source,
+            'destinations': self.destinations,
+            'files_total': self._files_total,
+            'files_copied': copied,
+            'files_skipped': skipped,
+            'bytes_total': self._bytes_total,
+            'bytes_copied': bytes_copied,
+            'failed': failed,
+            'algorithm': self.algorithm,
+            'verified': self.verify,
+            'elapsed': time.monotonic() - self._started
+        }
+    
+    def _is_complete(self, item: IngestFile) -> bool:
+        """Проверяет по журналу и размерам копий, что файл уже загружен"""
+        if self.journal.get(item) is None:
+            return False
+        for root in self.destinations:
+            try:
+                if os.stat(os.path.join(root, item.rel_path)).st_size != item.size:
+                    return False
+            except OSError:
+                return False
+        return True
+    
+    def _copy_file(self, item: IngestFile, writers: List[_DestinationWriter]) -> Optional[str]:
+        """
+        Копирует один файл во все места назначения за один проход чтения
+        
+        Returns:
+            Описание ошибки или None при успехе
+        """
+        for writer in writers:
+            writer.commands.put(('open', item.rel_path))
+        
+        hasher = new_hasher(self.algorithm)
+        file_done = 0
+        try:
+            with open(os.path.join(self.source, item.rel_path), 'rb') as src:
+                while True:
+                    if self.cancel_event.is_set():
+                        raise IngestCancelled()
+                    chunk = src.read(self.buffer_size)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    for writer in writers:
+                        writer.commands.put(('write', chunk))
+                    file_done += len(chunk)
+                    self._report(item.rel_path, file_done)
+        except (OSError, IngestCancelled) as e:
+            for writer in writers:
+                writer.commands.put(('abort',))
+            if isinstance(e, IngestCancelled):
+                raise
+            return f"чтение: {e}"
+        
+        for writer in writers:
+            writer.commands.put(('close', item.rel_path, item.mtime_ns))
+        
+        source_digest = hasher.hexdigest()
+        errors = []
+        for writer in writers:
+            result = writer.results.get()
+            if result['error'] is not None:
+                errors.append(f"{result['root']}: {result['error']}")
+            elif self.verify and result['digest'] != source_digest:
+                # Поврежденную копию удаляем, чтобы повторная загрузка ее перезаписала
+                errors.append(f"{result['root']}: несовпадение контрольной суммы")
+                try:
+                    os.remove(os.path.join(result['root'], item.rel_path))
+                except OSError:
+                    pass
+        
+        if errors:
+            return '; '.join(errors)
+        self.journal.mark_done(item, source_digest, self.algorithm)
+        return None
+    
+    def _report(self, current_file: str, file_done: int = 0, force: bool = False) -> None:
+        """Передает прогресс не чаще PROGRESS_INTERVAL"""
+        if self.progress_callback is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_report < PROGRESS_INTERVAL:
+            return
+        self._last_report = now
+        
+        done = self._bytes_done + file_done
+        elapsed = max(now - self._started, 1e-6)
+        speed = done / elapsed
+        remaining = self._bytes_total - done
+        self.progress_callback({
+            'current_file': current_file,
+            'files_done': self._files_done,
+            'files_total': self._files_total,
+            'bytes_done': done,
+            'bytes_total': self._bytes_total,
+            'speed': speed,
+            'eta': remaining / speed if speed > 0 else None
+        })
+
+
+class IngestWorker(QThread):
+    """Рабочий поток загрузки отснятого материала"""
+    
+    progress_updated = pyqtSignal(dict)
+    finished = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, source: str, destinations: List[str], verify: bool = True):
+        """
+        Инициализация рабочего потока
+        
+        Args:
+            source: Папка источника
+            destinations: Папки назначения
+            verify: Проверять копии по контрольной сумме
+        """
+        super().__init__()
+        self.source = source
+        self.destinations = destinations
+        self.verify = verify
+        self.cancel_event = threading.Event()
+    
+    def cancel(self) -> None:
+        """Запрашивает отмену загрузки"""
+        self.cancel_event.set()
+    
+    def run(self) -> None:
+        """Основной метод выполнения загрузки"""
+        try:
+            engine = IngestEngine(self.source, self.destinations, self.verify,
+                                  progress_callback=self.progress_updated.emit,
+                                  cancel_event=self.cancel_event)
+            result = engine.run()
+            self.finished.emit(result)
+        except IngestCancelled:
+            self.error_occurred.emit("Загрузка отменена")
+        except Exception as e:
+            self.error_occurred.emit(str(e))
@@ -0,0 +1,306 @@
+"""
+Политика обработки ошибок ввода-вывода
+Классифицирует ошибки на временные и постоянные, повторяет временные
+с ограниченной экспоненциальной задержкой и ведет счетчики повторов
+"""
+
+import errno
+import random
+import threading
+import time
+from typing import IO, Any, Callable, Dict, List, Optional
+
+from core.file_system import LocalFileSystem
+
+
+# Классы ошибок
+TRANSIENT = 'transient'
+PERMANENT = 'permanent'
+
+# Коды ошибок, которые на сетевых хранилищах обычно проходят при повторе
+TRANSIENT_ERRNOS = {
+    code for code in (
+        getattr(errno, 'EAGAIN', None),
+        getattr(errno, 'EWOULDBLOCK', None),
+        getattr(errno, 'ESTALE', None),
+        getattr(errno, 'EBUSY', None),
+        getattr(errno, 'EINTR', None),
+        getattr(errno, 'ETIMEDOUT', None),
+        getattr(errno, 'ECONNRESET', None),
+        getattr(errno, 'ECONNABORTED', None),
+        getattr(errno, 'EHOSTUNREACH', None),
+        getattr(errno, 'ENETRESET', None),
+    ) if code is not None
+}
+
+# Коды ошибок Windows (winerror) для временных сбоев SMB
+TRANSIENT_WINERRORS = {
+    32,    # ERROR_SHARING_VIOLATION
+    33,    # ERROR_LOCK_VIOLATION
+    53,    # ERROR_BAD_NETPATH
+    64,    # ERROR_NETNAME_DELETED
+    121,   # ERROR_SEM_TIMEOUT
+}
+
+
+def classify_error(error: BaseException) -> str:
+    """
+    Определяет класс ошибки ввода-вывода
+    
+    Args:
+        error: Исключение
+    
+    Returns:
+        TRANSIENT для ошибок, которые стоит повторить, иначе PERMANENT
+    """
+    if isinstance(error, (TimeoutError, InterruptedError, BlockingIOError)):
+        return TRANSIENT
+    if isinstance(error, OSError):
+        if getattr(error, 'winerror', None) in TRANSIENT_WINERRORS:
+            return TRANSIENT
+        if error.errno in TRANSIENT_ERRNOS:
+            return TRANSIENT
+    return PERMANENT
+
+
+def describe_error(error: BaseException) -> str:
+    """
+    Формирует краткое описание ошибки с ее классом и кодом
+    
+    Args:
+        error: Исключение
+    
+    Returns:
+        Строка вида "[transient EAGAIN] сообщение"
+    """
+    code = getattr(error, 'errno', None)
+    code_name = errno.errorcode.get(code, '') if code is not None else ''
+    label = f"{classify_error(error)} {code_name}".strip()
+    return f"[{label}] {error}"
+
+
+class IOMetrics:
+    """Потокобезопасные счетчики операций ввода-вывода одного задания"""
+    
+    def __init__(self):
+        """Инициализация счетчиков"""
+        self._lock = threading.Lock()
+        self.operations = 0
+        self.retries = 0
+        self.transient_errors = 0
+        self.permanent_errors = 0
+        self.exhausted = 0
+        self.retries_by_operation = {}
+        self.backoff_s = 0.0
+    
+    def record_operation(self) -> None:
+        """Учитывает выполненную операцию"""
+        with self._lock:
+            self.operations += 1
+    
+    def record_retry(self, operation: str, delay: float) -> None:
+        """
+        Учитывает повтор операции после временной ошибки
+        
+        Args:
+            operation: Имя операции
+            delay: Задержка перед повтором в секундах
+        """
+        with self._lock:
+            self.retries += 1
+            self.transient_errors += 1
+            self.backoff_s += delay
+            self.retries_by_operation[operation] = self.retries_by_operation.get(operation, 0) + 1
+    
+    def record_failure(self, error_class: str) -> None:
+        """
+        Учитывает окончательную ошибку операции
+        
+        Args:
+            error_class: TRANSIENT (исчерпаны попытки) или PERMANENT
+        """
+        with self._lock:
+            if error_class == TRANSIENT:
+                self.transient_errors += 1
+                self.exhausted += 1
+            else:
+                self.permanent_errors += 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Возвращает снимок счетчиков в виде словаря"""
+        with self._lock:
+            return {
+                'operations': self.operations,
+                'retries': self.retries,
+                'transient_errors': self.transient_errors,
+                'permanent_errors': self.permanent_errors,
+                'exhausted': self.exhausted,
+                'backoff_s': round(self.backoff_s, 4),
+                'retries_by_operation': dict(self.retries_by_operation)
+            }
+
+
+class RetryPolicy:
+    """Повтор временных ошибок с ограниченной экспоненциальной задержкой"""
+    
+    def __init__(self, max_attempts: int = 5, base_delay: float = 0.05, max_delay: float = 2.0,
+                 jitter: float = 0.5, sleep: Callable[[float], None] = time.sleep,
+                 rng: Optional[random.Random] = None):
+        """
+        Инициализация политики
+        
+        Args:
+            max_attempts: Максимальное количество попыток (включая первую)
+            base_delay: Задержка перед первым повтором в секундах
+            max_delay: Верхняя граница задержки в секундах
+            jitter: Доля задержки, выбираемая случайно (0 - без разброса, 1 - полный разброс)
+            sleep: Функция ожидания (подменяется в бенчмарках)
+            rng: Генератор случайных чисел
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = min(max(jitter, 0.0), 1.0)
+        self.sleep = sleep
+        self._random = rng or random.Random()
+        self._random_lock = threading.Lock()
+    
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Вычисляет задержку перед повтором
+        
+        Args:
+            attempt: Номер неудачной попытки, начиная с 1
+        
+        Returns:
+            Задержка в секундах
+        """
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        with self._random_lock:
+            spread = self._random.uniform(0.0, delay * self.jitter)
+        return delay - spread
+    
+    def call(self, operation: str, func: Callable[..., Any], *args: Any,
+             metrics: Optional[IOMetrics] = None, **kwargs: Any) -> Any:
+        """
+        Выполняет операцию с повторами временных ошибок
+        
+        Args:
+            operation: Имя операции (для счетчиков)
+            func: Вызываемая функция
+            *args: Позиционные аргументы функции
+            metrics: Счетчики, в которые записываются повторы
+            **kwargs: Именованные аргументы функции
+        
+        Returns:
+            Результат функции
+        
+        Raises:
+            OSError: Постоянная ошибка или временная после исчерпания попыток
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                result = func(*args, **kwargs)
+                if metrics is not None:
+                    metrics.record_operation()
+                return result
+            except Exception as e:
+                error_class = classify_error(e)
+                if error_class == PERMANENT or attempt >= self.max_attempts:
+                    if metrics is not None:
+                        metrics.record_failure(error_class)
+                    raise
+                
+                delay = self.backoff_delay(attempt)
+                if metrics is not None:
+                    metrics.record_retry(operation, delay)
+                self.sleep(delay)
+
+
+class RetryingFileSystem(LocalFileSystem):
+    """Слой файловых операций, применяющий политику повторов к другому слою"""
+    
+    def __init__(self, inner: Optional[LocalFileSystem] = None, policy: Optional[RetryPolicy] = None,
+                 metrics: Optional[IOMetrics] = None):
+        """
+        Инициализация слоя
+        
+        Args:
+            inner: Оборачиваемый слой файловых операций
+            policy: Политика повторов
+            metrics: Счетчики операций
+        """
+        self.inner = inner or LocalFileSystem()
+        self.policy = policy or RetryPolicy()
+        self.metrics = metrics or IOMetrics()
+    
+    def _call(self, operation: str, *args: Any, **kwargs: Any) -> Any:
+        """Вызывает операцию вложенного слоя через политику повторов"""
+        func = getattr(self.inner, operation)
+        return self.policy.call(operation, func, *args, metrics=self.metrics, **kwargs)
+    
+    def run(self, operation: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Выполняет составную операцию над вложенным слоем, повторяя ее целиком
+        
+        Нужна для потоковых чтения и записи: ошибка посреди потока не
+        повторяется на уровне open, поэтому операция должна быть идемпотентной
+        (например, перезапись файла назначения с начала)
+        
+        Args:
+            operation: Имя операции (для счетчиков)
+            func: Функция, получающая вложенный слой первым аргументом
+            *args: Остальные позиционные аргументы функции
+            **kwargs: Именованные аргументы функции
+        
+        Returns:
+            Результат функции
+        """
+        return self.policy.call(operation, func, self.inner, *args, metrics=self.metrics, **kwargs)
+    
+    def makedirs(self, path: str, exist_ok: bool = True) -> None:
+        self._call('makedirs', path, exist_ok=exist_ok)
+    
+    def exists(self, path: str) -> bool:
+        return self._call('exists', path)
+    
+    def isdir(self, path: str) -> bool:
+        return self._call('isdir', path)
+    
+    def glob(self, pattern: str) -> List[str]:
+        return self._call('glob', pattern)
+    
+    def listdir(self, path: str) -> List[str]:
+        return self._call('listdir', path)
+    
+    def stat(self, path: str):
+        return self._call('stat', path)
+    
+    def open(self, path: str, mode: str = 'r', **kwargs: Any) -> IO:
+        return self._call('open', path, mode, **kwargs)
+    
+    def copy_file(self, source: str, destination: str) -> None:
+        self._call('copy_file', source, destination)
+    
+    def copy_stat(self, source: str, destination: str) -> None:
+        self._call('copy_stat', source, destination)
+    
+    def read_bytes(self, path: str) -> bytes:
+        return self._call('read_bytes', path)
+    
+    def write_text(self, path: str, content: str, encoding: str = 'utf-8') -> None:
+        self._call('write_text', path, content, encoding=encoding)
+    
+    def write_bytes(self, path: str, data: bytes, mtime: Optional[float] = None) -> None:
+        self._call('write_bytes', path, data, mtime=mtime)
+    
+    def set_mtime(self, path: str, mtime: float) -> None:
+        self._call('set_mtime', path, mtime)
+    
+    def remove(self, path: str) -> None:
+        self._call('remove', path)
+    
+    def rename(self, source: str, destination: str) -> None:
+        self._call('rename', source, destination)
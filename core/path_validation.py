@@ -0,0 +1,178 @@
+"""
+Фоновая проверка папки проектов и имени нового проекта
+Обращения к диску (существование, права, свободное место, занятость имени)
+выполняются вне потока интерфейса и кэшируются на несколько секунд,
+поэтому ввод в форме не замирает, даже если папка лежит на спящем NAS
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from utils.platform_utils import get_free_disk_space
+
+
+# Время жизни результата проверки папки в секундах
+PATH_CHECK_TTL = 5.0
+
+# Пауза после последнего изменения поля перед проверкой
+VALIDATION_DEBOUNCE_MS = 200
+
+# Свободное место, при котором форма предупреждает о нехватке
+MIN_FREE_SPACE = 1024 ** 3
+
+# Потоки проверки: зависшая проверка медленной папки не задерживает другие
+VALIDATION_WORKERS = 4
+
+
+def check_base_path(path: str) -> Dict[str, Any]:
+    """
+    Проверяет папку проектов
+    
+    Args:
+        path: Папка проектов
+    
+    Returns:
+        Словарь: 'exists', 'writable', 'free_space' (байт или None)
+    """
+    exists = os.path.isdir(path)
+    return {
+        'exists': exists,
+        'writable': exists and os.access(path, os.W_OK | os.X_OK),
+        'free_space': get_free_disk_space(path) if exists else None
+    }
+
+
+class PathValidator(QObject):
+    """Служба асинхронной проверки формы создания проекта с кэшем по путям"""
+    
+    # Результат последнего запроса: 'path', 'name', 'exists', 'writable', 'free_space', 'collision'
+    validated = pyqtSignal(dict)
+    
+    def __init__(self, ttl: float = PATH_CHECK_TTL, debounce_ms: int = VALIDATION_DEBOUNCE_MS,
+                 parent: Optional[QObject] = None):
+        """
+        Инициализация службы
+        
+        Args:
+            ttl: Время жизни кэша в секундах
+            debounce_ms: Пауза после последнего запроса перед проверкой
+            parent: Родительский объект Qt
+        """
+        super().__init__(parent)
+        self.ttl = ttl
+        
+        self._executor = ThreadPoolExecutor(max_workers=VALIDATION_WORKERS, thread_name_prefix='PathValidator')
+        self._lock = threading.Lock()
+        # Путь -> (время проверки, результат)
+        self._paths: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._names: Dict[str, Tuple[float, bool]] = {}
+        self._generation = 0
+        self._pending: Optional[Tuple[int, str, str]] = None
+        self._future: Optional[Future] = None
+        
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(debounce_ms)
+        self._debounce_timer.timeout.connect(self._submit)
+    
+    def _cached(self, cache: Dict[str, Tuple[float, Any]], key: str) -> Optional[Any]:
+        """Значение кэша, если оно еще не устарело"""
+        with self._lock:
+            entry = cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+    
+    def _result(self, path: str, name: str) -> Optional[Dict[str, Any]]:
+        """Собирает результат из кэша (None, если чего-то не хватает)"""
+        base = self._cached(self._paths, path)
+        if base is None:
+            return None
+        collision = False
+        if base['exists'] and name:
+            collision = self._cached(self._names, os.path.join(path, name))
+            if collision is None:
+                return None
+        return dict(base, path=path, name=name, collision=collision)
+    
+    def request(self, path: str, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Запрашивает проверку; предыдущие незавершенные запросы устаревают
+        
+        Args:
+            path: Папка проектов
+            name: Имя нового проекта (пустое - без проверки занятости)
+        
+        Returns:
+            Результат из кэша или None - тогда он придет сигналом validated
+        """
+        self.cancel()
+        result = self._result(path, name)
+        if result is not None:
+            return result
+        self._pending = (self._generation, path, name)
+        self._debounce_timer.start()
+        return None
+    
+    def cancel(self) -> None:
+        """Отменяет текущий запрос: результат начатой проверки не будет отправлен"""
+        self._generation += 1
+        self._pending = None
+        self._debounce_timer.stop()
+        if self._future is not None:
+            # Еще не начатая проверка снимается с очереди пула
+            self._future.cancel()
+            self._future = None
+    
+    def _submit(self) -> None:
+        """Отправляет отложенный запрос в пул потоков"""
+        if self._pending is not None:
+            self._future = self._executor.submit(self._check, *self._pending)
+            self._pending = None
+    
+    def _check(self, generation: int, path: str, name: str) -> None:
+        """Выполняет проверку в фоне и отправляет результат, если запрос актуален"""
+        if self._cached(self._paths, path) is None:
+            base = check_base_path(path)
+            with self._lock:
+                self._paths[path] = (time.monotonic(), base)
+        if generation != self._generation:
+            return
+        
+        target = os.path.join(path, name)
+        base = self._cached(self._paths, path) or {}
+        if base.get('exists') and name and self._cached(self._names, target) is None:
+            collision = os.path.lexists(target)
+            with self._lock:
+                self._names[target] = (time.monotonic(), collision)
+        
+        result = self._result(path, name)
+        if result is not None and generation == self._generation:
+            self.validated.emit(result)
+    
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Сбрасывает кэш (например, после создания проекта)
+        
+        Args:
+            path: Папка проектов (по умолчанию весь кэш)
+        """
+        with self._lock:
+            if path is None:
+                self._paths.clear()
+                self._names.clear()
+                return
+            self._paths.pop(path, None)
+            prefix = os.path.join(path, '')
+            for key in [key for key in self._names if key.startswith(prefix)]:
+                del self._names[key]
+    
+    def shutdown(self) -> None:
+        """Останавливает службу, не дожидаясь зависших проверок"""
+        self.cancel()
+        self._executor.shutdown(wait=False)
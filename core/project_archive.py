@@ -0,0 +1,562 @@
+"""
+Архивация проектов
+Потоково упаковывает проект в tar, сжимая независимые блоки в пуле
+потоков (zstd при наличии модуля zstandard, иначе gzip), и записывает
+рядом индекс участников и блоков для выборочного восстановления
+"""
+
+import fnmatch
+import gzip
+import json
+import os
+import tarfile
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.file_hashing import DEFAULT_ALGORITHM, new_hasher
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Содержимое папок и файлы, которые по умолчанию не попадают в архив
+# (пути относительно корня проекта; исключенная папка сохраняется пустой)
+ARCHIVE_EXCLUDES = [
+    '03_RENDER',
+    '02_PROCESS/AE/Adobe Premiere Pro Auto-Save',
+    '02_PROCESS/*/*Cache*',
+    '02_PROCESS/*/*cache*',
+    '02_PROCESS/PR/Adobe Premiere Pro Auto-Save',
+    '02_PROCESS/PR/Adobe Premiere Pro Video Previews',
+    '02_PROCESS/PR/Adobe Premiere Pro Audio Previews',
+    '02_PROCESS/C4D/backup',
+    '02_PROCESS/HOUDINI/backup',
+    '02_PROCESS/BLENDER/*.blend1',
+    '*.DS_Store',
+    '*/Thumbs.db',
+]
+
+# Размер несжатого блока: блоки сжимаются независимо и параллельно
+ARCHIVE_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Уровни сжатия по умолчанию ('none' - несжатый tar)
+COMPRESSION_LEVELS = {'zstd': 3, 'gzip': 6, 'none': 0}
+
+# Расширения архивов по кодеку
+ARCHIVE_EXTENSIONS = {'zstd': '.tar.zst', 'gzip': '.tar.gz', 'none': '.tar'}
+
+INDEX_SUFFIX = '.index.json'
+INDEX_FORMAT_VERSION = 1
+
+# Минимальный интервал между уведомлениями о прогрессе
+PROGRESS_INTERVAL = 0.2
+
+
+def default_codec() -> str:
+    """Возвращает кодек по умолчанию: zstd, если установлен модуль zstandard"""
+    return 'zstd' if zstandard is not None else 'gzip'
+
+
+def codec_from_path(path: str) -> str:
+    """
+    Определяет кодек по расширению архива
+    
+    Args:
+        path: Путь к архиву
+    
+    Returns:
+        'zstd', 'gzip' или 'none' для несжатого tar
+    """
+    if path.endswith('.tar'):
+        return 'none'
+    return 'zstd' if path.endswith(('.zst', '.zstd')) else 'gzip'
+
+
+def is_excluded(rel_path: str, patterns: List[str]) -> bool:
+    """
+    Проверяет, попадает ли путь под правила исключения
+    
+    Args:
+        rel_path: Путь относительно корня проекта с разделителем '/'
+        patterns: Шаблоны исключения
+    
+    Returns:
+        True если путь исключен
+    """
+    return any(fnmatch.fnmatchcase(rel_path, pattern) for pattern in patterns)
+
+
+def _compress_gzip(block: bytes, level: int) -> bytes:
+    # Каждый блок - отдельный член gzip, склейка членов остается корректным gzip-потоком
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return compressor.compress(block) + compressor.flush()
+
+
+def _store_block(block: bytes, level: int) -> bytes:
+    # Несжатый tar: блок записывается как есть, смещения блоков совпадают с несжатыми
+    return block
+
+
+_zstd_local = threading.local()
+
+
+def _compress_zstd(block: bytes, level: int) -> bytes:
+    # Компрессор не потокобезопасен, поэтому у каждого потока пула свой
+    compressor = getattr(_zstd_local, 'compressor', None)
+    if compressor is None or getattr(_zstd_local, 'level', None) != level:
+        compressor = zstandard.ZstdCompressor(level=level)
+        _zstd_local.compressor = compressor
+        _zstd_local.level = level
+    return compressor.compress(block)
+
+
+class ParallelBlockWriter:
+    """
+    Поток записи, сжимающий блоки фиксированного размера в пуле потоков
+    
+    Блоки записываются в исходном порядке, в памяти одновременно
+    находится не более 2 * workers блоков
+    """
+    
+    def __init__(self, fileobj: IO[bytes], codec: str, level: Optional[int] = None,
+                 block_size: int = ARCHIVE_BLOCK_SIZE, workers: Optional[int] = None):
+        """
+        Инициализация потока записи
+        
+        Args:
+            fileobj: Файл архива
+            codec: 'zstd', 'gzip' или 'none' (без сжатия)
+            level: Уровень сжатия
+            block_size: Размер несжатого блока
+            workers: Количество потоков сжатия
+        """
+        if codec not in COMPRESSION_LEVELS:
+            raise ValueError(f"Неизвестный кодек архива: {codec}")
+        if codec == 'zstd' and zstandard is None:
+            raise RuntimeError("Для сжатия zstd требуется модуль zstandard")
+        self.fileobj = fileobj
+        self.codec = codec
+        self.level = level if level is not None else COMPRESSION_LEVELS[codec]
+        self.block_size = block_size
+        self.workers = workers or os.cpu_count() or 2
+        self._compress = {'zstd': _compress_zstd, 'gzip': _compress_gzip, 'none': _store_block}[codec]
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='ArchiveCompress')
+        self._pending = deque()
+        self._buffer = bytearray()
+        
+        # Смещения блоков: [несжатое, сжатое] - для поиска участников при восстановлении
+        self.blocks: List[List[int]] = []
+        self.uncompressed_size = 0
+        self.compressed_size = 0
+    
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self.block_size:
+            block = bytes(self._buffer[:self.block_size])
+            del self._buffer[:self.block_size]
+            self._submit(block)
+        return len(data)
+    
+    def flush(self) -> None:
+        pass
+    
+    def _submit(self, block: bytes) -> None:
+        self._pending.append((self._pool.submit(self._compress, block, self.level), len(block)))
+        while len(self._pending) > self.workers * 2:
+            self._drain_one()
+    
+    def _drain_one(self) -> None:
+        future, raw_size = self._pending.popleft()
+        compressed = future.result()
+        self.blocks.append([self.uncompressed_size, self.compressed_size])
+        self.fileobj.write(compressed)
+        self.uncompressed_size += raw_size
+        self.compressed_size += len(compressed)
+    
+    def close(self) -> None:
+        """Сжимает остаток буфера и дожидается записи всех блоков"""
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            self._buffer = bytearray()
+        while self._pending:
+            self._drain_one()
+        self._pool.shutdown()
+    
+    def abort(self) -> None:
+        """Отменяет несжатые блоки и останавливает пул после ошибки записи"""
+        self._pending.clear()
+        self._buffer = bytearray()
+        self._pool.shutdown(cancel_futures=True)
+
+
+def open_archive_stream(path: str, codec: Optional[str] = None, compressed_offset: int = 0) -> IO[bytes]:
+    """
+    Открывает несжатый поток архива, начиная с границы блока
+    
+    Args:
+        path: Путь к архиву
+        codec: Кодек (по умолчанию по расширению)
+        compressed_offset: Смещение начала блока в сжатом файле
+    
+    Returns:
+        Двоичный поток для чтения
+    """
+    codec = codec or codec_from_path(path)
+    raw = open(path, 'rb')
+    raw.seek(compressed_offset)
+    if codec == 'none':
+        return raw
+    if codec == 'zstd':
+        if zstandard is None:
+            raw.close()
+            raise RuntimeError("Для чтения архива zstd требуется модуль zstandard")
+        return zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+    stream = gzip.GzipFile(fileobj=raw, mode='rb')
+    # GzipFile закрывает при close() только собственный файл
+    stream.myfileobj = raw
+    return stream
+
+
+def get_index_path(archive_path: str) -> str:
+    """Возвращает путь к индексу архива"""
+    return archive_path + INDEX_SUFFIX
+
+
+def load_archive_index(archive_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Загружает индекс архива
+    
+    Args:
+        archive_path: Путь к архиву
+    
+    Returns:
+        Индекс или None, если его нет
+    """
+    index_path = get_index_path(archive_path)
+    if not os.path.exists(index_path):
+        return None
+    with open(index_path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    return index if index.get('version') == INDEX_FORMAT_VERSION else None
+
+
+class _HashingReader:
+    """Обертка чтения файла, хеширующая прочитанные tarfile данные"""
+    
+    def __init__(self, handle: IO[bytes], algorithm: str, on_read: Callable[[int], None]):
+        self._handle = handle
+        self._hasher = new_hasher(algorithm)
+        self._on_read = on_read
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._handle.read(size)
+        self._hasher.update(data)
+        self._on_read(len(data))
+        return data
+    
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+
+class ProjectArchiver:
+    """Упаковка проекта в сжатый tar с индексом и проверкой"""
+    
+    def __init__(self, project_path: str, archive_path: str, codec: Optional[str] = None,
+                 level: Optional[int] = None, excludes: Optional[List[str]] = None,
+                 workers: Optional[int] = None,
+                 progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 cancel_event: Optional[threading.Event] = None):
+        """
+        Инициализация архивации
+        
+        Args:
+            project_path: Путь к проекту
+            archive_path: Путь к создаваемому архиву
+            codec: 'zstd', 'gzip' или 'none' (по умолчанию по расширению архива)
+            level: Уровень сжатия
+            excludes: Правила исключения (по умолчанию ARCHIVE_EXCLUDES)
+            workers: Количество потоков сжатия
+            progress_callback: Функция, получающая словарь прогресса
+            cancel_event: Событие отмены
+        """
+        self.project_path = os.path.abspath(project_path)
+        self.project_name = os.path.basename(self.project_path)
+        self.archive_path = archive_path
+        self.codec = codec or codec_from_path(archive_path)
+        self.level = level
+        self.excludes = ARCHIVE_EXCLUDES if excludes is None else excludes
+        self.workers = workers
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event or threading.Event()
+        self._bytes_done = 0
+        self._bytes_total = 0
+        self._phase = 'archive'
+        self._started = 0.0
+        self._last_report = 0.0
+    
+    def collect(self) -> Tuple[List[Tuple[str, str]], List[str]]:
+        """
+        Собирает участников архива
+        
+        Returns:
+            Кортеж (список (путь в архиве, путь на диске), список исключенных путей)
+        """
+        members = [(self.project_name, self.project_path)]
+        excluded = []
+        stack = ['']
+        while stack:
+            rel_dir = stack.pop()
+            directory = os.path.join(self.project_path, rel_dir) if rel_dir else self.project_path
+            with os.scandir(directory) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    arcname = f"{self.project_name}/{rel_path}"
+                    if entry.is_dir(follow_symlinks=False):
+                        members.append((arcname, entry.path))
+                        # Исключенная папка остается в архиве пустой, чтобы сохранить структуру
+                        if is_excluded(rel_path, self.excludes):
+                            excluded.append(rel_path)
+                        else:
+                            stack.append(rel_path)
+                    elif is_excluded(rel_path, self.excludes):
+                        excluded.append(rel_path)
+                    else:
+                        members.append((arcname, entry.path))
+        return members, excluded
+    
+    def run(self, verify: bool = True) -> Dict[str, Any]:
+        """
+        Создает архив и его индекс
+        
+        Args:
+            verify: Перечитать архив и сверить хеши участников
+        
+        Returns:
+            Словарь с итогами архивации
+        """
+        self._started = time.monotonic()
+        members, excluded = self.collect()
+        self._bytes_total = sum(os.lstat(path).st_size for _, path in members if not os.path.isdir(path))
+        
+        index_members = []
+        temp_path = self.archive_path + '.part'
+        writer = None
+        try:
+            with open(temp_path, 'wb') as raw:
+                writer = ParallelBlockWriter(raw, self.codec, self.level, workers=self.workers)
+                with tarfile.open(fileobj=writer, mode='w|', format=tarfile.PAX_FORMAT) as tar:
+                    for arcname, path in members:
+                        if self.cancel_event.is_set():
+                            raise InterruptedError("Архивация отменена")
+                        index_members.append(self._add_member(tar, arcname, path))
+                writer.close()
+            os.replace(temp_path, self.archive_path)
+        except BaseException:
+            if writer is not None:
+                writer.abort()
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        
+        index = {
+            'version': INDEX_FORMAT_VERSION,
+            'project': self.project_name,
+            'codec': self.codec,
+            'block_size': writer.block_size,
+            'algorithm': DEFAULT_ALGORITHM,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'excludes': self.excludes,
+            'excluded': excluded,
+            'uncompressed_size': writer.uncompressed_size,
+            'compressed_size': writer.compressed_size,
+            'blocks': writer.blocks,
+            'members': index_members
+        }
+        with open(get_index_path(self.archive_path), 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+        
+        elapsed = time.monotonic() - self._started
+        result = {
+            'archive': self.archive_path,
+            'index': get_index_path(self.archive_path),
+            'codec': self.codec,
+            'members': len(index_members),
+            'excluded': excluded,
+            'bytes_in': self._bytes_total,
+            'uncompressed_size': writer.uncompressed_size,
+            'compressed_size': writer.compressed_size,
+            'elapsed': elapsed,
+            'throughput': self._bytes_total / elapsed if elapsed > 0 else 0.0,
+            'verified': None
+        }
+        if verify:
+            result['verified'] = verify_archive(self.archive_path, index, self._on_verify_progress,
+                                                self.cancel_event)
+        return result
+    
+    def _add_member(self, tar: tarfile.TarFile, arcname: str, path: str) -> List[Any]:
+        """Добавляет файл или папку в архив и возвращает запись индекса"""
+        # Смещение заголовка в несжатом потоке позволяет начать чтение с нужного участника
+        header_offset = tar.offset
+        tarinfo = tar.gettarinfo(path, arcname)
+        tarinfo.uname = tarinfo.gname = ''
+        digest = None
+        if tarinfo.isreg():
+            with open(path, 'rb') as handle:
+                reader = _HashingReader(handle, DEFAULT_ALGORITHM, self._on_archive_progress)
+                tar.addfile(tarinfo, reader)
+                digest = reader.hexdigest()
+        else:
+            tar.addfile(tarinfo)
+        return [arcname, header_offset, tarinfo.size, tarinfo.type.decode('ascii'), digest]
+    
+    def _on_archive_progress(self, size: int) -> None:
+        self._bytes_done += size
+        self._report()
+    
+    def _on_verify_progress(self, done: int, total: int) -> None:
+        if self._phase != 'verify':
+            self._phase = 'verify'
+            self._started = self._last_report = time.monotonic()
+        self._bytes_done = done
+        self._bytes_total = total
+        self._report()
+    
+    def _report(self) -> None:
+        """Передает прогресс не чаще PROGRESS_INTERVAL"""
+        if self.progress_callback is None:
+            return
+        now = time.monotonic()
+        if now - self._last_report < PROGRESS_INTERVAL:
+            return
+        self._last_report = now
+        elapsed = max(now - self._started, 1e-6)
+        self.progress_callback({
+            'phase': self._phase,
+            'bytes_done': self._bytes_done,
+            'bytes_total': self._bytes_total,
+            'throughput': self._bytes_done / elapsed
+        })
+
+
+def verify_archive(archive_path: str, index: Optional[Dict[str, Any]] = None,
+                   progress_callback: Optional[Callable[[int, int], None]] = None,
+                   cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+    """
+    Читает архив целиком и сверяет участников с индексом
+    
+    Args:
+        archive_path: Путь к архиву
+        index: Индекс архива (по умолчанию загружается с диска)
+        progress_callback: Функция (прочитано байт данных, всего байт данных)
+        cancel_event: Событие отмены
+    
+    Returns:
+        Словарь: 'ok', 'members', 'mismatches', 'missing'
+    """
+    index = index or load_archive_index(archive_path)
+    expected = {}
+    total = 0
+    if index is not None:
+        expected = {name: (size, digest) for name, _, size, _, digest in index['members']}
+        total = sum(size for size, digest in expected.values() if digest)
+    algorithm = index['algorithm'] if index else DEFAULT_ALGORITHM
+    
+    seen = set()
+    mismatches = []
+    done = 0
+    with open_archive_stream(archive_path, index['codec'] if index else None) as stream, \
+            tarfile.open(fileobj=stream, mode='r|') as tar:
+        for member in tar:
+            if cancel_event is not None and cancel_event.is_set():
+                raise InterruptedError("Проверка архива отменена")
+            seen.add(member.name)
+            if not member.isreg():
+                continue
+            hasher = new_hasher(algorithm)
+            source = tar.extractfile(member)
+            while True:
+                chunk = source.read(1024 * 1024)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                done += len(chunk)
+                if progress_callback is not None:
+                    progress_callback(done, total)
+            size, digest = expected.get(member.name, (member.size, None))
+            if digest is not None and hasher.hexdigest() != digest:
+                mismatches.append(member.name)
+    
+    missing = sorted(set(expected) - seen)
+    return {
+        'ok': not mismatches and not missing,
+        'members': len(seen),
+        'mismatches': mismatches,
+        'missing': missing
+    }
+
+
+def get_default_archive_path(project_path: str, codec: Optional[str] = None) -> str:
+    """
+    Возвращает путь к архиву рядом с проектом
+    
+    Args:
+        project_path: Путь к проекту
+        codec: Кодек
+    
+    Returns:
+        Путь вида <папка проектов>/<проект>_<дата>.tar.zst
+    """
+    project_path = os.path.abspath(project_path)
+    name = f"{os.path.basename(project_path)}_{time.strftime('%Y%m%d')}"
+    return os.path.join(os.path.dirname(project_path), name + ARCHIVE_EXTENSIONS[codec or default_codec()])
+
+
+class ArchiveWorker(QThread):
+    """Рабочий поток архивации проекта"""
+    
+    progress_updated = pyqtSignal(dict)
+    finished = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, project_path: str, archive_path: str, excludes: Optional[List[str]] = None,
+                 verify: bool = True):
+        """
+        Инициализация рабочего потока
+        
+        Args:
+            project_path: Путь к проекту
+            archive_path: Путь к архиву
+            excludes: Правила исключения
+            verify: Проверить архив после записи
+        """
+        super().__init__()
+        self.project_path = project_path
+        self.archive_path = archive_path
+        self.excludes = excludes
+        self.verify = verify
+        self.cancel_event = threading.Event()
+    
+    def cancel(self) -> None:
+        """Запрашивает отмену архивации"""
+        self.cancel_event.set()
+    
+    def run(self) -> None:
+        """Основной метод архивации"""
+        try:
+            archiver = ProjectArchiver(self.project_path, self.archive_path, excludes=self.excludes,
+                                       progress_callback=self.progress_updated.emit,
+                                       cancel_event=self.cancel_event)
+            self.finished.emit(archiver.run(verify=self.verify))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
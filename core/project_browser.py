@@ -0,0 +1,135 @@
+"""
+Фоновое чтение списка проектов базовой папки
+Папки перечисляются лениво и отдаются страницами, поэтому первые
+проекты видны сразу, даже если на сетевом диске их тысячи
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.project_index import ProjectIndex, describe_project, get_project_index
+from core.project_metadata import read_metadata_bulk
+from core.structure_audit import StructureAuditor
+
+
+# Количество проектов на странице
+BROWSER_PAGE_SIZE = 100
+
+# Статусы соответствия текущей структуре папок
+STRUCTURE_CURRENT = 'current'
+STRUCTURE_OUTDATED = 'outdated'
+STRUCTURE_UNKNOWN = 'unknown'
+
+
+def get_structure_status(audit: Optional[Dict[str, Any]]) -> str:
+    """
+    Определяет соответствие проекта текущей структуре по результату проверки
+    
+    Args:
+        audit: Результат StructureAuditor или None
+    
+    Returns:
+        STRUCTURE_CURRENT, STRUCTURE_OUTDATED или STRUCTURE_UNKNOWN
+    """
+    if audit is None or audit.get('error'):
+        return STRUCTURE_UNKNOWN
+    return STRUCTURE_CURRENT if audit['ok'] else STRUCTURE_OUTDATED
+
+
+class ProjectPageLoader(QThread):
+    """Рабочий поток постраничной загрузки проектов базовой папки"""
+    
+    progress_updated = pyqtSignal(int)
+    page_ready = pyqtSignal(list)
+    finished = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, base_path: str, index: Optional[ProjectIndex] = None,
+                 page_size: int = BROWSER_PAGE_SIZE):
+        """
+        Инициализация рабочего потока
+        
+        Args:
+            base_path: Базовая папка проектов
+            index: Индекс проектов с размерами (по умолчанию общий)
+            page_size: Количество проектов на странице
+        """
+        super().__init__()
+        self.base_path = os.path.abspath(base_path)
+        self.index = index or get_project_index()
+        self.page_size = page_size
+        self.cancel_event = threading.Event()
+    
+    def cancel(self) -> None:
+        """Запрашивает отмену загрузки"""
+        self.cancel_event.set()
+    
+    def _build_page(self, paths: List[str], auditor: StructureAuditor) -> List[Dict[str, Any]]:
+        """
+        Собирает записи страницы: из индекса, project.json или по папкам
+        
+        Args:
+            paths: Папки страницы
+            auditor: Проверка структуры (с кэшем по mtime папок)
+        
+        Returns:
+            Записи проектов (папки, не похожие на проект, пропускаются)
+        """
+        indexed = self.index.get_many(paths)
+        metadata_by_path = read_metadata_bulk(path for path in paths if path not in indexed)
+        
+        rows = []
+        for path in paths:
+            project = indexed.get(path)
+            if project is None:
+                try:
+                    project = describe_project(path, metadata_by_path.get(path))
+                except OSError:
+                    continue
+                if project is None:
+                    continue
+            rows.append(project)
+        
+        audits = auditor.audit_paths(project['path'] for project in rows)
+        for project, audit in zip(rows, audits):
+            project['structure_status'] = get_structure_status(audit)
+            project['structure_problems'] = (
+                [f"- {path}" for path in audit['missing']] +
+                [f"+ {path}" for path in audit['extra']] +
+                [f"{found} → {expected}" for found, expected in audit['misnamed']]
+            )
+        return rows
+    
+    def run(self) -> None:
+        """Основной метод загрузки"""
+        try:
+            auditor = StructureAuditor(self.base_path, cancel_event=self.cancel_event)
+            loaded = 0
+            paths: List[str] = []
+            with os.scandir(self.base_path) as entries:
+                for entry in entries:
+                    if self.cancel_event.is_set():
+                        break
+                    if not entry.is_dir(follow_symlinks=False) or entry.name.startswith('.'):
+                        continue
+                    paths.append(entry.path)
+                    if len(paths) >= self.page_size:
+                        page = self._build_page(paths, auditor)
+                        paths = []
+                        loaded += len(page)
+                        self.page_ready.emit(page)
+                        self.progress_updated.emit(loaded)
+            
+            if paths and not self.cancel_event.is_set():
+                page = self._build_page(paths, auditor)
+                loaded += len(page)
+                self.page_ready.emit(page)
+                self.progress_updated.emit(loaded)
+            auditor.save_cache()
+            self.finished.emit({'projects': loaded, 'cancelled': self.cancel_event.is_set()})
+        except (OSError, sqlite3.Error, InterruptedError) as e:
+            self.error_occurred.emit(str(e))
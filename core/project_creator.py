@@ -3,25 +3,43 @@
 Содержит классы для создания структуры папок и файлов проекта
 """
 
+import io
 import os
+import sqlite3
 import time
-import shutil
-import glob
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from PyQt5.QtCore import QThread, pyqtSignal
 
 from config.translations import Translations
-from utils.resource_manager import resource_path
+from core.file_hashing import HashingWriter, copy_file_hashed, hash_bytes
+from core.file_system import LocalFileSystem
+from core.folder_structure_manager import FolderStructureManager
+from core.io_policy import (IOMetrics, RetryPolicy, RetryingFileSystem, PERMANENT,
+                            classify_error, describe_error)
+from core.project_index import ProjectIndex
+from core.project_metadata import build_project_metadata, get_metadata_path, serialize_metadata
+from core.skeleton_archive import extract_skeleton, get_skeleton_cache
+from core.template_cache import TemplateCache, get_template_cache
+from core.template_catalog import TemplateCatalog, get_default_templates_dir
+from core.template_transforms import TRANSFORM_ERRORS, copy_with_transform, get_template_transform
+from core.template_variants import TemplateVariant, get_variant_index
 
 
 class ProjectCreatorWorker(QThread):
     """Рабочий поток для создания проекта в фоновом режиме"""
     
+    # Количество попыток копирования шаблона при несовпадении хеша
+    VERIFY_ATTEMPTS = 3
+    
     progress_updated = pyqtSignal(int)
     finished = pyqtSignal(dict)
     error_occurred = pyqtSignal(str)
     
-    def __init__(self, project_data: Dict[str, Any], base_path: str, lang: str = 'ru'):
+    def __init__(self, project_data: Dict[str, Any], base_path: str, lang: str = 'ru',
+                 fs: Optional[LocalFileSystem] = None, retry_policy: Optional[RetryPolicy] = None,
+                 use_skeleton_archive: bool = False, template_cache: Optional[TemplateCache] = None,
+                 templates_dir: Optional[str] = None, verify_copies: bool = False,
+                 project_index: Optional[ProjectIndex] = None):
         """
         Инициализация рабочего потока
         
@@ -29,6 +47,13 @@ class ProjectCreatorWorker(QThread):
             project_data: Данные проекта (имя, инструменты)
             base_path: Базовый путь для создания проекта
             lang: Язык интерфейса
+            fs: Слой файловых операций (по умолчанию локальная ФС)
+            retry_policy: Политика повторов временных ошибок ввода-вывода
+            use_skeleton_archive: Создавать проект распаковкой архива-заготовки
+            template_cache: Кэш содержимого шаблонов (по умолчанию общий)
+            templates_dir: Папка с шаблонами (по умолчанию встроенная)
+            verify_copies: Проверять скопированные шаблоны по хешу содержимого
+            project_index: Индекс проектов, в который записывается созданный проект
         """
         super().__init__()
         self.project_data = project_data
@@ -36,22 +61,38 @@ class ProjectCreatorWorker(QThread):
         self.lang = lang
         self.t = Translations.get(lang)
         
+        # Все файловые операции проходят через политику повторов
+        self.io_metrics = IOMetrics()
+        self.fs = RetryingFileSystem(fs or LocalFileSystem(), retry_policy, self.io_metrics)
+        self.failed_files = []
+        self.use_skeleton_archive = use_skeleton_archive
+        
+        # Проверка целостности скопированных шаблонов
+        self.verify_copies = verify_copies
+        self.verification_failures = []
+        
+        # Созданный проект записывается в индекс для поиска
+        self.project_index = project_index
+        
+        # Параметры подстановки в шаблоны (frame_rate, resolution, sequence_name)
+        self.template_params = project_data.get('template_params', {})
+        
+        # Выбранные варианты шаблонов: tool -> variant_id
+        self.variants = project_data.get('variants', {})
+        self.variant_index = None
+        
+        # Искусственные паузы между шагами для плавной анимации прогресса
+        # (отключаются в бенчмарках и пакетном создании)
+        self.ui_delays = True
+        
         # Путь к папке с шаблонами
-        self.templates_dir = resource_path("resources/templates")
-        
-        # Определяем структуру папок
-        self.base_folders = [
-            "01_IN/FOOTAGES",
-            "01_IN/SFX", 
-            "01_IN/FONTS",
-            "01_IN/ASSETS",
-            "02_PROCESS",
-            "03_RENDER",
-            "04_OUT/01_PREVIEW",
-            "04_OUT/02_STILLSHOTS", 
-            "04_OUT/03_ANIMATIC",
-            "04_OUT/04_MASTER"
-        ]
+        self.templates_dir = templates_dir or get_default_templates_dir()
+        self.catalog = TemplateCatalog(self.templates_dir, self.fs)
+        self.template_cache = template_cache or get_template_cache()
+        
+        # Папки проекта и хеш структуры, по которой он создается (заполняются в run)
+        self.folders: List[str] = []
+        self.structure_hash: Optional[str] = None
     
     def run(self) -> None:
         """Основной метод выполнения создания проекта"""
@@ -60,7 +101,7 @@ class ProjectCreatorWorker(QThread):
             project_path = os.path.join(self.base_path, project_name)
             
             # Проверяем, существует ли уже проект
-            if os.path.exists(project_path):
+            if self.fs.exists(project_path):
                 self.error_occurred.emit(self.t['project_exists'].format(project_name))
                 return
             
@@ -71,10 +112,31 @@ class ProjectCreatorWorker(QThread):
                 self.error_occurred.emit(error_msg)
                 return
             
+            # Структура читается один раз: по ней создаются папки, а ее снимок
+            # и хеш записываются в project.json и в индекс проектов
+            structure_manager = FolderStructureManager()
+            self.folders = structure_manager.get_folder_list(self.project_data['tools'])
+            self.structure_hash = structure_manager.save_snapshot()
+            self._add_template_folders()
+            
+            # Сбрасываем кэш шаблонов и индекс вариантов, если каталог изменился
+            fingerprint = self.catalog.fingerprint()
+            self.template_cache.sync_fingerprint(fingerprint)
+            self.variant_index = get_variant_index(self.catalog, fingerprint)
+            
             # Создаем структуру проекта
-            result = self._create_project_structure(project_path, project_name)
-            self.finished.emit(result)
+            if self.use_skeleton_archive:
+                result = self._create_from_skeleton(project_path, project_name)
+            else:
+                result = self._create_project_structure(project_path, project_name)
             
+            # Сохраняем хеши шаблонов, вычисленные при проверке и для project.json
+            self.catalog.hash_store.save()
+            self._record_in_index(result)
+            self.finished.emit(result)
+        
+        except OSError as e:
+            self.error_occurred.emit(describe_error(e))
         except Exception as e:
             self.error_occurred.emit(str(e))
     
@@ -89,26 +151,25 @@ class ProjectCreatorWorker(QThread):
         Returns:
             Словарь с информацией о созданном проекте
         """
-        # Получаем список всех папок для создания
-        folders = self._get_folder_list()
+        folders = self.folders
         
         # Подсчитываем общее количество шагов
         total_steps = len(folders) + len(self.project_data['tools']) + 2
         current_step = 0
         
         # Создаем основную папку проекта
-        os.makedirs(project_path, exist_ok=True)
+        self.fs.makedirs(project_path, exist_ok=True)
         current_step += 1
         self.progress_updated.emit(int((current_step / total_steps) * 100))
-        time.sleep(0.1)
+        self._step_delay(0.1)
         
         # Создаем структуру папок
         for folder in folders:
             folder_path = os.path.join(project_path, folder)
-            os.makedirs(folder_path, exist_ok=True)
+            self.fs.makedirs(folder_path, exist_ok=True)
             current_step += 1
             self.progress_updated.emit(int((current_step / total_steps) * 100))
-            time.sleep(0.05)
+            self._step_delay(0.05)
         
         # Создаем файлы проектов для выбранных инструментов
         files_created = 0
@@ -118,11 +179,13 @@ class ProjectCreatorWorker(QThread):
             
             current_step += 1
             self.progress_updated.emit(int((current_step / total_steps) * 100))
-            time.sleep(0.1)
+            self._step_delay(0.1)
         
-        # Создаем README файл
+        # Создаем README и файл метаданных
         self._create_readme(project_path, project_name)
         files_created += 1
+        if self._create_metadata(project_path, project_name):
+            files_created += 1
         current_step += 1
         self.progress_updated.emit(100)
         
@@ -131,63 +194,131 @@ class ProjectCreatorWorker(QThread):
             'name': project_name,
             'tools': self.project_data['tools'],
             'folders_created': len(folders),
-            'files_created': files_created
+            'files_created': files_created,
+            'failed_files': list(self.failed_files),
+            'verification_failures': list(self.verification_failures),
+            'retries': self.io_metrics.retries,
+            'io_metrics': self.io_metrics.to_dict()
         }
     
-    def _check_templates(self) -> List[str]:
+    def _record_in_index(self, result: Dict[str, Any]) -> None:
         """
-        Проверяет наличие шаблонов для выбранных инструментов
+        Записывает созданный проект в индекс проектов
+        
+        Args:
+            result: Результат создания проекта
+        """
+        if self.project_index is None:
+            return
+        try:
+            self.project_index.record_created(result, self.structure_hash)
+        except (OSError, sqlite3.Error) as e:
+            # Проект уже создан, сбой индекса не должен считаться ошибкой создания
+            print(f"Не удалось записать проект в индекс: {e}")
+    
+    def _create_from_skeleton(self, project_path: str, project_name: str) -> Dict[str, Any]:
+        """
+        Создает проект распаковкой архива-заготовки из кэша
+        
+        Args:
+            project_path: Путь к проекту
+            project_name: Имя проекта
         
         Returns:
-            Список инструментов, для которых не найдены шаблоны
+            Словарь с информацией о созданном проекте
         """
-        missing_templates = []
-        
-        # Определяем соответствие инструментов и расширений файлов
-        tool_extensions = {
-            'ae': ('*.aep', 'After Effects (.aep)'),
-            'c4d': ('*.c4d', 'Cinema 4D (.c4d)'),
-            'pr': ('*.prproj', 'Premiere Pro (.prproj)'),        
-            'houdini': ('*.hip', 'Houdini (.hip)'),              
-            'blender': ('*.blend', 'Blender (.blend)'),          
+        folders = self.folders
+        tools = self.project_data['tools']
+        
+        # Архив собирается один раз на структуру, набор инструментов и варианты шаблонов
+        templates = {}
+        params_by_extension = {}
+        for tool in tools:
+            variant = self._resolve_variant(tool)
+            config = self.catalog.get_tool_config(tool)
+            if variant is not None and config is not None:
+                templates[tool] = variant.path
+                params_by_extension[config['extension']] = self._get_template_params(variant)
+        
+        archive_path = get_skeleton_cache().get_or_build(folders, tools, self.catalog, templates)
+        self.progress_updated.emit(10)
+        
+        extracted = extract_skeleton(archive_path, project_path, project_name, self.fs,
+                                     params_by_extension)
+        self.progress_updated.emit(90)
+        
+        self._create_readme(project_path, project_name)
+        metadata_created = self._create_metadata(project_path, project_name)
+        self.progress_updated.emit(100)
+        
+        return {
+            'path': project_path,
+            'name': project_name,
+            'tools': tools,
+            'folders_created': extracted['folders_created'],
+            'files_created': extracted['files_created'] + 1 + int(metadata_created),
+            'failed_files': list(self.failed_files),
+            'verification_failures': list(self.verification_failures),
+            'retries': self.io_metrics.retries,
+            'io_metrics': self.io_metrics.to_dict(),
+            'skeleton_archive': archive_path
         }
+    
+    def _resolve_variant(self, tool: str) -> Optional[TemplateVariant]:
+        """
+        Возвращает выбранный вариант шаблона инструмента
         
-        for tool in self.project_data['tools']:
-            if tool in tool_extensions:
-                pattern, display_name = tool_extensions[tool]
-                template_files = glob.glob(os.path.join(self.templates_dir, pattern))
-                if not template_files:
-                    missing_templates.append(display_name)
-            else:
-                missing_templates.append(f"Неизвестный инструмент: {tool}")
+        Args:
+            tool: Код инструмента
         
-        return missing_templates
-
-    def _get_folder_list(self) -> List[str]:
+        Returns:
+            Вариант шаблона или None, если шаблонов нет
         """
-        Получает список папок для создания с учетом выбранных инструментов
+        if self.variant_index is None:
+            self.variant_index = get_variant_index(self.catalog)
+        return self.variant_index.resolve(tool, self.variants.get(tool))
+    
+    def _get_template_params(self, variant: TemplateVariant) -> Dict[str, Any]:
+        """
+        Объединяет параметры варианта с явно заданными параметрами проекта
+        
+        Args:
+            variant: Вариант шаблона
         
         Returns:
-            Список путей папок
+            Параметры подстановки в шаблон
         """
-        folders = self.base_folders.copy()
-        
-        # Определяем соответствие инструментов и папок
-        tool_folders = {
-            'ae': '02_PROCESS/AE',
-            'c4d': '02_PROCESS/C4D',
-            'pr': '02_PROCESS/PR',               
-            'houdini': '02_PROCESS/HOUDINI',     
-            'blender': '02_PROCESS/BLENDER',     
-        }
+        params = variant.get_template_params()
+        params.update(self.template_params)
+        return params
+    
+    def _step_delay(self, seconds: float) -> None:
+        """
+        Пауза между шагами создания для наглядного прогресса
         
-        # Добавляем папки для выбранных инструментов
-        for tool in self.project_data['tools']:
-            if tool in tool_folders:
-                folders.append(tool_folders[tool])
+        Args:
+            seconds: Длительность паузы в секундах
+        """
+        if self.ui_delays:
+            time.sleep(seconds)
+    
+    def _check_templates(self) -> List[str]:
+        """
+        Проверяет наличие шаблонов для выбранных инструментов
         
-        return folders
-
+        Returns:
+            Список инструментов, для которых не найдены шаблоны
+        """
+        return self.catalog.missing_templates(self.project_data['tools'])
+    
+    def _add_template_folders(self) -> None:
+        """Добавляет папки шаблонов инструментов, если в структуре нет 02_PROCESS"""
+        existing = {os.path.normpath(folder) for folder in self.folders}
+        for tool in self.project_data['tools']:
+            config = self.catalog.get_tool_config(tool)
+            if config is not None and os.path.normpath(config['folder']) not in existing:
+                self.folders.append(config['folder'])
+                existing.add(os.path.normpath(config['folder']))
     
     def _create_tool_project_file(self, project_path: str, project_name: str, tool: str) -> bool:
         """
@@ -200,65 +331,140 @@ class ProjectCreatorWorker(QThread):
             
         Returns:
             True если файл скопирован успешно
+        
+        Raises:
+            OSError: Постоянная ошибка ввода-вывода (создание проекта прерывается)
         """
         try:
-            # Определяем параметры для каждого инструмента
-            tool_config = {
-                'ae': {
-                    'pattern': '*.aep',
-                    'folder': '02_PROCESS/AE',
-                    'extension': '.aep'
-                },
-                'c4d': {
-                    'pattern': '*.c4d',
-                    'folder': '02_PROCESS/C4D',
-                    'extension': '.c4d'
-                },
-                'pr': {                                          
-                    'pattern': '*.prproj',
-                    'folder': '02_PROCESS/PR',
-                    'extension': '.prproj'
-                },
-                'houdini': {                                     
-                    'pattern': '*.hip',
-                    'folder': '02_PROCESS/HOUDINI',
-                    'extension': '.hip'
-                },
-                'blender': {                                     
-                    'pattern': '*.blend',
-                    'folder': '02_PROCESS/BLENDER',
-                    'extension': '.blend'
-                },
-            }
-            
-            if tool not in tool_config:
+            config = self.catalog.get_tool_config(tool)
+            if config is None:
                 print(f"Неизвестный инструмент: {tool}")
                 return False
             
-            config = tool_config[tool]
-            
-            # Ищем шаблон
-            template_files = glob.glob(os.path.join(self.templates_dir, config['pattern']))
+            # Ищем выбранный вариант шаблона
+            variant = self._resolve_variant(tool)
             destination_dir = os.path.join(project_path, config['folder'])
             new_filename = f"{project_name}{config['extension']}"
             
-            if not template_files:
+            if variant is None:
                 print(f"Шаблон для {tool} не найден")
                 return False
             
-            # Используем первый найденный шаблон
-            template_file = template_files[0]
+            template_file = variant.path
             destination_file = os.path.join(destination_dir, new_filename)
             
-            # Копируем файл
-            shutil.copy2(template_file, destination_file)
+            # Копируем файл (из кэша шаблонов, если он там есть)
+            if not self._copy_template(template_file, destination_file, project_name,
+                                       config['extension'], self._get_template_params(variant)):
+                self.failed_files.append(tool)
+                return False
             print(f"Шаблон {tool} скопирован: {template_file} -> {destination_file}")
             return True
-            
+        
         except Exception as e:
-            print(f"Ошибка копирования шаблона для {tool}: {e}")
+            # Постоянные ошибки ввода-вывода прерывают создание, временные уже повторены
+            # политикой; прочие ошибки (поврежденный шаблон и т.п.) затрагивают только этот файл
+            if isinstance(e, OSError) and classify_error(e) == PERMANENT:
+                raise
+            print(f"Ошибка копирования шаблона для {tool}: {describe_error(e)}")
+            self.failed_files.append(tool)
             return False
     
+    def _copy_template(self, template_file: str, destination_file: str,
+                       project_name: str, extension: str, params: Dict[str, Any]) -> bool:
+        """
+        Копирует шаблон, используя кэш шаблонов в памяти
+        
+        Args:
+            template_file: Путь к шаблону
+            destination_file: Путь к файлу проекта
+            project_name: Имя проекта для подстановки в шаблон
+            extension: Расширение файла шаблона
+            params: Параметры подстановки в шаблон
+        
+        Returns:
+            True если файл скопирован (и, при включенной проверке, прошел ее)
+        """
+        transform = get_template_transform(extension, project_name, params)
+        if not self.verify_copies:
+            cached = self.template_cache.get_or_load(template_file, self.fs)
+            self._write_template(template_file, destination_file, cached, transform)
+            return True
+        
+        # Повторяем копирование, пока хеш и размер копии не совпадут с ожидаемыми
+        expected = None
+        for attempt in range(1, self.VERIFY_ATTEMPTS + 1):
+            # После неудачной попытки читаем шаблон с диска в обход кэша
+            cached = self.template_cache.get_or_load(template_file, self.fs) if attempt == 1 else None
+            digest, size = self._write_template(template_file, destination_file, cached, transform)
+            actual_size = self.fs.stat(destination_file).st_size
+            
+            # Для преобразованных шаблонов сверяется только размер записанного
+            if digest is not None:
+                expected = expected or self.catalog.get_source_hash(template_file)
+            if actual_size == size and (digest is None or digest == expected):
+                return True
+            print(f"Несовпадение при проверке {destination_file} (попытка {attempt}): "
+                  f"размер {actual_size}/{size}, хеш {digest}/{expected}")
+        
+        self.verification_failures.append({
+            'template': template_file,
+            'destination': destination_file,
+            'expected_hash': expected,
+            'actual_hash': digest,
+            'expected_size': size,
+            'actual_size': actual_size
+        })
+        return False
+    
+    def _write_template(self, template_file: str, destination_file: str,
+                        cached: Optional[Any], transform: Optional[Any]) -> Optional[Tuple[Optional[str], int]]:
+        """
+        Записывает файл проекта из шаблона, вычисляя хеш за тот же проход при проверке
+        
+        Args:
+            template_file: Путь к шаблону
+            destination_file: Путь к файлу проекта
+            cached: Запись кэша шаблонов или None
+            transform: Преобразование шаблона или None
+        
+        Returns:
+            Кортеж (хеш записанного, размер записанного); хеш равен None для
+            преобразованных шаблонов, а весь кортеж - None без проверки
+        """
+        algorithm = self.catalog.hash_store.algorithm
+        
+        if transform is not None:
+            def write_transformed(fs: LocalFileSystem) -> Optional[Tuple[None, int]]:
+                source = io.BytesIO(cached.data) if cached is not None else fs.open(template_file, 'rb')
+                with source, fs.open(destination_file, 'wb') as destination:
+                    if not self.verify_copies:
+                        copy_with_transform(source, destination, transform)
+                        return None
+                    writer = HashingWriter(destination, algorithm)
+                    copy_with_transform(source, writer, transform)
+                return None, writer.bytes_written
+            
+            try:
+                # Сбой посреди потока повторяется целиком: файл назначения перезаписывается с начала
+                return self.fs.run('write_template', write_transformed)
+            except TRANSFORM_ERRORS as e:
+                print(f"Предупреждение: шаблон {template_file} скопирован без подстановки параметров: {e}")
+        
+        if cached is None:
+            # Слишком большой для кэша шаблон копируем напрямую
+            if not self.verify_copies:
+                self.fs.copy_file(template_file, destination_file)
+                return None
+            writer = self.fs.run('copy_file', lambda fs: copy_file_hashed(template_file, destination_file,
+                                                                          fs, algorithm))
+            return writer.hexdigest(), writer.bytes_written
+        
+        self.fs.write_bytes(destination_file, cached.data, mtime=cached.mtime)
+        if not self.verify_copies:
+            return None
+        return hash_bytes(cached.data, algorithm), len(cached.data)
+    
     def _create_readme(self, project_path: str, project_name: str) -> None:
         """
         Создает README файл с описанием проекта
@@ -271,11 +477,48 @@ class ProjectCreatorWorker(QThread):
         readme_path = os.path.join(project_path, "README.md")
         
         try:
-            with open(readme_path, 'w', encoding='utf-8') as f:
-                f.write(readme_content)
+            self.fs.write_text(readme_path, readme_content)
         except Exception as e:
             print(f"Предупреждение: Не удалось создать README файл: {e}")
     
+    def _create_metadata(self, project_path: str, project_name: str) -> bool:
+        """
+        Создает project.json с метаданными проекта
+        
+        Args:
+            project_path: Путь к проекту
+            project_name: Имя проекта
+        
+        Returns:
+            True если файл записан
+        """
+        templates = {}
+        for tool in self.project_data['tools']:
+            variant = self._resolve_variant(tool)
+            if variant is None:
+                continue
+            try:
+                template_hash = self.catalog.get_source_hash(variant.path)
+            except OSError as e:
+                print(f"Ошибка хеширования шаблона {variant.path}: {e}")
+                template_hash = None
+            templates[tool] = {
+                'variant': variant.variant_id,
+                'file': os.path.basename(variant.path),
+                'hash': template_hash,
+                'algorithm': self.catalog.hash_store.algorithm
+            }
+        
+        # Снимок структуры нужен для будущей миграции проекта на новую ревизию
+        metadata = build_project_metadata(project_name, self.project_data['tools'], templates,
+                                          self.structure_hash)
+        try:
+            self.fs.write_text(get_metadata_path(project_path), serialize_metadata(metadata))
+            return True
+        except Exception as e:
+            print(f"Предупреждение: Не удалось создать файл метаданных проекта: {e}")
+            return False
+    
     def _generate_readme_content(self, project_name: str) -> str:
         """
         Генерирует содержимое README файла
@@ -0,0 +1,455 @@
+"""
+Индекс проектов студии
+Локальная база SQLite с полнотекстовым индексом FTS5: хранит созданные
+и импортированные проекты и находит их по началу слова или с опечаткой
+"""
+
+import difflib
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.folder_structure_manager import FolderStructureManager
+from core.project_metadata import read_metadata_bulk
+from core.size_scanner import SizeScanner
+from utils.resource_manager import get_app_data_path
+
+
+# Папки верхнего уровня, по которым папка опознается как проект
+PROJECT_MARKERS = ['01_IN', '02_PROCESS', '03_RENDER', '04_OUT']
+
+# Сколько папок-маркеров должно быть у проекта
+PROJECT_MARKERS_REQUIRED = 2
+
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    tools TEXT NOT NULL DEFAULT '',
+    structure_hash TEXT,
+    created REAL,
+    size INTEGER,
+    files INTEGER,
+    latest_mtime REAL,
+    indexed REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS projects_fts USING fts5(
+    name, path, tools,
+    content='projects', content_rowid='id',
+    tokenize="unicode61 remove_diacritics 2",
+    prefix='1 2 3'
+);
+CREATE TRIGGER IF NOT EXISTS projects_ai AFTER INSERT ON projects BEGIN
+    INSERT INTO projects_fts(rowid, name, path, tools) VALUES (new.id, new.name, new.path, new.tools);
+END;
+CREATE TRIGGER IF NOT EXISTS projects_ad AFTER DELETE ON projects BEGIN
+    INSERT INTO projects_fts(projects_fts, rowid, name, path, tools)
+    VALUES ('delete', old.id, old.name, old.path, old.tools);
+END;
+CREATE TRIGGER IF NOT EXISTS projects_au AFTER UPDATE ON projects BEGIN
+    INSERT INTO projects_fts(projects_fts, rowid, name, path, tools)
+    VALUES ('delete', old.id, old.name, old.path, old.tools);
+    INSERT INTO projects_fts(rowid, name, path, tools) VALUES (new.id, new.name, new.path, new.tools);
+END;
+"""
+
+_COLUMNS = ['path', 'name', 'tools', 'structure_hash', 'created', 'size', 'files', 'latest_mtime']
+
+# Слова запроса: буквы и цифры любого алфавита ('_' разделяет слова, как в FTS5)
+_TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+# Порог похожести слова при поиске с опечатками
+FUZZY_CUTOFF = 0.75
+
+# Порог похожести названия целиком (запрос набран без разделителей)
+FUZZY_WHOLE_CUTOFF = 0.6
+
+
+def is_project_dir(path: str) -> bool:
+    """
+    Проверяет, похожа ли папка на проект по папкам верхнего уровня
+    
+    Args:
+        path: Путь к папке
+    
+    Returns:
+        True если найдено не меньше PROJECT_MARKERS_REQUIRED папок структуры
+    """
+    return sum(os.path.isdir(os.path.join(path, marker)) for marker in PROJECT_MARKERS) >= PROJECT_MARKERS_REQUIRED
+
+
+def detect_tools(project_path: str) -> List[str]:
+    """
+    Определяет инструменты проекта по папкам в 02_PROCESS
+    
+    Args:
+        project_path: Путь к проекту
+    
+    Returns:
+        Список кодов инструментов
+    """
+    process_path = os.path.join(project_path, '02_PROCESS')
+    mapping = FolderStructureManager().get_tool_folder_mapping()
+    return [tool for tool, folder in mapping.items() if os.path.isdir(os.path.join(process_path, folder))]
+
+
+class ProjectIndex:
+    """База проектов с полнотекстовым поиском"""
+    
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Инициализация индекса
+        
+        Args:
+            db_path: Файл базы (по умолчанию в папке данных приложения)
+        """
+        self.db_path = db_path or os.path.join(get_app_data_path(), 'projects.sqlite3')
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        # Одно соединение на все потоки, запись и чтение под общей блокировкой
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._words: Optional[Dict[str, set]] = None
+        self._init_schema()
+    
+    def _init_schema(self) -> None:
+        """Создает таблицы, если база новая"""
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                # Таблица проектов сохраняется, полнотекстовый индекс пересобирается по ней
+                self._conn.executescript("DROP TABLE IF EXISTS projects_fts;" if version else "")
+                self._conn.executescript(SCHEMA)
+                if version:
+                    self._conn.execute("INSERT INTO projects_fts(projects_fts) VALUES ('rebuild')")
+                self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+    
+    def close(self) -> None:
+        """Закрывает соединение с базой"""
+        with self._lock:
+            self._conn.close()
+    
+    def upsert_many(self, projects: Iterable[Dict[str, Any]]) -> int:
+        """
+        Добавляет или обновляет проекты одной транзакцией
+        
+        Args:
+            projects: Словари с ключами из _COLUMNS (path и name обязательны);
+                отсутствующие ключи не меняют уже сохраненные значения
+        
+        Returns:
+            Количество записанных проектов
+        """
+        now = time.time()
+        rows = []
+        for project in projects:
+            row = {column: project.get(column) for column in _COLUMNS}
+            row['path'] = os.path.abspath(project['path'])
+            # Отсутствующий ключ (None) не затирает сохраненные инструменты при частичном обновлении
+            tools = project.get('tools')
+            row['tools'] = ' '.join(tools) if tools is not None else None
+            row['indexed'] = now
+            rows.append(row)
+        
+        values = ', '.join("COALESCE(:tools, '')" if column == 'tools' else f":{column}" for column in _COLUMNS)
+        assignments = ', '.join(f"{column}=COALESCE(:{column}, {column})" for column in _COLUMNS[1:])
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT INTO projects ({', '.join(_COLUMNS)}, indexed) VALUES ({values}, :indexed) "
+                f"ON CONFLICT(path) DO UPDATE SET {assignments}, indexed=:indexed",
+                rows
+            )
+            self._words = None
+        return len(rows)
+    
+    def record_created(self, result: Dict[str, Any], structure_hash: Optional[str] = None) -> None:
+        """
+        Записывает только что созданный проект вместе с его размером
+        
+        Args:
+            result: Результат ProjectCreatorWorker
+            structure_hash: Хеш структуры папок, по которой создан проект
+        """
+        totals = SizeScanner(result['path'], workers=4).scan().get('.', {})
+        self.upsert_many([{
+            'path': result['path'],
+            'name': result['name'],
+            'tools': result['tools'],
+            'structure_hash': structure_hash,
+            'created': time.time(),
+            'size': totals.get('size'),
+            'files': totals.get('files'),
+            'latest_mtime': totals.get('latest_mtime')
+        }])
+    
+    def remove_missing(self, base_path: str, present: Iterable[str]) -> int:
+        """
+        Удаляет проекты базовой папки, которых больше нет на диске
+        
+        Args:
+            base_path: Базовая папка
+            present: Пути найденных проектов
+        
+        Returns:
+            Количество удаленных записей
+        """
+        prefix = os.path.join(os.path.abspath(base_path), '')
+        present = {os.path.abspath(path) for path in present}
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT id, path FROM projects WHERE substr(path, 1, ?) = ?", (len(prefix), prefix)).fetchall()
+            # Учитываются только проекты верхнего уровня базовой папки
+            stale = [(row['id'],) for row in rows
+                     if os.sep not in row['path'][len(prefix):] and row['path'] not in present]
+            self._conn.executemany("DELETE FROM projects WHERE id = ?", stale)
+            if stale:
+                self._words = None
+        return len(stale)
+    
+    def remove_paths(self, paths: Iterable[str]) -> int:
+        """
+        Удаляет проекты по путям
+        
+        Args:
+            paths: Пути проектов
+        
+        Returns:
+            Количество удаленных записей
+        """
+        rows = [(os.path.abspath(path),) for path in paths]
+        with self._lock, self._conn:
+            removed = self._conn.executemany("DELETE FROM projects WHERE path = ?", rows).rowcount
+            if removed:
+                self._words = None
+        return removed
+    
+    def count(self) -> int:
+        """Возвращает количество проектов в индексе"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+    
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """Возвращает запись проекта по пути"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM projects WHERE path = ?", (os.path.abspath(path),)).fetchone()
+        return self._to_dict(row) if row else None
+    
+    def get_many(self, paths: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Возвращает записи нескольких проектов одним запросом
+        
+        Args:
+            paths: Пути проектов
+        
+        Returns:
+            Словарь {путь: запись} для проектов, которые есть в индексе
+        """
+        paths = [os.path.abspath(path) for path in paths]
+        if not paths:
+            return {}
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM projects WHERE path IN ({', '.join('?' * len(paths))})", paths).fetchall()
+        return {row['path']: self._to_dict(row) for row in rows}
+    
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        project = dict(row)
+        project['tools'] = project['tools'].split() if project['tools'] else []
+        return project
+    
+    def search(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Ищет проекты по названию, пути и инструментам
+        
+        Каждое слово запроса ищется как начало слова (FTS5); если ничего
+        не найдено, запрос сравнивается с названиями с учетом опечаток
+        
+        Args:
+            query: Строка поиска
+            limit: Максимум результатов
+        
+        Returns:
+            Список проектов, самые релевантные первыми
+        """
+        tokens = _TOKEN_PATTERN.findall(query)
+        if not tokens:
+            return []
+        
+        match = ' '.join(f'"{token}"*' for token in tokens)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT projects.* FROM projects_fts JOIN projects ON projects.id = projects_fts.rowid "
+                "WHERE projects_fts MATCH ? ORDER BY bm25(projects_fts, 10.0, 1.0, 2.0), projects.created DESC "
+                "LIMIT ?", (match, limit)).fetchall()
+        if rows:
+            return [self._to_dict(row) for row in rows]
+        return self._fuzzy_search(query, limit)
+    
+    def _fuzzy_search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """Ищет названия, слова которых похожи на слова запроса (опечатки, пропущенные буквы)"""
+        with self._lock:
+            if self._words is None:
+                self._words = {}
+                for (name,) in self._conn.execute("SELECT DISTINCT name FROM projects"):
+                    for word in _TOKEN_PATTERN.findall(name.lower()):
+                        self._words.setdefault(word, set()).add(name)
+            words = self._words
+        
+        # Название должно содержать похожее слово для каждого слова запроса
+        candidates = None
+        for token in _TOKEN_PATTERN.findall(query.lower()):
+            # Слова сильно другой длины заведомо не пройдут порог
+            vocabulary = [word for word in words if abs(len(word) - len(token)) <= 2]
+            close = difflib.get_close_matches(token, vocabulary, n=20, cutoff=FUZZY_CUTOFF)
+            names = set().union(*(words[word] for word in close))
+            candidates = names if candidates is None else candidates & names
+        if not candidates:
+            # Слитно набранное название сравнивается целиком
+            whole = {}
+            for names in words.values():
+                whole.update((name.lower(), name) for name in names)
+            close = difflib.get_close_matches(query.lower(), list(whole), n=limit, cutoff=FUZZY_WHOLE_CUTOFF)
+            candidates = {whole[name] for name in close}
+        if not candidates:
+            return []
+        
+        ranked = sorted(candidates, key=lambda name: difflib.SequenceMatcher(None, query.lower(),
+                                                                             name.lower()).ratio(),
+                        reverse=True)[:limit]
+        order = {name: position for position, name in enumerate(ranked)}
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM projects WHERE name IN ({', '.join('?' * len(order))})", list(order)).fetchall()
+        rows.sort(key=lambda row: order[row['name']])
+        return [self._to_dict(row) for row in rows[:limit]]
+
+
+def describe_project(path: str, metadata: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Собирает запись индекса для папки проекта (без размеров)
+    
+    Args:
+        path: Путь к папке
+        metadata: Уже прочитанный project.json или None
+    
+    Returns:
+        Словарь для upsert_many или None, если папка не похожа на проект
+    """
+    name = os.path.basename(os.path.normpath(path))
+    if metadata is not None:
+        return {
+            'path': path,
+            'name': name,
+            'tools': metadata['tools'],
+            'structure_hash': metadata.get('structure'),
+            'created': metadata.get('created')
+        }
+    if not is_project_dir(path):
+        return None
+    stat = os.stat(path)
+    return {
+        'path': path,
+        'name': name,
+        'tools': detect_tools(path),
+        'created': getattr(stat, 'st_birthtime', stat.st_ctime)
+    }
+
+
+def import_projects(index: ProjectIndex, base_path: str, with_sizes: bool = True,
+                    progress_callback: Optional[Callable[[int], None]] = None,
+                    cancel_event: Optional[threading.Event] = None) -> Dict[str, int]:
+    """
+    Импортирует существующие проекты базовой папки
+    
+    Args:
+        index: Индекс проектов
+        base_path: Базовая папка проектов
+        with_sizes: Посчитать размеры (SizeScanner с кэшем по папкам)
+        progress_callback: Функция, получающая количество просканированных папок
+        cancel_event: Событие отмены (проверяется между проектами)
+    
+    Returns:
+        Словарь: 'imported', 'removed'
+    
+    Raises:
+        InterruptedError: Импорт отменен; индекс не изменяется
+    """
+    base_path = os.path.abspath(base_path)
+    with os.scandir(base_path) as entries:
+        candidates = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+    
+    # project.json читаются параллельно; папки без него опознаются по структуре
+    metadata_by_path = read_metadata_bulk(entry.path for entry in candidates)
+    projects = []
+    for entry in candidates:
+        if cancel_event is not None and cancel_event.is_set():
+            raise InterruptedError("Импорт проектов отменен")
+        project = describe_project(entry.path, metadata_by_path.get(entry.path))
+        if project is not None:
+            projects.append(project)
+    
+    if with_sizes and projects:
+        totals = SizeScanner(base_path, progress_callback=progress_callback, cancel_event=cancel_event).scan()
+        for project in projects:
+            total = totals.get(project['name'])
+            if total is not None:
+                project.update(size=total['size'], files=total['files'], latest_mtime=total['latest_mtime'])
+    
+    imported = index.upsert_many(projects)
+    removed = index.remove_missing(base_path, [project['path'] for project in projects])
+    return {'imported': imported, 'removed': removed}
+
+
+_default_index = None
+
+
+def get_project_index() -> ProjectIndex:
+    """
+    Возвращает общий для приложения индекс проектов
+    
+    Returns:
+        Экземпляр ProjectIndex
+    """
+    global _default_index
+    if _default_index is None:
+        _default_index = ProjectIndex()
+    return _default_index
+
+
+class ProjectImportWorker(QThread):
+    """Рабочий поток импорта проектов базовой папки"""
+    
+    progress_updated = pyqtSignal(int)
+    finished = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, base_path: str, index: Optional[ProjectIndex] = None):
+        """
+        Инициализация рабочего потока
+        
+        Args:
+            base_path: Базовая папка проектов
+            index: Индекс проектов (по умолчанию общий)
+        """
+        super().__init__()
+        self.base_path = base_path
+        self.index = index or get_project_index()
+    
+    def run(self) -> None:
+        """Основной метод импорта"""
+        try:
+            self.finished.emit(import_projects(self.index, self.base_path,
+                                               progress_callback=self.progress_updated.emit))
+        except (OSError, sqlite3.Error) as e:
+            self.error_occurred.emit(str(e))
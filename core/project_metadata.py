@@ -0,0 +1,138 @@
+"""
+Метаданные проекта (project.json)
+Компактный машиночитаемый файл в корне проекта: имя, инструменты,
+варианты и хеши шаблонов, структура и версия приложения.
+Индекс, сканер и проверка проектов читают его вместо разбора README.md
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+from config.settings import APP_VERSION
+
+
+PROJECT_METADATA_FILE = 'project.json'
+
+METADATA_FORMAT_VERSION = 1
+
+# Файлы маленькие, время уходит на задержки сетевых дисков - потоков больше, чем ядер
+BULK_READ_WORKERS = 16
+
+
+def get_metadata_path(project_path: str) -> str:
+    """
+    Возвращает путь к файлу метаданных проекта
+    
+    Args:
+        project_path: Путь к проекту
+    
+    Returns:
+        Путь к project.json
+    """
+    return os.path.join(project_path, PROJECT_METADATA_FILE)
+
+
+def build_project_metadata(name: str, tools: List[str], templates: Dict[str, Dict[str, Any]],
+                           structure_hash: Optional[str] = None,
+                           created: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Собирает метаданные нового проекта
+    
+    Args:
+        name: Имя проекта
+        tools: Коды инструментов
+        templates: Шаблоны по инструментам: {'variant', 'file', 'hash', 'algorithm'}
+        structure_hash: Хеш структуры папок (FolderStructureManager.get_structure_hash)
+        created: Время создания (по умолчанию - текущее)
+    
+    Returns:
+        Словарь метаданных
+    """
+    return {
+        'format': METADATA_FORMAT_VERSION,
+        'name': name,
+        'tools': list(tools),
+        'templates': templates,
+        'structure': structure_hash,
+        'app_version': APP_VERSION,
+        'created': created if created is not None else time.time()
+    }
+
+
+def serialize_metadata(metadata: Dict[str, Any]) -> str:
+    """
+    Сериализует метаданные в компактный JSON
+    
+    Args:
+        metadata: Словарь метаданных
+    
+    Returns:
+        Текст project.json
+    """
+    return json.dumps(metadata, ensure_ascii=False, separators=(',', ':'), sort_keys=True) + '\n'
+
+
+def parse_metadata(data: bytes) -> Dict[str, Any]:
+    """
+    Разбирает содержимое project.json
+    
+    Args:
+        data: Содержимое файла
+    
+    Returns:
+        Словарь метаданных
+    
+    Raises:
+        ValueError: Файл поврежден или записан более новой версией
+    """
+    metadata = json.loads(data.decode('utf-8'))
+    if not isinstance(metadata, dict) or not isinstance(metadata.get('tools'), list):
+        raise ValueError("некорректный формат метаданных проекта")
+    if metadata.get('format', 0) > METADATA_FORMAT_VERSION:
+        raise ValueError(f"неподдерживаемая версия метаданных: {metadata.get('format')}")
+    return metadata
+
+
+def read_project_metadata(project_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Читает метаданные проекта
+    
+    Args:
+        project_path: Путь к проекту
+    
+    Returns:
+        Словарь метаданных или None, если файла нет или он поврежден
+    """
+    try:
+        with open(get_metadata_path(project_path), 'rb') as f:
+            return parse_metadata(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Не удалось прочитать метаданные проекта {project_path}: {e}")
+        return None
+
+
+def read_metadata_bulk(project_paths: Iterable[str],
+                       workers: int = BULK_READ_WORKERS) -> Dict[str, Dict[str, Any]]:
+    """
+    Читает метаданные множества проектов параллельно
+    
+    Args:
+        project_paths: Пути к проектам
+        workers: Количество потоков чтения
+    
+    Returns:
+        Словарь {путь проекта: метаданные} только для проектов с корректным project.json
+    """
+    project_paths = list(project_paths)
+    if not project_paths:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(project_paths))),
+                            thread_name_prefix='MetadataRead') as pool:
+        results = pool.map(read_project_metadata, project_paths)
+        return {path: metadata for path, metadata in zip(project_paths, results) if metadata is not None}
@@ -0,0 +1,408 @@
+"""
+Восстановление проектов из архивов
+Извлекает выбранные поддеревья за один проход, по индексу архива
+переходя сразу к нужным блокам, и воссоздает структуру папок проекта
+"""
+
+import bisect
+import json
+import os
+import tarfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.file_hashing import DEFAULT_ALGORITHM, new_hasher
+from core.folder_structure_manager import FolderStructureManager
+from core.project_archive import (INDEX_FORMAT_VERSION, PROGRESS_INTERVAL, codec_from_path,
+                                  get_index_path, load_archive_index, open_archive_stream)
+
+
+RESTORE_CHUNK_SIZE = 1024 * 1024
+
+# Переход к другому блоку выгоднее чтения насквозь, если между участниками больше блоков
+SEEK_MIN_BLOCKS = 2
+
+# Фильтр безопасного извлечения (Python 3.11.4+)
+_DATA_FILTER = getattr(tarfile, 'data_filter', None)
+
+# Типы участников в индексе
+_DIRECTORY_TYPE = tarfile.DIRTYPE.decode('ascii')
+_REGULAR_TYPES = {member_type.decode('ascii') for member_type in tarfile.REGULAR_TYPES}
+
+
+def _relative_name(name: str) -> str:
+    """Путь участника относительно корня проекта (первый компонент - имя проекта)"""
+    _, _, rel = name.partition('/')
+    return rel
+
+
+def is_selected(name: str, include: Optional[List[str]]) -> bool:
+    """
+    Проверяет, входит ли участник архива в выбранные поддеревья
+    
+    Args:
+        name: Имя участника архива
+        include: Поддеревья относительно корня проекта (None - все)
+    
+    Returns:
+        True если участник нужно извлечь
+    """
+    if not include:
+        return True
+    rel = _relative_name(name)
+    return any(rel == path or rel.startswith(path + '/') for path in include)
+
+
+def build_archive_index(archive_path: str, save: bool = True) -> Dict[str, Any]:
+    """
+    Строит индекс участников архива без индекса полным чтением потока
+    
+    Смещения блоков неизвестны, поэтому переходы по такому индексу
+    возможны только в несжатом tar
+    
+    Args:
+        archive_path: Путь к архиву
+        save: Сохранить индекс рядом с архивом
+    
+    Returns:
+        Индекс в формате ProjectArchiver
+    """
+    codec = codec_from_path(archive_path)
+    members = []
+    with open_archive_stream(archive_path, codec) as stream, tarfile.open(fileobj=stream, mode='r|') as tar:
+        for member in tar:
+            members.append([member.name, member.offset, member.size, member.type.decode('ascii'), None])
+    index = _scanned_index(codec, members)
+    if save:
+        _save_index(archive_path, index)
+    return index
+
+
+def _scanned_index(codec: str, members: List[List[Any]]) -> Dict[str, Any]:
+    """Собирает индекс по участникам, прочитанным из потока (без блоков и хешей)"""
+    return {
+        'version': INDEX_FORMAT_VERSION,
+        'project': members[0][0].split('/')[0] if members else '',
+        'codec': codec,
+        'block_size': 0,
+        'algorithm': DEFAULT_ALGORITHM,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'blocks': [[0, 0]],
+        'members': members
+    }
+
+
+def _save_index(archive_path: str, index: Dict[str, Any]) -> None:
+    """Сохраняет индекс рядом с архивом (архив может лежать на носителе только для чтения)"""
+    try:
+        with open(get_index_path(archive_path), 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    except OSError as e:
+        print(f"Не удалось сохранить индекс архива: {e}")
+
+
+def list_archive_folders(index: Dict[str, Any], max_depth: int = 2) -> List[str]:
+    """
+    Возвращает папки архива до заданной глубины для выбора поддеревьев
+    
+    Args:
+        index: Индекс архива
+        max_depth: Глубина относительно корня проекта
+    
+    Returns:
+        Отсортированный список путей относительно корня проекта
+    """
+    folders = set()
+    for name, _, _, member_type, _ in index['members']:
+        parts = _relative_name(name).split('/')
+        # Для файла папками являются только родительские компоненты
+        depth = len(parts) if member_type == _DIRECTORY_TYPE else len(parts) - 1
+        for level in range(1, min(depth, max_depth) + 1):
+            folders.add('/'.join(parts[:level]))
+    folders.discard('')
+    return sorted(folders)
+
+
+class ArchiveRestorer:
+    """Выборочное восстановление проекта из архива"""
+    
+    def __init__(self, archive_path: str, destination: str, include: Optional[List[str]] = None,
+                 recreate_skeleton: bool = True,
+                 progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 cancel_event: Optional[threading.Event] = None):
+        """
+        Инициализация восстановления
+        
+        Args:
+            archive_path: Путь к архиву
+            destination: Папка, в которой будет создана папка проекта
+            include: Поддеревья относительно корня проекта, например ['01_IN', '02_PROCESS/AE']
+            recreate_skeleton: Создать пустые папки структуры проекта
+            progress_callback: Функция, получающая словарь прогресса
+            cancel_event: Событие отмены
+        """
+        self.archive_path = archive_path
+        self.destination = os.path.abspath(destination)
+        self.include = [path.strip('/').replace(os.sep, '/') for path in include] if include else None
+        self.recreate_skeleton = recreate_skeleton
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event or threading.Event()
+        self.index = load_archive_index(archive_path)
+        self.codec = self.index['codec'] if self.index else codec_from_path(archive_path)
+        
+        self.members_restored = 0
+        self.bytes_restored = 0
+        self.seeks = 0
+        self.mismatches: List[str] = []
+        self.errors: Dict[str, str] = {}
+        self._directories: List[tarfile.TarInfo] = []
+        self._bytes_total = 0
+        self._started = 0.0
+        self._last_report = 0.0
+        self._hash_algorithm = None
+        self._expected: Dict[str, Optional[str]] = {}
+    
+    def run(self) -> Dict[str, Any]:
+        """
+        Извлекает выбранные участники
+        
+        Returns:
+            Словарь с итогами восстановления
+        """
+        self._started = time.monotonic()
+        os.makedirs(self.destination, exist_ok=True)
+        
+        if self.index is not None:
+            self._hash_algorithm = self._resolve_hash_algorithm(self.index.get('algorithm'))
+            selected = [member for member in self.index['members'] if is_selected(member[0], self.include)]
+            self._bytes_total = sum(member[2] for member in selected if member[3] in _REGULAR_TYPES)
+            self._expected = {member[0]: member[4] for member in selected}
+            for block, start, end in self._plan_reads():
+                self._restore_span(block, start, end)
+            project = self.index['project']
+        else:
+            # Индекса нет: извлекаем за тот же единственный проход, попутно строя индекс
+            self.index = self._restore_and_index()
+            project = self.index['project']
+        
+        self._finish_directories()
+        if self.recreate_skeleton and project:
+            self._create_skeleton(project)
+        
+        elapsed = time.monotonic() - self._started
+        return {
+            'project_path': os.path.join(self.destination, project),
+            'members': self.members_restored,
+            'bytes': self.bytes_restored,
+            'seeks': self.seeks,
+            'mismatches': self.mismatches,
+            'errors': self.errors,
+            'elapsed': elapsed,
+            'throughput': self.bytes_restored / elapsed if elapsed > 0 else 0.0
+        }
+    
+    @staticmethod
+    def _resolve_hash_algorithm(algorithm: Optional[str]) -> Optional[str]:
+        """Возвращает алгоритм хешей индекса, если он доступен на этой машине"""
+        try:
+            new_hasher(algorithm)
+            return algorithm
+        except ValueError as e:
+            print(f"Хеши архива не будут проверены: {e}")
+            return None
+    
+    def _plan_reads(self) -> List[Tuple[List[int], int, int]]:
+        """
+        Группирует выбранные участники в отрезки последовательного чтения
+        
+        Returns:
+            Список (блок [несжатое, сжатое смещение], начало отрезка, конец отрезка)
+            в смещениях несжатого потока; конец -1 означает чтение до конца архива
+        """
+        members = self.index['members']
+        blocks = self.index['blocks']
+        block_starts = [block[0] for block in blocks]
+        block_size = self.index.get('block_size') or 0
+        # Без смещений блоков сжатый поток можно читать только с начала
+        seekable = self.codec == 'none' or len(blocks) > 1
+        
+        def block_for(offset: int) -> List[int]:
+            if self.codec == 'none':
+                return [offset, offset]
+            return blocks[bisect.bisect_right(block_starts, offset) - 1]
+        
+        spans = []
+        for position, member in enumerate(members):
+            if not is_selected(member[0], self.include):
+                continue
+            end = members[position + 1][1] if position + 1 < len(members) else -1
+            if spans:
+                gap = member[1] - spans[-1][2]
+                # Короткий промежуток дешевле прочитать насквозь, чем распаковывать блок заново
+                if gap == 0 or not seekable or (self.codec != 'none' and gap < SEEK_MIN_BLOCKS * block_size):
+                    spans[-1][2] = end
+                    continue
+            spans.append([block_for(member[1]), member[1], end])
+        return [tuple(span) for span in spans]
+    
+    def _restore_span(self, block: List[int], start: int, end: int) -> None:
+        """Читает отрезок архива от начала блока и извлекает выбранные участники"""
+        self.seeks += 1
+        with open_archive_stream(self.archive_path, self.codec, block[1]) as stream:
+            _skip(stream, start - block[0])
+            with tarfile.open(fileobj=stream, mode='r|') as tar:
+                tar.extraction_filter = _DATA_FILTER
+                for member in tar:
+                    if end != -1 and start + member.offset >= end:
+                        break
+                    if is_selected(member.name, self.include):
+                        self._extract(tar, member, self._expected.get(member.name))
+    
+    def _restore_and_index(self) -> Dict[str, Any]:
+        """Извлекает выбранные участники архива без индекса и сохраняет построенный индекс"""
+        self._hash_algorithm = None
+        self.seeks = 1
+        members = []
+        with open_archive_stream(self.archive_path, self.codec) as stream, \
+                tarfile.open(fileobj=stream, mode='r|') as tar:
+            tar.extraction_filter = _DATA_FILTER
+            for member in tar:
+                members.append([member.name, member.offset, member.size, member.type.decode('ascii'), None])
+                if is_selected(member.name, self.include):
+                    self._extract(tar, member, None)
+        index = _scanned_index(self.codec, members)
+        _save_index(self.archive_path, index)
+        return index
+    
+    def _extract(self, tar: tarfile.TarFile, member: tarfile.TarInfo, digest: Optional[str]) -> None:
+        """Извлекает один участник с проверкой пути и хеша"""
+        if self.cancel_event.is_set():
+            raise InterruptedError("Восстановление отменено")
+        try:
+            if _DATA_FILTER is not None:
+                member = _DATA_FILTER(member, self.destination)
+            target = self._safe_target(member.name)
+            if member.isdir():
+                os.makedirs(target, exist_ok=True)
+                self._directories.append(member)
+            elif member.isreg():
+                self._extract_file(tar, member, target, digest)
+            else:
+                tar.extract(member, self.destination)
+            self.members_restored += 1
+        except (tarfile.TarError, ValueError) as e:
+            self.errors[member.name] = str(e)
+    
+    def _safe_target(self, name: str) -> str:
+        """Возвращает путь назначения, не выходящий за папку восстановления"""
+        target = os.path.realpath(os.path.join(self.destination, name))
+        if not target.startswith(os.path.realpath(self.destination) + os.sep):
+            raise ValueError(f"Путь вне папки восстановления: {name}")
+        return target
+    
+    def _extract_file(self, tar: tarfile.TarFile, member: tarfile.TarInfo, target: str,
+                      digest: Optional[str]) -> None:
+        """Записывает файл участника, сверяя хеш с индексом"""
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        hasher = new_hasher(self._hash_algorithm) if digest and self._hash_algorithm else None
+        source = tar.extractfile(member)
+        with open(target, 'wb') as output:
+            while True:
+                chunk = source.read(RESTORE_CHUNK_SIZE)
+                if not chunk:
+                    break
+                output.write(chunk)
+                if hasher is not None:
+                    hasher.update(chunk)
+                self.bytes_restored += len(chunk)
+                self._report()
+        # Фильтр безопасного извлечения может сбросить права, тогда остаются права по умолчанию
+        if member.mode is not None:
+            os.chmod(target, member.mode)
+        os.utime(target, (member.mtime, member.mtime))
+        if hasher is not None and hasher.hexdigest() != digest:
+            self.mismatches.append(member.name)
+    
+    def _finish_directories(self) -> None:
+        """Восстанавливает права и время папок после записи их содержимого"""
+        for member in sorted(self._directories, key=lambda m: m.name, reverse=True):
+            target = os.path.join(self.destination, member.name)
+            try:
+                if member.mode is not None:
+                    os.chmod(target, member.mode)
+                os.utime(target, (member.mtime, member.mtime))
+            except OSError as e:
+                self.errors[member.name] = str(e)
+    
+    def _create_skeleton(self, project: str) -> None:
+        """Создает пустые папки структуры, включая папки инструментов из архива"""
+        manager = FolderStructureManager()
+        archived = {_relative_name(member[0]) for member in self.index['members']}
+        tools = [tool for tool, folder in manager.get_tool_folder_mapping().items()
+                 if f"02_PROCESS/{folder}" in archived]
+        for folder in manager.get_folder_list(tools):
+            os.makedirs(os.path.join(self.destination, project, folder), exist_ok=True)
+    
+    def _report(self) -> None:
+        """Передает прогресс не чаще PROGRESS_INTERVAL"""
+        if self.progress_callback is None:
+            return
+        now = time.monotonic()
+        if now - self._last_report < PROGRESS_INTERVAL:
+            return
+        self._last_report = now
+        self.progress_callback({
+            'phase': 'restore',
+            'bytes_done': self.bytes_restored,
+            'bytes_total': self._bytes_total,
+            'throughput': self.bytes_restored / max(now - self._started, 1e-6)
+        })
+
+
+def _skip(stream, count: int) -> None:
+    """Пропускает байты несжатого потока от начала блока до заголовка участника"""
+    while count > 0:
+        chunk = stream.read(min(count, RESTORE_CHUNK_SIZE))
+        if not chunk:
+            raise EOFError("Архив короче, чем указано в индексе")
+        count -= len(chunk)
+
+
+class RestoreWorker(QThread):
+    """Рабочий поток восстановления проекта"""
+    
+    progress_updated = pyqtSignal(dict)
+    finished = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, archive_path: str, destination: str, include: Optional[List[str]] = None):
+        """
+        Инициализация рабочего потока
+        
+        Args:
+            archive_path: Путь к архиву
+            destination: Папка назначения
+            include: Поддеревья для извлечения (None - весь проект)
+        """
+        super().__init__()
+        self.archive_path = archive_path
+        self.destination = destination
+        self.include = include
+        self.cancel_event = threading.Event()
+    
+    def cancel(self) -> None:
+        """Запрашивает отмену восстановления"""
+        self.cancel_event.set()
+    
+    def run(self) -> None:
+        """Основной метод восстановления"""
+        try:
+            restorer = ArchiveRestorer(self.archive_path, self.destination, self.include,
+                                       progress_callback=self.progress_updated.emit,
+                                       cancel_event=self.cancel_event)
+            self.finished.emit(restorer.run())
+        except Exception as e:
+            self.error_occurred.emit(str(e))
@@ -0,0 +1,494 @@
+"""
+Наблюдение за базовыми папками проектов
+События создания, переименования и удаления папок (inotify на Linux,
+QFileSystemWatcher на остальных системах) собираются в пакеты с задержкой
+и применяются к индексу проектов и кэшу размеров; редкая фоновая сверка
+подбирает пропущенные события
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import sqlite3
+import struct
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from PyQt5.QtCore import QFileSystemWatcher, QObject, QThread, QTimer, pyqtSignal
+
+from core.project_index import ProjectIndex, describe_project, get_project_index, import_projects
+from core.project_metadata import read_metadata_bulk
+from core.size_scanner import SizeScanner
+
+
+# Пауза после последнего события перед применением пакета
+WATCH_DEBOUNCE_MS = 1000
+
+# Максимальная задержка пакета при непрерывном потоке событий
+WATCH_MAX_DELAY = 5.0
+
+# Период фоновой сверки с диском (ловит пропущенные события и изменения глубже верхнего уровня)
+RECONCILE_INTERVAL_MS = 15 * 60 * 1000
+
+# Флаги inotify (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# В базовой папке интересны появление, переименование и удаление проектов
+BASE_WATCH_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+
+# В папке проекта - изменения верхнего уровня: папки структуры и project.json
+PROJECT_WATCH_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_CLOSE_WRITE | IN_ONLYDIR
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+class InotifyWatcher:
+    """Минимальная обертка над inotify через ctypes"""
+    
+    def __init__(self):
+        """
+        Создает экземпляр inotify
+        
+        Raises:
+            OSError: inotify недоступен
+        """
+        if not sys.platform.startswith('linux'):
+            raise OSError("inotify доступен только в Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._paths: Dict[int, str] = {}
+        self._watches: Dict[str, int] = {}
+    
+    def add_watch(self, path: str, mask: int) -> None:
+        """
+        Добавляет наблюдение за папкой
+        
+        Args:
+            path: Путь к папке
+            mask: Маска событий
+        
+        Raises:
+            OSError: Не удалось добавить наблюдение (например, исчерпан max_user_watches)
+        """
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), path)
+        self._paths[wd] = path
+        self._watches[path] = wd
+    
+    def remove_watch(self, path: str) -> None:
+        """Снимает наблюдение за папкой (если оно есть)"""
+        wd = self._watches.pop(path, None)
+        if wd is not None:
+            self._paths.pop(wd, None)
+            self._libc.inotify_rm_watch(self.fd, wd)
+    
+    def read_events(self, timeout: float) -> List[Tuple[str, int, str]]:
+        """
+        Читает накопившиеся события
+        
+        Args:
+            timeout: Сколько ждать первого события, секунд
+        
+        Returns:
+            Список (папка наблюдения, маска, имя); для IN_Q_OVERFLOW папка пустая
+        """
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        
+        events = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                events.append(('', mask, ''))
+                continue
+            path = self._paths.get(wd)
+            if mask & IN_IGNORED:
+                self._paths.pop(wd, None)
+                if path is not None and self._watches.get(path) == wd:
+                    del self._watches[path]
+                continue
+            if path is not None:
+                events.append((path, mask, name))
+        return events
+    
+    def close(self) -> None:
+        """Закрывает дескриптор inotify"""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def inotify_available() -> bool:
+    """Проверяет, можно ли использовать inotify"""
+    try:
+        InotifyWatcher().close()
+        return True
+    except (OSError, AttributeError):
+        return False
+
+
+def apply_watch_batch(index: ProjectIndex, batch: Dict[str, Iterable[str]],
+                      cancel_event: Optional[threading.Event] = None) -> Dict[str, int]:
+    """
+    Применяет пакет изменений к индексу проектов
+    
+    Каждая папка перепроверяется на диске, поэтому порядок событий внутри
+    пакета не важен: переименование - это исчезнувшее старое имя и новое
+    
+    Args:
+        index: Индекс проектов
+        batch: Базовая папка -> имена изменившихся папок верхнего уровня
+        cancel_event: Событие отмены (проверяется между проектами)
+    
+    Returns:
+        Словарь: 'updated', 'removed'
+    
+    Raises:
+        InterruptedError: Применение отменено; индекс не изменяется
+    """
+    paths = [os.path.join(base_path, name) for base_path, names in batch.items() for name in names]
+    present = [path for path in paths if os.path.isdir(path)]
+    metadata_by_path = read_metadata_bulk(present)
+    
+    projects = []
+    removed = [path for path in paths if path not in present]
+    for path in present:
+        if cancel_event is not None and cancel_event.is_set():
+            raise InterruptedError("Обновление индекса проектов отменено")
+        try:
+            project = describe_project(path, metadata_by_path.get(path))
+        except OSError:
+            project = None
+        if project is None:
+            removed.append(path)
+            continue
+        # Кэш размеров проекта обновляется тем же проходом
+        try:
+            totals = SizeScanner(path, workers=4, cancel_event=cancel_event).scan().get('.')
+        except InterruptedError:
+            raise
+        except OSError as e:
+            print(f"Не удалось посчитать размер {path}: {e}")
+            totals = None
+        if totals is not None:
+            project.update(size=totals['size'], files=totals['files'], latest_mtime=totals['latest_mtime'])
+        projects.append(project)
+    
+    return {
+        'updated': index.upsert_many(projects) if projects else 0,
+        'removed': index.remove_paths(removed) if removed else 0
+    }
+
+
+class _InotifyThread(QThread):
+    """Поток чтения событий inotify"""
+    
+    events_ready = pyqtSignal(list)
+    overflow = pyqtSignal()
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, base_paths: List[str]):
+        """
+        Инициализация потока
+        
+        Args:
+            base_paths: Наблюдаемые базовые папки
+        """
+        super().__init__()
+        self.base_paths = base_paths
+        self._stop_event = threading.Event()
+    
+    def stop(self) -> None:
+        """Останавливает чтение событий"""
+        self._stop_event.set()
+    
+    def _watch_projects(self, watcher: InotifyWatcher, base_path: str) -> None:
+        """Добавляет наблюдение за всеми папками верхнего уровня базовой папки"""
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    watcher.add_watch(entry.path, PROJECT_WATCH_MASK)
+    
+    def run(self) -> None:
+        """Основной цикл чтения"""
+        try:
+            watcher = InotifyWatcher()
+        except (OSError, AttributeError) as e:
+            self.error_occurred.emit(str(e))
+            return
+        
+        try:
+            for base_path in self.base_paths:
+                watcher.add_watch(base_path, BASE_WATCH_MASK)
+                self._watch_projects(watcher, base_path)
+            
+            bases = set(self.base_paths)
+            while not self._stop_event.is_set():
+                changed: Set[Tuple[str, str]] = set()
+                for path, mask, name in watcher.read_events(0.5):
+                    if not path:
+                        self.overflow.emit()
+                    elif path in bases:
+                        if not mask & IN_ISDIR or not name:
+                            continue
+                        project_path = os.path.join(path, name)
+                        if mask & (IN_CREATE | IN_MOVED_TO):
+                            try:
+                                watcher.add_watch(project_path, PROJECT_WATCH_MASK)
+                            except OSError as e:
+                                print(f"Не удалось наблюдать за {project_path}: {e}")
+                        elif mask & (IN_DELETE | IN_MOVED_FROM):
+                            watcher.remove_watch(project_path)
+                        changed.add((path, name))
+                    else:
+                        changed.add((os.path.dirname(path), os.path.basename(path)))
+                if changed:
+                    self.events_ready.emit(sorted(changed))
+        except OSError as e:
+            self.error_occurred.emit(str(e))
+        finally:
+            watcher.close()
+
+
+class ProjectWatchWorker(QThread):
+    """Рабочий поток применения пакета событий или сверки базовых папок"""
+    
+    progress_updated = pyqtSignal(int)
+    finished = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, index: ProjectIndex, batch: Optional[Dict[str, Set[str]]] = None,
+                 reconcile_paths: Optional[List[str]] = None):
+        """
+        Инициализация рабочего потока
+        
+        Args:
+            index: Индекс проектов
+            batch: Пакет событий (базовая папка -> имена папок)
+            reconcile_paths: Базовые папки для полной сверки
+        """
+        super().__init__()
+        self.index = index
+        self.batch = batch or {}
+        self.reconcile_paths = reconcile_paths or []
+        self.cancel_event = threading.Event()
+    
+    def cancel(self) -> None:
+        """Запрашивает отмену; прерывается между проектами"""
+        self.cancel_event.set()
+    
+    def run(self) -> None:
+        """Основной метод"""
+        try:
+            result = {'updated': 0, 'removed': 0}
+            if self.batch:
+                result = apply_watch_batch(self.index, self.batch, self.cancel_event)
+            for base_path in self.reconcile_paths:
+                imported = import_projects(self.index, base_path, progress_callback=self.progress_updated.emit,
+                                           cancel_event=self.cancel_event)
+                result['updated'] += imported['imported']
+                result['removed'] += imported['removed']
+            self.finished.emit(result)
+        except InterruptedError:
+            # Отмена при остановке службы: ничего не сообщается
+            pass
+        except (OSError, sqlite3.Error) as e:
+            self.error_occurred.emit(str(e))
+
+
+class ProjectWatchService(QObject):
+    """Служба наблюдения за базовыми папками, поддерживающая индекс проектов"""
+    
+    batch_applied = pyqtSignal(dict)
+    
+    def __init__(self, base_paths: Iterable[str], index: Optional[ProjectIndex] = None,
+                 debounce_ms: int = WATCH_DEBOUNCE_MS, reconcile_interval_ms: int = RECONCILE_INTERVAL_MS,
+                 parent: Optional[QObject] = None):
+        """
+        Инициализация службы
+        
+        Args:
+            base_paths: Базовые папки проектов
+            index: Индекс проектов (по умолчанию общий)
+            debounce_ms: Пауза после последнего события перед применением пакета
+            reconcile_interval_ms: Период фоновой сверки (0 - без сверки)
+            parent: Родительский объект Qt
+        """
+        super().__init__(parent)
+        self.base_paths = sorted({os.path.abspath(path) for path in base_paths if os.path.isdir(path)})
+        self.index = index or get_project_index()
+        self.backend = None
+        
+        self._pending: Dict[str, Set[str]] = {}
+        self._pending_since = 0.0
+        self._reconcile_pending = False
+        self._worker: Optional[ProjectWatchWorker] = None
+        self._inotify_thread: Optional[_InotifyThread] = None
+        self._qt_watcher: Optional[QFileSystemWatcher] = None
+        self._listings: Dict[str, Set[str]] = {}
+        
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(debounce_ms)
+        self._debounce_timer.timeout.connect(self._flush)
+        
+        self._reconcile_timer = QTimer(self)
+        self._reconcile_interval_ms = reconcile_interval_ms
+        self._reconcile_timer.timeout.connect(self.reconcile)
+    
+    def start(self) -> None:
+        """Запускает наблюдение (inotify или QFileSystemWatcher)"""
+        if not self.base_paths or self.backend is not None:
+            return
+        
+        if inotify_available():
+            self.backend = 'inotify'
+            self._inotify_thread = _InotifyThread(self.base_paths)
+            self._inotify_thread.events_ready.connect(self._on_events)
+            self._inotify_thread.overflow.connect(self.reconcile)
+            self._inotify_thread.error_occurred.connect(self._on_backend_error)
+            self._inotify_thread.start()
+        else:
+            self._start_qt_watcher()
+        
+        if self._reconcile_interval_ms > 0:
+            self._reconcile_timer.start(self._reconcile_interval_ms)
+        print(f"Наблюдение за проектами ({self.backend}): {', '.join(self.base_paths)}")
+    
+    def _start_qt_watcher(self) -> None:
+        """
+        Запасной вариант: QFileSystemWatcher только на базовых папках
+        
+        Сообщает лишь, что папка изменилась, поэтому изменившиеся имена
+        находятся сравнением со снимком содержимого; изменения внутри
+        проектов подбирает периодическая сверка
+        """
+        self.backend = 'qt'
+        self._listings = {path: self._list_dirs(path) for path in self.base_paths}
+        self._qt_watcher = QFileSystemWatcher(self.base_paths, self)
+        self._qt_watcher.directoryChanged.connect(self._on_directory_changed)
+    
+    @staticmethod
+    def _list_dirs(path: str) -> Set[str]:
+        """Возвращает имена подпапок базовой папки"""
+        try:
+            with os.scandir(path) as entries:
+                return {entry.name for entry in entries if entry.is_dir(follow_symlinks=False)}
+        except OSError:
+            return set()
+    
+    def _on_directory_changed(self, path: str) -> None:
+        """Обработчик QFileSystemWatcher: находит появившиеся и исчезнувшие папки"""
+        listing = self._list_dirs(path)
+        changed = listing ^ self._listings.get(path, set())
+        self._listings[path] = listing
+        self._on_events([(path, name) for name in changed])
+    
+    def _on_backend_error(self, error_message: str) -> None:
+        """Переключается на QFileSystemWatcher, если inotify не запустился"""
+        print(f"Наблюдение через inotify недоступно: {error_message}")
+        if self.backend == 'inotify':
+            self._start_qt_watcher()
+            self.reconcile()
+    
+    def stop(self) -> None:
+        """Останавливает наблюдение и дожидается фоновых потоков"""
+        self._debounce_timer.stop()
+        self._reconcile_timer.stop()
+        if self._inotify_thread is not None:
+            self._inotify_thread.stop()
+            self._inotify_thread.wait()
+            self._inotify_thread = None
+        if self._qt_watcher is not None:
+            self._qt_watcher.deleteLater()
+            self._qt_watcher = None
+        if self._worker is not None:
+            # Сверка большой базовой папки может идти долго: без отмены окно ждало бы ее конца
+            self._worker.cancel()
+            self._worker.wait()
+        self.backend = None
+    
+    def _on_events(self, events: List[Tuple[str, str]]) -> None:
+        """
+        Добавляет события в очередь и откладывает применение пакета
+        
+        Args:
+            events: Список (базовая папка, имя папки верхнего уровня)
+        """
+        if not events:
+            return
+        if not self._pending:
+            self._pending_since = time.monotonic()
+        for base_path, name in events:
+            self._pending.setdefault(base_path, set()).add(name)
+        
+        # При непрерывном потоке событий пакет все равно применяется не реже WATCH_MAX_DELAY
+        if time.monotonic() - self._pending_since >= WATCH_MAX_DELAY:
+            self._flush()
+        else:
+            self._debounce_timer.start()
+    
+    def reconcile(self) -> None:
+        """Запускает полную сверку базовых папок с низким приоритетом"""
+        self._reconcile_pending = True
+        self._flush()
+    
+    def _flush(self) -> None:
+        """Передает накопленный пакет в рабочий поток"""
+        if self._worker is not None and self._worker.isRunning():
+            # Пакет подождет завершения текущего
+            return
+        if not self._pending and not self._reconcile_pending:
+            return
+        
+        batch, self._pending = self._pending, {}
+        reconcile_paths = list(self.base_paths) if self._reconcile_pending else []
+        self._reconcile_pending = False
+        
+        self._worker = ProjectWatchWorker(self.index, batch, reconcile_paths)
+        self._worker.finished.connect(self._on_worker_finished)
+        self._worker.error_occurred.connect(self._on_worker_error)
+        self._worker.start(QThread.LowPriority)
+    
+    def _on_worker_finished(self, result: Dict[str, Any]) -> None:
+        """Обработчик применения пакета"""
+        self._worker.wait()
+        if result['updated'] or result['removed']:
+            self.batch_applied.emit(result)
+        self._flush()
+    
+    def _on_worker_error(self, error_message: str) -> None:
+        """Обработчик ошибки применения пакета"""
+        print(f"Ошибка обновления индекса проектов: {error_message}")
+        self._worker.wait()
+        self._flush()
@@ -0,0 +1,168 @@
+"""
+Проверка полноты рендеров
+Сверяет секвенции 03_RENDER с ожидаемыми диапазонами и ищет пропуски,
+пустые и усеченные кадры; повторная проверка пересканирует только
+изменившиеся папки
+"""
+
+import os
+from statistics import median
+from typing import Any, Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.sequence_index import FrameSequence, SequenceIndex, collapse_frames
+
+
+# Папка рендеров проекта
+RENDER_FOLDER = '03_RENDER'
+
+# Кадр считается усеченным, если он меньше этой доли от медианы соседних кадров
+OUTLIER_RATIO = 0.5
+
+# Количество соседних кадров с каждой стороны для локальной медианы
+OUTLIER_WINDOW = 7
+
+
+def resolve_render_root(path: str) -> str:
+    """
+    Возвращает папку рендеров: 03_RENDER для папки проекта или сам путь
+    
+    Args:
+        path: Папка проекта или папка рендеров
+    
+    Returns:
+        Путь к папке рендеров
+    """
+    render_root = os.path.join(path, RENDER_FOLDER)
+    return render_root if os.path.isdir(render_root) else path
+
+
+def find_size_outliers(sequence: FrameSequence, ratio: float = OUTLIER_RATIO,
+                       window: int = OUTLIER_WINDOW) -> List[Tuple[int, int]]:
+    """
+    Ищет кадры, заметно меньшие соседних (обычно недописанные рендером)
+    
+    Медиана берется по соседним кадрам, чтобы плавно меняющийся
+    по шоту размер кадров не давал ложных срабатываний
+    
+    Args:
+        sequence: Секвенция кадров
+        ratio: Порог относительно локальной медианы
+        window: Количество соседей с каждой стороны
+    
+    Returns:
+        Список (кадр, размер)
+    """
+    sizes = sequence.sizes
+    if len(sizes) < 3:
+        return []
+    
+    outliers = []
+    for position, (frame, size) in enumerate(zip(sequence.frames(), sizes)):
+        if size == 0:
+            continue
+        neighbours = [s for s in sizes[max(0, position - window):position + window + 1] if s > 0]
+        if len(neighbours) >= 3 and size < median(neighbours) * ratio:
+            outliers.append((frame, size))
+    return outliers
+
+
+def check_sequence(sequence: FrameSequence, first: Optional[int] = None,
+                   last: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Проверяет одну секвенцию
+    
+    Args:
+        sequence: Секвенция кадров
+        first: Ожидаемый первый кадр (по умолчанию первый присутствующий)
+        last: Ожидаемый последний кадр (по умолчанию последний присутствующий)
+    
+    Returns:
+        Словарь с результатами проверки
+    """
+    missing = sequence.missing(first, last)
+    zero_byte = sequence.zero_byte_frames()
+    outliers = find_size_outliers(sequence)
+    return {
+        'directory': sequence.directory,
+        'pattern': sequence.pattern,
+        'first': sequence.first,
+        'last': sequence.last,
+        'frame_count': sequence.frame_count,
+        'total_bytes': sequence.total_bytes,
+        'missing': missing,
+        'missing_count': sum(end - start + 1 for start, end in missing),
+        'zero_byte': collapse_frames(zero_byte),
+        'outliers': outliers,
+        'ok': not missing and not zero_byte and not outliers
+    }
+
+
+class RenderChecker:
+    """Проверка всех секвенций папки рендеров"""
+    
+    def __init__(self, path: str, expected_range: Optional[Tuple[int, int]] = None):
+        """
+        Инициализация проверки
+        
+        Args:
+            path: Папка проекта или папка рендеров
+            expected_range: Ожидаемый диапазон кадров (по умолчанию свой у каждой секвенции)
+        """
+        self.root = resolve_render_root(path)
+        self.expected_range = expected_range
+        self.index = SequenceIndex(self.root)
+    
+    def run(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Обновляет индекс секвенций и проверяет их
+        
+        Args:
+            force: Пересканировать все папки без кэша
+        
+        Returns:
+            Словарь с результатами по секвенциям и статистикой сканирования
+        """
+        self.index.refresh(force=force)
+        first, last = self.expected_range or (None, None)
+        
+        sequences = []
+        for sequence in self.index.iter_sequences():
+            report = check_sequence(sequence, first, last)
+            report['directory'] = os.path.relpath(sequence.directory, self.root)
+            sequences.append(report)
+        
+        return {
+            'root': self.root,
+            'sequences': sequences,
+            'problems': sum(1 for report in sequences if not report['ok']),
+            'dirs_scanned': self.index.dirs_scanned,
+            'dirs_reused': self.index.dirs_reused
+        }
+
+
+class RenderCheckWorker(QThread):
+    """Рабочий поток проверки рендеров"""
+    
+    finished = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, path: str, force: bool = False):
+        """
+        Инициализация рабочего потока
+        
+        Args:
+            path: Папка проекта или папка рендеров
+            force: Пересканировать все папки без кэша
+        """
+        super().__init__()
+        self.path = path
+        self.force = force
+    
+    def run(self) -> None:
+        """Основной метод проверки"""
+        try:
+            self.finished.emit(RenderChecker(self.path).run(force=self.force))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
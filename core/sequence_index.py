@@ -0,0 +1,380 @@
+"""
+Индекс секвенций кадров
+Сворачивает кадры вида shot010_v003.0001.exr в компактные записи
+(префикс, разрядность, диапазоны кадров) и кэширует результат
+по времени изменения папок
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.resource_manager import get_app_data_path
+
+
+# Расширения файлов, которые могут быть кадрами секвенций
+SEQUENCE_EXTENSIONS = {
+    '.exr', '.dpx', '.cin', '.png', '.jpg', '.jpeg', '.tif', '.tiff', '.tga',
+    '.hdr', '.bmp', '.psd', '.iff', '.sgi', '.rgb', '.jp2', '.webp', '.avif'
+}
+
+# Номер кадра - последняя группа цифр перед расширением
+FRAME_PATTERN = re.compile(r'^(?P<prefix>.*?)(?P<frame>\d+)(?P<suffix>\.[^.]+)$')
+
+# Минимальное количество кадров, чтобы файлы считались секвенцией
+MIN_SEQUENCE_FRAMES = 2
+
+# Версия формата кэша (меняется при изменении структуры записей)
+CACHE_FORMAT_VERSION = 1
+
+
+def parse_frame_name(name: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Разбирает имя файла кадра
+    
+    Args:
+        name: Имя файла
+    
+    Returns:
+        Кортеж (префикс, номер кадра строкой, расширение) или None
+    """
+    match = FRAME_PATTERN.match(name)
+    if match is None or match.group('suffix').lower() not in SEQUENCE_EXTENSIONS:
+        return None
+    return match.group('prefix'), match.group('frame'), match.group('suffix')
+
+
+def collapse_frames(frames: Iterable[int]) -> List[List[int]]:
+    """
+    Сворачивает отсортированные номера кадров в интервалы
+    
+    Args:
+        frames: Отсортированные номера кадров
+    
+    Returns:
+        Список интервалов [начало, конец] включительно
+    """
+    intervals = []
+    for frame in frames:
+        if intervals and frame == intervals[-1][1] + 1:
+            intervals[-1][1] = frame
+        elif not intervals or frame > intervals[-1][1]:
+            intervals.append([frame, frame])
+    return intervals
+
+
+def expand_intervals(intervals: List[List[int]]) -> Iterable[int]:
+    """Перебирает номера кадров из интервалов"""
+    for start, end in intervals:
+        yield from range(start, end + 1)
+
+
+def format_intervals(intervals: List[List[int]]) -> str:
+    """
+    Форматирует интервалы для вывода
+    
+    Args:
+        intervals: Список интервалов
+    
+    Returns:
+        Строка вида '1-100, 120, 130-140'
+    """
+    return ', '.join(str(start) if start == end else f"{start}-{end}" for start, end in intervals)
+
+
+class FrameSequence:
+    """Секвенция кадров в одной папке"""
+    
+    def __init__(self, directory: str, prefix: str, suffix: str, padding: int,
+                 intervals: List[List[int]], sizes: List[int]):
+        """
+        Инициализация секвенции
+        
+        Args:
+            directory: Папка секвенции
+            prefix: Часть имени до номера кадра
+            suffix: Расширение
+            padding: Разрядность номера кадра
+            intervals: Интервалы присутствующих кадров
+            sizes: Размеры кадров в порядке номеров
+        """
+        self.directory = directory
+        self.prefix = prefix
+        self.suffix = suffix
+        self.padding = padding
+        self.intervals = intervals
+        self.sizes = sizes
+    
+    @property
+    def pattern(self) -> str:
+        """Шаблон имени кадра вида shot010_v003.####.exr"""
+        return f"{self.prefix}{'#' * self.padding}{self.suffix}"
+    
+    @property
+    def first(self) -> int:
+        return self.intervals[0][0]
+    
+    @property
+    def last(self) -> int:
+        return self.intervals[-1][1]
+    
+    @property
+    def frame_count(self) -> int:
+        return len(self.sizes)
+    
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.sizes)
+    
+    def frame_name(self, frame: int) -> str:
+        """Возвращает имя файла кадра"""
+        return f"{self.prefix}{frame:0{self.padding}d}{self.suffix}"
+    
+    def frames(self) -> Iterable[int]:
+        """Перебирает номера присутствующих кадров"""
+        return expand_intervals(self.intervals)
+    
+    def missing(self, first: Optional[int] = None, last: Optional[int] = None) -> List[List[int]]:
+        """
+        Возвращает пропущенные кадры
+        
+        Args:
+            first: Ожидаемый первый кадр (по умолчанию первый присутствующий)
+            last: Ожидаемый последний кадр (по умолчанию последний присутствующий)
+        
+        Returns:
+            Интервалы отсутствующих кадров
+        """
+        first = self.first if first is None else first
+        last = self.last if last is None else last
+        gaps = []
+        cursor = first
+        for start, end in self.intervals:
+            if start > cursor:
+                gaps.append([cursor, min(start - 1, last)])
+            cursor = max(cursor, end + 1)
+            if cursor > last:
+                break
+        if cursor <= last:
+            gaps.append([cursor, last])
+        return [gap for gap in gaps if gap[0] <= gap[1]]
+    
+    def zero_byte_frames(self) -> List[int]:
+        """Возвращает номера кадров нулевого размера"""
+        return [frame for frame, size in zip(self.frames(), self.sizes) if size == 0]
+    
+    def describe(self) -> str:
+        """Краткое описание для вывода"""
+        description = f"{self.pattern} [{format_intervals(self.intervals)}] {self.frame_count} кадров"
+        missing = self.missing()
+        if missing:
+            description += f", пропущено: {format_intervals(missing)}"
+        zero = self.zero_byte_frames()
+        if zero:
+            description += f", пустых: {format_intervals(collapse_frames(zero))}"
+        return description
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'prefix': self.prefix,
+            'suffix': self.suffix,
+            'padding': self.padding,
+            'intervals': self.intervals,
+            'sizes': self.sizes
+        }
+    
+    @classmethod
+    def from_dict(cls, directory: str, data: Dict[str, Any]) -> 'FrameSequence':
+        return cls(directory, data['prefix'], data['suffix'], data['padding'],
+                   data['intervals'], data['sizes'])
+
+
+class DirectoryIndex:
+    """Содержимое одной папки: секвенции, отдельные файлы и подпапки"""
+    
+    def __init__(self, path: str, mtime_ns: int, sequences: List[FrameSequence],
+                 files: Dict[str, int], subdirs: List[str]):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.sequences = sequences
+        self.files = files
+        self.subdirs = subdirs
+    
+    @property
+    def total_bytes(self) -> int:
+        return sum(seq.total_bytes for seq in self.sequences) + sum(self.files.values())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'mtime_ns': self.mtime_ns,
+            'sequences': [seq.to_dict() for seq in self.sequences],
+            'files': self.files,
+            'subdirs': self.subdirs
+        }
+    
+    @classmethod
+    def from_dict(cls, path: str, data: Dict[str, Any]) -> 'DirectoryIndex':
+        sequences = [FrameSequence.from_dict(path, seq) for seq in data['sequences']]
+        return cls(path, data['mtime_ns'], sequences, data['files'], data['subdirs'])
+
+
+def index_directory(path: str) -> DirectoryIndex:
+    """
+    Индексирует одну папку (без подпапок) через os.scandir
+    
+    Args:
+        path: Путь к папке
+    
+    Returns:
+        Индекс папки
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    groups: Dict[Tuple[str, str], List[Tuple[int, str, int]]] = {}
+    files = {}
+    subdirs = []
+    
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.name)
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            size = entry.stat(follow_symlinks=False).st_size
+            parsed = parse_frame_name(entry.name)
+            if parsed is None:
+                files[entry.name] = size
+                continue
+            prefix, frame, suffix = parsed
+            groups.setdefault((prefix, suffix), []).append((int(frame), entry.name, size))
+    
+    sequences = []
+    for (prefix, suffix), frames in groups.items():
+        if len(frames) < MIN_SEQUENCE_FRAMES:
+            for _, name, size in frames:
+                files[name] = size
+            continue
+        frames.sort()
+        
+        # Один номер с разной разрядностью (f.1.exr и f.001.exr) - лишние файлы не кадры
+        unique = []
+        for frame, name, size in frames:
+            if unique and unique[-1][0] == frame:
+                files[name] = size
+            else:
+                unique.append((frame, name, size))
+        
+        padding = min(len(name) - len(prefix) - len(suffix) for _, name, _ in unique)
+        sequences.append(FrameSequence(
+            path, prefix, suffix, padding,
+            collapse_frames(frame for frame, _, _ in unique),
+            [size for _, _, size in unique]
+        ))
+    
+    sequences.sort(key=lambda seq: seq.pattern)
+    subdirs.sort()
+    return DirectoryIndex(path, mtime_ns, sequences, files, subdirs)
+
+
+class SequenceIndex:
+    """Индекс дерева папок с кэшем по времени изменения каждой папки"""
+    
+    def __init__(self, root: str, cache_path: Optional[str] = None):
+        """
+        Инициализация индекса
+        
+        Args:
+            root: Корневая папка (например, 03_RENDER проекта)
+            cache_path: Файл кэша (по умолчанию в папке данных приложения)
+        """
+        self.root = os.path.abspath(root)
+        if cache_path is None:
+            key = hashlib.sha1(self.root.encode('utf-8')).hexdigest()[:16]
+            cache_path = os.path.join(get_app_data_path(), 'sequence_index', f"{key}.json")
+        self.cache_path = cache_path
+        self.directories: Dict[str, DirectoryIndex] = {}
+        self.dirs_scanned = 0
+        self.dirs_reused = 0
+        self._load_cache()
+    
+    def _load_cache(self) -> None:
+        """Загружает кэш индекса"""
+        try:
+            if os.path.exists(self.cache_path):
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == CACHE_FORMAT_VERSION and data.get('root') == self.root:
+                    self.directories = {
+                        rel: DirectoryIndex.from_dict(os.path.join(self.root, rel), entry)
+                        for rel, entry in data['directories'].items()
+                    }
+        except (json.JSONDecodeError, KeyError, IOError) as e:
+            print(f"Ошибка загрузки индекса секвенций: {e}")
+            self.directories = {}
+    
+    def save(self) -> None:
+        """Сохраняет кэш индекса"""
+        try:
+            directory = os.path.dirname(self.cache_path)
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix='.index_', dir=directory)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': CACHE_FORMAT_VERSION,
+                    'root': self.root,
+                    'directories': {rel: entry.to_dict() for rel, entry in self.directories.items()}
+                }, f, separators=(',', ':'))
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"Ошибка сохранения индекса секвенций: {e}")
+    
+    def refresh(self, force: bool = False) -> Dict[str, DirectoryIndex]:
+        """
+        Обновляет индекс, пересканируя только папки с изменившимся mtime
+        
+        Перезапись существующего кадра на месте не меняет mtime папки,
+        для таких случаев используется force=True
+        
+        Args:
+            force: Пересканировать все папки
+        
+        Returns:
+            Словарь: относительный путь папки ('.' для корня) -> индекс папки
+        """
+        self.dirs_scanned = 0
+        self.dirs_reused = 0
+        refreshed = {}
+        stack = ['.']
+        while stack:
+            rel = stack.pop()
+            path = self.root if rel == '.' else os.path.join(self.root, rel)
+            cached = self.directories.get(rel)
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+                if not force and cached is not None and cached.mtime_ns == mtime_ns:
+                    entry = cached
+                    self.dirs_reused += 1
+                else:
+                    entry = index_directory(path)
+                    self.dirs_scanned += 1
+            except OSError as e:
+                print(f"Ошибка индексации {path}: {e}")
+                continue
+            refreshed[rel] = entry
+            stack.extend(name if rel == '.' else os.path.join(rel, name) for name in entry.subdirs)
+        
+        self.directories = refreshed
+        self.save()
+        return refreshed
+    
+    def iter_sequences(self) -> Iterable[FrameSequence]:
+        """Перебирает все секвенции индекса"""
+        for rel in sorted(self.directories):
+            yield from self.directories[rel].sequences
+    
+    @property
+    def total_bytes(self) -> int:
+        return sum(entry.total_bytes for entry in self.directories.values())
@@ -0,0 +1,305 @@
+"""
+Подсчет размеров проектов
+Параллельно обходит папки пулом потоков с os.scandir и кэширует
+содержимое каждой папки по (устройство, inode, mtime), чтобы повторный
+обход больших сетевых томов пропускал нетронутые папки
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from utils.resource_manager import get_app_data_path
+
+
+# Количество параллельных обходчиков по умолчанию (сетевые тома выигрывают от большего числа)
+DEFAULT_SCAN_WORKERS = 16
+
+# Минимальный интервал между уведомлениями о прогрессе
+PROGRESS_INTERVAL = 0.1
+
+# Версия формата кэша
+CACHE_FORMAT_VERSION = 1
+
+
+def format_size(size: int) -> str:
+    """
+    Форматирует размер в байтах для вывода
+    
+    Args:
+        size: Размер в байтах
+        
+    Returns:
+        Строка вида '1.5 GB'
+    """
+    value = float(size)
+    for unit in ('B', 'KB', 'MB', 'GB', 'TB'):
+        if value < 1024 or unit == 'TB':
+            return f"{value:.0f} {unit}" if unit == 'B' else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} PB"
+
+
+class _DirectoryEntry:
+    """Собственное содержимое папки (без подпапок)"""
+    
+    __slots__ = ('key', 'size', 'files', 'latest_mtime', 'subdirs')
+    
+    def __init__(self, key: List[int], size: int, files: int, latest_mtime: float, subdirs: List[str]):
+        self.key = key
+        self.size = size
+        self.files = files
+        self.latest_mtime = latest_mtime
+        self.subdirs = subdirs
+    
+    def to_list(self) -> List[Any]:
+        return [self.key, self.size, self.files, self.latest_mtime, self.subdirs]
+    
+    @classmethod
+    def from_list(cls, data: List[Any]) -> '_DirectoryEntry':
+        return cls(*data)
+
+
+def _directory_key(stat: os.stat_result) -> List[int]:
+    return [stat.st_dev, stat.st_ino, stat.st_mtime_ns]
+
+
+def _scan_directory(path: str, key: List[int], dir_mtime: float) -> _DirectoryEntry:
+    """Читает собственное содержимое одной папки"""
+    size = files = 0
+    latest_mtime = dir_mtime
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    size += stat.st_size
+                    files += 1
+                    latest_mtime = max(latest_mtime, stat.st_mtime)
+            except OSError:
+                continue
+    return _DirectoryEntry(key, size, files, latest_mtime, sorted(subdirs))
+
+
+class SizeScanner:
+    """Параллельный подсчет размеров дерева папок с постоянным кэшем"""
+    
+    def __init__(self, root: str, workers: int = DEFAULT_SCAN_WORKERS, cache_path: Optional[str] = None,
+                 progress_callback: Optional[Callable[[int], None]] = None,
+                 cancel_event: Optional[threading.Event] = None):
+        """
+        Инициализация сканера
+        
+        Args:
+            root: Папка проекта или базовая папка проектов
+            workers: Количество параллельных обходчиков
+            cache_path: Файл кэша (по умолчанию в папке данных приложения)
+            progress_callback: Функция, получающая количество обработанных папок
+            cancel_event: Событие отмены
+        """
+        self.root = os.path.abspath(root)
+        self.workers = workers
+        if cache_path is None:
+            key = hashlib.sha1(self.root.encode('utf-8')).hexdigest()[:16]
+            cache_path = os.path.join(get_app_data_path(), 'size_cache', f"{key}.json")
+        self.cache_path = cache_path
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event or threading.Event()
+        self.dirs_scanned = 0
+        self.dirs_reused = 0
+        self.errors: Dict[str, str] = {}
+        self._cache = self._load_cache()
+    
+    def _load_cache(self) -> Dict[str, _DirectoryEntry]:
+        """Загружает кэш папок"""
+        try:
+            if os.path.exists(self.cache_path):
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == CACHE_FORMAT_VERSION and data.get('root') == self.root:
+                    return {rel: _DirectoryEntry.from_list(entry) for rel, entry in data['directories'].items()}
+        except (json.JSONDecodeError, KeyError, TypeError, IOError) as e:
+            print(f"Ошибка загрузки кэша размеров: {e}")
+        return {}
+    
+    def _save_cache(self, directories: Dict[str, _DirectoryEntry]) -> None:
+        """Сохраняет кэш папок"""
+        try:
+            directory = os.path.dirname(self.cache_path)
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix='.sizes_', dir=directory)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': CACHE_FORMAT_VERSION,
+                    'root': self.root,
+                    'directories': {rel: entry.to_list() for rel, entry in directories.items()}
+                }, f, separators=(',', ':'))
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"Ошибка сохранения кэша размеров: {e}")
+    
+    def _visit(self, rel: str, force: bool) -> _DirectoryEntry:
+        """Возвращает содержимое папки из кэша или читает его заново"""
+        path = self.root if rel == '.' else os.path.join(self.root, rel)
+        stat = os.stat(path)
+        key = _directory_key(stat)
+        cached = self._cache.get(rel)
+        if not force and cached is not None and cached.key == key:
+            return cached
+        return _scan_directory(path, key, stat.st_mtime)
+    
+    def scan(self, force: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Обходит дерево и считает итоги по каждой папке
+        
+        Неизменившаяся папка (тот же inode и mtime) не перечитывается,
+        проверяются только ее подпапки; перезапись файла на месте не меняет
+        mtime папки, для полного пересчета используется force=True
+        
+        Args:
+            force: Перечитать все папки без кэша
+        
+        Returns:
+            Словарь: относительный путь ('.' для корня) -> {'size', 'files', 'dirs', 'latest_mtime'}
+        """
+        self.dirs_scanned = 0
+        self.dirs_reused = 0
+        self.errors = {}
+        directories: Dict[str, _DirectoryEntry] = {}
+        last_report = 0.0
+        
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='SizeScan') as pool:
+            pending = {pool.submit(self._visit, '.', force): '.'}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    rel = pending.pop(future)
+                    try:
+                        entry = future.result()
+                    except OSError as e:
+                        self.errors[rel] = str(e)
+                        continue
+                    
+                    if entry is self._cache.get(rel):
+                        self.dirs_reused += 1
+                    else:
+                        self.dirs_scanned += 1
+                    directories[rel] = entry
+                    
+                    if self.cancel_event.is_set():
+                        continue
+                    for name in entry.subdirs:
+                        child = name if rel == '.' else os.path.join(rel, name)
+                        pending[pool.submit(self._visit, child, force)] = child
+                
+                now = time.monotonic()
+                if self.progress_callback is not None and now - last_report >= PROGRESS_INTERVAL:
+                    last_report = now
+                    self.progress_callback(len(directories))
+        
+        if self.cancel_event.is_set():
+            raise InterruptedError("Подсчет размеров отменен")
+        
+        self._cache = directories
+        self._save_cache(directories)
+        return self._aggregate(directories)
+    
+    @staticmethod
+    def _aggregate(directories: Dict[str, _DirectoryEntry]) -> Dict[str, Dict[str, Any]]:
+        """Складывает итоги папок снизу вверх"""
+        totals = {
+            rel: {'size': entry.size, 'files': entry.files, 'dirs': 0, 'latest_mtime': entry.latest_mtime}
+            for rel, entry in directories.items()
+        }
+        # Самые глубокие папки обрабатываются первыми
+        for rel in sorted(totals, key=lambda r: r.count(os.sep) if r != '.' else -1, reverse=True):
+            if rel == '.':
+                continue
+            parent = os.path.dirname(rel) or '.'
+            if parent in totals:
+                total = totals[rel]
+                parent_total = totals[parent]
+                parent_total['size'] += total['size']
+                parent_total['files'] += total['files']
+                parent_total['dirs'] += total['dirs'] + 1
+                parent_total['latest_mtime'] = max(parent_total['latest_mtime'], total['latest_mtime'])
+        return totals
+
+
+def build_size_report(root: str, totals: Dict[str, Dict[str, Any]], max_depth: int = 2) -> Dict[str, Any]:
+    """
+    Строит вложенный отчет для вывода в JSON
+    
+    Args:
+        root: Корневая папка
+        totals: Итоги SizeScanner.scan()
+        max_depth: Глубина вложенности отчета
+    
+    Returns:
+        Дерево {'name', 'path', 'size', 'files', 'dirs', 'latest_mtime', 'children'}
+    """
+    children: Dict[str, List[str]] = {}
+    for rel in totals:
+        if rel != '.':
+            children.setdefault(os.path.dirname(rel) or '.', []).append(rel)
+    
+    def build(rel: str, depth: int) -> Dict[str, Any]:
+        total = totals[rel]
+        node = {
+            'name': os.path.basename(root) if rel == '.' else os.path.basename(rel),
+            'path': rel,
+            'size': total['size'],
+            'files': total['files'],
+            'dirs': total['dirs'],
+            'latest_mtime': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(total['latest_mtime']))
+        }
+        if depth < max_depth:
+            kids = sorted(children.get(rel, []), key=lambda child: totals[child]['size'], reverse=True)
+            node['children'] = [build(child, depth + 1) for child in kids]
+        return node
+    
+    return build('.', 0)
+
+
+class SizeScanWorker(QThread):
+    """Рабочий поток подсчета размеров"""
+    
+    progress_updated = pyqtSignal(int)
+    finished = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, root: str, force: bool = False):
+        """
+        Инициализация рабочего потока
+        
+        Args:
+            root: Папка проекта или базовая папка проектов
+            force: Перечитать все папки без кэша
+        """
+        super().__init__()
+        self.root = root
+        self.force = force
+        self.cancel_event = threading.Event()
+    
+    def cancel(self) -> None:
+        """Запрашивает отмену подсчета"""
+        self.cancel_event.set()
+    
+    def run(self) -> None:
+        """Основной метод подсчета"""
+        try:
+            scanner = SizeScanner(self.root, progress_callback=self.progress_updated.emit,
+                                  cancel_event=self.cancel_event)
+            self.finished.emit(scanner.scan(force=self.force))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
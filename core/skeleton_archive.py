@@ -0,0 +1,303 @@
+"""
+Архивы-заготовки проектов (skeleton archives)
+Структура папок и шаблоны инструментов заранее собираются в один tar-архив
+(опционально со сжатием zstd). Новый проект создается одной потоковой
+распаковкой с подстановкой имени проекта в имена файлов шаблонов
+"""
+
+import hashlib
+import io
+import json
+import os
+import tarfile
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from core.file_system import LocalFileSystem
+from core.folder_structure_manager import FolderStructureManager
+from core.template_catalog import TemplateCatalog
+from core.template_transforms import TRANSFORM_ERRORS, copy_with_transform, get_template_transform
+from utils.resource_manager import get_app_data_path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Заполнитель имени проекта в именах файлов внутри архива
+PROJECT_NAME_PLACEHOLDER = '__PROJECT_NAME__'
+
+# Версия формата архива - входит в ключ кэша
+SKELETON_FORMAT_VERSION = 1
+
+# Сколько последних архивов хранить в кэше
+MAX_CACHED_ARCHIVES = 16
+
+
+def is_zstd_available() -> bool:
+    """Проверяет, установлен ли модуль zstandard"""
+    return zstandard is not None
+
+
+def compute_skeleton_key(folders: List[str], tools: List[str], catalog: TemplateCatalog,
+                         templates: Optional[Dict[str, str]] = None) -> str:
+    """
+    Вычисляет ключ кэша архива по структуре, набору инструментов и шаблонам
+    
+    Args:
+        folders: Список относительных путей папок проекта
+        tools: Список кодов инструментов
+        catalog: Каталог шаблонов
+        templates: Выбранные файлы шаблонов: tool -> путь (None - по умолчанию)
+        
+    Returns:
+        Шестнадцатеричный ключ
+    """
+    payload = json.dumps({
+        'version': SKELETON_FORMAT_VERSION,
+        'folders': sorted(folders),
+        'tools': sorted(tools),
+        'selected': {tool: os.path.basename(path) for tool, path in (templates or {}).items()},
+        'templates': catalog.fingerprint(tools)
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:24]
+
+
+class SkeletonArchiveCache:
+    """Кэш архивов-заготовок, ключ - (хеш структуры, набор инструментов, шаблоны)"""
+    
+    def __init__(self, cache_dir: Optional[str] = None, compression: str = 'auto'):
+        """
+        Инициализация кэша
+        
+        Args:
+            cache_dir: Папка кэша (по умолчанию в папке данных приложения)
+            compression: 'zstd', 'none' или 'auto' (zstd если доступен)
+        """
+        self.cache_dir = cache_dir or os.path.join(get_app_data_path(), 'skeletons')
+        if compression == 'auto':
+            compression = 'zstd' if is_zstd_available() else 'none'
+        if compression == 'zstd' and not is_zstd_available():
+            print("Предупреждение: zstandard не установлен, архивы будут без сжатия")
+            compression = 'none'
+        self.compression = compression
+        self._lock = threading.Lock()
+    
+    def _archive_path(self, key: str) -> str:
+        """Возвращает путь к архиву для ключа"""
+        extension = '.tar.zst' if self.compression == 'zstd' else '.tar'
+        return os.path.join(self.cache_dir, f"skeleton_{key}{extension}")
+    
+    def get_or_build(self, folders: List[str], tools: List[str], catalog: TemplateCatalog,
+                     templates: Optional[Dict[str, str]] = None) -> str:
+        """
+        Возвращает путь к архиву, собирая его при отсутствии в кэше
+        
+        Args:
+            folders: Список относительных путей папок проекта
+            tools: Список кодов инструментов
+            catalog: Каталог шаблонов
+            templates: Выбранные файлы шаблонов: tool -> путь (None - по умолчанию)
+            
+        Returns:
+            Путь к архиву-заготовке
+        """
+        key = compute_skeleton_key(folders, tools, catalog, templates)
+        archive_path = self._archive_path(key)
+        
+        with self._lock:
+            if not os.path.exists(archive_path):
+                self._build(archive_path, folders, tools, catalog, templates or {})
+                self._prune()
+        
+        return archive_path
+    
+    def _build(self, archive_path: str, folders: List[str], tools: List[str],
+               catalog: TemplateCatalog, templates: Dict[str, str]) -> None:
+        """
+        Собирает архив-заготовку атомарно (через временный файл)
+        
+        Args:
+            archive_path: Путь к итоговому архиву
+            folders: Список относительных путей папок проекта
+            tools: Список кодов инструментов
+            catalog: Каталог шаблонов
+            templates: Выбранные файлы шаблонов: tool -> путь
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix='.skeleton_', dir=self.cache_dir)
+        now = time.time()
+        
+        try:
+            with os.fdopen(fd, 'wb') as raw:
+                if self.compression == 'zstd':
+                    stream = zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=False)
+                else:
+                    stream = raw
+                
+                with tarfile.open(fileobj=stream, mode='w|', format=tarfile.PAX_FORMAT) as tar:
+                    # Папки сортируются, чтобы родительские шли раньше дочерних
+                    for folder in sorted(set(folders)):
+                        info = tarfile.TarInfo(folder.replace(os.sep, '/'))
+                        info.type = tarfile.DIRTYPE
+                        info.mode = 0o755
+                        info.mtime = now
+                        tar.addfile(info)
+                    
+                    for tool in tools:
+                        config = catalog.get_tool_config(tool)
+                        template = templates.get(tool) or catalog.find_template(tool)
+                        if config is None or template is None:
+                            continue
+                        name = f"{config['folder']}/{PROJECT_NAME_PLACEHOLDER}{config['extension']}"
+                        info = tar.gettarinfo(template, arcname=name)
+                        info.uid = info.gid = 0
+                        info.uname = info.gname = ''
+                        with open(template, 'rb') as f:
+                            tar.addfile(info, f)
+                
+                if stream is not raw:
+                    stream.close()
+            
+            os.replace(temp_path, archive_path)
+            print(f"Архив-заготовка собран: {archive_path}")
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    
+    def _prune(self) -> None:
+        """Удаляет самые старые архивы сверх лимита кэша"""
+        try:
+            archives = [
+                os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                if name.startswith('skeleton_')
+            ]
+        except OSError:
+            return
+        
+        archives.sort(key=lambda path: os.path.getmtime(path), reverse=True)
+        for path in archives[MAX_CACHED_ARCHIVES:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    
+    def invalidate(self) -> None:
+        """Удаляет все архивы из кэша (например, после изменения структуры)"""
+        with self._lock:
+            if not os.path.isdir(self.cache_dir):
+                return
+            for name in os.listdir(self.cache_dir):
+                if name.startswith('skeleton_'):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError as e:
+                        print(f"Предупреждение: не удалось удалить архив {name}: {e}")
+
+
+def _open_archive_stream(raw: io.BufferedReader, archive_path: str):
+    """Открывает поток чтения архива с распаковкой zstd при необходимости"""
+    if archive_path.endswith('.zst'):
+        if zstandard is None:
+            raise RuntimeError("Для распаковки архива требуется модуль zstandard")
+        return zstandard.ZstdDecompressor().stream_reader(raw)
+    return raw
+
+
+def _safe_member_path(name: str) -> str:
+    """
+    Проверяет путь элемента архива на выход за пределы проекта
+    
+    Args:
+        name: Имя элемента архива
+        
+    Returns:
+        Нормализованный относительный путь
+        
+    Raises:
+        ValueError: Абсолютный путь или выход за пределы папки проекта
+    """
+    normalized = os.path.normpath(name)
+    if os.path.isabs(normalized) or normalized == '..' or normalized.startswith('..' + os.sep):
+        raise ValueError(f"Недопустимый путь в архиве: {name}")
+    return normalized
+
+
+def extract_skeleton(archive_path: str, project_path: str, project_name: str,
+                     fs: Optional[LocalFileSystem] = None,
+                     template_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Создает проект одной потоковой распаковкой архива-заготовки
+    
+    Args:
+        archive_path: Путь к архиву-заготовке
+        project_path: Путь к создаваемому проекту
+        project_name: Имя проекта для подстановки в имена файлов
+        fs: Слой файловых операций для записи проекта
+        template_params: Параметры подстановки в шаблоны по расширению файла:
+            '.prproj' -> {frame_rate, resolution, ...} (см. template_transforms)
+        
+    Returns:
+        Словарь с количеством созданных папок и файлов и объемом данных
+    """
+    fs = fs or LocalFileSystem()
+    result = {'folders_created': 0, 'files_created': 0, 'bytes_written': 0}
+    
+    fs.makedirs(project_path, exist_ok=True)
+    
+    with open(archive_path, 'rb') as raw:
+        stream = _open_archive_stream(raw, archive_path)
+        with tarfile.open(fileobj=stream, mode='r|') as tar:
+            for member in tar:
+                relative = _safe_member_path(member.name.replace(PROJECT_NAME_PLACEHOLDER, project_name))
+                target = os.path.join(project_path, relative)
+                
+                if member.isdir():
+                    fs.makedirs(target, exist_ok=True)
+                    result['folders_created'] += 1
+                elif member.isfile():
+                    extension = os.path.splitext(target)[1]
+                    transform = get_template_transform(extension, project_name,
+                                                       (template_params or {}).get(extension))
+                    source = tar.extractfile(member)
+                    if transform is None:
+                        with fs.open(target, 'wb') as f:
+                            copy_with_transform(source, f, None)
+                        fs.set_mtime(target, member.mtime)
+                    else:
+                        # Элемент потокового архива нельзя перечитать, поэтому шаблон
+                        # буферизуется: при сбое подстановки он записывается без изменений
+                        data = source.read()
+                        try:
+                            with fs.open(target, 'wb') as f:
+                                transform.apply(io.BytesIO(data), f)
+                            fs.set_mtime(target, member.mtime)
+                        except TRANSFORM_ERRORS as e:
+                            print(f"Предупреждение: шаблон {relative} скопирован без подстановки параметров: {e}")
+                            fs.write_bytes(target, data, mtime=member.mtime)
+                    result['files_created'] += 1
+                    result['bytes_written'] += member.size
+    
+    return result
+
+
+_default_cache = None
+
+
+def get_skeleton_cache() -> SkeletonArchiveCache:
+    """
+    Возвращает общий для приложения кэш архивов-заготовок
+    
+    Returns:
+        Экземпляр SkeletonArchiveCache
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SkeletonArchiveCache()
+        # Изменение структуры делает собранные архивы неактуальными
+        FolderStructureManager.add_change_listener(lambda structure: _default_cache.invalidate())
+    return _default_cache
@@ -0,0 +1,458 @@
+"""
+Проверка соответствия существующих проектов текущей структуре папок
+Структура компилируется один раз, проекты обходятся параллельно с одним
+scandir на папку; результаты кэшируются по mtime проверенных папок.
+Отчет служит входом для восстановления (repair_projects)
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.folder_structure_manager import FolderStructureManager
+from core.project_index import is_project_dir
+from core.project_metadata import PROJECT_METADATA_FILE, read_project_metadata
+from utils.resource_manager import get_app_data_path
+
+
+AUDIT_FORMAT_VERSION = 1
+
+# Проверка - это несколько stat/scandir на проект, время уходит на задержки диска
+AUDIT_WORKERS = 16
+
+# Похожесть имен, при которой лишняя папка считается неверно названной недостающей
+MISNAME_CUTOFF = 0.8
+
+_NAME_NOISE = re.compile(r'[\W_]+')
+
+
+def _join(rel: str, name: str) -> str:
+    """Относительный путь внутри проекта (разделитель '/')"""
+    return name if rel == '.' else f"{rel}/{name}"
+
+
+def _normalize_name(name: str) -> str:
+    """Имя без регистра, пробелов и разделителей для поиска опечаток"""
+    return _NAME_NOISE.sub('', name).lower()
+
+
+class CompiledStructure:
+    """Структура папок, развернутая в таблицу обязательных подпапок"""
+    
+    def __init__(self, structure: Dict[str, Any], tool_folders: Dict[str, str], structure_hash: str):
+        """
+        Инициализация
+        
+        Args:
+            structure: Структура папок (current_structure.json)
+            tool_folders: Соответствие инструментов и папок в 02_PROCESS
+            structure_hash: Хеш структуры
+        """
+        self.structure_hash = structure_hash
+        self.tool_folders = dict(tool_folders)
+        # Папка -> обязательные подпапки; лишнее ищется только в папках с описанными подпапками
+        self.required: Dict[str, Set[str]] = {}
+        self.paths: List[str] = []
+        self._compile(structure, '.')
+    
+    @classmethod
+    def from_manager(cls, manager: Optional[FolderStructureManager] = None) -> 'CompiledStructure':
+        """
+        Компилирует текущую структуру менеджера
+        
+        Args:
+            manager: Менеджер структуры (по умолчанию новый)
+        
+        Returns:
+            Скомпилированная структура
+        """
+        manager = manager or FolderStructureManager()
+        return cls(manager.get_current_structure(), manager.get_tool_folder_mapping(),
+                   manager.get_structure_hash())
+    
+    def _compile(self, children: Dict[str, Any], rel: str) -> None:
+        """Рекурсивно заполняет таблицу обязательных подпапок"""
+        self.required[rel] = set(children)
+        for name, data in children.items():
+            path = _join(rel, name)
+            self.paths.append(path)
+            if data.get('children'):
+                self._compile(data['children'], path)
+    
+    def descendants(self, path: str) -> List[str]:
+        """Возвращает все папки структуры внутри указанной"""
+        prefix = path + '/'
+        return [child for child in self.paths if child.startswith(prefix)]
+    
+    def expected(self, rel: str, tools: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+        """
+        Возвращает ожидаемые подпапки папки проекта
+        
+        Args:
+            rel: Относительный путь папки
+            tools: Инструменты проекта
+        
+        Returns:
+            Кортеж (обязательные, допустимые дополнительно)
+        """
+        required = set(self.required.get(rel, ()))
+        allowed: Set[str] = set()
+        if rel == '02_PROCESS':
+            required |= {self.tool_folders[tool] for tool in tools if tool in self.tool_folders}
+            allowed = set(self.tool_folders.values())
+        return required, allowed
+    
+    def needs_visit(self, rel: str, tools: Iterable[str]) -> bool:
+        """Нужно ли читать содержимое папки (есть ли в ней что проверять)"""
+        if self.required.get(rel):
+            return True
+        return rel == '02_PROCESS' and any(tool in self.tool_folders for tool in tools)
+    
+    def is_strict(self, rel: str) -> bool:
+        """Проверять ли в папке лишние подпапки"""
+        return bool(self.required.get(rel))
+
+
+def _stat_key(path: str) -> Optional[List[int]]:
+    """Ключ кэша: inode и mtime (None, если файла нет)"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_ino, stat.st_mtime_ns]
+
+
+def audit_project(project_path: str, compiled: CompiledStructure) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Проверяет один проект
+    
+    Args:
+        project_path: Путь к проекту
+        compiled: Скомпилированная структура
+    
+    Returns:
+        Кортеж (результат, ключи кэша проверенных папок)
+    """
+    keys: Dict[str, Any] = {PROJECT_METADATA_FILE: _stat_key(os.path.join(project_path, PROJECT_METADATA_FILE))}
+    metadata = read_project_metadata(project_path) if keys[PROJECT_METADATA_FILE] else None
+    tools = metadata['tools'] if metadata is not None else []
+    
+    missing: List[str] = []
+    extra: List[str] = []
+    misnamed: List[List[str]] = []
+    pending = ['.']
+    while pending:
+        rel = pending.pop()
+        directory = project_path if rel == '.' else os.path.join(project_path, rel)
+        keys[rel] = _stat_key(directory)
+        with os.scandir(directory) as entries:
+            names = {entry.name for entry in entries
+                     if entry.is_dir() and not entry.name.startswith('.')}
+        
+        required, allowed = compiled.expected(rel, tools)
+        absent = sorted(required - names)
+        unknown = sorted(names - required - allowed) if compiled.is_strict(rel) else []
+        
+        for name in list(unknown):
+            match = _match_misnamed(name, absent)
+            if match is not None:
+                misnamed.append([_join(rel, name), _join(rel, match)])
+                absent.remove(match)
+                unknown.remove(name)
+        
+        for name in absent:
+            path = _join(rel, name)
+            missing.append(path)
+            missing.extend(compiled.descendants(path))
+        extra.extend(_join(rel, name) for name in unknown)
+        pending.extend(_join(rel, name) for name in required & names if compiled.needs_visit(_join(rel, name), tools))
+    
+    result = {
+        'path': project_path,
+        'name': os.path.basename(project_path),
+        'tools': tools,
+        'missing': sorted(missing),
+        'extra': sorted(extra),
+        'misnamed': sorted(misnamed),
+        'ok': not (missing or extra or misnamed)
+    }
+    return result, keys
+
+
+def _match_misnamed(name: str, candidates: List[str]) -> Optional[str]:
+    """Находит недостающую папку, на которую похоже имя лишней"""
+    normalized = _normalize_name(name)
+    for candidate in candidates:
+        if _normalize_name(candidate) == normalized:
+            return candidate
+    matches = difflib.get_close_matches(name.upper(), [c.upper() for c in candidates], n=1, cutoff=MISNAME_CUTOFF)
+    if matches:
+        return candidates[[c.upper() for c in candidates].index(matches[0])]
+    return None
+
+
+class StructureAuditor:
+    """Параллельная проверка всех проектов базовой папки с кэшем"""
+    
+    def __init__(self, base_path: str, compiled: Optional[CompiledStructure] = None,
+                 workers: int = AUDIT_WORKERS, cache_path: Optional[str] = None,
+                 progress_callback: Optional[Callable[[int], None]] = None,
+                 cancel_event: Optional[threading.Event] = None):
+        """
+        Инициализация
+        
+        Args:
+            base_path: Базовая папка проектов
+            compiled: Скомпилированная структура (по умолчанию текущая)
+            workers: Количество потоков
+            cache_path: Файл кэша (по умолчанию в папке данных приложения)
+            progress_callback: Функция, получающая количество проверенных проектов
+            cancel_event: Событие отмены
+        """
+        self.base_path = os.path.abspath(base_path)
+        self.compiled = compiled or CompiledStructure.from_manager()
+        self.workers = workers
+        if cache_path is None:
+            key = hashlib.sha1(self.base_path.encode('utf-8')).hexdigest()[:16]
+            cache_path = os.path.join(get_app_data_path(), 'structure_audit', f"{key}.json")
+        self.cache_path = cache_path
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event or threading.Event()
+        self.reused = 0
+        self._lock = threading.Lock()
+        self._cache = self._load_cache()
+        self._dirty = False
+    
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Загружает кэш, если он построен для той же структуры"""
+        try:
+            if os.path.exists(self.cache_path):
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if (data.get('version') == AUDIT_FORMAT_VERSION
+                        and data.get('structure_hash') == self.compiled.structure_hash):
+                    return data['projects']
+        except (json.JSONDecodeError, KeyError, TypeError, OSError) as e:
+            print(f"Ошибка загрузки кэша проверки структуры: {e}")
+        return {}
+    
+    def save_cache(self) -> None:
+        """Сохраняет кэш, если он изменился"""
+        with self._lock:
+            if not self._dirty:
+                return
+            projects = dict(self._cache)
+            self._dirty = False
+        try:
+            directory = os.path.dirname(self.cache_path)
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(prefix='.audit_', dir=directory)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': AUDIT_FORMAT_VERSION,
+                    'structure_hash': self.compiled.structure_hash,
+                    'projects': projects
+                }, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"Ошибка сохранения кэша проверки структуры: {e}")
+    
+    def find_projects(self) -> List[str]:
+        """Возвращает папки проектов базовой папки"""
+        projects = []
+        with os.scandir(self.base_path) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False) or entry.name.startswith('.'):
+                    continue
+                if (os.path.exists(os.path.join(entry.path, PROJECT_METADATA_FILE))
+                        or is_project_dir(entry.path)):
+                    projects.append(entry.path)
+        return sorted(projects)
+    
+    def _audit_cached(self, project_path: str) -> Dict[str, Any]:
+        """Возвращает результат из кэша, если проверенные папки не менялись"""
+        cached = self._cache.get(project_path)
+        if cached is not None:
+            valid = True
+            for rel, key in cached['keys'].items():
+                path = project_path if rel == '.' else os.path.join(project_path, rel)
+                try:
+                    if _stat_key(path) != key:
+                        valid = False
+                        break
+                except OSError:
+                    valid = False
+                    break
+            if valid:
+                with self._lock:
+                    self.reused += 1
+                return cached['result']
+        
+        result, keys = audit_project(project_path, self.compiled)
+        with self._lock:
+            self._cache[project_path] = {'keys': keys, 'result': result}
+            self._dirty = True
+        return result
+    
+    def audit_paths(self, project_paths: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Проверяет указанные проекты параллельно
+        
+        Args:
+            project_paths: Пути проектов
+        
+        Returns:
+            Результаты в том же порядке (для недоступных проектов - с полем 'error')
+        """
+        project_paths = [os.path.abspath(path) for path in project_paths]
+        results: List[Dict[str, Any]] = []
+        if not project_paths:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(project_paths))),
+                                thread_name_prefix='StructureAudit') as pool:
+            futures = [pool.submit(self._audit_cached, path) for path in project_paths]
+            for path, future in zip(project_paths, futures):
+                if self.cancel_event.is_set():
+                    future.cancel()
+                    continue
+                try:
+                    results.append(future.result())
+                except OSError as e:
+                    results.append({'path': path, 'name': os.path.basename(path), 'ok': False,
+                                    'missing': [], 'extra': [], 'misnamed': [], 'tools': [],
+                                    'error': str(e)})
+                if self.progress_callback is not None:
+                    self.progress_callback(len(results))
+        
+        if self.cancel_event.is_set():
+            raise InterruptedError("Проверка структуры отменена")
+        return results
+    
+    def run(self) -> Dict[str, Any]:
+        """
+        Проверяет все проекты базовой папки
+        
+        Returns:
+            Отчет: 'format', 'base_path', 'structure_hash', 'checked', 'compliant',
+            'reused', 'elapsed' и 'projects' - только проекты с отклонениями
+        """
+        started = time.monotonic()
+        self.reused = 0
+        results = self.audit_paths(self.find_projects())
+        self.save_cache()
+        return {
+            'format': AUDIT_FORMAT_VERSION,
+            'base_path': self.base_path,
+            'structure_hash': self.compiled.structure_hash,
+            'checked': len(results),
+            'compliant': sum(1 for result in results if result['ok']),
+            'reused': self.reused,
+            'elapsed': time.monotonic() - started,
+            'projects': [result for result in results if not result['ok']]
+        }
+
+
+def save_audit_report(report: Dict[str, Any], path: str) -> None:
+    """Сохраняет отчет проверки в JSON"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def load_audit_report(path: str) -> Dict[str, Any]:
+    """
+    Загружает отчет проверки
+    
+    Raises:
+        ValueError: Файл не является отчетом проверки структуры
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        report = json.load(f)
+    if not isinstance(report, dict) or report.get('format') != AUDIT_FORMAT_VERSION or 'projects' not in report:
+        raise ValueError(f"{path}: не отчет проверки структуры")
+    return report
+
+
+def repair_projects(entries: Iterable[Dict[str, Any]], dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Исправляет проекты по записям отчета: переименовывает неверно названные
+    папки и создает недостающие; лишние папки не трогаются
+    
+    Args:
+        entries: Записи отчета проверки ('path', 'missing', 'misnamed')
+        dry_run: Только перечислить действия
+    
+    Returns:
+        Словарь: 'renamed', 'created', 'actions', 'errors'
+    """
+    renamed = 0
+    created = 0
+    actions: List[str] = []
+    errors: Dict[str, str] = {}
+    for entry in entries:
+        project_path = entry['path']
+        for found, expected in entry.get('misnamed', []):
+            source = os.path.join(project_path, found)
+            target = os.path.join(project_path, expected)
+            actions.append(f"rename {source} -> {target}")
+            if dry_run:
+                continue
+            try:
+                if os.path.exists(target):
+                    raise FileExistsError(f"папка уже существует: {target}")
+                os.rename(source, target)
+                renamed += 1
+            except OSError as e:
+                errors[source] = str(e)
+        for rel in entry.get('missing', []):
+            target = os.path.join(project_path, rel)
+            actions.append(f"mkdir {target}")
+            if dry_run or os.path.isdir(target):
+                continue
+            try:
+                os.makedirs(target)
+                created += 1
+            except OSError as e:
+                errors[target] = str(e)
+    return {'renamed': renamed, 'created': created, 'actions': actions, 'errors': errors}
+
+
+class AuditWorker(QThread):
+    """Рабочий поток проверки структуры проектов"""
+    
+    progress_updated = pyqtSignal(int)
+    finished = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, base_path: str):
+        """
+        Инициализация рабочего потока
+        
+        Args:
+            base_path: Базовая папка проектов
+        """
+        super().__init__()
+        self.base_path = base_path
+        self.cancel_event = threading.Event()
+    
+    def cancel(self) -> None:
+        """Запрашивает отмену проверки"""
+        self.cancel_event.set()
+    
+    def run(self) -> None:
+        """Основной метод проверки"""
+        try:
+            auditor = StructureAuditor(self.base_path, progress_callback=self.progress_updated.emit,
+                                       cancel_event=self.cancel_event)
+            self.finished.emit(auditor.run())
+        except (OSError, InterruptedError) as e:
+            self.error_occurred.emit(str(e))
@@ -0,0 +1,598 @@
+"""
+Миграция существующих проектов на новую ревизию структуры папок
+Разница структур вычисляется один раз на пару ревизий и применяется к
+проектам параллельно как план переименований и создания папок.
+Каждое действие пишется в журнал проекта до выполнения, поэтому миграцию
+можно откатить; скорость операций ограничивается по томам
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.folder_structure_manager import FolderStructureManager
+from core.project_index import ProjectIndex
+from core.project_metadata import (get_metadata_path, parse_metadata, read_project_metadata,
+                                   serialize_metadata)
+from core.structure_audit import StructureAuditor
+from utils.resource_manager import get_app_data_path
+
+
+MIGRATION_WORKERS = 8
+
+# Операций в секунду на том в рабочее время и вне его (0 - без ограничения)
+DEFAULT_OPS_PER_SECOND = 20
+DEFAULT_OFF_HOURS_OPS_PER_SECOND = 0
+
+# Рабочие часы (локальное время, [начало, конец))
+WORK_HOURS = (9, 20)
+
+# Похожесть имен для сопоставления переименованных папок без подсказки
+RENAME_CUTOFF = 0.8
+
+# Действия плана
+OP_MOVE = 'move'
+OP_MKDIR = 'mkdir'
+
+
+def _flatten(structure: Dict[str, Any], prefix: str = '') -> Dict[str, Dict[str, Any]]:
+    """Разворачивает структуру в словарь 'путь/через/слеш' -> описание папки"""
+    paths = {}
+    for name, data in structure.items():
+        path = f"{prefix}/{name}" if prefix else name
+        paths[path] = data
+        if data.get('children'):
+            paths.update(_flatten(data['children'], path))
+    return paths
+
+
+def _parent(path: str) -> str:
+    """Родительская папка пути структуры ('' для верхнего уровня)"""
+    return path.rsplit('/', 1)[0] if '/' in path else ''
+
+
+def _depth(path: str) -> int:
+    return path.count('/')
+
+
+class StructureDiff:
+    """
+    Разница двух ревизий структуры в виде упорядоченного плана
+    
+    Папки сопоставляются по уровням: по подсказке "renamed_from" в новой
+    структуре (имена или пути прежних папок), затем по совпадению пути, затем внутри
+    той же родительской папки по комментарию или похожему имени. Несколько
+    прежних папок, сопоставленных одной новой, сливаются. Прежние папки без
+    пары не трогаются (данные не удаляются)
+    """
+    
+    def __init__(self, old_structure: Dict[str, Any], new_structure: Dict[str, Any]):
+        """
+        Инициализация и вычисление плана
+        
+        Args:
+            old_structure: Прежняя структура
+            new_structure: Новая структура
+        """
+        self.old_hash = FolderStructureManager.hash_structure(old_structure)
+        self.new_hash = FolderStructureManager.hash_structure(new_structure)
+        old_paths = _flatten(old_structure)
+        new_paths = _flatten(new_structure)
+        
+        self.mapping: Dict[str, str] = {}
+        # По уровням сверху вниз: к началу уровня все родители уже сопоставлены
+        for depth in range(max(map(_depth, list(old_paths) + list(new_paths)), default=-1) + 1):
+            self._match_level(depth, old_paths, new_paths)
+        
+        self.orphaned = sorted(path for path in old_paths if path not in self.mapping)
+        self.operations = self._build_operations(old_paths, new_paths)
+    
+    def _old_parents(self, new_parent: str) -> List[str]:
+        """Прежние папки, которые переходят в указанную новую ('' - корень)"""
+        if not new_parent:
+            return ['']
+        return [old for old, new in self.mapping.items() if new == new_parent]
+    
+    def _match_level(self, depth: int, old_paths: Dict[str, Dict[str, Any]],
+                     new_paths: Dict[str, Dict[str, Any]]) -> None:
+        """Сопоставляет папки одного уровня: подсказки, совпадение пути, похожесть"""
+        level_old = sorted(path for path in old_paths if _depth(path) == depth)
+        level_new = sorted(path for path in new_paths if _depth(path) == depth)
+        
+        for new_path in level_new:
+            for hint in new_paths[new_path].get('renamed_from', []):
+                # Имя без слеша ищется в прежних папках, соответствующих родителю,
+                # путь со слешем ('/MISC', '01_IN/SOUND') - от корня проекта
+                candidates = [hint.lstrip('/')] if '/' in hint else [
+                    f"{parent}/{hint}" if parent else hint for parent in self._old_parents(_parent(new_path))]
+                for old_path in candidates:
+                    if old_path in old_paths and old_path not in self.mapping:
+                        self.mapping[old_path] = new_path
+        
+        for old_path in level_old:
+            if old_path not in self.mapping and old_path in new_paths:
+                self.mapping[old_path] = old_path
+        
+        targets = set(self.mapping.values())
+        for old_path in level_old:
+            if old_path in self.mapping:
+                continue
+            old_parent = _parent(old_path)
+            if old_parent and old_parent not in self.mapping:
+                continue
+            new_parent = self.mapping[old_parent] if old_parent else ''
+            candidates = [path for path in level_new if path not in targets and _parent(path) == new_parent]
+            if not candidates:
+                continue
+            
+            comment = old_paths[old_path].get('comment')
+            match = next((path for path in candidates if comment and new_paths[path].get('comment') == comment), None)
+            if match is None:
+                names = [path.rsplit('/', 1)[-1].upper() for path in candidates]
+                close = difflib.get_close_matches(old_path.rsplit('/', 1)[-1].upper(), names, n=1,
+                                                  cutoff=RENAME_CUTOFF)
+                match = candidates[names.index(close[0])] if close else None
+            if match is not None:
+                self.mapping[old_path] = match
+                targets.add(match)
+    
+    def _build_operations(self, old_paths: Dict[str, Dict[str, Any]],
+                          new_paths: Dict[str, Dict[str, Any]]) -> List[Tuple[str, str, str]]:
+        """
+        Строит план: перемещения сверху вниз, затем создание новых папок
+        
+        Источник перемещения указывается с учетом уже выполненных
+        перемещений родителей
+        """
+        operations: List[Tuple[str, str, str]] = []
+        location: Dict[str, str] = {}
+        for old_path in sorted(old_paths, key=_depth):
+            parent = _parent(old_path)
+            name = old_path.rsplit('/', 1)[-1]
+            current = f"{location[parent]}/{name}" if parent else name
+            target = self.mapping.get(old_path)
+            if target is not None and target != current:
+                operations.append((OP_MOVE, current, target))
+                location[old_path] = target
+            else:
+                location[old_path] = current
+        
+        targets = set(self.mapping.values())
+        for new_path in sorted(new_paths, key=_depth):
+            if new_path not in targets:
+                operations.append((OP_MKDIR, '', new_path))
+        return operations
+    
+    def is_empty(self) -> bool:
+        """Нет ли изменений, требующих действий"""
+        return not self.operations
+
+
+class VolumeThrottle:
+    """Ограничение скорости файловых операций отдельно для каждого тома"""
+    
+    def __init__(self, ops_per_second: float = DEFAULT_OPS_PER_SECOND,
+                 off_hours_ops_per_second: float = DEFAULT_OFF_HOURS_OPS_PER_SECOND,
+                 work_hours: Tuple[int, int] = WORK_HOURS):
+        """
+        Инициализация
+        
+        Args:
+            ops_per_second: Операций в секунду на том в рабочее время (0 - без ограничения)
+            off_hours_ops_per_second: То же вне рабочего времени
+            work_hours: Рабочие часы [начало, конец)
+        """
+        self.ops_per_second = ops_per_second
+        self.off_hours_ops_per_second = off_hours_ops_per_second
+        self.work_hours = work_hours
+        self._lock = threading.Lock()
+        self._next_slot: Dict[int, float] = {}
+    
+    def _current_rate(self) -> float:
+        """Действующий лимит с учетом времени суток"""
+        hour = time.localtime().tm_hour
+        start, end = self.work_hours
+        return self.ops_per_second if start <= hour < end else self.off_hours_ops_per_second
+    
+    def acquire(self, path: str) -> None:
+        """
+        Ждет очереди на операцию с томом, на котором лежит путь
+        
+        Args:
+            path: Путь на томе
+        """
+        rate = self._current_rate()
+        if rate <= 0:
+            return
+        try:
+            device = os.stat(path).st_dev
+        except OSError:
+            device = -1
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(device, now))
+            self._next_slot[device] = slot + 1.0 / rate
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class MigrationJournal:
+    """Журнал действий миграции одного проекта (JSON lines, запись до действия)"""
+    
+    def __init__(self, path: str):
+        """
+        Инициализация
+        
+        Args:
+            path: Файл журнала
+        """
+        self.path = path
+        self._file = None
+    
+    def open(self, header: Dict[str, Any]) -> None:
+        """Создает журнал и записывает заголовок"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self.write(header)
+    
+    def write(self, record: Dict[str, Any]) -> None:
+        """Записывает действие на диск до его выполнения"""
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+    
+    def close(self) -> None:
+        """Закрывает журнал"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    @staticmethod
+    def read(path: str) -> List[Dict[str, Any]]:
+        """Читает записи журнала (неполная последняя строка пропускается)"""
+        records = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+        return records
+
+
+def get_migrations_dir() -> str:
+    """Папка журналов миграций"""
+    return os.path.join(get_app_data_path(), 'migrations')
+
+
+class ProjectMigrator:
+    """Параллельная миграция проектов базовой папки на текущую структуру"""
+    
+    def __init__(self, base_path: str, target_structure: Optional[Dict[str, Any]] = None,
+                 source_structure: Optional[Dict[str, Any]] = None,
+                 workers: int = MIGRATION_WORKERS, throttle: Optional[VolumeThrottle] = None,
+                 index: Optional[ProjectIndex] = None,
+                 progress_callback: Optional[Callable[[int], None]] = None,
+                 cancel_event: Optional[threading.Event] = None):
+        """
+        Инициализация
+        
+        Args:
+            base_path: Базовая папка проектов
+            target_structure: Новая структура (по умолчанию текущая)
+            source_structure: Прежняя структура для проектов без снимка своей ревизии
+            workers: Количество проектов, обрабатываемых одновременно
+            throttle: Ограничение скорости по томам
+            index: Индекс проектов для обновления хеша структуры
+            progress_callback: Функция, получающая количество обработанных проектов
+            cancel_event: Событие отмены
+        """
+        self.base_path = os.path.abspath(base_path)
+        self.target_structure = (target_structure if target_structure is not None
+                                 else FolderStructureManager().get_current_structure())
+        self.target_hash = FolderStructureManager.hash_structure(self.target_structure)
+        self.source_structure = source_structure
+        self.workers = workers
+        self.throttle = throttle or VolumeThrottle()
+        self.index = index
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event or threading.Event()
+        # Метка времени для сортировки и случайный суффикс: миграции, запущенные
+        # в одну секунду, не пишут журналы отката в одну папку
+        self.migration_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        self._diffs: Dict[str, Optional[StructureDiff]] = {}
+        self._lock = threading.Lock()
+    
+    def _get_diff(self, source_hash: Optional[str]) -> Optional[StructureDiff]:
+        """Возвращает разницу для ревизии проекта (вычисляется один раз на ревизию)"""
+        with self._lock:
+            if source_hash in self._diffs:
+                return self._diffs[source_hash]
+            structure = FolderStructureManager.load_snapshot(source_hash) if source_hash else None
+            if structure is None:
+                structure = self.source_structure
+            diff = StructureDiff(structure, self.target_structure) if structure is not None else None
+            self._diffs[source_hash] = diff
+            return diff
+    
+    def _plan_project(self, project_path: str) -> Dict[str, Any]:
+        """Определяет ревизию проекта и его план"""
+        metadata = read_project_metadata(project_path)
+        source_hash = metadata.get('structure') if metadata is not None else None
+        plan = {'path': project_path, 'name': os.path.basename(project_path),
+                'from': source_hash, 'operations': [], 'status': 'pending'}
+        if source_hash == self.target_hash:
+            plan['status'] = 'current'
+            return plan
+        diff = self._get_diff(source_hash)
+        if diff is None:
+            plan['status'] = 'unknown_revision'
+            return plan
+        plan['from'] = diff.old_hash
+        plan['operations'] = self._applicable(project_path, diff.operations)
+        if not plan['operations']:
+            plan['status'] = 'nothing_to_do'
+        return plan
+    
+    @staticmethod
+    def _applicable(project_path: str, operations: List[Tuple[str, str, str]]) -> List[List[str]]:
+        """
+        Отбирает действия, применимые к проекту на диске
+        
+        Перемещение без источника пропускается, перемещение в существующую
+        папку становится слиянием, существующие папки не создаются. Состояние
+        диска моделируется по ходу плана: после переименования родителя его
+        вложенные папки ищутся по исходным путям
+        """
+        # Путь структуры -> исходные пути на диске, из которых он теперь состоит
+        origins: Dict[str, List[str]] = {}
+        created = set()
+        
+        def on_disk(rel: str) -> List[str]:
+            prefix = rel
+            while prefix:
+                if prefix in origins:
+                    return [origin + rel[len(prefix):] for origin in origins[prefix]]
+                prefix = _parent(prefix)
+            return [rel]
+        
+        def exists(rel: str) -> bool:
+            return rel in created or any(os.path.isdir(os.path.join(project_path, path)) for path in on_disk(rel))
+        
+        result = []
+        for op, source, target in operations:
+            if op == OP_MOVE:
+                if not exists(source):
+                    continue
+                merge = exists(target)
+                result.append(['merge' if merge else 'rename', source, target])
+                origins[target] = (on_disk(target) if merge else []) + on_disk(source)
+                origins[source] = []
+                created.discard(source)
+            elif not exists(target):
+                result.append([OP_MKDIR, '', target])
+                created.add(target)
+        return result
+    
+    def plan(self, project_paths: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Строит планы миграции без изменений на диске
+        
+        Args:
+            project_paths: Проекты (по умолчанию все проекты базовой папки)
+        
+        Returns:
+            Планы проектов с 'status' и 'operations'
+        """
+        if project_paths is None:
+            project_paths = StructureAuditor(self.base_path).find_projects()
+        project_paths = list(project_paths)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(project_paths) or 1)),
+                                thread_name_prefix='MigrationPlan') as pool:
+            return list(pool.map(self._plan_project, project_paths))
+    
+    def _journal_path(self, project_path: str) -> str:
+        """Файл журнала проекта для текущей миграции"""
+        key = hashlib.sha1(project_path.encode('utf-8')).hexdigest()[:8]
+        return os.path.join(get_migrations_dir(), self.migration_id,
+                            f"{os.path.basename(project_path)}-{key}.jsonl")
+    
+    def _apply_project(self, plan: Dict[str, Any]) -> Dict[str, Any]:
+        """Выполняет план одного проекта с журналом"""
+        project_path = plan['path']
+        journal = MigrationJournal(self._journal_path(project_path))
+        journal.open({'project': project_path, 'from': plan['from'], 'to': self.target_hash})
+        conflicts: List[str] = []
+        try:
+            for op, source, target in plan['operations']:
+                if self.cancel_event.is_set():
+                    plan['status'] = 'cancelled'
+                    break
+                target_path = os.path.join(project_path, target)
+                if op == OP_MKDIR:
+                    self._make_dirs(journal, target_path)
+                    continue
+                source_path = os.path.join(project_path, source)
+                self._make_dirs(journal, os.path.dirname(target_path))
+                if not os.path.exists(target_path):
+                    self.throttle.acquire(project_path)
+                    journal.write({'op': 'rename', 'src': source_path, 'dst': target_path})
+                    os.rename(source_path, target_path)
+                    continue
+                # Слияние: содержимое переносится по одному элементу, совпадающие имена остаются на месте
+                with os.scandir(source_path) as entries:
+                    names = [entry.name for entry in entries]
+                for name in names:
+                    destination = os.path.join(target_path, name)
+                    if os.path.lexists(destination):
+                        conflicts.append(os.path.join(source, name))
+                        continue
+                    self.throttle.acquire(project_path)
+                    journal.write({'op': 'rename', 'src': os.path.join(source_path, name), 'dst': destination})
+                    os.rename(os.path.join(source_path, name), destination)
+                if not os.listdir(source_path):
+                    journal.write({'op': 'rmdir', 'path': source_path})
+                    os.rmdir(source_path)
+            else:
+                self._update_metadata(journal, project_path)
+                plan['status'] = 'conflicts' if conflicts else 'migrated'
+        except OSError as e:
+            plan['status'] = 'error'
+            plan['error'] = str(e)
+        finally:
+            journal.close()
+        plan['conflicts'] = conflicts
+        plan['journal'] = journal.path
+        return plan
+    
+    def _make_dirs(self, journal: MigrationJournal, path: str) -> None:
+        """Создает папку и недостающих родителей, записывая каждую в журнал"""
+        missing = []
+        while not os.path.isdir(path):
+            missing.append(path)
+            path = os.path.dirname(path)
+        for directory in reversed(missing):
+            self.throttle.acquire(path)
+            journal.write({'op': 'mkdir', 'path': directory})
+            os.mkdir(directory)
+    
+    def _update_metadata(self, journal: MigrationJournal, project_path: str) -> None:
+        """Записывает в project.json ревизию структуры после миграции"""
+        metadata_path = get_metadata_path(project_path)
+        try:
+            with open(metadata_path, 'rb') as f:
+                metadata = parse_metadata(f.read())
+        except FileNotFoundError:
+            return
+        except ValueError as e:
+            print(f"Не удалось обновить метаданные {project_path}: {e}")
+            return
+        journal.write({'op': 'metadata', 'path': metadata_path, 'structure': metadata.get('structure')})
+        metadata['structure'] = self.target_hash
+        _write_metadata(metadata_path, metadata)
+    
+    def run(self, dry_run: bool = True, project_paths: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Строит планы и (если не dry_run) выполняет их
+        
+        Args:
+            dry_run: Только построить планы
+            project_paths: Проекты (по умолчанию все проекты базовой папки)
+        
+        Returns:
+            Словарь: 'migration_id', 'projects' (планы с итогами), 'counts', 'elapsed'
+        """
+        started = time.monotonic()
+        plans = self.plan(project_paths)
+        pending = [plan for plan in plans if plan['status'] == 'pending']
+        
+        if not dry_run and pending:
+            done = 0
+            with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(pending))),
+                                    thread_name_prefix='Migration') as pool:
+                for plan in pool.map(self._apply_project, pending):
+                    done += 1
+                    if self.progress_callback is not None:
+                        self.progress_callback(done)
+            if self.index is not None:
+                self.index.upsert_many([{'path': plan['path'], 'name': plan['name'],
+                                         'structure_hash': self.target_hash}
+                                        for plan in pending if plan['status'] in ('migrated', 'conflicts')])
+        
+        counts: Dict[str, int] = {}
+        for plan in plans:
+            counts[plan['status']] = counts.get(plan['status'], 0) + 1
+        return {
+            'migration_id': None if dry_run or not pending else self.migration_id,
+            'projects': plans,
+            'counts': counts,
+            'elapsed': time.monotonic() - started
+        }
+
+
+def _write_metadata(path: str, metadata: Dict[str, Any]) -> None:
+    """Атомарно перезаписывает project.json"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(serialize_metadata(metadata))
+    os.replace(temp_path, path)
+
+
+def list_migrations() -> List[str]:
+    """Возвращает идентификаторы миграций с журналами (новые первыми)"""
+    try:
+        return sorted(os.listdir(get_migrations_dir()), reverse=True)
+    except FileNotFoundError:
+        return []
+
+
+def rollback_migration(migration_id: str, throttle: Optional[VolumeThrottle] = None,
+                       index: Optional[ProjectIndex] = None) -> Dict[str, Any]:
+    """
+    Откатывает миграцию по журналам проектов в обратном порядке
+    
+    Действие отменяется, только если его результат на месте, поэтому
+    откат безопасно повторять, в том числе после прерванной миграции
+    
+    Args:
+        migration_id: Идентификатор миграции
+        throttle: Ограничение скорости по томам
+        index: Индекс проектов, в котором возвращается прежняя ревизия структуры
+    
+    Returns:
+        Словарь: 'projects', 'undone', 'errors'
+    """
+    throttle = throttle or VolumeThrottle(0)
+    directory = os.path.join(get_migrations_dir(), migration_id)
+    projects = 0
+    undone = 0
+    errors: Dict[str, str] = {}
+    restored = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith('.jsonl'):
+            continue
+        records = MigrationJournal.read(os.path.join(directory, name))
+        if not records:
+            continue
+        projects += 1
+        for record in reversed(records[1:]):
+            try:
+                if record['op'] == 'rename':
+                    if os.path.lexists(record['dst']) and not os.path.lexists(record['src']):
+                        throttle.acquire(record['dst'])
+                        os.makedirs(os.path.dirname(record['src']), exist_ok=True)
+                        os.rename(record['dst'], record['src'])
+                        undone += 1
+                elif record['op'] == 'mkdir':
+                    if os.path.isdir(record['path']) and not os.listdir(record['path']):
+                        os.rmdir(record['path'])
+                        undone += 1
+                elif record['op'] == 'rmdir':
+                    if not os.path.exists(record['path']):
+                        os.mkdir(record['path'])
+                        undone += 1
+                elif record['op'] == 'metadata':
+                    metadata = read_project_metadata(os.path.dirname(record['path']))
+                    if metadata is not None and metadata.get('structure') != record['structure']:
+                        metadata['structure'] = record['structure']
+                        _write_metadata(record['path'], metadata)
+                        undone += 1
+            except OSError as e:
+                errors[record.get('dst') or record.get('path', '')] = str(e)
+        
+        # Ревизия до миграции: из project.json, а для проектов без него - из заголовка журнала
+        project_path = records[0]['project']
+        structure_hash = next((record['structure'] for record in records[1:] if record['op'] == 'metadata'), None)
+        if os.path.isdir(project_path):
+            restored.append({'path': project_path, 'name': os.path.basename(project_path),
+                             'structure_hash': structure_hash or records[0].get('from')})
+    
+    if index is not None and restored:
+        index.upsert_many(restored)
+    return {'projects': projects, 'undone': undone, 'errors': errors}
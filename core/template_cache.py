@@ -0,0 +1,211 @@
+"""
+Кэш шаблонов в памяти
+Содержимое шаблонов читается один раз и хранится в памяти с вытеснением
+по LRU в пределах заданного объема. Кэш сбрасывается при изменении
+отпечатка каталога шаблонов
+"""
+
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+from core.file_system import LocalFileSystem
+from core.template_catalog import TemplateCatalog
+
+
+# Объем кэша по умолчанию
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Доля объема кэша, больше которой файл не кэшируется
+MAX_ENTRY_FRACTION = 0.5
+
+
+class CachedTemplate:
+    """Содержимое шаблона с метаданными исходного файла"""
+    
+    __slots__ = ('data', 'mtime')
+    
+    def __init__(self, data: bytes, mtime: float):
+        self.data = data
+        self.mtime = mtime
+
+
+class TemplateCache:
+    """LRU-кэш содержимого шаблонов с ограничением по суммарному объему"""
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Инициализация кэша
+        
+        Args:
+            max_bytes: Максимальный суммарный объем кэшированных данных
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._fingerprint = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @property
+    def total_bytes(self) -> int:
+        """Текущий объем кэшированных данных"""
+        return self._total_bytes
+    
+    def sync_fingerprint(self, fingerprint: str) -> None:
+        """
+        Сбрасывает кэш, если отпечаток каталога шаблонов изменился
+        
+        Args:
+            fingerprint: Текущий отпечаток каталога
+        """
+        with self._lock:
+            if self._fingerprint != fingerprint:
+                if self._fingerprint is not None:
+                    print("Каталог шаблонов изменился, кэш шаблонов сброшен")
+                self._entries.clear()
+                self._total_bytes = 0
+                self._fingerprint = fingerprint
+    
+    def get(self, path: str) -> Optional[CachedTemplate]:
+        """
+        Возвращает шаблон из кэша
+        
+        Args:
+            path: Путь к шаблону
+        
+        Returns:
+            Кэшированный шаблон или None
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(path)
+            self.hits += 1
+            return entry
+    
+    def get_or_load(self, path: str, fs: Optional[LocalFileSystem] = None) -> Optional[CachedTemplate]:
+        """
+        Возвращает шаблон из кэша, при отсутствии читает и кэширует его
+        
+        Args:
+            path: Путь к шаблону
+            fs: Слой файловых операций для чтения
+        
+        Returns:
+            Кэшированный шаблон или None, если файл слишком велик для кэша
+        """
+        entry = self.get(path)
+        if entry is not None:
+            return entry
+        return self.load(path, fs)
+    
+    def load(self, path: str, fs: Optional[LocalFileSystem] = None) -> Optional[CachedTemplate]:
+        """
+        Читает шаблон и помещает его в кэш
+        
+        Args:
+            path: Путь к шаблону
+            fs: Слой файловых операций для чтения
+        
+        Returns:
+            Кэшированный шаблон или None, если файл слишком велик для кэша
+        """
+        fs = fs or LocalFileSystem()
+        stat = fs.stat(path)
+        if stat.st_size > self.max_bytes * MAX_ENTRY_FRACTION:
+            return None
+        
+        data = fs.read_bytes(path)
+        entry = CachedTemplate(data, stat.st_mtime)
+        
+        with self._lock:
+            previous = self._entries.pop(path, None)
+            if previous is not None:
+                self._total_bytes -= len(previous.data)
+            self._entries[path] = entry
+            self._total_bytes += len(data)
+            
+            # Вытесняем давно не использованные шаблоны
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted.data)
+        
+        return entry
+    
+    def clear(self) -> None:
+        """Очищает кэш"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+    
+    def warm_up(self, catalog: TemplateCatalog, tools: Optional[List[str]] = None) -> int:
+        """
+        Заранее загружает шаблоны каталога в кэш
+        
+        Args:
+            catalog: Каталог шаблонов
+            tools: Инструменты для загрузки (None - все)
+        
+        Returns:
+            Количество загруженных шаблонов
+        """
+        tools = tools if tools is not None else list(catalog.get_tools())
+        self.sync_fingerprint(catalog.fingerprint())
+        
+        loaded = 0
+        for tool in tools:
+            template = catalog.find_template(tool)
+            if template is None or self.get(template) is not None:
+                continue
+            try:
+                if self.load(template, catalog.fs) is not None:
+                    loaded += 1
+            except OSError as e:
+                print(f"Предупреждение: не удалось загрузить шаблон {template}: {e}")
+        return loaded
+    
+    def start_background_warm_up(self, catalog: TemplateCatalog,
+                                 precompute_hashes: bool = False) -> threading.Thread:
+        """
+        Запускает прогрев кэша в фоновом потоке
+        
+        Args:
+            catalog: Каталог шаблонов
+            precompute_hashes: Также вычислить хеши шаблонов для проверки копий
+        
+        Returns:
+            Запущенный поток
+        """
+        def worker():
+            try:
+                loaded = self.warm_up(catalog)
+                print(f"✅ Кэш шаблонов прогрет: {loaded} шаблонов, {self._total_bytes} байт")
+                if precompute_hashes:
+                    hashed = catalog.precompute_hashes()
+                    print(f"✅ Хеши шаблонов актуальны: {hashed} шаблонов")
+            except Exception as e:
+                print(f"⚠️ Ошибка прогрева кэша шаблонов: {e}")
+        
+        thread = threading.Thread(target=worker, name='TemplateCacheWarmUp', daemon=True)
+        thread.start()
+        return thread
+
+
+_default_cache = None
+
+
+def get_template_cache() -> TemplateCache:
+    """
+    Возвращает общий для приложения кэш шаблонов
+    
+    Returns:
+        Экземпляр TemplateCache
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TemplateCache()
+    return _default_cache
@@ -0,0 +1,200 @@
+"""
+Каталог шаблонов проектов
+Описывает соответствие инструментов, шаблонов и папок проекта
+и вычисляет отпечаток набора шаблонов для инвалидации кэшей
+"""
+
+import hashlib
+import os
+from typing import Dict, List, Optional
+
+from core.file_hashing import SourceHashStore, get_source_hash_store
+from core.file_system import LocalFileSystem
+from utils.resource_manager import resource_path
+
+
+# Параметры шаблонов для каждого инструмента
+TOOL_TEMPLATES = {
+    'ae': {
+        'pattern': '*.aep',
+        'folder': '02_PROCESS/AE',
+        'extension': '.aep',
+        'display_name': 'After Effects (.aep)'
+    },
+    'c4d': {
+        'pattern': '*.c4d',
+        'folder': '02_PROCESS/C4D',
+        'extension': '.c4d',
+        'display_name': 'Cinema 4D (.c4d)'
+    },
+    'pr': {
+        'pattern': '*.prproj',
+        'folder': '02_PROCESS/PR',
+        'extension': '.prproj',
+        'display_name': 'Premiere Pro (.prproj)'
+    },
+    'houdini': {
+        'pattern': '*.hip',
+        'folder': '02_PROCESS/HOUDINI',
+        'extension': '.hip',
+        'display_name': 'Houdini (.hip)'
+    },
+    'blender': {
+        'pattern': '*.blend',
+        'folder': '02_PROCESS/BLENDER',
+        'extension': '.blend',
+        'display_name': 'Blender (.blend)'
+    },
+}
+
+
+def get_default_templates_dir() -> str:
+    """
+    Возвращает папку со встроенными шаблонами
+    
+    Returns:
+        Путь к папке шаблонов
+    """
+    return resource_path("resources/templates")
+
+
+class TemplateCatalog:
+    """Класс для поиска шаблонов инструментов в папке шаблонов"""
+    
+    def __init__(self, templates_dir: Optional[str] = None, fs: Optional[LocalFileSystem] = None,
+                 hash_store: Optional[SourceHashStore] = None):
+        """
+        Инициализация каталога
+        
+        Args:
+            templates_dir: Папка с шаблонами (по умолчанию встроенная)
+            fs: Слой файловых операций
+            hash_store: Хранилище хешей шаблонов (по умолчанию общее)
+        """
+        self.templates_dir = templates_dir or get_default_templates_dir()
+        self.fs = fs or LocalFileSystem()
+        self.hash_store = hash_store or get_source_hash_store()
+    
+    def get_tools(self) -> List[str]:
+        """
+        Возвращает коды всех известных инструментов
+        
+        Returns:
+            Список кодов инструментов
+        """
+        return list(TOOL_TEMPLATES)
+    
+    def get_tool_config(self, tool: str) -> Optional[Dict[str, str]]:
+        """
+        Возвращает параметры шаблона инструмента
+        
+        Args:
+            tool: Код инструмента
+            
+        Returns:
+            Словарь параметров или None для неизвестного инструмента
+        """
+        return TOOL_TEMPLATES.get(tool)
+    
+    def find_templates(self, tool: str) -> List[str]:
+        """
+        Ищет все файлы шаблонов инструмента
+        
+        Args:
+            tool: Код инструмента
+            
+        Returns:
+            Отсортированный список путей к шаблонам
+        """
+        config = TOOL_TEMPLATES.get(tool)
+        if config is None:
+            return []
+        return self.fs.glob(os.path.join(self.templates_dir, config['pattern']))
+    
+    def find_template(self, tool: str) -> Optional[str]:
+        """
+        Возвращает шаблон инструмента по умолчанию
+        
+        Args:
+            tool: Код инструмента
+            
+        Returns:
+            Путь к шаблону или None, если шаблон не найден
+        """
+        templates = self.find_templates(tool)
+        return templates[0] if templates else None
+    
+    def missing_templates(self, tools: List[str]) -> List[str]:
+        """
+        Проверяет наличие шаблонов для инструментов
+        
+        Args:
+            tools: Список кодов инструментов
+            
+        Returns:
+            Список отображаемых имен инструментов без шаблонов
+        """
+        missing = []
+        for tool in tools:
+            config = TOOL_TEMPLATES.get(tool)
+            if config is None:
+                missing.append(f"Неизвестный инструмент: {tool}")
+            elif not self.find_templates(tool):
+                missing.append(config['display_name'])
+        return missing
+    
+    def fingerprint(self, tools: Optional[List[str]] = None) -> str:
+        """
+        Вычисляет отпечаток набора шаблонов и их файлов метаданных
+        по именам, размерам и времени изменения
+        
+        Args:
+            tools: Учитываемые инструменты (None - все)
+            
+        Returns:
+            Шестнадцатеричный отпечаток
+        """
+        digest = hashlib.sha1()
+        for tool in sorted(tools if tools is not None else TOOL_TEMPLATES):
+            for path in self.find_templates(tool):
+                # Файл метаданных варианта (<шаблон>.json) тоже влияет на отпечаток
+                for candidate in (path, path + '.json'):
+                    try:
+                        stat = self.fs.stat(candidate)
+                    except OSError:
+                        continue
+                    digest.update(f"{tool}|{os.path.basename(candidate)}|{stat.st_size}|{stat.st_mtime_ns}\n".encode('utf-8'))
+        return digest.hexdigest()
+    
+    def get_source_hash(self, path: str) -> str:
+        """
+        Возвращает хеш содержимого шаблона (из хранилища, если файл не менялся)
+        
+        Args:
+            path: Путь к файлу шаблона
+            
+        Returns:
+            Шестнадцатеричный хеш
+        """
+        return self.hash_store.get_hash(path, self.fs)
+    
+    def precompute_hashes(self, tools: Optional[List[str]] = None) -> int:
+        """
+        Заранее вычисляет и сохраняет хеши всех шаблонов
+        
+        Args:
+            tools: Учитываемые инструменты (None - все)
+            
+        Returns:
+            Количество обработанных шаблонов
+        """
+        count = 0
+        for tool in tools if tools is not None else TOOL_TEMPLATES:
+            for path in self.find_templates(tool):
+                try:
+                    self.get_source_hash(path)
+                    count += 1
+                except OSError as e:
+                    print(f"Ошибка хеширования шаблона {path}: {e}")
+        self.hash_store.save()
+        return count
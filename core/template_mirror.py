@@ -0,0 +1,270 @@
+"""
+Локальное зеркало сетевой папки шаблонов
+Шаблоны из удаленного источника копируются в контентно-адресуемое
+хранилище в папке данных приложения. Создание проектов читает шаблоны
+только из локального зеркала, а удаленная папка используется лишь для
+фоновой сверки по размеру/времени изменения и хешу
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from utils.resource_manager import get_app_data_path
+
+
+MANIFEST_NAME = 'manifest.json'
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _hash_and_copy(source: str, destination: str) -> str:
+    """
+    Копирует файл, одновременно вычисляя его SHA-256 (один проход чтения)
+    
+    Args:
+        source: Исходный файл
+        destination: Файл назначения
+        
+    Returns:
+        Шестнадцатеричный хеш содержимого
+    """
+    digest = hashlib.sha256()
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        while True:
+            chunk = src.read(COPY_BUFFER_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            dst.write(chunk)
+    shutil.copystat(source, destination)
+    return digest.hexdigest()
+
+
+class TemplateMirror:
+    """Контентно-адресуемое локальное зеркало удаленной папки шаблонов"""
+    
+    def __init__(self, remote_dir: str, cache_root: Optional[str] = None):
+        """
+        Инициализация зеркала
+        
+        Args:
+            remote_dir: Удаленная папка шаблонов (например, на сетевом диске)
+            cache_root: Папка зеркала (по умолчанию в папке данных приложения)
+        """
+        self.remote_dir = remote_dir
+        remote_key = hashlib.sha1(os.path.normpath(remote_dir).encode('utf-8')).hexdigest()[:12]
+        self.root = cache_root or os.path.join(get_app_data_path(), 'template_mirror', remote_key)
+        self.objects_dir = os.path.join(self.root, 'objects')
+        self.view_dir = os.path.join(self.root, 'current')
+        self.manifest_path = os.path.join(self.root, MANIFEST_NAME)
+        self._lock = threading.Lock()
+        self.manifest = self._load_manifest()
+        self.last_error = None
+    
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Загружает манифест зеркала"""
+        try:
+            if os.path.exists(self.manifest_path):
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Ошибка загрузки манифеста зеркала шаблонов: {e}")
+        return {'remote': self.remote_dir, 'synced_at': None, 'files': {}}
+    
+    def _save_manifest(self) -> None:
+        """Сохраняет манифест атомарно"""
+        os.makedirs(self.root, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix='.manifest_', dir=self.root)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.manifest_path)
+    
+    def _object_path(self, digest: str) -> str:
+        """Возвращает путь к объекту хранилища по хешу"""
+        return os.path.join(self.objects_dir, digest[:2], digest)
+    
+    def is_populated(self) -> bool:
+        """
+        Проверяет, есть ли в зеркале синхронизированные шаблоны
+        
+        Returns:
+            True если зеркало можно использовать
+        """
+        return bool(self.manifest.get('files')) and os.path.isdir(self.view_dir)
+    
+    def local_templates_dir(self) -> str:
+        """
+        Возвращает локальную папку с шаблонами зеркала
+        
+        Returns:
+            Путь к папке-представлению зеркала
+        """
+        return self.view_dir
+    
+    def sync(self) -> Dict[str, int]:
+        """
+        Сверяет зеркало с удаленной папкой и загружает изменения
+        
+        Returns:
+            Статистика: added, updated, removed, unchanged
+            
+        Raises:
+            OSError: Удаленная папка недоступна
+        """
+        stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+        
+        with self._lock:
+            os.makedirs(self.objects_dir, exist_ok=True)
+            os.makedirs(self.view_dir, exist_ok=True)
+            files = self.manifest.setdefault('files', {})
+            seen = set()
+            
+            with os.scandir(self.remote_dir) as entries:
+                remote_entries = [entry for entry in entries if entry.is_file()]
+            
+            for entry in remote_entries:
+                seen.add(entry.name)
+                stat = entry.stat()
+                known = files.get(entry.name)
+                view_path = os.path.join(self.view_dir, entry.name)
+                
+                # Сверка по размеру и времени изменения - без чтения файла
+                if (known and known['size'] == stat.st_size and known['mtime_ns'] == stat.st_mtime_ns
+                        and os.path.exists(view_path)):
+                    stats['unchanged'] += 1
+                    continue
+                
+                fd, temp_path = tempfile.mkstemp(prefix='.incoming_', dir=self.objects_dir)
+                os.close(fd)
+                try:
+                    digest = _hash_and_copy(entry.path, temp_path)
+                    object_path = self._object_path(digest)
+                    os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                    if os.path.exists(object_path):
+                        os.remove(temp_path)
+                    else:
+                        os.replace(temp_path, object_path)
+                finally:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+                
+                self._link_into_view(object_path, view_path)
+                files[entry.name] = {'sha256': digest, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+                stats['updated' if known else 'added'] += 1
+            
+            for name in list(files):
+                if name not in seen:
+                    del files[name]
+                    view_path = os.path.join(self.view_dir, name)
+                    if os.path.exists(view_path):
+                        os.remove(view_path)
+                    stats['removed'] += 1
+            
+            self.manifest['remote'] = self.remote_dir
+            self.manifest['synced_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+            self._save_manifest()
+            self._collect_garbage()
+        
+        return stats
+    
+    def _link_into_view(self, object_path: str, view_path: str) -> None:
+        """
+        Публикует объект в папке-представлении под именем шаблона
+        
+        Args:
+            object_path: Путь к объекту хранилища
+            view_path: Путь к файлу в папке-представлении
+        """
+        temp_path = f"{view_path}.tmp"
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        try:
+            os.link(object_path, temp_path)
+        except OSError:
+            # Файловая система без жестких ссылок - копируем
+            shutil.copy2(object_path, temp_path)
+        os.replace(temp_path, view_path)
+    
+    def _collect_garbage(self) -> None:
+        """Удаляет объекты, на которые не ссылается манифест"""
+        referenced = {info['sha256'] for info in self.manifest.get('files', {}).values()}
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+            if not os.path.isdir(prefix_dir):
+                continue
+            for name in os.listdir(prefix_dir):
+                if name not in referenced:
+                    try:
+                        os.remove(os.path.join(prefix_dir, name))
+                    except OSError:
+                        pass
+    
+    def start_background_sync(self, on_finished=None) -> threading.Thread:
+        """
+        Запускает сверку зеркала в фоновом потоке
+        
+        Args:
+            on_finished: Функция, вызываемая со статистикой (или None при ошибке)
+            
+        Returns:
+            Запущенный поток
+        """
+        def worker():
+            stats = None
+            try:
+                stats = self.sync()
+                self.last_error = None
+                print(f"✅ Зеркало шаблонов синхронизировано: {stats}")
+            except OSError as e:
+                self.last_error = str(e)
+                print(f"⚠️ Удаленная папка шаблонов недоступна, используется локальное зеркало: {e}")
+            if on_finished is not None:
+                on_finished(stats)
+        
+        thread = threading.Thread(target=worker, name='TemplateMirrorSync', daemon=True)
+        thread.start()
+        return thread
+
+
+_mirrors = {}
+_mirrors_lock = threading.Lock()
+
+
+def get_template_mirror(remote_dir: str) -> TemplateMirror:
+    """
+    Возвращает общее для приложения зеркало удаленной папки
+    
+    Args:
+        remote_dir: Удаленная папка шаблонов
+        
+    Returns:
+        Экземпляр TemplateMirror
+    """
+    with _mirrors_lock:
+        if remote_dir not in _mirrors:
+            _mirrors[remote_dir] = TemplateMirror(remote_dir)
+        return _mirrors[remote_dir]
+
+
+def resolve_templates_dir(remote_dir: Optional[str]) -> Optional[str]:
+    """
+    Определяет папку, из которой следует читать шаблоны
+    
+    Args:
+        remote_dir: Настроенный удаленный источник шаблонов или None
+        
+    Returns:
+        Папка локального зеркала, если оно синхронизировано; удаленная папка,
+        если зеркало еще пусто; None, если источник не настроен
+    """
+    if not remote_dir:
+        return None
+    mirror = get_template_mirror(remote_dir)
+    if mirror.is_populated():
+        return mirror.local_templates_dir()
+    return remote_dir
@@ -0,0 +1,292 @@
+"""
+Потоковые преобразования шаблонов при копировании
+Шаблон Premiere Pro (.prproj) - это XML, сжатый gzip. Преобразование
+распаковывает его потоком, переписывает выбранные элементы SAX-фильтром
+и сразу сжимает обратно, не загружая дерево XML в память
+"""
+
+import gzip
+import re
+import shutil
+import xml.sax
+import zlib
+from typing import IO, Any, Dict, FrozenSet, List, Optional, Set, Tuple
+from xml.sax.saxutils import XMLGenerator
+from xml.sax.xmlreader import AttributesImpl
+
+
+# Размер блока чтения при потоковой обработке
+STREAM_CHUNK_SIZE = 256 * 1024
+
+# Тики Premiere Pro в одной секунде (FrameRate хранится как длительность кадра в тиках)
+PREMIERE_TICKS_PER_SECOND = 254016000000
+
+# Подстановочные маркеры, которые автор шаблона может использовать в тексте и атрибутах
+TOKEN_PATTERN = re.compile(r'\{\{([A-Z_]+)\}\}')
+
+# Ссылки на VideoSettings, задающие параметры видео проекта и новых секвенций
+# (остальные VideoSettings принадлежат настройкам предпросмотра и экспорта)
+VIDEO_SETTINGS_OWNERS = ('ProjectSettings', 'DefaultSequenceSettings')
+
+# Путь к элементу правила: окончание цепочки имен от корня документа
+ElementPath = Tuple[str, ...]
+
+
+def fps_to_premiere_ticks(fps: float) -> int:
+    """
+    Переводит частоту кадров в длительность кадра в тиках Premiere Pro
+    
+    Args:
+        fps: Частота кадров (например, 25 или 29.97)
+        
+    Returns:
+        Длительность кадра в тиках
+    """
+    # Для NTSC-частот используем точные дроби (30000/1001 и т.д.)
+    for nominal in (24, 30, 60):
+        if abs(fps - nominal * 1000 / 1001) < 0.01:
+            return PREMIERE_TICKS_PER_SECOND * 1001 // (nominal * 1000)
+    return round(PREMIERE_TICKS_PER_SECOND / fps)
+
+
+class _RewriteFilter(xml.sax.ContentHandler):
+    """
+    SAX-обработчик, переписывающий текст выбранных элементов и копирующий остальное
+    Правило задает путь к элементу и замены текста его дочерних элементов.
+    Premiere Pro хранит объекты плоским списком и ссылается на них атрибутами
+    ObjectRef/ObjectURef, поэтому для ссылки правило переносится на объект
+    с тем же ObjectID/ObjectUID, который в файле идет после ссылки
+    """
+    
+    def __init__(self, output: XMLGenerator, rules: Dict[ElementPath, Dict[str, str]],
+                 tokens: Dict[str, str], once: FrozenSet[ElementPath] = frozenset()):
+        """
+        Инициализация фильтра
+        
+        Args:
+            output: Генератор XML для записи результата
+            rules: Замены текста: путь к элементу -> {дочерний элемент: новый текст}
+            tokens: Значения подстановочных маркеров {{NAME}}
+            once: Пути, правило которых применяется только к первому совпадению
+        """
+        super().__init__()
+        self._out = output
+        self._rules = rules
+        self._tokens = tokens
+        self._once = once
+        self._used: Set[ElementPath] = set()
+        # Идентификатор объекта -> замены его дочерних элементов
+        self._targets: Dict[str, Dict[str, str]] = {}
+        self._stack: List[str] = []
+        # Замены для дочерних элементов каждого открытого элемента
+        self._scopes: List[Optional[Dict[str, str]]] = []
+        self._text: List[str] = []
+        self._replacement: Optional[str] = None
+        self.replacements = 0
+    
+    def _match(self, attrs) -> Optional[Dict[str, str]]:
+        """Находит замены для дочерних элементов только что открытого элемента"""
+        children = None
+        object_id = attrs.get('ObjectID') or attrs.get('ObjectUID')
+        if object_id is not None and object_id in self._targets:
+            children = self._targets.pop(object_id)
+        
+        for path, replacements in self._rules.items():
+            if path in self._used or tuple(self._stack[-len(path):]) != path:
+                continue
+            if path in self._once:
+                self._used.add(path)
+            reference = attrs.get('ObjectRef') or attrs.get('ObjectURef')
+            if reference is not None:
+                self._targets[reference] = replacements
+            else:
+                children = replacements
+        return children
+    
+    def _substitute(self, value: str) -> str:
+        """Подставляет значения маркеров {{NAME}} в строку"""
+        if '{{' not in value:
+            return value
+        
+        def replace(match):
+            name = match.group(1)
+            if name in self._tokens:
+                self.replacements += 1
+                return self._tokens[name]
+            return match.group(0)
+        
+        return TOKEN_PATTERN.sub(replace, value)
+    
+    def _flush_text(self) -> None:
+        """Записывает накопленный текст (или его замену)"""
+        if self._replacement is not None:
+            if self._text:
+                self.replacements += 1
+                self._out.characters(self._replacement)
+            self._replacement = None
+        elif self._text:
+            self._out.characters(self._substitute(''.join(self._text)))
+        self._text = []
+    
+    def startDocument(self):
+        self._out.startDocument()
+    
+    def endDocument(self):
+        self._out.endDocument()
+    
+    def processingInstruction(self, target, data):
+        self._flush_text()
+        self._out.processingInstruction(target, data)
+    
+    def startElement(self, name, attrs):
+        self._flush_text()
+        scope = self._scopes[-1] if self._scopes else None
+        self._replacement = scope.get(name) if scope else None
+        self._stack.append(name)
+        self._scopes.append(self._match(attrs))
+        
+        values = {key: self._substitute(value) for key, value in attrs.items()}
+        self._out.startElement(name, AttributesImpl(values))
+    
+    def endElement(self, name):
+        self._flush_text()
+        self._stack.pop()
+        self._scopes.pop()
+        self._out.endElement(name)
+    
+    def characters(self, content):
+        self._text.append(content)
+    
+    def ignorableWhitespace(self, whitespace):
+        self._text.append(whitespace)
+
+
+class PrprojTransform:
+    """Подстановка параметров проекта в шаблон Premiere Pro (.prproj)"""
+    
+    def __init__(self, project_name: str, sequence_name: Optional[str] = None,
+                 frame_rate: Optional[float] = None, resolution: Optional[Tuple[int, int]] = None):
+        """
+        Инициализация преобразования
+        
+        Args:
+            project_name: Имя проекта
+            sequence_name: Имя основной (первой) секвенции шаблона (по умолчанию имя проекта)
+            frame_rate: Частота кадров видео (None - как в шаблоне)
+            resolution: Разрешение (ширина, высота) (None - как в шаблоне)
+        """
+        self.project_name = project_name
+        self.sequence_name = sequence_name or project_name
+        self.frame_rate = frame_rate
+        self.resolution = resolution
+        self.replacements = 0
+    
+    def _build_rules(self) -> Dict[ElementPath, Dict[str, str]]:
+        """Формирует правила замены текста элементов"""
+        rules = {('Sequence',): {'Name': self.sequence_name}}
+        video = {}
+        if self.frame_rate:
+            video['FrameRate'] = str(fps_to_premiere_ticks(self.frame_rate))
+        if self.resolution:
+            width, height = self.resolution
+            video['FrameSize'] = f"0,0,{int(width)},{int(height)}"
+        if video:
+            for owner in VIDEO_SETTINGS_OWNERS:
+                rules[(owner, 'VideoSettings')] = video
+        return rules
+    
+    def _build_tokens(self) -> Dict[str, str]:
+        """Формирует значения подстановочных маркеров"""
+        tokens = {
+            'PROJECT_NAME': self.project_name,
+            'SEQUENCE_NAME': self.sequence_name,
+        }
+        if self.frame_rate:
+            tokens['FRAME_RATE'] = f"{self.frame_rate:g}"
+        if self.resolution:
+            tokens['WIDTH'], tokens['HEIGHT'] = (str(int(value)) for value in self.resolution)
+        return tokens
+    
+    def apply(self, source: IO[bytes], destination: IO[bytes]) -> int:
+        """
+        Преобразует шаблон потоком: gzip -> SAX-фильтр -> gzip
+        
+        Args:
+            source: Двоичный поток сжатого шаблона
+            destination: Двоичный поток для записи результата
+            
+        Returns:
+            Количество выполненных замен
+        """
+        with gzip.GzipFile(fileobj=source, mode='rb') as compressed_in, \
+                gzip.GzipFile(fileobj=destination, mode='wb') as compressed_out:
+            output = XMLGenerator(compressed_out, encoding='UTF-8', short_empty_elements=True)
+            # Переименовывается только основная секвенция, остальные сохраняют свои имена
+            handler = _RewriteFilter(output, self._build_rules(), self._build_tokens(),
+                                     once=frozenset({('Sequence',)}))
+            
+            parser = xml.sax.make_parser()
+            parser.setFeature(xml.sax.handler.feature_namespaces, False)
+            parser.setFeature(xml.sax.handler.feature_external_ges, False)
+            parser.setContentHandler(handler)
+            
+            while True:
+                chunk = compressed_in.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                parser.feed(chunk)
+            parser.close()
+        
+        self.replacements = handler.replacements
+        return self.replacements
+
+
+# Ошибки разбора шаблона, при которых он копируется без преобразования
+TRANSFORM_ERRORS = (xml.sax.SAXException, gzip.BadGzipFile, EOFError, zlib.error)
+
+# Преобразования по расширению файла шаблона
+TEMPLATE_TRANSFORMS = {
+    '.prproj': PrprojTransform,
+}
+
+
+def get_template_transform(extension: str, project_name: str,
+                           params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+    """
+    Возвращает преобразование для шаблона с указанным расширением
+    
+    Args:
+        extension: Расширение файла шаблона (с точкой)
+        project_name: Имя проекта
+        params: Параметры шаблона (frame_rate, resolution, sequence_name)
+        
+    Returns:
+        Объект преобразования или None, если преобразование не требуется
+    """
+    transform_class = TEMPLATE_TRANSFORMS.get(extension.lower())
+    if transform_class is None:
+        return None
+    
+    params = params or {}
+    resolution = params.get('resolution')
+    return transform_class(
+        project_name,
+        sequence_name=params.get('sequence_name'),
+        frame_rate=params.get('frame_rate'),
+        resolution=tuple(resolution) if resolution else None
+    )
+
+
+def copy_with_transform(source: IO[bytes], destination: IO[bytes], transform: Optional[Any]) -> None:
+    """
+    Копирует поток, применяя преобразование, если оно задано
+    
+    Args:
+        source: Исходный двоичный поток
+        destination: Двоичный поток назначения
+        transform: Объект преобразования или None
+    """
+    if transform is None:
+        shutil.copyfileobj(source, destination, STREAM_CHUNK_SIZE)
+    else:
+        transform.apply(source, destination)
@@ -0,0 +1,370 @@
+"""
+Варианты шаблонов инструментов
+У каждого инструмента может быть несколько шаблонов (1080p25, 2160p50,
+вертикальный 9:16, шаблоны клиентов). Метаданные варианта хранятся рядом
+с шаблоном в файле <шаблон>.json, например template_2160p50.aep.json:
+
+    {
+        "name": "2160p50",
+        "resolution": [3840, 2160],
+        "fps": 50,
+        "client": "ACME",
+        "tags": ["4k", "broadcast"],
+        "default": false
+    }
+
+Индекс вариантов строится один раз на отпечаток каталога и дает
+выбор варианта за O(1) при пакетном создании
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.template_catalog import TemplateCatalog
+
+
+METADATA_SUFFIX = '.json'
+
+
+def get_metadata_path(template_path: str) -> str:
+    """
+    Возвращает путь к файлу метаданных шаблона
+    
+    Args:
+        template_path: Путь к шаблону
+        
+    Returns:
+        Путь к файлу метаданных
+    """
+    return template_path + METADATA_SUFFIX
+
+
+def validate_metadata(metadata: Any) -> Dict[str, Any]:
+    """
+    Проверяет метаданные варианта и приводит поля к ожидаемым типам
+    
+    Args:
+        metadata: Содержимое файла <шаблон>.json
+        
+    Returns:
+        Метаданные с приведенными полями (например, "fps": "25" -> 25.0)
+        
+    Raises:
+        ValueError: Поле имеет недопустимое значение
+    """
+    if not isinstance(metadata, dict):
+        raise ValueError("ожидается объект JSON")
+    
+    result = {}
+    for key in ('name', 'client'):
+        if metadata.get(key) is not None:
+            if not isinstance(metadata[key], (str, int, float)) or isinstance(metadata[key], bool):
+                raise ValueError(f"поле {key} должно быть строкой")
+            result[key] = str(metadata[key])
+    
+    resolution = metadata.get('resolution')
+    if resolution is not None:
+        try:
+            width, height = (int(value) for value in resolution)
+        except (TypeError, ValueError):
+            raise ValueError(f"поле resolution должно быть парой чисел: {resolution!r}")
+        if width <= 0 or height <= 0:
+            raise ValueError(f"недопустимое разрешение: {resolution!r}")
+        result['resolution'] = (width, height)
+    
+    fps = metadata.get('fps')
+    if fps is not None:
+        try:
+            fps = float(fps)
+        except (TypeError, ValueError):
+            raise ValueError(f"поле fps должно быть числом: {fps!r}")
+        if not 0 < fps < 1000:
+            raise ValueError(f"недопустимая частота кадров: {fps!r}")
+        result['fps'] = fps
+    
+    tags = metadata.get('tags')
+    if tags is not None:
+        if isinstance(tags, str) or not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+            raise ValueError("поле tags должно быть списком строк")
+        result['tags'] = tags
+    
+    default = metadata.get('default')
+    if default is not None:
+        if not isinstance(default, bool):
+            raise ValueError("поле default должно быть true или false")
+        result['default'] = default
+    return result
+
+
+class TemplateVariant:
+    """Вариант шаблона инструмента с метаданными"""
+    
+    __slots__ = ('tool', 'variant_id', 'path', 'label', 'resolution', 'fps', 'client', 'tags', 'is_default')
+    
+    def __init__(self, tool: str, variant_id: str, path: str, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Инициализация варианта
+        
+        Args:
+            tool: Код инструмента
+            variant_id: Идентификатор варианта
+            path: Путь к файлу шаблона
+            metadata: Проверенные метаданные (см. validate_metadata)
+        """
+        metadata = metadata or {}
+        self.tool = tool
+        self.variant_id = variant_id
+        self.path = path
+        self.label = metadata.get('name') or variant_id
+        resolution = metadata.get('resolution')
+        self.resolution = tuple(resolution) if resolution else None
+        self.fps = metadata.get('fps')
+        self.client = metadata.get('client') or ''
+        self.tags = frozenset(tag.lower() for tag in metadata.get('tags', []))
+        self.is_default = bool(metadata.get('default', False))
+    
+    def get_template_params(self) -> Dict[str, Any]:
+        """
+        Возвращает параметры для подстановки в шаблон (см. template_transforms)
+        
+        Returns:
+            Словарь с frame_rate и resolution, если они заданы
+        """
+        params = {}
+        if self.fps:
+            params['frame_rate'] = self.fps
+        if self.resolution:
+            params['resolution'] = self.resolution
+        return params
+    
+    def describe(self) -> str:
+        """Возвращает краткое описание варианта для интерфейса"""
+        parts = [self.label]
+        if self.resolution:
+            parts.append(f"{self.resolution[0]}x{self.resolution[1]}")
+        if self.fps:
+            parts.append(f"{self.fps:g} fps")
+        if self.client:
+            parts.append(self.client)
+        return " · ".join(parts)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Возвращает описание варианта в виде словаря"""
+        return {
+            'tool': self.tool,
+            'variant_id': self.variant_id,
+            'path': self.path,
+            'label': self.label,
+            'resolution': list(self.resolution) if self.resolution else None,
+            'fps': self.fps,
+            'client': self.client,
+            'tags': sorted(self.tags),
+            'default': self.is_default
+        }
+
+
+class TemplateVariantIndex:
+    """Индекс вариантов шаблонов с быстрым поиском и фильтрацией"""
+    
+    def __init__(self, variants: Iterable[TemplateVariant]):
+        """
+        Инициализация индекса
+        
+        Args:
+            variants: Все варианты шаблонов каталога
+        """
+        self._by_tool: Dict[str, Dict[str, TemplateVariant]] = {}
+        self._defaults: Dict[str, TemplateVariant] = {}
+        self._by_client: Dict[str, Set[Tuple[str, str]]] = {}
+        self._by_tag: Dict[str, Set[Tuple[str, str]]] = {}
+        
+        for variant in variants:
+            self._by_tool.setdefault(variant.tool, {})[variant.variant_id] = variant
+            key = (variant.tool, variant.variant_id)
+            if variant.client:
+                self._by_client.setdefault(variant.client.lower(), set()).add(key)
+            for tag in variant.tags:
+                self._by_tag.setdefault(tag, set()).add(key)
+        
+        # Вариант по умолчанию: отмеченный в метаданных или первый по имени файла
+        for tool, tool_variants in self._by_tool.items():
+            ordered = sorted(tool_variants.values(), key=lambda v: os.path.basename(v.path))
+            marked = [v for v in ordered if v.is_default]
+            self._defaults[tool] = marked[0] if marked else ordered[0]
+    
+    @classmethod
+    def build(cls, catalog: TemplateCatalog) -> 'TemplateVariantIndex':
+        """
+        Строит индекс по каталогу шаблонов
+        
+        Args:
+            catalog: Каталог шаблонов
+            
+        Returns:
+            Индекс вариантов
+        """
+        variants = []
+        for tool in catalog.get_tools():
+            for path in catalog.find_templates(tool):
+                metadata = {}
+                metadata_path = get_metadata_path(path)
+                try:
+                    if catalog.fs.exists(metadata_path):
+                        with catalog.fs.open(metadata_path, 'r', encoding='utf-8') as f:
+                            metadata = validate_metadata(json.load(f))
+                except (OSError, ValueError) as e:
+                    # Некорректные метаданные пропускаются: шаблон остается вариантом без них
+                    print(f"Ошибка чтения метаданных шаблона {metadata_path}: {e}")
+                    metadata = {}
+                
+                variant_id = os.path.splitext(os.path.basename(path))[0]
+                variants.append(TemplateVariant(tool, variant_id, path, metadata))
+        return cls(variants)
+    
+    def get_variants(self, tool: str) -> List[TemplateVariant]:
+        """
+        Возвращает варианты инструмента (вариант по умолчанию первым)
+        
+        Args:
+            tool: Код инструмента
+            
+        Returns:
+            Список вариантов
+        """
+        default = self._defaults.get(tool)
+        variants = sorted(self._by_tool.get(tool, {}).values(), key=lambda v: v.label.lower())
+        if default is not None:
+            variants.remove(default)
+            variants.insert(0, default)
+        return variants
+    
+    def resolve(self, tool: str, variant_id: Optional[str] = None) -> Optional[TemplateVariant]:
+        """
+        Возвращает вариант инструмента за O(1)
+        
+        Args:
+            tool: Код инструмента
+            variant_id: Идентификатор варианта (None - вариант по умолчанию)
+            
+        Returns:
+            Вариант или None, если у инструмента нет шаблонов
+        """
+        if variant_id:
+            variant = self._by_tool.get(tool, {}).get(variant_id)
+            if variant is not None:
+                return variant
+            print(f"Вариант шаблона {tool}/{variant_id} не найден, используется вариант по умолчанию")
+        return self._defaults.get(tool)
+    
+    def filter(self, tool: str, client: Optional[str] = None, tags: Optional[Iterable[str]] = None,
+               resolution: Optional[Tuple[int, int]] = None, fps: Optional[float] = None) -> List[TemplateVariant]:
+        """
+        Возвращает варианты инструмента, подходящие под условия
+        
+        Args:
+            tool: Код инструмента
+            client: Клиент (без учета регистра)
+            tags: Теги, которые должны быть у варианта
+            resolution: Разрешение (ширина, высота)
+            fps: Частота кадров
+            
+        Returns:
+            Список подходящих вариантов
+        """
+        tool_variants = self._by_tool.get(tool, {})
+        keys = None
+        
+        # Сначала сужаем выборку по индексам клиента и тегов
+        if client:
+            keys = set(self._by_client.get(client.lower(), set()))
+        for tag in tags or []:
+            tagged = self._by_tag.get(tag.lower(), set())
+            keys = tagged if keys is None else keys & tagged
+        
+        if keys is None:
+            candidates = list(tool_variants.values())
+        else:
+            candidates = [tool_variants[variant_id] for key_tool, variant_id in keys if key_tool == tool]
+        
+        if resolution:
+            candidates = [v for v in candidates if v.resolution == tuple(resolution)]
+        if fps:
+            candidates = [v for v in candidates if v.fps and abs(v.fps - fps) < 0.01]
+        
+        return sorted(candidates, key=lambda v: v.label.lower())
+    
+    def search(self, text: str) -> Dict[str, List[TemplateVariant]]:
+        """
+        Ищет варианты по подстроке в названии, клиенте или тегах
+        
+        Args:
+            text: Строка поиска
+            
+        Returns:
+            Словарь tool -> подходящие варианты
+        """
+        text = text.strip().lower()
+        result = {}
+        for tool in self._by_tool:
+            matched = [
+                v for v in self.get_variants(tool)
+                if not text or text in v.label.lower() or text in v.client.lower()
+                or any(text in tag for tag in v.tags)
+            ]
+            result[tool] = matched
+        return result
+
+
+_index_cache: Dict[Tuple[str, str], TemplateVariantIndex] = {}
+_index_lock = threading.Lock()
+
+
+def get_variant_index(catalog: TemplateCatalog, fingerprint: Optional[str] = None) -> TemplateVariantIndex:
+    """
+    Возвращает индекс вариантов, перестраивая его при изменении каталога
+    
+    Args:
+        catalog: Каталог шаблонов
+        fingerprint: Уже вычисленный отпечаток каталога (чтобы не считать повторно)
+        
+    Returns:
+        Индекс вариантов
+    """
+    key = (catalog.templates_dir, fingerprint or catalog.fingerprint())
+    with _index_lock:
+        index = _index_cache.get(key)
+        if index is None:
+            index = TemplateVariantIndex.build(catalog)
+            # Храним только актуальный индекс для каждой папки шаблонов
+            for stale in [k for k in _index_cache if k[0] == catalog.templates_dir]:
+                del _index_cache[stale]
+            _index_cache[key] = index
+        return index
+
+
+class VariantIndexWorker(QThread):
+    """Рабочий поток построения индекса вариантов (отпечаток каталога читает диск)"""
+    
+    finished = pyqtSignal(object)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, templates_dir: str):
+        """
+        Инициализация рабочего потока
+        
+        Args:
+            templates_dir: Папка шаблонов
+        """
+        super().__init__()
+        self.templates_dir = templates_dir
+    
+    def run(self) -> None:
+        """Строит индекс и передает его в поток интерфейса"""
+        try:
+            self.finished.emit(get_variant_index(TemplateCatalog(self.templates_dir)))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
@@ -9,6 +9,7 @@ import os
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtGui import QIcon
 
+from config.settings import APP_VERSION
 from ui.main_window import ProjectCreatorApp
 
 
@@ -16,7 +17,7 @@ def main():
     """Главная функция приложения"""
     app = QApplication(sys.argv)
     app.setApplicationName("Motion Design Project Creator")
-    app.setApplicationVersion("0.3")
+    app.setApplicationVersion(APP_VERSION)
     
     # Устанавливаем иконку приложения
     app.setWindowIcon(QIcon())
@@ -0,0 +1,10 @@
+"""
+Общие настройки тестов: корень проекта в sys.path, как в cli.py
+"""
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
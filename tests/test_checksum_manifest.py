@@ -0,0 +1,44 @@
+"""
+Инкрементальные манифесты контрольных сумм
+"""
+
+import os
+
+from core import checksum_manifest
+from core.checksum_manifest import STATUS_ERROR, STATUS_MISMATCH, ManifestBuilder
+
+
+def _write(path, data: bytes, mtime: int = 1700000000) -> None:
+    path.write_bytes(data)
+    os.utime(path, (mtime, mtime))
+
+
+def test_read_error_keeps_reference_hash(tmp_path, monkeypatch):
+    _write(tmp_path / 'A001.mov', b'original')
+    ManifestBuilder(str(tmp_path)).run()
+    
+    def failing_hash(path, algorithm=None):
+        raise OSError('NAS timeout')
+    
+    with monkeypatch.context() as patch:
+        patch.setattr(checksum_manifest, 'hash_file', failing_hash)
+        result = ManifestBuilder(str(tmp_path)).run(full_verify=True)
+    assert result['counts'] == {STATUS_ERROR: 1}
+    
+    # Повреждение после сбоя чтения все еще обнаруживается по эталонному хешу
+    _write(tmp_path / 'A001.mov', b'corrupt!')
+    result = ManifestBuilder(str(tmp_path)).run(full_verify=True)
+    assert result['mismatches'] == ['A001.mov']
+
+
+def test_missing_file_keeps_reference_hash(tmp_path):
+    _write(tmp_path / 'A001.mov', b'original')
+    ManifestBuilder(str(tmp_path)).run()
+    
+    os.rename(tmp_path / 'A001.mov', tmp_path.parent / 'A001.mov.away')
+    assert ManifestBuilder(str(tmp_path)).run()['missing'] == ['A001.mov']
+    
+    os.rename(tmp_path.parent / 'A001.mov.away', tmp_path / 'A001.mov')
+    _write(tmp_path / 'A001.mov', b'corrupt!')
+    result = ManifestBuilder(str(tmp_path)).run(full_verify=True)
+    assert result['counts'] == {STATUS_MISMATCH: 1}
@@ -0,0 +1,55 @@
+"""
+Фоновое открытие папок: отчет об ошибках и таймаутах
+"""
+
+import subprocess
+import sys
+import time
+
+import pytest
+from PyQt5.QtCore import QCoreApplication
+
+from core import folder_launcher
+from core.folder_launcher import ERROR_NOT_FOUND, ERROR_TIMEOUT, FolderLauncher
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QCoreApplication.instance() or QCoreApplication(sys.argv)
+
+
+def _run_batch(app, launcher, paths, limit=5.0):
+    """Открывает папки и ждет отчета batch_finished"""
+    results = []
+    launcher.batch_finished.connect(results.append)
+    launcher.open_many(paths)
+    deadline = time.monotonic() + limit
+    while not results and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    launcher.shutdown()
+    return results[0]
+
+
+def _command(code):
+    return lambda path: subprocess.Popen([sys.executable, '-c', code], stdout=subprocess.DEVNULL,
+                                         stderr=subprocess.DEVNULL)
+
+
+def test_long_running_command_counts_as_opened(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(folder_launcher, 'launch_file_manager', _command('import time; time.sleep(30)'))
+    result = _run_batch(app, FolderLauncher(timeout=0.3), [str(tmp_path)])
+    assert result == {'opened': [str(tmp_path)], 'failed': {}}
+
+
+def test_failed_command_and_missing_folder_are_reported(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(folder_launcher, 'launch_file_manager', _command('raise SystemExit(4)'))
+    missing = str(tmp_path / 'missing')
+    result = _run_batch(app, FolderLauncher(), [str(tmp_path), missing])
+    assert result == {'opened': [], 'failed': {str(tmp_path): 'exit code 4', missing: ERROR_NOT_FOUND}}
+
+
+def test_hanging_folder_check_times_out(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(folder_launcher, '_start_launch', lambda path: time.sleep(1))
+    result = _run_batch(app, FolderLauncher(timeout=0.2), [str(tmp_path)])
+    assert result == {'opened': [], 'failed': {str(tmp_path): ERROR_TIMEOUT}}
@@ -0,0 +1,37 @@
+"""
+Загрузка материала в проект
+"""
+
+import threading
+
+from core import ingest
+from core.ingest import IngestEngine
+
+
+def test_writer_failure_is_reported_per_file(tmp_path, monkeypatch):
+    source = tmp_path / 'card'
+    source.mkdir()
+    (source / 'A001.mov').write_bytes(b'frame' * 100)
+    (source / 'A002.mov').write_bytes(b'frame' * 200)
+    calls = []
+    
+    def broken_hash(path, algorithm=None):
+        calls.append(path)
+        if len(calls) == 1:
+            raise ValueError('hash backend crashed')
+        return original_hash(path, algorithm)
+    
+    original_hash = ingest.hash_file
+    monkeypatch.setattr(ingest, 'hash_file', broken_hash)
+    
+    results = []
+    thread = threading.Thread(target=lambda: results.append(
+        IngestEngine(str(source), [str(tmp_path / 'project')]).run()), daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive(), "загрузка зависла после сбоя потока записи"
+    
+    result = results[0]
+    assert result['files_copied'] == 1
+    assert len(result['failed']) == 1
+    assert 'hash backend crashed' in result['failed'][0]['error']
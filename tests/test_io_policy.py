@@ -0,0 +1,83 @@
+"""
+Повтор временных ошибок ввода-вывода через имитацию сетевого хранилища
+"""
+
+import errno
+
+import pytest
+
+from benchmarks.fake_filesystem import LatencyFileSystem, NetworkProfile
+from core.io_policy import (PERMANENT, TRANSIENT, IOMetrics, RetryingFileSystem, RetryPolicy,
+                            classify_error)
+
+
+def _retrying(profile: NetworkProfile, max_attempts: int = 50, seed: int = 0):
+    """Слой с повторами поверх имитации без реальных пауз"""
+    inner = LatencyFileSystem(profile, seed=seed)
+    metrics = IOMetrics()
+    policy = RetryPolicy(max_attempts=max_attempts, sleep=lambda delay: None)
+    return inner, RetryingFileSystem(inner, policy, metrics), metrics
+
+
+def test_classify_error():
+    assert classify_error(OSError(errno.EAGAIN, 'again')) == TRANSIENT
+    assert classify_error(OSError(errno.ESTALE, 'stale')) == TRANSIENT
+    assert classify_error(OSError(errno.EACCES, 'denied')) == PERMANENT
+    assert classify_error(ValueError('bad')) == PERMANENT
+
+
+def test_transient_errors_are_retried_and_counted(tmp_path):
+    profile = NetworkProfile(error_rate=0.3, error_codes=(errno.EAGAIN, errno.ESTALE))
+    inner, fs, metrics = _retrying(profile)
+    
+    for i in range(40):
+        fs.makedirs(str(tmp_path / f"DIR_{i}"))
+    
+    assert all((tmp_path / f"DIR_{i}").is_dir() for i in range(40))
+    assert inner.stats['injected_errors'] > 0
+    assert metrics.retries == inner.stats['injected_errors']
+    assert metrics.retries_by_operation == {'makedirs': metrics.retries}
+    assert metrics.operations == 40
+    assert metrics.permanent_errors == 0
+
+
+def test_permanent_error_fails_fast(tmp_path):
+    profile = NetworkProfile(error_rate=1.0, error_codes=(errno.EACCES,))
+    inner, fs, metrics = _retrying(profile)
+    
+    with pytest.raises(PermissionError):
+        fs.makedirs(str(tmp_path / 'DIR'))
+    
+    assert inner.stats['calls'] == {'makedirs': 1}
+    assert metrics.retries == 0
+    assert metrics.permanent_errors == 1
+
+
+def test_transient_error_gives_up_after_max_attempts(tmp_path):
+    profile = NetworkProfile(error_rate=1.0, error_codes=(errno.ESTALE,))
+    inner, fs, metrics = _retrying(profile, max_attempts=3)
+    
+    with pytest.raises(OSError) as info:
+        fs.listdir(str(tmp_path))
+    
+    assert info.value.errno == errno.ESTALE
+    assert inner.stats['calls'] == {'listdir': 3}
+    assert metrics.retries == 2
+    assert metrics.exhausted == 1
+
+
+def test_run_retries_compound_stream_operation(tmp_path):
+    _, fs, metrics = _retrying(NetworkProfile())
+    target = tmp_path / 'out.bin'
+    attempts = []
+    
+    def write(inner):
+        with inner.open(str(target), 'wb') as f:
+            f.write(b'partial')
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise OSError(errno.ESTALE, 'stale handle mid-stream')
+        return target.stat().st_size
+    
+    assert fs.run('write_template', write) == len(b'partial')
+    assert metrics.retries_by_operation == {'write_template': 2}
@@ -0,0 +1,47 @@
+"""
+Архивация проекта и восстановление из архива
+"""
+
+import os
+import tarfile
+import threading
+
+import pytest
+
+from core import project_archive
+from core.project_archive import ProjectArchiver, codec_from_path
+
+
+def _make_project(root):
+    project = root / 'Promo'
+    (project / '01_IN' / 'FOOTAGES').mkdir(parents=True)
+    (project / '01_IN' / 'FOOTAGES' / 'A001.mov').write_bytes(os.urandom(300 * 1024))
+    (project / '02_PROCESS').mkdir()
+    return project
+
+
+def test_uncompressed_tar_archive(tmp_path):
+    project = _make_project(tmp_path)
+    archive_path = str(tmp_path / 'Promo.tar')
+    assert codec_from_path(archive_path) == 'none'
+    
+    result = ProjectArchiver(str(project), archive_path).run()
+    assert result['codec'] == 'none'
+    assert result['verified']
+    with tarfile.open(archive_path) as tar:
+        assert 'Promo/01_IN/FOOTAGES/A001.mov' in tar.getnames()
+
+
+def test_write_error_stops_compression_pool(tmp_path, monkeypatch):
+    project = _make_project(tmp_path)
+    archive_path = str(tmp_path / 'Promo.tar.gz')
+    
+    def failing_drain(writer):
+        raise OSError('disk full')
+    
+    monkeypatch.setattr(project_archive.ParallelBlockWriter, '_drain_one', failing_drain)
+    with pytest.raises(OSError):
+        ProjectArchiver(str(project), archive_path, workers=1).run()
+    
+    assert not os.path.exists(archive_path + '.part')
+    assert not [t for t in threading.enumerate() if t.name.startswith('ArchiveCompress')]
@@ -0,0 +1,53 @@
+"""
+Создание проекта по текущей структуре папок
+"""
+
+import os
+
+import pytest
+
+from core.folder_structure_manager import FolderStructureManager
+from core.project_creator import ProjectCreatorWorker
+from core.project_index import ProjectIndex
+from core.project_metadata import read_project_metadata
+from core.template_cache import TemplateCache
+
+
+@pytest.fixture(autouse=True)
+def app_data(tmp_path, monkeypatch):
+    """Данные приложения (структура, снимки) во временной папке"""
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    monkeypatch.setenv('APPDATA', str(tmp_path / 'home'))
+
+
+def test_folder_list_does_not_change_structure():
+    manager = FolderStructureManager()
+    structure_hash = manager.get_structure_hash()
+    
+    folders = manager.get_folder_list(['ae', 'c4d'])
+    assert os.path.join('02_PROCESS', 'AE') in folders
+    assert manager.get_structure_hash() == structure_hash
+    assert os.path.join('02_PROCESS', 'AE') not in manager.get_folder_list([])
+
+
+@pytest.mark.parametrize('use_skeleton_archive', [False, True])
+def test_metadata_and_index_record_structure_used(tmp_path, use_skeleton_archive):
+    index = ProjectIndex(str(tmp_path / 'projects.sqlite3'))
+    worker = ProjectCreatorWorker({'name': 'Nike_Spring', 'tools': ['ae']}, str(tmp_path / 'projects'),
+                                  use_skeleton_archive=use_skeleton_archive, template_cache=TemplateCache(),
+                                  project_index=index)
+    worker.ui_delays = False
+    os.makedirs(worker.base_path)
+    errors = []
+    worker.error_occurred.connect(errors.append)
+    worker.run()
+    assert errors == []
+    
+    project_path = os.path.join(worker.base_path, 'Nike_Spring')
+    structure_hash = FolderStructureManager().get_structure_hash()
+    assert read_project_metadata(project_path)['structure'] == structure_hash
+    assert index.get(project_path)['structure_hash'] == structure_hash
+    assert FolderStructureManager.load_snapshot(structure_hash) is not None
+    for folder in FolderStructureManager().get_folder_list(['ae']):
+        assert os.path.isdir(os.path.join(project_path, folder))
+    index.close()
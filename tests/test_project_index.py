@@ -0,0 +1,51 @@
+"""
+Полнотекстовый поиск по индексу проектов
+"""
+
+import sqlite3
+
+from core import project_index
+from core.project_index import ProjectIndex
+
+
+def _index(tmp_path) -> ProjectIndex:
+    index = ProjectIndex(str(tmp_path / 'projects.sqlite3'))
+    index.upsert_many([
+        {'path': '/projects/Nike-Spring_2024', 'name': 'Nike-Spring_2024', 'tools': ['ae', 'pr']},
+        {'path': '/projects/Adidas_Summer', 'name': 'Adidas_Summer', 'tools': ['c4d']},
+    ])
+    return index
+
+
+def test_prefix_search_matches_hyphenated_name(tmp_path):
+    index = _index(tmp_path)
+    assert [project['name'] for project in index.search('nike spr')] == ['Nike-Spring_2024']
+    assert [project['name'] for project in index.search('Nike-Spr')] == ['Nike-Spring_2024']
+    index.close()
+
+
+def test_partial_upsert_keeps_tools(tmp_path):
+    index = _index(tmp_path)
+    index.upsert_many([{'path': '/projects/Nike-Spring_2024', 'name': 'Nike-Spring_2024',
+                        'structure_hash': 'abc'}])
+    
+    project = index.get('/projects/Nike-Spring_2024')
+    assert project['tools'] == ['ae', 'pr']
+    assert project['structure_hash'] == 'abc'
+    assert [project['name'] for project in index.search('c4d')] == ['Adidas_Summer']
+    index.close()
+
+
+def test_old_schema_is_rebuilt_without_losing_projects(tmp_path, monkeypatch):
+    db_path = str(tmp_path / 'projects.sqlite3')
+    monkeypatch.setattr(project_index, 'SCHEMA_VERSION', 1)
+    monkeypatch.setattr(project_index, 'SCHEMA', project_index.SCHEMA.replace(
+        'remove_diacritics 2', "remove_diacritics 2 tokenchars '-'"))
+    _index(tmp_path).close()
+    monkeypatch.undo()
+    
+    index = ProjectIndex(db_path)
+    assert [project['name'] for project in index.search('nike spr')] == ['Nike-Spring_2024']
+    index.close()
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == project_index.SCHEMA_VERSION
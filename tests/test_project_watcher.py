@@ -0,0 +1,28 @@
+"""
+Отмена фонового обновления индекса проектов
+"""
+
+import pytest
+
+from core.project_index import ProjectIndex, import_projects
+from core.project_watcher import ProjectWatchWorker
+
+
+def test_cancelled_reconcile_leaves_index_untouched(tmp_path):
+    base_path = tmp_path / 'projects'
+    (base_path / 'Nike_Spring').mkdir(parents=True)
+    index = ProjectIndex(str(tmp_path / 'projects.sqlite3'))
+    index.upsert_many([{'path': str(base_path / 'Adidas_Summer'), 'name': 'Adidas_Summer'}])
+    
+    worker = ProjectWatchWorker(index, {str(base_path): {'Nike_Spring'}}, [str(base_path)])
+    results = []
+    worker.finished.connect(results.append)
+    worker.error_occurred.connect(results.append)
+    worker.cancel()
+    worker.run()
+    
+    assert results == []
+    assert index.get(str(base_path / 'Adidas_Summer')) is not None
+    with pytest.raises(InterruptedError):
+        import_projects(index, str(base_path), cancel_event=worker.cancel_event)
+    index.close()
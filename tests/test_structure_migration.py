@@ -0,0 +1,70 @@
+"""
+Снимки структур и журналы миграций
+"""
+
+import os
+
+import pytest
+
+from core import folder_structure_manager
+from core.folder_structure_manager import FolderStructureManager
+from core.project_index import ProjectIndex, describe_project
+from core.project_metadata import (build_project_metadata, get_metadata_path, read_project_metadata,
+                                   serialize_metadata)
+from core.structure_migration import ProjectMigrator, rollback_migration
+
+
+@pytest.fixture(autouse=True)
+def app_data(tmp_path, monkeypatch):
+    """Данные приложения (структура, снимки) во временной папке"""
+    monkeypatch.setenv('HOME', str(tmp_path / 'home'))
+    monkeypatch.setenv('APPDATA', str(tmp_path / 'home'))
+
+
+def test_failed_snapshot_leaves_no_temp_file(monkeypatch):
+    def fail_replace(source, destination):
+        raise OSError('disk full')
+    
+    manager = FolderStructureManager()
+    structure = dict(manager.get_current_structure(), EXTRA={'children': {}})
+    with monkeypatch.context() as patch:
+        patch.setattr(folder_structure_manager.os, 'replace', fail_replace)
+        structure_hash = manager.save_snapshot(structure)
+    
+    names = os.listdir(FolderStructureManager._get_snapshots_dir())
+    assert not [name for name in names if name.startswith('.structure_')]
+    assert f"{structure_hash}.json" not in names
+
+
+def test_migration_ids_are_unique(tmp_path):
+    structure = FolderStructureManager().get_current_structure()
+    ids = {ProjectMigrator(str(tmp_path), structure).migration_id for _ in range(5)}
+    assert len(ids) == 5
+
+
+def test_migration_and_rollback_update_index_row(tmp_path):
+    source = {'IN': {'comment': '', 'children': {}}}
+    target = dict(source, OUT={'comment': '', 'children': {}})
+    source_hash = FolderStructureManager().save_snapshot(source)
+    project_path = str(tmp_path / 'projects' / 'Nike_Spring')
+    os.makedirs(os.path.join(project_path, 'IN'))
+    metadata_path = get_metadata_path(project_path)
+    os.makedirs(os.path.dirname(metadata_path), exist_ok=True)
+    with open(metadata_path, 'w', encoding='utf-8') as f:
+        f.write(serialize_metadata(build_project_metadata('Nike_Spring', ['ae'], {}, source_hash)))
+    index = ProjectIndex(str(tmp_path / 'projects.sqlite3'))
+    index.upsert_many([describe_project(project_path, read_project_metadata(project_path))])
+    
+    migrator = ProjectMigrator(str(tmp_path / 'projects'), target, index=index)
+    result = migrator.run(dry_run=False, project_paths=[project_path])
+    assert result['counts'] == {'migrated': 1}
+    project = index.get(project_path)
+    assert project['tools'] == ['ae']
+    assert project['structure_hash'] == migrator.target_hash
+    
+    rollback_migration(result['migration_id'], index=index)
+    assert not os.path.isdir(os.path.join(project_path, 'OUT'))
+    project = index.get(project_path)
+    assert project['tools'] == ['ae']
+    assert project['structure_hash'] == source_hash
+    index.close()
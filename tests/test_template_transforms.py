@@ -0,0 +1,115 @@
+"""
+Потоковая подстановка параметров проекта в шаблон Premiere Pro
+"""
+
+import gzip
+import io
+import os
+import tarfile
+import xml.sax
+
+from core.skeleton_archive import PROJECT_NAME_PLACEHOLDER, extract_skeleton
+from core.template_transforms import PrprojTransform, fps_to_premiere_ticks
+
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'resources', 'templates', 'template.prproj')
+
+
+class _Collector(xml.sax.ContentHandler):
+    """Собирает текст листовых элементов по пути и ObjectID верхнего объекта"""
+    
+    def __init__(self):
+        super().__init__()
+        self.stack = []
+        self.object_ids = []
+        self.text = ''
+        self.values = []
+    
+    def startElement(self, name, attrs):
+        self.stack.append(name)
+        if len(self.stack) == 2:
+            self.object_ids.append(attrs.get('ObjectID') or attrs.get('ObjectUID'))
+        self.text = ''
+    
+    def characters(self, content):
+        self.text += content
+    
+    def endElement(self, name):
+        object_id = self.object_ids[-1] if len(self.stack) > 1 else None
+        self.values.append(('/'.join(self.stack[1:]), object_id, self.text.strip()))
+        self.stack.pop()
+        self.text = ''
+
+
+def _collect(compressed: bytes):
+    handler = _Collector()
+    xml.sax.parseString(gzip.decompress(compressed), handler)
+    return handler.values
+
+
+def _transform(compressed: bytes, **params) -> bytes:
+    output = io.BytesIO()
+    PrprojTransform('Nike_Spring', **params).apply(io.BytesIO(compressed), output)
+    return output.getvalue()
+
+
+def test_real_template_rewrites_only_project_video_settings():
+    with open(TEMPLATE_PATH, 'rb') as f:
+        original = f.read()
+    
+    result = _transform(original, frame_rate=25, resolution=(1920, 1080))
+    before = _collect(original)
+    after = _collect(result)
+    assert len(before) == len(after)
+    
+    # ProjectSettings ссылается на VideoSettings с ObjectID 12
+    changed = {(path, object_id): value for (path, object_id, value), old in zip(after, before)
+               if value != old[2]}
+    assert changed == {
+        ('VideoSettings/FrameRate', '12'): str(fps_to_premiere_ticks(25)),
+        ('VideoSettings/FrameSize', '12'): '0,0,1920,1080',
+    }
+    # Настройки предпросмотра и экспорта, звук и имя корневой папки не тронуты
+    assert ('RootProjectItem/ProjectItem/Name', '13591f0d-c805-444d-8756-395e55220160', 'Root Bin') in after
+
+
+def test_real_template_without_params_is_unchanged():
+    with open(TEMPLATE_PATH, 'rb') as f:
+        original = f.read()
+    
+    assert _collect(_transform(original)) == _collect(original)
+
+
+def test_only_primary_sequence_is_renamed():
+    document = (
+        '<PremiereData Version="3">'
+        '<Sequence ObjectURef="a"/>'
+        '<Sequence ObjectUID="b"><Name>Sequence 02</Name></Sequence>'
+        '<Sequence ObjectUID="a"><Name>Sequence 01</Name></Sequence>'
+        '</PremiereData>'
+    ).encode('utf-8')
+    
+    result = _collect(_transform(gzip.compress(document)))
+    names = {object_id: value for path, object_id, value in result if path == 'Sequence/Name'}
+    assert names == {'a': 'Nike_Spring', 'b': 'Sequence 02'}
+
+
+def test_skeleton_extraction_copies_broken_template_unchanged(tmp_path):
+    data = b'not a gzip stream'
+    archive_path = str(tmp_path / 'skeleton.tar')
+    with tarfile.open(archive_path, 'w') as tar:
+        member = tarfile.TarInfo(f'{PROJECT_NAME_PLACEHOLDER}.prproj')
+        member.size = len(data)
+        member.mtime = 1700000000
+        tar.addfile(member, io.BytesIO(data))
+    
+    project_path = str(tmp_path / 'Nike_Spring')
+    result = extract_skeleton(archive_path, project_path, 'Nike_Spring',
+                              template_params={'.prproj': {'frame_rate': 25}})
+    
+    target = os.path.join(project_path, 'Nike_Spring.prproj')
+    assert result['files_created'] == 1
+    with open(target, 'rb') as f:
+        assert f.read() == data
+    assert os.stat(target).st_mtime == 1700000000
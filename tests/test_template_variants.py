@@ -0,0 +1,42 @@
+"""
+Проверка метаданных вариантов шаблонов
+"""
+
+import json
+
+import pytest
+
+from core.template_catalog import TemplateCatalog
+from core.template_variants import TemplateVariantIndex, validate_metadata
+
+
+def test_validate_metadata_coerces_fields():
+    metadata = validate_metadata({'name': '1080p25', 'fps': '25', 'resolution': ['1920', 1080],
+                                  'tags': ['HD'], 'default': True})
+    assert metadata == {'name': '1080p25', 'fps': 25.0, 'resolution': (1920, 1080),
+                        'tags': ['HD'], 'default': True}
+
+
+@pytest.mark.parametrize('metadata', [
+    [],
+    {'fps': 'fast'},
+    {'fps': 0},
+    {'resolution': [1920]},
+    {'tags': '4k'},
+    {'default': 'false'},
+])
+def test_validate_metadata_rejects_invalid(metadata):
+    with pytest.raises(ValueError):
+        validate_metadata(metadata)
+
+
+def test_invalid_sidecar_is_skipped(tmp_path):
+    (tmp_path / 'template_1080p25.aep').write_bytes(b'aep')
+    (tmp_path / 'template_1080p25.aep.json').write_text(json.dumps({'name': '1080p25', 'fps': '25'}))
+    (tmp_path / 'template_vertical.aep').write_bytes(b'aep')
+    (tmp_path / 'template_vertical.aep.json').write_text(json.dumps({'name': 'Vertical', 'fps': 'fast'}))
+    
+    index = TemplateVariantIndex.build(TemplateCatalog(str(tmp_path)))
+    variants = {variant.variant_id: variant for variant in index.get_variants('ae')}
+    assert variants['template_1080p25'].describe() == '1080p25 · 25 fps'
+    assert variants['template_vertical'].describe() == 'template_vertical'
@@ -0,0 +1,229 @@
+"""
+Диалоговое окно загрузки отснятого материала
+Копирует источник в 01_IN/FOOTAGES проекта и на резервные диски
+"""
+
+import os
+from typing import Any, Dict, List
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                            QPushButton, QFileDialog, QListWidget, QCheckBox,
+                            QProgressBar, QMessageBox)
+
+from config.translations import Translations
+from core.ingest import IngestWorker, get_footage_destination
+from ui.styles.stylesheet import StyleSheet
+
+
+class IngestDialog(QDialog):
+    """Диалог загрузки материала в проект"""
+    
+    def __init__(self, parent=None, project_path: str = '', current_lang: str = 'ru'):
+        """
+        Инициализация диалога загрузки
+        
+        Args:
+            parent: Родительский виджет
+            project_path: Папка проекта по умолчанию
+            current_lang: Текущий язык интерфейса
+        """
+        super().__init__(parent)
+        
+        self.current_lang = current_lang
+        self.t = Translations.get(current_lang)
+        self.worker = None
+        
+        self._init_ui()
+        self.project_edit.setText(project_path)
+    
+    def _init_ui(self) -> None:
+        """Инициализация пользовательского интерфейса"""
+        self.setWindowTitle(self.t['ingest_title'])
+        self.setMinimumSize(750, 520)
+        self.setStyleSheet(StyleSheet.get_dialog_stylesheet())
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+        layout.setContentsMargins(30, 30, 30, 30)
+        
+        self.source_edit = self._create_folder_input(layout, self.t['ingest_source'])
+        self.project_edit = self._create_folder_input(layout, self.t['ingest_project'])
+        
+        # Резервные копии пишутся из того же прохода чтения
+        layout.addWidget(QLabel(self.t['ingest_backups']))
+        backups_layout = QHBoxLayout()
+        self.backups_list = QListWidget()
+        self.backups_list.setMaximumHeight(90)
+        backups_buttons = QVBoxLayout()
+        self.add_backup_btn = QPushButton(self.t['add'])
+        self.add_backup_btn.setObjectName("browse_btn")
+        self.add_backup_btn.clicked.connect(self._add_backup)
+        self.remove_backup_btn = QPushButton(self.t['remove'])
+        self.remove_backup_btn.setObjectName("browse_btn")
+        self.remove_backup_btn.clicked.connect(self._remove_backup)
+        backups_buttons.addWidget(self.add_backup_btn)
+        backups_buttons.addWidget(self.remove_backup_btn)
+        backups_buttons.addStretch()
+        backups_layout.addWidget(self.backups_list, 1)
+        backups_layout.addLayout(backups_buttons)
+        layout.addLayout(backups_layout)
+        
+        self.verify_checkbox = QCheckBox(self.t['ingest_verify'])
+        self.verify_checkbox.setChecked(True)
+        layout.addWidget(self.verify_checkbox)
+        
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+        
+        self.status_label = QLabel('')
+        self.status_label.setWordWrap(True)
+        layout.addWidget(self.status_label)
+        
+        layout.addStretch()
+        
+        buttons_layout = QHBoxLayout()
+        self.start_btn = QPushButton(self.t['ingest_start'])
+        self.start_btn.setObjectName("save_btn")
+        self.start_btn.clicked.connect(self._start_ingest)
+        self.cancel_btn = QPushButton(self.t['close'])
+        self.cancel_btn.setObjectName("cancel_btn")
+        self.cancel_btn.clicked.connect(self.close)
+        buttons_layout.addStretch()
+        buttons_layout.addWidget(self.cancel_btn)
+        buttons_layout.addWidget(self.start_btn)
+        layout.addLayout(buttons_layout)
+    
+    def _create_folder_input(self, layout: QVBoxLayout, label: str) -> QLineEdit:
+        """
+        Создает поле выбора папки с кнопкой обзора
+        
+        Args:
+            layout: Родительский layout
+            label: Подпись поля
+        
+        Returns:
+            Поле ввода пути
+        """
+        layout.addWidget(QLabel(label))
+        input_layout = QHBoxLayout()
+        input_layout.setSpacing(12)
+        
+        edit = QLineEdit()
+        browse_btn = QPushButton(self.t['browse'])
+        browse_btn.setObjectName("browse_btn")
+        browse_btn.setMaximumWidth(120)
+        browse_btn.clicked.connect(lambda: self._browse_into(edit))
+        
+        input_layout.addWidget(edit, 1)
+        input_layout.addWidget(browse_btn, 0)
+        layout.addLayout(input_layout)
+        return edit
+    
+    def _browse_into(self, edit: QLineEdit) -> None:
+        """Открывает диалог выбора папки для поля ввода"""
+        folder = QFileDialog.getExistingDirectory(self, self.t['browse'], edit.text())
+        if folder:
+            edit.setText(folder)
+    
+    def _add_backup(self) -> None:
+        """Добавляет резервный диск"""
+        folder = QFileDialog.getExistingDirectory(self, self.t['browse'])
+        if folder:
+            self.backups_list.addItem(folder)
+    
+    def _remove_backup(self) -> None:
+        """Удаляет выбранный резервный диск"""
+        for item in self.backups_list.selectedItems():
+            self.backups_list.takeItem(self.backups_list.row(item))
+    
+    def _get_destinations(self, source: str, project_path: str) -> List[str]:
+        """
+        Составляет список мест назначения: основная копия в проекте,
+        резервные - в папке проекта с тем же именем на каждом диске
+        
+        Args:
+            source: Папка источника
+            project_path: Папка проекта
+        
+        Returns:
+            Список папок назначения
+        """
+        project_name = os.path.basename(os.path.normpath(project_path))
+        destinations = [get_footage_destination(project_path, source)]
+        for row in range(self.backups_list.count()):
+            backup_root = os.path.join(self.backups_list.item(row).text(), project_name)
+            destinations.append(get_footage_destination(backup_root, source))
+        return destinations
+    
+    def _start_ingest(self) -> None:
+        """Запускает загрузку в фоновом потоке"""
+        source = self.source_edit.text().strip()
+        project_path = self.project_edit.text().strip()
+        if not os.path.isdir(source) or not os.path.isdir(project_path):
+            QMessageBox.warning(self, self.t['warning'], self.t['folder_not_exists'])
+            return
+        
+        self._set_running(True)
+        self.worker = IngestWorker(source, self._get_destinations(source, project_path),
+                                   self.verify_checkbox.isChecked())
+        self.worker.progress_updated.connect(self._on_progress)
+        self.worker.finished.connect(self._on_finished)
+        self.worker.error_occurred.connect(self._on_error)
+        self.worker.start()
+    
+    def _set_running(self, running: bool) -> None:
+        """
+        Переключает состояние диалога во время загрузки
+        
+        Args:
+            running: True если идет загрузка
+        """
+        self.start_btn.setEnabled(not running)
+        self.cancel_btn.setText(self.t['cancel'] if running else self.t['close'])
+        self.progress_bar.setVisible(running)
+        if running:
+            self.progress_bar.setValue(0)
+    
+    def _on_progress(self, progress: Dict[str, Any]) -> None:
+        """Обновляет индикатор прогресса"""
+        total = progress['bytes_total'] or 1
+        self.progress_bar.setValue(int(progress['bytes_done'] * 100 / total))
+        
+        eta = progress['eta']
+        eta_text = f"{int(eta // 60)}:{int(eta % 60):02d}" if eta is not None else '—'
+        self.status_label.setText(
+            f"{progress['current_file']}\n" + self.t['ingest_progress'].format(
+                progress['files_done'], progress['files_total'],
+                progress['speed'] / (1024 * 1024), eta_text
+            )
+        )
+    
+    def _on_finished(self, result: Dict[str, Any]) -> None:
+        """Обработчик завершения загрузки"""
+        self._set_running(False)
+        failed = result['failed']
+        self.status_label.setText(self.t['ingest_done'].format(
+            result['files_copied'], result['files_skipped'], len(failed)))
+        
+        if failed:
+            details = '\n'.join(f"{item['file']}: {item['error']}" for item in failed)
+            msg = QMessageBox(self)
+            msg.setIcon(QMessageBox.Warning)
+            msg.setWindowTitle(self.t['warning'])
+            msg.setText(self.t['ingest_failed'])
+            msg.setDetailedText(details)
+            msg.exec_()
+    
+    def _on_error(self, error_message: str) -> None:
+        """Обработчик ошибки или отмены загрузки"""
+        self._set_running(False)
+        self.status_label.setText(error_message)
+    
+    def closeEvent(self, event) -> None:
+        """Отменяет загрузку при закрытии диалога"""
+        if self.worker is not None and self.worker.isRunning():
+            # Первое нажатие отменяет загрузку, диалог закроется после остановки
+            self.worker.cancel()
+            event.ignore()
+            return
+        event.accept()
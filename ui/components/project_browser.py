@@ -0,0 +1,286 @@
+"""
+Панель обзора проектов базовой папки
+Табличная модель получает страницы из фонового загрузчика и
+показывает их по мере прокрутки (canFetchMore/fetchMore)
+"""
+
+import os
+import time
+from typing import Any, Dict, List, Optional
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                            QTableView, QHeaderView, QAbstractItemView, QMessageBox)
+
+from config.translations import Translations
+from core.folder_launcher import get_folder_launcher
+from core.project_browser import (ProjectPageLoader, STRUCTURE_CURRENT, STRUCTURE_OUTDATED)
+from core.size_scanner import format_size
+from ui.styles.stylesheet import StyleSheet
+
+
+# Сколько строк добавляется в таблицу за один fetchMore
+FETCH_BATCH_SIZE = 50
+
+# Начиная с какого количества папок открытие выбранных требует подтверждения
+OPEN_CONFIRM_LIMIT = 10
+
+
+class ProjectTableModel(QAbstractTableModel):
+    """Модель списка проектов с постепенной подгрузкой строк"""
+    
+    COLUMNS = ['name', 'tools', 'size', 'modified', 'structure']
+    
+    STRUCTURE_COLORS = {
+        STRUCTURE_CURRENT: QColor('#2e7d32'),
+        STRUCTURE_OUTDATED: QColor('#c62828')
+    }
+    
+    def __init__(self, current_lang: str = 'ru', parent=None):
+        """
+        Инициализация модели
+        
+        Args:
+            current_lang: Текущий язык интерфейса
+            parent: Родительский объект
+        """
+        super().__init__(parent)
+        self.t = Translations.get(current_lang)
+        self._rows: List[Dict[str, Any]] = []
+        self._buffer: List[Dict[str, Any]] = []
+        self._loading = False
+        self._fetch_requested = False
+    
+    def set_language(self, current_lang: str) -> None:
+        """
+        Переключает язык подписей
+        
+        Args:
+            current_lang: Код языка
+        """
+        self.t = Translations.get(current_lang)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self.COLUMNS) - 1)
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, len(self.COLUMNS) - 1))
+    
+    def clear(self) -> None:
+        """Очищает модель перед новой загрузкой"""
+        self.beginResetModel()
+        self._rows = []
+        self._buffer = []
+        self._loading = True
+        self._fetch_requested = True
+        self.endResetModel()
+    
+    def add_page(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Принимает страницу от загрузчика
+        
+        Args:
+            rows: Записи проектов
+        """
+        self._buffer.extend(rows)
+        # Представление уже просило строк, которых еще не было
+        if self._fetch_requested:
+            self.fetchMore(QModelIndex())
+    
+    def set_loading_finished(self) -> None:
+        """Отмечает, что загрузчик отдал все страницы"""
+        self._loading = False
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Количество уже показанных строк"""
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Количество колонок"""
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Есть ли еще строки в буфере или у загрузчика"""
+        return not parent.isValid() and (bool(self._buffer) or self._loading)
+    
+    def fetchMore(self, parent: QModelIndex) -> None:
+        """Показывает следующую порцию строк из буфера"""
+        if parent.isValid():
+            return
+        if not self._buffer:
+            self._fetch_requested = True
+            return
+        self._fetch_requested = False
+        batch, self._buffer = self._buffer[:FETCH_BATCH_SIZE], self._buffer[FETCH_BATCH_SIZE:]
+        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(batch) - 1)
+        self._rows.extend(batch)
+        self.endInsertRows()
+    
+    def project_path(self, row: int) -> str:
+        """Возвращает путь проекта строки"""
+        return self._rows[row]['path']
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """Возвращает данные ячейки"""
+        if not index.isValid():
+            return QVariant()
+        project = self._rows[index.row()]
+        column = self.COLUMNS[index.column()]
+        
+        if role == Qt.DisplayRole:
+            if column == 'name':
+                return project['name']
+            if column == 'tools':
+                return ', '.join(project.get('tools') or [])
+            if column == 'size':
+                return format_size(project['size']) if project.get('size') is not None else '—'
+            if column == 'modified':
+                mtime = project.get('latest_mtime')
+                return time.strftime('%Y-%m-%d %H:%M', time.localtime(mtime)) if mtime else '—'
+            if column == 'structure':
+                return self.t['browser_structure'][project['structure_status']]
+        elif role == Qt.ToolTipRole:
+            if column == 'structure' and project.get('structure_problems'):
+                return '\n'.join(project['structure_problems'])
+            return project['path']
+        elif role == Qt.ForegroundRole and column == 'structure':
+            return self.STRUCTURE_COLORS.get(project['structure_status'], QVariant())
+        elif role == Qt.TextAlignmentRole and column == 'size':
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return QVariant()
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        """Возвращает заголовки колонок"""
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.t['browser_columns'][section]
+        return QVariant()
+
+
+class ProjectBrowserPane(QWidget):
+    """Панель обзора проектов базовой папки"""
+    
+    def __init__(self, parent=None, current_lang: str = 'ru'):
+        """
+        Инициализация панели
+        
+        Args:
+            parent: Родительский виджет
+            current_lang: Текущий язык интерфейса
+        """
+        super().__init__(parent)
+        
+        self.current_lang = current_lang
+        self.t = Translations.get(current_lang)
+        self.loader: Optional[ProjectPageLoader] = None
+        self.base_path = ''
+        
+        self._init_ui()
+    
+    def _init_ui(self) -> None:
+        """Инициализация пользовательского интерфейса"""
+        self.setStyleSheet(StyleSheet.get_dialog_stylesheet())
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(8)
+        layout.setContentsMargins(12, 12, 12, 12)
+        
+        header_layout = QHBoxLayout()
+        self.path_label = QLabel('')
+        self.path_label.setWordWrap(True)
+        self.refresh_btn = QPushButton(self.t['browser_refresh'])
+        self.refresh_btn.setObjectName("browse_btn")
+        self.refresh_btn.setMaximumWidth(120)
+        self.refresh_btn.clicked.connect(lambda: self.load(self.base_path))
+        self.open_selected_btn = QPushButton(self.t['browser_open_selected'])
+        self.open_selected_btn.setObjectName("browse_btn")
+        self.open_selected_btn.setEnabled(False)
+        self.open_selected_btn.clicked.connect(self._open_selected)
+        header_layout.addWidget(self.path_label, 1)
+        header_layout.addWidget(self.open_selected_btn, 0)
+        header_layout.addWidget(self.refresh_btn, 0)
+        layout.addLayout(header_layout)
+        
+        self.model = ProjectTableModel(self.current_lang, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.table.setAlternatingRowColors(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.doubleClicked.connect(self._open_project)
+        self.table.selectionModel().selectionChanged.connect(
+            lambda: self.open_selected_btn.setEnabled(self.table.selectionModel().hasSelection()))
+        layout.addWidget(self.table, 1)
+        
+        self.status_label = QLabel('')
+        layout.addWidget(self.status_label)
+    
+    def set_language(self, current_lang: str) -> None:
+        """
+        Переключает язык интерфейса панели
+        
+        Args:
+            current_lang: Код языка
+        """
+        self.current_lang = current_lang
+        self.t = Translations.get(current_lang)
+        self.refresh_btn.setText(self.t['browser_refresh'])
+        self.open_selected_btn.setText(self.t['browser_open_selected'])
+        self.model.set_language(current_lang)
+    
+    def load(self, base_path: str) -> None:
+        """
+        Запускает загрузку проектов базовой папки
+        
+        Args:
+            base_path: Базовая папка проектов
+        """
+        self.stop()
+        self.base_path = base_path
+        self.path_label.setText(base_path)
+        self.model.clear()
+        self.open_selected_btn.setEnabled(False)
+        if not os.path.isdir(base_path):
+            self.model.set_loading_finished()
+            self.status_label.setText(self.t['folder_not_exists'])
+            return
+        
+        self.status_label.setText(self.t['browser_loading'].format(0))
+        self.loader = ProjectPageLoader(base_path)
+        # Страницы отмененного загрузчика могут еще стоять в очереди событий
+        loader = self.loader
+        loader.page_ready.connect(lambda rows: self.loader is loader and self.model.add_page(rows))
+        loader.progress_updated.connect(
+            lambda count: self.loader is loader and self.status_label.setText(self.t['browser_loading'].format(count)))
+        loader.finished.connect(lambda result: self.loader is loader and self._on_finished(result))
+        loader.error_occurred.connect(lambda message: self.loader is loader and self._on_error(message))
+        self.loader.start()
+    
+    def stop(self) -> None:
+        """Отменяет текущую загрузку и дожидается потока"""
+        if self.loader is not None:
+            self.loader.cancel()
+            self.loader.wait()
+            self.loader = None
+    
+    def _on_finished(self, result: Dict[str, Any]) -> None:
+        """Обработчик завершения загрузки"""
+        self.model.set_loading_finished()
+        self.status_label.setText(self.t['browser_done'].format(result['projects']))
+    
+    def _on_error(self, error_message: str) -> None:
+        """Обработчик ошибки загрузки"""
+        self.model.set_loading_finished()
+        self.status_label.setText(error_message)
+    
+    def _open_project(self, index: QModelIndex) -> None:
+        """Открывает папку проекта по двойному щелчку"""
+        get_folder_launcher().open(self.model.project_path(index.row()))
+    
+    def _open_selected(self) -> None:
+        """Открывает папки всех выбранных проектов"""
+        paths = [self.model.project_path(index.row()) for index in self.table.selectionModel().selectedRows()]
+        if len(paths) >= OPEN_CONFIRM_LIMIT:
+            reply = QMessageBox.question(self, self.t['warning'], self.t['open_many_confirm'].format(len(paths)),
+                                         QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+        get_folder_launcher().open_many(paths)
@@ -0,0 +1,190 @@
+"""
+Диалоговое окно размеров проектов
+Показывает размер, количество файлов и дату изменения по папкам
+"""
+
+import json
+import os
+import time
+from typing import Any, Dict, List
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                            QPushButton, QFileDialog, QTreeWidget, QTreeWidgetItem,
+                            QCheckBox, QMessageBox)
+from PyQt5.QtCore import Qt
+
+from config.translations import Translations
+from core.size_scanner import SizeScanWorker, build_size_report, format_size
+from ui.styles.stylesheet import StyleSheet
+
+
+class ProjectSizeDialog(QDialog):
+    """Диалог подсчета размеров проектов"""
+    
+    def __init__(self, parent=None, path: str = '', current_lang: str = 'ru'):
+        """
+        Инициализация диалога
+        
+        Args:
+            parent: Родительский виджет
+            path: Папка проекта или базовая папка проектов
+            current_lang: Текущий язык интерфейса
+        """
+        super().__init__(parent)
+        
+        self.current_lang = current_lang
+        self.t = Translations.get(current_lang)
+        self.worker = None
+        self.totals: Dict[str, Dict[str, Any]] = {}
+        self.children: Dict[str, List[str]] = {}
+        self.scanned_root = ''
+        
+        self._init_ui()
+        self.path_edit.setText(path)
+    
+    def _init_ui(self) -> None:
+        """Инициализация пользовательского интерфейса"""
+        self.setWindowTitle(self.t['size_title'])
+        self.setMinimumSize(800, 560)
+        self.setStyleSheet(StyleSheet.get_dialog_stylesheet())
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+        layout.setContentsMargins(30, 30, 30, 30)
+        
+        path_layout = QHBoxLayout()
+        path_layout.setSpacing(12)
+        self.path_edit = QLineEdit()
+        self.browse_btn = QPushButton(self.t['browse'])
+        self.browse_btn.setObjectName("browse_btn")
+        self.browse_btn.setMaximumWidth(120)
+        self.browse_btn.clicked.connect(self._browse_folder)
+        path_layout.addWidget(self.path_edit, 1)
+        path_layout.addWidget(self.browse_btn, 0)
+        layout.addLayout(path_layout)
+        
+        # Дочерние папки добавляются при раскрытии узла
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(self.t['size_columns'])
+        self.tree.setAlternatingRowColors(True)
+        self.tree.itemExpanded.connect(self._on_item_expanded)
+        layout.addWidget(self.tree, 1)
+        
+        self.status_label = QLabel('')
+        layout.addWidget(self.status_label)
+        
+        buttons_layout = QHBoxLayout()
+        self.force_checkbox = QCheckBox(self.t['render_check_force'])
+        self.export_btn = QPushButton(self.t['size_export'])
+        self.export_btn.setObjectName("browse_btn")
+        self.export_btn.setEnabled(False)
+        self.export_btn.clicked.connect(self._export_json)
+        self.scan_btn = QPushButton(self.t['size_scan'])
+        self.scan_btn.setObjectName("save_btn")
+        self.scan_btn.clicked.connect(self._start_scan)
+        self.close_btn = QPushButton(self.t['close'])
+        self.close_btn.setObjectName("cancel_btn")
+        self.close_btn.clicked.connect(self.close)
+        buttons_layout.addWidget(self.force_checkbox)
+        buttons_layout.addStretch()
+        buttons_layout.addWidget(self.export_btn)
+        buttons_layout.addWidget(self.close_btn)
+        buttons_layout.addWidget(self.scan_btn)
+        layout.addLayout(buttons_layout)
+    
+    def _browse_folder(self) -> None:
+        """Открывает диалог выбора папки"""
+        folder = QFileDialog.getExistingDirectory(self, self.t['browse'], self.path_edit.text())
+        if folder:
+            self.path_edit.setText(folder)
+    
+    def _start_scan(self) -> None:
+        """Запускает подсчет в фоновом потоке"""
+        path = self.path_edit.text().strip()
+        if not os.path.isdir(path):
+            QMessageBox.warning(self, self.t['warning'], self.t['folder_not_exists'])
+            return
+        
+        self.scanned_root = path
+        self.scan_btn.setEnabled(False)
+        self.worker = SizeScanWorker(path, self.force_checkbox.isChecked())
+        self.worker.progress_updated.connect(
+            lambda count: self.status_label.setText(self.t['size_progress'].format(count)))
+        self.worker.finished.connect(self._on_finished)
+        self.worker.error_occurred.connect(self._on_error)
+        self.worker.start()
+    
+    def _on_finished(self, totals: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Показывает итоги подсчета
+        
+        Args:
+            totals: Итоги по папкам
+        """
+        self.scan_btn.setEnabled(True)
+        self.export_btn.setEnabled(True)
+        self.totals = totals
+        self.children = {}
+        for rel in totals:
+            if rel != '.':
+                self.children.setdefault(os.path.dirname(rel) or '.', []).append(rel)
+        
+        self.tree.clear()
+        root_item = self._create_item(None, '.')
+        root_item.setExpanded(True)
+        for column in range(self.tree.columnCount()):
+            self.tree.resizeColumnToContents(column)
+        
+        total = totals['.']
+        self.status_label.setText(self.t['size_summary'].format(
+            format_size(total['size']), total['files'], total['dirs']))
+    
+    def _create_item(self, parent, rel: str) -> QTreeWidgetItem:
+        """Создает узел дерева для папки"""
+        total = self.totals[rel]
+        name = os.path.basename(os.path.normpath(self.scanned_root)) if rel == '.' else os.path.basename(rel)
+        texts = [
+            name,
+            format_size(total['size']),
+            str(total['files']),
+            time.strftime('%Y-%m-%d %H:%M', time.localtime(total['latest_mtime']))
+        ]
+        item = QTreeWidgetItem(parent or self.tree, texts)
+        item.setData(0, Qt.UserRole, rel)
+        item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
+        item.setTextAlignment(2, Qt.AlignRight | Qt.AlignVCenter)
+        if self.children.get(rel):
+            item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+        return item
+    
+    def _on_item_expanded(self, item: QTreeWidgetItem) -> None:
+        """Заполняет дочерние папки при первом раскрытии, самые большие первыми"""
+        if item.childCount():
+            return
+        rel = item.data(0, Qt.UserRole)
+        for child in sorted(self.children.get(rel, []), key=lambda c: self.totals[c]['size'], reverse=True):
+            self._create_item(item, child)
+    
+    def _export_json(self) -> None:
+        """Сохраняет отчет в JSON"""
+        path, _ = QFileDialog.getSaveFileName(self, self.t['size_export'], 'sizes.json', 'JSON (*.json)')
+        if not path:
+            return
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(build_size_report(self.scanned_root, self.totals, max_depth=3),
+                          f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            QMessageBox.critical(self, self.t['error'], str(e))
+    
+    def _on_error(self, error_message: str) -> None:
+        """Обработчик ошибки подсчета"""
+        self.scan_btn.setEnabled(True)
+        self.status_label.setText('')
+        QMessageBox.critical(self, self.t['error'], error_message)
+    
+    def closeEvent(self, event) -> None:
+        """Отменяет подсчет при закрытии диалога"""
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.cancel()
+            self.worker.wait()
+        event.accept()
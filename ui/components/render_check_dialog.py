@@ -0,0 +1,141 @@
+"""
+Диалоговое окно проверки рендеров
+Показывает секвенции 03_RENDER с пропусками, пустыми и усеченными кадрами
+"""
+
+from typing import Any, Dict
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                            QPushButton, QFileDialog, QTreeWidget, QTreeWidgetItem,
+                            QCheckBox, QMessageBox)
+
+from config.translations import Translations
+from core.render_check import RenderCheckWorker
+from core.sequence_index import collapse_frames, format_intervals
+from ui.styles.stylesheet import StyleSheet
+
+
+class RenderCheckDialog(QDialog):
+    """Диалог проверки полноты рендеров"""
+    
+    def __init__(self, parent=None, project_path: str = '', current_lang: str = 'ru'):
+        """
+        Инициализация диалога проверки
+        
+        Args:
+            parent: Родительский виджет
+            project_path: Папка проекта по умолчанию
+            current_lang: Текущий язык интерфейса
+        """
+        super().__init__(parent)
+        
+        self.current_lang = current_lang
+        self.t = Translations.get(current_lang)
+        self.worker = None
+        
+        self._init_ui()
+        self.path_edit.setText(project_path)
+    
+    def _init_ui(self) -> None:
+        """Инициализация пользовательского интерфейса"""
+        self.setWindowTitle(self.t['render_check_title'])
+        self.setMinimumSize(900, 560)
+        self.setStyleSheet(StyleSheet.get_dialog_stylesheet())
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+        layout.setContentsMargins(30, 30, 30, 30)
+        
+        layout.addWidget(QLabel(self.t['ingest_project']))
+        path_layout = QHBoxLayout()
+        path_layout.setSpacing(12)
+        self.path_edit = QLineEdit()
+        self.browse_btn = QPushButton(self.t['browse'])
+        self.browse_btn.setObjectName("browse_btn")
+        self.browse_btn.setMaximumWidth(120)
+        self.browse_btn.clicked.connect(self._browse_folder)
+        path_layout.addWidget(self.path_edit, 1)
+        path_layout.addWidget(self.browse_btn, 0)
+        layout.addLayout(path_layout)
+        
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(self.t['render_check_columns'])
+        self.tree.setRootIsDecorated(True)
+        self.tree.setAlternatingRowColors(True)
+        layout.addWidget(self.tree, 1)
+        
+        self.status_label = QLabel('')
+        layout.addWidget(self.status_label)
+        
+        buttons_layout = QHBoxLayout()
+        self.force_checkbox = QCheckBox(self.t['render_check_force'])
+        self.check_btn = QPushButton(self.t['render_check_run'])
+        self.check_btn.setObjectName("save_btn")
+        self.check_btn.clicked.connect(self._start_check)
+        self.close_btn = QPushButton(self.t['close'])
+        self.close_btn.setObjectName("cancel_btn")
+        self.close_btn.clicked.connect(self.close)
+        buttons_layout.addWidget(self.force_checkbox)
+        buttons_layout.addStretch()
+        buttons_layout.addWidget(self.close_btn)
+        buttons_layout.addWidget(self.check_btn)
+        layout.addLayout(buttons_layout)
+    
+    def _browse_folder(self) -> None:
+        """Открывает диалог выбора папки проекта"""
+        folder = QFileDialog.getExistingDirectory(self, self.t['browse'], self.path_edit.text())
+        if folder:
+            self.path_edit.setText(folder)
+    
+    def _start_check(self) -> None:
+        """Запускает проверку в фоновом потоке"""
+        path = self.path_edit.text().strip()
+        if not path:
+            return
+        
+        self.check_btn.setEnabled(False)
+        self.status_label.setText(self.t['render_check_running'])
+        self.worker = RenderCheckWorker(path, self.force_checkbox.isChecked())
+        self.worker.finished.connect(self._on_finished)
+        self.worker.error_occurred.connect(self._on_error)
+        self.worker.start()
+    
+    def _on_finished(self, result: Dict[str, Any]) -> None:
+        """
+        Заполняет дерево результатами проверки
+        
+        Args:
+            result: Результат RenderChecker.run()
+        """
+        self.check_btn.setEnabled(True)
+        self.tree.clear()
+        
+        folders = {}
+        for report in result['sequences']:
+            parent = folders.get(report['directory'])
+            if parent is None:
+                parent = QTreeWidgetItem(self.tree, [report['directory']])
+                parent.setExpanded(True)
+                folders[report['directory']] = parent
+            
+            outliers = format_intervals(collapse_frames(frame for frame, _ in report['outliers']))
+            QTreeWidgetItem(parent, [
+                report['pattern'],
+                f"{report['first']}-{report['last']} ({report['frame_count']})",
+                format_intervals(report['missing']),
+                format_intervals(report['zero_byte']),
+                outliers,
+                '✅' if report['ok'] else '❌'
+            ])
+            if not report['ok']:
+                parent.setText(len(self.t['render_check_columns']) - 1, '❌')
+        
+        for column in range(self.tree.columnCount()):
+            self.tree.resizeColumnToContents(column)
+        self.status_label.setText(self.t['render_check_summary'].format(
+            len(result['sequences']), result['problems'], result['dirs_scanned'], result['dirs_reused']))
+    
+    def _on_error(self, error_message: str) -> None:
+        """Обработчик ошибки проверки"""
+        self.check_btn.setEnabled(True)
+        self.status_label.setText('')
+        QMessageBox.critical(self, self.t['error'], error_message)
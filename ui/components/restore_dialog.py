@@ -0,0 +1,211 @@
+"""
+Диалоговое окно восстановления проекта из архива
+Позволяет выбрать папки проекта и извлечь только их
+"""
+
+import os
+from typing import Any, Dict, List
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                            QPushButton, QFileDialog, QListWidget, QListWidgetItem,
+                            QProgressBar, QMessageBox)
+
+from config.translations import Translations
+from core.project_archive import load_archive_index
+from core.project_restore import RestoreWorker, list_archive_folders
+from core.size_scanner import format_size
+from ui.styles.stylesheet import StyleSheet
+
+
+class RestoreDialog(QDialog):
+    """Диалог выборочного восстановления проекта"""
+    
+    def __init__(self, parent=None, destination: str = '', current_lang: str = 'ru'):
+        """
+        Инициализация диалога восстановления
+        
+        Args:
+            parent: Родительский виджет
+            destination: Папка назначения по умолчанию
+            current_lang: Текущий язык интерфейса
+        """
+        super().__init__(parent)
+        
+        self.current_lang = current_lang
+        self.t = Translations.get(current_lang)
+        self.worker = None
+        
+        self._init_ui()
+        self.destination_edit.setText(destination)
+    
+    def _init_ui(self) -> None:
+        """Инициализация пользовательского интерфейса"""
+        self.setWindowTitle(self.t['restore_title'])
+        self.setMinimumSize(700, 560)
+        self.setStyleSheet(StyleSheet.get_dialog_stylesheet())
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+        layout.setContentsMargins(30, 30, 30, 30)
+        
+        layout.addWidget(QLabel(self.t['restore_archive']))
+        archive_layout = QHBoxLayout()
+        archive_layout.setSpacing(12)
+        self.archive_edit = QLineEdit()
+        self.archive_edit.editingFinished.connect(self._load_folders)
+        archive_btn = QPushButton(self.t['browse'])
+        archive_btn.setObjectName("browse_btn")
+        archive_btn.setMaximumWidth(120)
+        archive_btn.clicked.connect(self._browse_archive)
+        archive_layout.addWidget(self.archive_edit, 1)
+        archive_layout.addWidget(archive_btn, 0)
+        layout.addLayout(archive_layout)
+        
+        layout.addWidget(QLabel(self.t['restore_destination']))
+        destination_layout = QHBoxLayout()
+        destination_layout.setSpacing(12)
+        self.destination_edit = QLineEdit()
+        destination_btn = QPushButton(self.t['browse'])
+        destination_btn.setObjectName("browse_btn")
+        destination_btn.setMaximumWidth(120)
+        destination_btn.clicked.connect(self._browse_destination)
+        destination_layout.addWidget(self.destination_edit, 1)
+        destination_layout.addWidget(destination_btn, 0)
+        layout.addLayout(destination_layout)
+        
+        layout.addWidget(QLabel(self.t['restore_folders']))
+        self.folders_list = QListWidget()
+        layout.addWidget(self.folders_list, 1)
+        
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+        
+        self.status_label = QLabel('')
+        self.status_label.setWordWrap(True)
+        layout.addWidget(self.status_label)
+        
+        buttons_layout = QHBoxLayout()
+        self.start_btn = QPushButton(self.t['restore_start'])
+        self.start_btn.setObjectName("save_btn")
+        self.start_btn.clicked.connect(self._start_restore)
+        self.cancel_btn = QPushButton(self.t['close'])
+        self.cancel_btn.setObjectName("cancel_btn")
+        self.cancel_btn.clicked.connect(self.close)
+        buttons_layout.addStretch()
+        buttons_layout.addWidget(self.cancel_btn)
+        buttons_layout.addWidget(self.start_btn)
+        layout.addLayout(buttons_layout)
+    
+    def _browse_archive(self) -> None:
+        """Открывает диалог выбора архива"""
+        path, _ = QFileDialog.getOpenFileName(self, self.t['restore_archive'], self.archive_edit.text(),
+                                              self.t['archive_filter'])
+        if path:
+            self.archive_edit.setText(path)
+            self._load_folders()
+    
+    def _browse_destination(self) -> None:
+        """Открывает диалог выбора папки назначения"""
+        folder = QFileDialog.getExistingDirectory(self, self.t['browse'], self.destination_edit.text())
+        if folder:
+            self.destination_edit.setText(folder)
+    
+    def _load_folders(self) -> None:
+        """Заполняет список папок по индексу архива"""
+        self.folders_list.clear()
+        path = self.archive_edit.text().strip()
+        if not os.path.isfile(path):
+            return
+        
+        try:
+            index = load_archive_index(path)
+        except (OSError, ValueError) as e:
+            self.status_label.setText(str(e))
+            return
+        if index is None:
+            self.status_label.setText(self.t['restore_no_index'])
+            return
+        
+        self.status_label.setText('')
+        for folder in list_archive_folders(index):
+            item = QListWidgetItem(('    ' if '/' in folder else '') + folder)
+            item.setData(Qt.UserRole, folder)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Unchecked)
+            self.folders_list.addItem(item)
+    
+    def _get_selected_folders(self) -> List[str]:
+        """Возвращает отмеченные папки (пустой список - весь проект)"""
+        selected = []
+        for row in range(self.folders_list.count()):
+            item = self.folders_list.item(row)
+            if item.checkState() == Qt.Checked:
+                selected.append(item.data(Qt.UserRole))
+        return selected
+    
+    def _start_restore(self) -> None:
+        """Запускает восстановление в фоновом потоке"""
+        archive_path = self.archive_edit.text().strip()
+        destination = self.destination_edit.text().strip()
+        if not os.path.isfile(archive_path) or not os.path.isdir(destination):
+            QMessageBox.warning(self, self.t['warning'], self.t['folder_not_exists'])
+            return
+        
+        self._set_running(True)
+        self.worker = RestoreWorker(archive_path, destination, self._get_selected_folders() or None)
+        self.worker.progress_updated.connect(self._on_progress)
+        self.worker.finished.connect(self._on_finished)
+        self.worker.error_occurred.connect(self._on_error)
+        self.worker.start()
+    
+    def _set_running(self, running: bool) -> None:
+        """
+        Переключает состояние диалога во время восстановления
+        
+        Args:
+            running: True если идет восстановление
+        """
+        self.start_btn.setEnabled(not running)
+        self.cancel_btn.setText(self.t['cancel'] if running else self.t['close'])
+        self.progress_bar.setVisible(running)
+        if running:
+            self.progress_bar.setValue(0)
+    
+    def _on_progress(self, progress: Dict[str, Any]) -> None:
+        """Обновляет индикатор прогресса"""
+        total = progress['bytes_total'] or 1
+        self.progress_bar.setValue(int(progress['bytes_done'] * 100 / total))
+        self.status_label.setText(self.t['restore_progress'].format(
+            format_size(progress['bytes_done']), format_size(int(progress['throughput']))))
+    
+    def _on_finished(self, result: Dict[str, Any]) -> None:
+        """Обработчик завершения восстановления"""
+        self._set_running(False)
+        self.status_label.setText(self.t['restore_done'].format(
+            result['members'], format_size(result['bytes']), result['elapsed'],
+            format_size(int(result['throughput']))))
+        
+        problems = result['mismatches'] + list(result['errors'])
+        if problems:
+            msg = QMessageBox(self)
+            msg.setIcon(QMessageBox.Warning)
+            msg.setWindowTitle(self.t['warning'])
+            msg.setText(self.t['restore_problems'])
+            msg.setDetailedText('\n'.join(
+                [f"❌ {name}" for name in result['mismatches']] +
+                [f"{name}: {error}" for name, error in result['errors'].items()]))
+            msg.exec_()
+    
+    def _on_error(self, error_message: str) -> None:
+        """Обработчик ошибки или отмены восстановления"""
+        self._set_running(False)
+        self.status_label.setText(error_message)
+    
+    def closeEvent(self, event) -> None:
+        """Отменяет восстановление при закрытии диалога"""
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.cancel()
+            event.ignore()
+            return
+        event.accept()
@@ -5,7 +5,8 @@
 
 from typing import Dict, Any
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QLineEdit, QComboBox, QPushButton, QFileDialog, QWidget)
+                            QLineEdit, QComboBox, QPushButton, QFileDialog, QWidget,
+                            QCheckBox)
 from PyQt5.QtCore import Qt
 
 from config.translations import Translations
@@ -47,6 +48,8 @@ class SettingsDialog(QDialog):
         
         self._create_path_section(layout)
         
+        self._create_creation_options_section(layout)
+        
         self._create_language_buttons_section(layout)
         
           
@@ -82,6 +85,38 @@ class SettingsDialog(QDialog):
         path_layout.addLayout(path_input_layout)
         layout.addWidget(path_widget)
     
+    def _create_creation_options_section(self, layout: QVBoxLayout) -> None:
+        """Создает секцию параметров создания проектов"""
+        templates_label = QLabel(self.t['templates_source'])
+        layout.addWidget(templates_label)
+        
+        templates_layout = QHBoxLayout()
+        templates_layout.setSpacing(12)
+        
+        self.templates_edit = QLineEdit()
+        self.templates_edit.setPlaceholderText(self.t['templates_source_placeholder'])
+        
+        self.templates_browse_btn = QPushButton(self.t['browse'])
+        self.templates_browse_btn.setObjectName("browse_btn")
+        self.templates_browse_btn.clicked.connect(self._browse_templates_folder)
+        self.templates_browse_btn.setMaximumWidth(120)
+        
+        templates_layout.addWidget(self.templates_edit, 1)
+        templates_layout.addWidget(self.templates_browse_btn, 0)
+        layout.addLayout(templates_layout)
+        
+        self.skeleton_checkbox = QCheckBox(self.t['use_skeleton_archive'])
+        self.skeleton_checkbox.setObjectName("skeleton_checkbox")
+        layout.addWidget(self.skeleton_checkbox)
+        
+        self.verify_checkbox = QCheckBox(self.t['verify_templates'])
+        self.verify_checkbox.setObjectName("verify_checkbox")
+        layout.addWidget(self.verify_checkbox)
+        
+        self.watch_checkbox = QCheckBox(self.t['watch_projects'])
+        self.watch_checkbox.setObjectName("watch_checkbox")
+        layout.addWidget(self.watch_checkbox)
+    
     def _create_language_buttons_section(self, layout: QVBoxLayout) -> None:
     
         lang_buttons_widget = QWidget()
@@ -146,12 +181,28 @@ class SettingsDialog(QDialog):
         if folder:
             self.path_edit.setText(folder)
     
+    def _browse_templates_folder(self) -> None:
+        """Открывает диалог выбора папки шаблонов"""
+        folder = QFileDialog.getExistingDirectory(
+            self,
+            self.t['templates_source'],
+            self.templates_edit.text()
+        )
+        if folder:
+            self.templates_edit.setText(folder)
+    
     def _load_current_settings(self) -> None:
         """Загружает текущие настройки в форму"""
         # Загружаем путь по умолчанию
         default_path = self.settings_manager.get('default_path', '')
         self.path_edit.setText(default_path)
         
+        # Загружаем параметры создания проектов
+        self.templates_edit.setText(self.settings_manager.get('templates_source', '') or '')
+        self.skeleton_checkbox.setChecked(bool(self.settings_manager.get('use_skeleton_archive', False)))
+        self.verify_checkbox.setChecked(bool(self.settings_manager.get('verify_templates', False)))
+        self.watch_checkbox.setChecked(bool(self.settings_manager.get('watch_projects', False)))
+        
         # Устанавливаем текущий язык
         current_index = 0 if self.current_lang == 'ru' else 1
         self.lang_combo.setCurrentIndex(current_index)
@@ -165,7 +216,11 @@ class SettingsDialog(QDialog):
         """
         return {
             'default_path': self.path_edit.text().strip(),
-            'language': self.lang_combo.currentData()
+            'language': self.lang_combo.currentData(),
+            'use_skeleton_archive': self.skeleton_checkbox.isChecked(),
+            'verify_templates': self.verify_checkbox.isChecked(),
+            'watch_projects': self.watch_checkbox.isChecked(),
+            'templates_source': self.templates_edit.text().strip()
         }
     
     def validate_settings(self) -> bool:
@@ -7,24 +7,49 @@ import os
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                             QLabel, QGroupBox, QLineEdit, QCheckBox, QTextEdit,
                             QProgressBar, QStatusBar, QMessageBox, QFileDialog,
-                            QApplication, QSizePolicy)
-from PyQt5.QtCore import Qt
+                            QApplication, QSizePolicy, QComboBox, QListWidget,
+                            QListWidgetItem, QDockWidget)
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QPixmap, QPainter, QPen, QColor, QFont, QIcon
 
 from config.settings import SettingsManager
 from config.translations import Translations
+from ui.components.ingest_dialog import IngestDialog
+from ui.components.project_browser import ProjectBrowserPane
+from ui.components.project_size_dialog import ProjectSizeDialog
+from ui.components.render_check_dialog import RenderCheckDialog
+from ui.components.restore_dialog import RestoreDialog
 from ui.components.settings_dialog import SettingsDialog
 from ui.styles.stylesheet import StyleSheet
+from core.checksum_manifest import ManifestWorker
+from core.folder_launcher import ERROR_NOT_FOUND, ERROR_TIMEOUT, get_folder_launcher
+from core.path_validation import MIN_FREE_SPACE, PathValidator
+from core.project_archive import ArchiveWorker, get_default_archive_path
 from core.project_creator import ProjectCreatorWorker
-from utils.platform_utils import open_folder
+from core.project_index import ProjectImportWorker, get_project_index
+from core.project_watcher import ProjectWatchService
+from core.structure_audit import AuditWorker, save_audit_report
+from core.size_scanner import format_size
+from core.template_cache import get_template_cache
+from core.template_catalog import TemplateCatalog, get_default_templates_dir
+from core.template_mirror import get_template_mirror, resolve_templates_dir
+from core.template_variants import VariantIndexWorker
+from utils.platform_utils import is_valid_filename
 from utils.resource_manager import resource_path
 from utils.button_animations import setup_button_animations_delayed
 from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QScrollArea
 
+# Период фоновой сверки зеркала сетевых шаблонов
+TEMPLATE_SYNC_INTERVAL_MS = 10 * 60 * 1000
+
+
 class ProjectCreatorApp(QMainWindow):
     """Главное окно приложения Project Creator"""
-
+    
+    # Сверка шаблонов завершилась (отправляется из фонового потока зеркала)
+    templates_synced = pyqtSignal()
+    
     def __init__(self):
         """Инициализация главного окна"""
         super().__init__()
@@ -43,7 +68,19 @@ class ProjectCreatorApp(QMainWindow):
         except Exception as e:
             print(f"⚠️ Ошибка инициализации FolderStructureManager: {e}")
             self.folder_structure_manager = None
-
+        
+        # Проверка папки и имени проекта выполняется в фоне (поля проверяются при каждом вводе)
+        self.creating = False
+        self.path_validator = PathValidator(parent=self)
+        self.path_validator.validated.connect(self._apply_path_check)
+        
+        # Индекс вариантов шаблонов строится в фоне после каждой сверки шаблонов,
+        # фильтр списков вариантов работает только с ним в памяти
+        self.variant_index = None
+        self.variant_index_worker = None
+        self._variant_index_stale = False
+        self.templates_synced.connect(self._on_templates_synced)
+        
         # Получаем адаптивные стили
         try:
             self.adaptive_styles = StyleSheet.get_adaptive_styles()
@@ -69,6 +106,118 @@ class ProjectCreatorApp(QMainWindow):
         
         # Восстанавливаем геометрию окна если сохранена
         self._restore_window_geometry()
+        
+        # Синхронизируем зеркало сетевых шаблонов и прогреваем кэш в фоне,
+        # чтобы первое создание не ждало диск
+        QTimer.singleShot(0, self._sync_templates)
+        self.template_sync_timer = QTimer(self)
+        self.template_sync_timer.timeout.connect(self._sync_templates)
+        self.template_sync_timer.start(TEMPLATE_SYNC_INTERVAL_MS)
+        
+        # Наблюдение за базовыми папками поддерживает индекс проектов актуальным
+        self.project_watch = None
+        QTimer.singleShot(0, self._restart_project_watch)
+        
+        # Папки открываются в фоне, об ошибках сообщается одним окном на пакет
+        self.folder_launcher = get_folder_launcher()
+        self.folder_launcher.batch_finished.connect(self._on_folders_opened)
+    
+    def _get_templates_dir(self) -> str:
+        """
+        Возвращает папку, из которой читаются шаблоны
+        
+        Returns:
+            Локальное зеркало сетевых шаблонов или встроенная папка шаблонов
+        """
+        source = self.settings_manager.get('templates_source', '')
+        return resolve_templates_dir(source) or get_default_templates_dir()
+    
+    def _sync_templates(self) -> None:
+        """Сверяет зеркало сетевых шаблонов (если настроено) и прогревает кэш"""
+        source = self.settings_manager.get('templates_source', '')
+        try:
+            if source:
+                mirror = get_template_mirror(source)
+                mirror.start_background_sync(lambda stats: self.templates_synced.emit())
+            else:
+                self._on_templates_synced()
+        except Exception as e:
+            print(f"⚠️ Не удалось запустить синхронизацию шаблонов: {e}")
+    
+    def _on_templates_synced(self) -> None:
+        """Прогревает кэш и перестраивает индекс вариантов после сверки шаблонов"""
+        self._warm_up_template_cache()
+        self._rebuild_variant_index()
+    
+    def _rebuild_variant_index(self) -> None:
+        """Запускает фоновое построение индекса вариантов шаблонов"""
+        if self.variant_index_worker is not None and self.variant_index_worker.isRunning():
+            # Папка шаблонов могла смениться - перестроим после текущего построения
+            self._variant_index_stale = True
+            return
+        self._variant_index_stale = False
+        self.variant_index_worker = VariantIndexWorker(self._get_templates_dir())
+        self.variant_index_worker.finished.connect(self._on_variant_index_built)
+        self.variant_index_worker.error_occurred.connect(self._on_variant_index_error)
+        self.variant_index_worker.start()
+    
+    def _on_variant_index_built(self, index) -> None:
+        """Применяет построенный индекс вариантов"""
+        self.variant_index = index
+        self._refresh_variant_pickers()
+        if self._variant_index_stale:
+            QTimer.singleShot(0, self._rebuild_variant_index)
+    
+    def _on_variant_index_error(self, error_message: str) -> None:
+        """Сообщает об ошибке построения индекса вариантов"""
+        print(f"⚠️ Не удалось построить индекс вариантов шаблонов: {error_message}")
+        if self._variant_index_stale:
+            QTimer.singleShot(0, self._rebuild_variant_index)
+    
+    def _restart_project_watch(self) -> None:
+        """Перезапускает наблюдение за папками проектов согласно настройкам"""
+        if self.project_watch is not None:
+            self.project_watch.stop()
+            self.project_watch = None
+        if not self.settings_manager.get('watch_projects', False):
+            return
+        
+        base_paths = [self.settings_manager.get_default_path()] + list(self.settings_manager.get('watch_paths', []))
+        try:
+            self.project_watch = ProjectWatchService(base_paths, get_project_index(), parent=self)
+            self.project_watch.batch_applied.connect(self._on_watch_batch)
+            self.project_watch.start()
+        except Exception as e:
+            print(f"⚠️ Не удалось запустить наблюдение за проектами: {e}")
+            self.project_watch = None
+    
+    def _on_watch_batch(self, result: dict) -> None:
+        """Обновляет результаты поиска после изменений в папках проектов"""
+        if self.search_edit.text().strip():
+            self._run_search()
+    
+    def _on_folders_opened(self, result: dict) -> None:
+        """Сообщает о папках, которые не удалось открыть"""
+        if not result['failed']:
+            return
+        lines = []
+        for path, error in result['failed'].items():
+            if error == ERROR_NOT_FOUND:
+                error = self.t['folder_not_exists']
+            elif error == ERROR_TIMEOUT:
+                error = self.t['open_folder_timeout'].format(self.folder_launcher.timeout)
+            lines.append(f"{path}: {error}")
+        QMessageBox.warning(self, self.t['warning'], self.t['open_folder_failed'] + '\n\n' + '\n'.join(lines))
+    
+    def _warm_up_template_cache(self) -> None:
+        """Запускает фоновую загрузку шаблонов в кэш"""
+        try:
+            get_template_cache().start_background_warm_up(
+                TemplateCatalog(self._get_templates_dir()),
+                precompute_hashes=self.settings_manager.get('verify_templates', False)
+            )
+        except Exception as e:
+            print(f"⚠️ Не удалось запустить прогрев кэша шаблонов: {e}")
     
     def _print_screen_info(self):
         """Выводит информацию об экране и масштабировании"""
@@ -179,11 +328,53 @@ class ProjectCreatorApp(QMainWindow):
         layout.setContentsMargins(margins, margins, margins, margins)
         
         # Создаем компоненты интерфейса
+        self._create_menu_bar()
         self._create_header(layout)
+        self._create_search(layout)
         self._create_main_form(layout)
         self._create_progress_bar(layout)
         self._create_buttons(layout)
         self._create_status_bar()
+        self._create_project_browser()
+    
+    def _create_menu_bar(self) -> None:
+        """Создает меню утилит для работы с существующими проектами"""
+        self.tools_menu = self.menuBar().addMenu(self.t['tools_menu'])
+        self.ingest_action = self.tools_menu.addAction(self.t['ingest_footage'])
+        self.ingest_action.triggered.connect(self._show_ingest)
+        self.manifest_action = self.tools_menu.addAction(self.t['build_manifests'])
+        self.manifest_action.triggered.connect(self._build_manifests)
+        self.render_check_action = self.tools_menu.addAction(self.t['render_check'])
+        self.render_check_action.triggered.connect(self._show_render_check)
+        self.sizes_action = self.tools_menu.addAction(self.t['project_sizes'])
+        self.sizes_action.triggered.connect(self._show_project_sizes)
+        self.archive_action = self.tools_menu.addAction(self.t['archive_project'])
+        self.archive_action.triggered.connect(self._archive_project)
+        self.restore_action = self.tools_menu.addAction(self.t['restore_project'])
+        self.restore_action.triggered.connect(self._show_restore)
+        self.tools_menu.addSeparator()
+        self.import_action = self.tools_menu.addAction(self.t['import_projects'])
+        self.import_action.triggered.connect(self._import_projects)
+        self.browse_action = self.tools_menu.addAction(self.t['browse_projects'])
+        self.browse_action.triggered.connect(self._show_project_browser)
+        self.audit_action = self.tools_menu.addAction(self.t['audit_structure'])
+        self.audit_action.triggered.connect(self._audit_structure)
+    
+    def _create_project_browser(self) -> None:
+        """Создает скрытую панель обзора проектов справа от формы"""
+        self.browser_pane = ProjectBrowserPane(self, self.current_lang)
+        self.browser_dock = QDockWidget(self.t['browser_title'], self)
+        self.browser_dock.setObjectName("project_browser_dock")
+        self.browser_dock.setWidget(self.browser_pane)
+        self.browser_dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.browser_dock)
+        self.browser_dock.hide()
+    
+    def _show_project_browser(self) -> None:
+        """Показывает панель обзора и загружает проекты базовой папки"""
+        self.browser_dock.show()
+        self.browser_dock.raise_()
+        self.browser_pane.load(self.project_path.text().strip())
     
     def _create_header(self, layout: QVBoxLayout) -> None:
         """
@@ -214,6 +405,58 @@ class ProjectCreatorApp(QMainWindow):
         header_layout.addWidget(self.subtitle)
         layout.addWidget(header_widget)
     
+    def _create_search(self, layout: QVBoxLayout) -> None:
+        """
+        Создает поле поиска по индексу проектов
+        
+        Args:
+            layout: Макет для размещения поля поиска
+        """
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText(self.t['search_placeholder'])
+        self.search_edit.setClearButtonEnabled(True)
+        
+        # Поиск запускается после паузы в наборе
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self._run_search)
+        self.search_edit.textChanged.connect(self.search_timer.start)
+        
+        self.search_results = QListWidget()
+        self.search_results.setMaximumHeight(180)
+        self.search_results.setVisible(False)
+        self.search_results.itemActivated.connect(self._open_search_result)
+        
+        layout.addWidget(self.search_edit)
+        layout.addWidget(self.search_results)
+    
+    def _run_search(self) -> None:
+        """Ищет проекты по тексту поля поиска"""
+        query = self.search_edit.text().strip()
+        self.search_results.clear()
+        if not query:
+            self.search_results.setVisible(False)
+            return
+        
+        for project in get_project_index().search(query, limit=20):
+            size = format_size(project['size']) if project['size'] is not None else '—'
+            item = QListWidgetItem(
+                f"📁 {project['name']}  ·  {', '.join(project['tools'])}  ·  {size}  —  {project['path']}")
+            item.setData(Qt.UserRole, project['path'])
+            self.search_results.addItem(item)
+        if not self.search_results.count():
+            item = QListWidgetItem(self.t['search_no_results'])
+            item.setFlags(Qt.NoItemFlags)
+            self.search_results.addItem(item)
+        self.search_results.setVisible(True)
+    
+    def _open_search_result(self, item: QListWidgetItem) -> None:
+        """Открывает папку найденного проекта"""
+        path = item.data(Qt.UserRole)
+        if path:
+            self.folder_launcher.open(path)
+    
     def _create_main_form(self, layout: QVBoxLayout) -> None:
         """
         Создает основную форму приложения
@@ -338,9 +581,11 @@ class ProjectCreatorApp(QMainWindow):
         
         tools_layout.setContentsMargins(margins, top_margin, margins, margins)
         
+        # Выбор варианта шаблона для каждого инструмента
+        self.variant_combos = {}
         
-        # Функция для создания контейнера с иконкой и чекбоксом
-        def create_tool_container(display_name, icon_filename, fallback_emoji):
+        # Функция для создания контейнера с иконкой, чекбоксом и выбором варианта
+        def create_tool_container(tool, display_name, icon_filename, fallback_emoji):
             container = QHBoxLayout()
             
             # Иконка
@@ -370,8 +615,17 @@ class ProjectCreatorApp(QMainWindow):
             checkbox.setObjectName("tool_checkbox")
             checkbox.stateChanged.connect(self._update_preview)
             
+            # Варианты шаблона (показываются, если их больше одного)
+            variant_combo = QComboBox()
+            variant_combo.setObjectName("variant_combo")
+            variant_combo.setEnabled(False)
+            variant_combo.setVisible(False)
+            checkbox.toggled.connect(variant_combo.setEnabled)
+            self.variant_combos[tool] = variant_combo
+            
             container.addWidget(checkbox)
             container.addWidget(icon_label)
+            container.addWidget(variant_combo)
             
             return container, checkbox
         
@@ -379,19 +633,19 @@ class ProjectCreatorApp(QMainWindow):
         row1_layout = QHBoxLayout()
         
         # After Effects
-        ae_container, self.ae_checkbox = create_tool_container("After Effects", "after_effects.png", "🎬")
+        ae_container, self.ae_checkbox = create_tool_container('ae', "After Effects", "after_effects.png", "🎬")
         ae_widget = QWidget()
         ae_widget.setLayout(ae_container)
         row1_layout.addWidget(ae_widget)
         
         # Cinema 4D
-        c4d_container, self.c4d_checkbox = create_tool_container("Cinema 4D", "cinema4d.png", "🎭")
+        c4d_container, self.c4d_checkbox = create_tool_container('c4d', "Cinema 4D", "cinema4d.png", "🎭")
         c4d_widget = QWidget()
         c4d_widget.setLayout(c4d_container)
         row1_layout.addWidget(c4d_widget)
         
         # Premiere Pro
-        pr_container, self.pr_checkbox = create_tool_container("Premiere Pro", "premiere_pro.png", "🎞️")
+        pr_container, self.pr_checkbox = create_tool_container('pr', "Premiere Pro", "premiere_pro.png", "🎞️")
         pr_widget = QWidget()
         pr_widget.setLayout(pr_container)
         row1_layout.addWidget(pr_widget)
@@ -402,24 +656,78 @@ class ProjectCreatorApp(QMainWindow):
         row2_layout = QHBoxLayout()
         
         # Houdini
-        houdini_container, self.houdini_checkbox = create_tool_container("Houdini", "houdini.png", "🌪️")
+        houdini_container, self.houdini_checkbox = create_tool_container('houdini', "Houdini", "houdini.png", "🌪️")
         houdini_widget = QWidget()
         houdini_widget.setLayout(houdini_container)
         row2_layout.addWidget(houdini_widget)
         
         # Blender
-        blender_container, self.blender_checkbox = create_tool_container("Blender", "blender.png", "🍊")
+        blender_container, self.blender_checkbox = create_tool_container('blender', "Blender", "blender.png", "🍊")
         blender_widget = QWidget()
         blender_widget.setLayout(blender_container)
         row2_layout.addWidget(blender_widget)
         
         row2_layout.addStretch()
         
+        # Фильтр вариантов шаблонов по названию, клиенту или тегу
+        self.variant_filter = QLineEdit()
+        self.variant_filter.setPlaceholderText(self.t['variant_filter_placeholder'])
+        self.variant_filter.textChanged.connect(self._refresh_variant_pickers)
+        
         # Добавляем строки в основной layout
         tools_layout.addLayout(row1_layout)
         tools_layout.addLayout(row2_layout)
+        tools_layout.addWidget(self.variant_filter)
         
         layout.addWidget(self.tools_group)
+        
+        self._refresh_variant_pickers()
+    
+    def _refresh_variant_pickers(self) -> None:
+        """Заполняет списки вариантов шаблонов с учетом фильтра (без обращения к диску)"""
+        index = self.variant_index
+        if index is None:
+            # Индекс еще строится - списки появятся, когда он будет готов
+            for combo in self.variant_combos.values():
+                combo.setVisible(False)
+            self.variant_filter.setVisible(False)
+            return
+        
+        matches = index.search(self.variant_filter.text())
+        has_variants = False
+        for tool, combo in self.variant_combos.items():
+            selected = combo.currentData()
+            combo.blockSignals(True)
+            combo.clear()
+            for variant in matches.get(tool, []):
+                combo.addItem(variant.describe(), variant.variant_id)
+            position = combo.findData(selected)
+            if position >= 0:
+                combo.setCurrentIndex(position)
+            combo.blockSignals(False)
+            
+            visible = len(index.get_variants(tool)) > 1
+            combo.setVisible(visible)
+            has_variants = has_variants or visible
+        
+        self.variant_filter.setVisible(has_variants)
+    
+    def _get_selected_variants(self, tools: list) -> dict:
+        """
+        Возвращает выбранные варианты шаблонов
+        
+        Args:
+            tools: Список выбранных инструментов
+        
+        Returns:
+            Словарь tool -> variant_id
+        """
+        variants = {}
+        for tool in tools:
+            combo = self.variant_combos.get(tool)
+            if combo is not None and not combo.isHidden() and combo.currentData():
+                variants[tool] = combo.currentData()
+        return variants
     
     def _create_preview_group(self, layout: QVBoxLayout) -> None:
         """
@@ -529,19 +837,49 @@ class ProjectCreatorApp(QMainWindow):
             self.project_path.setText(folder)
     
     def _validate_form(self) -> None:
-        """Проверяет корректность заполнения формы"""
+        """Проверяет корректность заполнения формы (обращения к диску - в фоне)"""
         name = self.project_name.text().strip()
         path = self.project_path.text().strip()
         
-        # Проверяем минимальную длину имени и существование пути
-        valid = len(name) >= 3 and os.path.exists(path)
-        self.create_btn.setEnabled(valid)
+        # Проверяем минимальную длину и допустимость имени без обращения к диску
+        if len(name) < 3 or not is_valid_filename(name) or not path:
+            self.path_validator.cancel()
+            self.create_btn.setEnabled(False)
+            self.status_bar.showMessage(self.t['fill_fields'])
+            return
         
-        # Обновляем статус
-        if valid:
-            self.status_bar.showMessage(self.t['ready_to_create'])
+        result = self.path_validator.request(path, name)
+        if result is not None:
+            self._apply_path_check(result)
+            return
+        # Пока папка проверяется, создание недоступно, а ввод не блокируется
+        self.create_btn.setEnabled(False)
+        self.status_bar.showMessage(self.t['path_checking'])
+    
+    def _apply_path_check(self, result: dict) -> None:
+        """
+        Применяет результат проверки папки проектов и имени
+        
+        Args:
+            result: Результат PathValidator
+        """
+        if (self.creating or result['name'] != self.project_name.text().strip()
+                or result['path'] != self.project_path.text().strip()):
+            return
+        
+        if not result['exists']:
+            message = self.t['folder_not_exists']
+        elif not result['writable']:
+            message = self.t['path_not_writable']
+        elif result['collision']:
+            message = self.t['project_exists'].format(result['name'])
         else:
-            self.status_bar.showMessage(self.t['fill_fields'])
+            message = None
+        self.create_btn.setEnabled(message is None)
+        
+        if message is None and result['free_space'] is not None and result['free_space'] < MIN_FREE_SPACE:
+            message = self.t['path_low_space'].format(format_size(result['free_space']))
+        self.status_bar.showMessage(message or self.t['ready_to_create'])
     
     def _update_preview(self) -> None:
         """Обновляет предварительный просмотр структуры проекта"""
@@ -601,14 +939,21 @@ class ProjectCreatorApp(QMainWindow):
         
         project_data = {
             'name': project_name,
-            'tools': tools
+            'tools': tools,
+            'variants': self._get_selected_variants(tools)
         }
         
         # Блокируем интерфейс и показываем прогресс
         self._set_ui_creating_state(True)
         
         # Запускаем рабочий поток
-        self.worker = ProjectCreatorWorker(project_data, base_path, self.current_lang)
+        self.worker = ProjectCreatorWorker(
+            project_data, base_path, self.current_lang,
+            use_skeleton_archive=self.settings_manager.get('use_skeleton_archive', False),
+            templates_dir=self._get_templates_dir(),
+            verify_copies=self.settings_manager.get('verify_templates', False),
+            project_index=get_project_index()
+        )
         self.worker.progress_updated.connect(self.progress_bar.setValue)
         self.worker.finished.connect(self._on_project_created)
         self.worker.error_occurred.connect(self._on_error)
@@ -621,6 +966,7 @@ class ProjectCreatorApp(QMainWindow):
         Args:
             creating: True если идет создание, False если завершено
         """
+        self.creating = creating
         self.create_btn.setEnabled(not creating)
         self.create_btn.setText(self.t['creating'] if creating else self.t['create_project'])
         self.progress_bar.setVisible(creating)
@@ -649,13 +995,21 @@ class ProjectCreatorApp(QMainWindow):
                     🛠️ {self.t['tools']}: {', '.join(result['tools'])}
                     🎉 {self.t['project_ready']}"""
         
+        # Сведения о повторах и сбоях ввода-вывода
+        if result.get('retries'):
+            details += f"\n🔁 {self.t['io_retries']}: {result['retries']}"
+        if result.get('failed_files'):
+            details += f"\n⚠️ {self.t['failed_files']}: {', '.join(result['failed_files'])}"
+        for failure in result.get('verification_failures', []):
+            details += f"\n❌ {self.t['verification_failures']}: {os.path.basename(failure['destination'])}"
+        
         msg.setDetailedText(details)
         msg.addButton(self.t['open_folder'], QMessageBox.ActionRole)
         msg.addButton(self.t['ok'], QMessageBox.AcceptRole)
         
         reply = msg.exec_()
         if reply == 0:  # Открыть папку
-            open_folder(result['path'])
+            self.folder_launcher.open(result['path'])
         
         # Сбрасываем форму и обновляем статус
         self._reset_form()
@@ -672,12 +1026,15 @@ class ProjectCreatorApp(QMainWindow):
             error_message: Сообщение об ошибке
         """
         self._set_ui_creating_state(False)
+        self.path_validator.invalidate(self.project_path.text().strip())
+        self._validate_form()
         
         QMessageBox.critical(self, self.t['error'], f"❌ {error_message}")
         self.status_bar.showMessage(self.t['creation_error'])
     
     def _reset_form(self) -> None:
         """Сбрасывает форму к начальному состоянию"""
+        self.path_validator.invalidate(self.project_path.text().strip())
         self.project_name.clear()
         self.ae_checkbox.setChecked(False)
         self.c4d_checkbox.setChecked(False)
@@ -702,6 +1059,10 @@ class ProjectCreatorApp(QMainWindow):
             # Обновляем путь к проектам
             self.project_path.setText(new_settings.get('default_path', ''))
             
+            # Источник шаблонов мог измениться
+            self._sync_templates()
+            self._restart_project_watch()
+            
             # Если язык изменился, обновляем интерфейс
             new_lang = new_settings.get('language', self.current_lang)
             if new_lang != self.current_lang:
@@ -709,8 +1070,263 @@ class ProjectCreatorApp(QMainWindow):
                 self.t = Translations.get(new_lang)
                 self._update_ui_texts()
     
+    def _show_ingest(self) -> None:
+        """Показывает диалог загрузки материала в проект"""
+        # По умолчанию предлагаем проект из формы, если он уже создан
+        dialog = IngestDialog(self, self._get_form_project_path(), self.current_lang)
+        dialog.exec_()
+    
+    def _show_render_check(self) -> None:
+        """Показывает диалог проверки рендеров"""
+        dialog = RenderCheckDialog(self, self._get_form_project_path(), self.current_lang)
+        dialog.exec_()
+    
+    def _show_project_sizes(self) -> None:
+        """Показывает диалог размеров проектов (по умолчанию для всей папки проектов)"""
+        dialog = ProjectSizeDialog(self, self.project_path.text().strip(), self.current_lang)
+        dialog.exec_()
+    
+    def _show_restore(self) -> None:
+        """Показывает диалог восстановления проекта из архива"""
+        dialog = RestoreDialog(self, self.project_path.text().strip(), self.current_lang)
+        dialog.exec_()
+    
+    def _get_form_project_path(self) -> str:
+        """
+        Возвращает путь к проекту из формы, если он уже создан
+        
+        Returns:
+            Путь к существующему проекту или пустая строка
+        """
+        name = self.project_name.text().strip()
+        project_path = os.path.join(self.project_path.text().strip(), name)
+        return project_path if name and os.path.isdir(project_path) else ''
+    
+    def _build_manifests(self) -> None:
+        """Строит манифесты контрольных сумм выбранного проекта в фоне"""
+        project_path = QFileDialog.getExistingDirectory(
+            self, self.t['build_manifests'], self._get_form_project_path() or self.project_path.text()
+        )
+        if not project_path:
+            return
+        
+        self.manifest_action.setEnabled(False)
+        self.manifest_worker = ManifestWorker(project_path)
+        self.manifest_worker.progress_updated.connect(
+            lambda percent: self.status_bar.showMessage(self.t['manifests_progress'].format(percent)))
+        self.manifest_worker.finished.connect(self._on_manifests_built)
+        self.manifest_worker.error_occurred.connect(self._on_manifests_error)
+        self.manifest_worker.start()
+    
+    def _on_manifests_built(self, results: list) -> None:
+        """
+        Обработчик завершения построения манифестов
+        
+        Args:
+            results: Итоги по папкам проекта
+        """
+        self.manifest_action.setEnabled(True)
+        self.status_bar.showMessage(self.t['manifests_done'])
+        
+        details = []
+        problems = False
+        for result in results:
+            counts = ', '.join(f"{status}: {count}" for status, count in sorted(result['counts'].items()))
+            details.append(f"{result['manifest']}\n{counts}")
+            details.extend(f"❌ {name}" for name in result['mismatches'] + result['missing'])
+            problems = problems or bool(result['mismatches'] or result['missing'] or result['errors'])
+        
+        msg = QMessageBox(self)
+        msg.setIcon(QMessageBox.Warning if problems else QMessageBox.Information)
+        msg.setWindowTitle(self.t['build_manifests'])
+        msg.setText(self.t['manifests_problems'] if problems else self.t['manifests_done'])
+        msg.setDetailedText('\n'.join(details))
+        msg.exec_()
+    
+    def _on_manifests_error(self, error_message: str) -> None:
+        """Обработчик ошибки построения манифестов"""
+        self.manifest_action.setEnabled(True)
+        QMessageBox.critical(self, self.t['error'], error_message)
+    
+    def _audit_structure(self) -> None:
+        """Проверяет все проекты базовой папки на соответствие текущей структуре"""
+        base_path = self.project_path.text().strip()
+        if not os.path.isdir(base_path):
+            QMessageBox.warning(self, self.t['warning'], self.t['folder_not_exists'])
+            return
+        
+        self.audit_action.setEnabled(False)
+        self.status_bar.showMessage(self.t['audit_progress'].format(0))
+        self.audit_worker = AuditWorker(base_path)
+        self.audit_worker.progress_updated.connect(
+            lambda count: self.status_bar.showMessage(self.t['audit_progress'].format(count)))
+        self.audit_worker.finished.connect(self._on_structure_audited)
+        self.audit_worker.error_occurred.connect(self._on_audit_error)
+        self.audit_worker.start()
+    
+    def _on_structure_audited(self, report: dict) -> None:
+        """
+        Показывает итоги проверки структуры и предлагает сохранить отчет
+        
+        Args:
+            report: Отчет StructureAuditor
+        """
+        self.audit_action.setEnabled(True)
+        summary = self.t['audit_done'].format(report['checked'], report['compliant'], len(report['projects']))
+        self.status_bar.showMessage(summary)
+        
+        details = []
+        for project in report['projects']:
+            details.append(project['name'])
+            details.extend(f"   - {path}" for path in project['missing'])
+            details.extend(f"   + {path}" for path in project['extra'])
+            details.extend(f"   {found} → {expected}" for found, expected in project['misnamed'])
+            if project.get('error'):
+                details.append(f"   ⚠️ {project['error']}")
+        
+        msg = QMessageBox(self)
+        msg.setIcon(QMessageBox.Warning if report['projects'] else QMessageBox.Information)
+        msg.setWindowTitle(self.t['audit_structure'])
+        msg.setText(summary)
+        if details:
+            msg.setDetailedText('\n'.join(details))
+            save_btn = msg.addButton(self.t['audit_save_report'], QMessageBox.ActionRole)
+        else:
+            save_btn = None
+        msg.addButton(QMessageBox.Close)
+        msg.exec_()
+        
+        if save_btn is not None and msg.clickedButton() is save_btn:
+            path, _ = QFileDialog.getSaveFileName(
+                self, self.t['audit_save_report'],
+                os.path.join(report['base_path'], 'structure_audit.json'), self.t['audit_report_filter'])
+            if path:
+                try:
+                    save_audit_report(report, path)
+                except OSError as e:
+                    QMessageBox.critical(self, self.t['error'], str(e))
+    
+    def _on_audit_error(self, error_message: str) -> None:
+        """Обработчик ошибки проверки структуры"""
+        self.audit_action.setEnabled(True)
+        self.status_bar.showMessage(self.t['ready'])
+        QMessageBox.critical(self, self.t['error'], error_message)
+    
+    def _import_projects(self) -> None:
+        """Импортирует существующие проекты базовой папки в индекс"""
+        base_path = QFileDialog.getExistingDirectory(
+            self, self.t['import_projects'], self.project_path.text().strip()
+        )
+        if not base_path:
+            return
+        
+        self.import_action.setEnabled(False)
+        self.status_bar.showMessage(self.t['import_progress'].format(0))
+        self.import_worker = ProjectImportWorker(base_path)
+        self.import_worker.progress_updated.connect(
+            lambda count: self.status_bar.showMessage(self.t['import_progress'].format(count)))
+        self.import_worker.finished.connect(self._on_projects_imported)
+        self.import_worker.error_occurred.connect(self._on_import_error)
+        self.import_worker.start()
+    
+    def _on_projects_imported(self, result: dict) -> None:
+        """
+        Обработчик завершения импорта проектов
+        
+        Args:
+            result: Количество импортированных и удаленных проектов
+        """
+        self.import_action.setEnabled(True)
+        self.status_bar.showMessage(self.t['import_done'].format(result['imported'], result['removed']))
+        if self.search_edit.text().strip():
+            self._run_search()
+    
+    def _on_import_error(self, error_message: str) -> None:
+        """Обработчик ошибки импорта проектов"""
+        self.import_action.setEnabled(True)
+        self.status_bar.showMessage(self.t['ready'])
+        QMessageBox.critical(self, self.t['error'], error_message)
+    
+    def _archive_project(self) -> None:
+        """Архивирует выбранный проект в фоне"""
+        project_path = QFileDialog.getExistingDirectory(
+            self, self.t['archive_project'], self._get_form_project_path() or self.project_path.text()
+        )
+        if not project_path:
+            return
+        archive_path, _ = QFileDialog.getSaveFileName(
+            self, self.t['archive_project'], get_default_archive_path(project_path), self.t['archive_filter']
+        )
+        if not archive_path:
+            return
+        
+        self.archive_action.setEnabled(False)
+        self.archive_worker = ArchiveWorker(project_path, archive_path)
+        self.archive_worker.progress_updated.connect(self._on_archive_progress)
+        self.archive_worker.finished.connect(self._on_archive_finished)
+        self.archive_worker.error_occurred.connect(self._on_archive_error)
+        self.archive_worker.start()
+    
+    def _on_archive_progress(self, progress: dict) -> None:
+        """
+        Показывает прогресс архивации в строке состояния
+        
+        Args:
+            progress: Словарь прогресса ProjectArchiver
+        """
+        percent = progress['bytes_done'] * 100 // progress['bytes_total'] if progress['bytes_total'] else 100
+        key = 'archive_verify_progress' if progress['phase'] == 'verify' else 'archive_progress'
+        self.status_bar.showMessage(self.t[key].format(percent, format_size(int(progress['throughput']))))
+    
+    def _on_archive_finished(self, result: dict) -> None:
+        """
+        Обработчик завершения архивации
+        
+        Args:
+            result: Итоги архивации
+        """
+        self.archive_action.setEnabled(True)
+        verified = result['verified']
+        ok = verified is None or verified['ok']
+        self.status_bar.showMessage(self.t['archive_done'] if ok else self.t['archive_verify_failed'])
+        
+        details = [
+            result['archive'],
+            f"{format_size(result['bytes_in'])} → {format_size(result['compressed_size'])} "
+            f"({result['codec']}, {format_size(int(result['throughput']))}/s)"
+        ]
+        details.extend(f"− {path}" for path in result['excluded'])
+        if verified is not None:
+            details.extend(f"❌ {name}" for name in verified['mismatches'] + verified['missing'])
+        
+        msg = QMessageBox(self)
+        msg.setIcon(QMessageBox.Information if ok else QMessageBox.Warning)
+        msg.setWindowTitle(self.t['archive_project'])
+        msg.setText(self.t['archive_done'] if ok else self.t['archive_verify_failed'])
+        msg.setDetailedText('\n'.join(details))
+        msg.exec_()
+    
+    def _on_archive_error(self, error_message: str) -> None:
+        """Обработчик ошибки архивации"""
+        self.archive_action.setEnabled(True)
+        self.status_bar.showMessage(self.t['ready'])
+        QMessageBox.critical(self, self.t['error'], error_message)
+    
     def _update_ui_texts(self) -> None:
         """Обновляет тексты интерфейса при смене языка"""
+        self.tools_menu.setTitle(self.t['tools_menu'])
+        self.ingest_action.setText(self.t['ingest_footage'])
+        self.manifest_action.setText(self.t['build_manifests'])
+        self.render_check_action.setText(self.t['render_check'])
+        self.sizes_action.setText(self.t['project_sizes'])
+        self.archive_action.setText(self.t['archive_project'])
+        self.restore_action.setText(self.t['restore_project'])
+        self.import_action.setText(self.t['import_projects'])
+        self.browse_action.setText(self.t['browse_projects'])
+        self.audit_action.setText(self.t['audit_structure'])
+        self.browser_dock.setWindowTitle(self.t['browser_title'])
+        self.browser_pane.set_language(self.current_lang)
+        self.search_edit.setPlaceholderText(self.t['search_placeholder'])
         self.title.setText(self.t['window_title'])
         self.subtitle.setText(self.t['subtitle'])
         self.name_group.setTitle(self.t['project_settings'])
@@ -720,6 +1336,7 @@ class ProjectCreatorApp(QMainWindow):
         self.project_path.setPlaceholderText(self.t['project_folder_placeholder'])
         self.browse_btn.setText(self.t['browse'])
         self.tools_group.setTitle(self.t['dev_tools'])
+        self.variant_filter.setPlaceholderText(self.t['variant_filter_placeholder'])
         self.preview_group.setTitle(self.t['project_structure'])
         self.create_btn.setText(self.t['create_project'])
         self.reset_btn.setText(self.t['reset'])
@@ -731,8 +1348,9 @@ class ProjectCreatorApp(QMainWindow):
     def _open_projects_folder(self) -> None:
         """Открывает папку с проектами"""
         path = self.project_path.text()
-        if os.path.exists(path):
-            open_folder(path)
+        if path:
+            # Существование проверяется в фоне, отсутствующая папка попадет в отчет
+            self.folder_launcher.open(path)
         else:
             QMessageBox.warning(self, self.t['warning'], self.t['folder_not_exists'])
     
@@ -773,6 +1391,12 @@ class ProjectCreatorApp(QMainWindow):
         Args:
             event: Событие закрытия
         """
+        if self.project_watch is not None:
+            self.project_watch.stop()
+        self.browser_pane.stop()
+        self.folder_launcher.shutdown()
+        self.path_validator.shutdown()
+        
         try:
             # Сохраняем геометрию окна
             self.settings_manager.set('window_geometry', self.saveGeometry())
@@ -9,31 +9,50 @@ import subprocess
 from typing import Optional
 
 
+def launch_file_manager(path: str) -> Optional[subprocess.Popen]:
+    """
+    Запускает файловый менеджер для папки, не дожидаясь его завершения
+    
+    Args:
+        path: Путь к папке для открытия
+    
+    Returns:
+        Запущенный процесс (None в Windows, где os.startfile не возвращает процесс)
+    
+    Raises:
+        OSError: Если команду открытия не удалось запустить
+    """
+    if sys.platform == 'win32':
+        # Windows: используем explorer
+        os.startfile(path)
+        return None
+    # macOS: используем open, Linux: используем xdg-open
+    command = ['open', path] if sys.platform == 'darwin' else ['xdg-open', path]
+    # Вывод не перехватывается: непрочитанный канал мог бы заблокировать команду
+    return subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL, start_new_session=True)
+
+
 def open_folder(path: str) -> bool:
     """
-    Открывает папку в файловом менеджере операционной системы
+    Открывает папку в файловом менеджере операционной системы без ожидания
+    
+    Окну приложения следует использовать FolderLauncher (core/folder_launcher.py),
+    который также проверяет папку в фоне и сообщает об ошибках и таймаутах
     
     Args:
         path: Путь к папке для открытия
         
     Returns:
-        True если операция выполнена успешно, False в противном случае
+        True если команда открытия запущена, False в противном случае
     """
     if not os.path.exists(path):
         return False
     
     try:
-        if sys.platform == 'win32':
-            # Windows: используем explorer
-            os.startfile(path)
-        elif sys.platform == 'darwin':
-            # macOS: используем open
-            subprocess.run(['open', path], check=True)
-        else:
-            # Linux: используем xdg-open
-            subprocess.run(['xdg-open', path], check=True)
+        launch_file_manager(path)
         return True
-    except (OSError, subprocess.CalledProcessError) as e:
+    except OSError as e:
         print(f"Ошибка при открытии папки {path}: {e}")
         return False
 
@@ -149,7 +168,7 @@ def get_free_disk_space(path: str) -> Optional[int]:
             return free_bytes.value
         else:
             statvfs = os.statvfs(path)
-            return statvfs.f_frsize * statvfs.f_available
+            return statvfs.f_frsize * statvfs.f_bavail
     except Exception as e:
         print(f"Ошибка при получении информации о диске: {e}")
         return None
@@ -209,4 +228,39 @@ def is_valid_filename(filename: str) -> bool:
     if len(filename) > 255:
         return False
     
-    return True
\ No newline at end of file
+    return True
+
+
+# ioctl FICLONE в Linux (Btrfs, XFS с reflink, bcachefs)
+FICLONE = 0x40049409
+
+
+def clone_file(source: str, destination: str) -> None:
+    """
+    Создает копию файла со ссылкой на те же блоки (reflink/copy-on-write)
+    
+    Args:
+        source: Исходный файл
+        destination: Новый файл (не должен существовать)
+        
+    Raises:
+        OSError: Если файловая система или ОС не поддерживает клонирование
+    """
+    if sys.platform == 'darwin':
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        # clonefile(2) есть в APFS начиная с macOS 10.12
+        if libc.clonefile(os.fsencode(source), os.fsencode(destination), 0) != 0:
+            error_code = ctypes.get_errno()
+            raise OSError(error_code, os.strerror(error_code), destination)
+    elif sys.platform.startswith('linux'):
+        import fcntl
+        with open(source, 'rb') as src, open(destination, 'xb') as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            except OSError:
+                dst.close()
+                os.remove(destination)
+                raise
+    else:
+        raise OSError(f"Клонирование файлов не поддерживается на {sys.platform}")